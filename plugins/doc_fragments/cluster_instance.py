@@ -47,4 +47,106 @@ options:
             variable will be used.
         required: false
         type: float
+      max_concurrent_requests:
+        description:
+          - Maximum number of requests that are sent to the HyperCore
+            instance at the same time, summed over all module invocations
+            (forks) running on the same machine.
+          - Limit is shared through lock files in the C(SC_STATE_DIR)
+            directory, or in a per-user directory in the system temporary
+            directory if C(SC_STATE_DIR) is not set. The directory must be
+            owned by the user running the module and not accessible to
+            other users.
+          - Time spent waiting for the limiter is returned in module
+            result as C(throttle).
+          - If not set, the value of the C(SC_MAX_CONCURRENT_REQUESTS)
+            environment variable will be used.
+          - If neither is set, number of requests is not limited.
+        required: false
+        type: int
+        version_added: 1.3.0
+      max_requests_per_second:
+        description:
+          - Maximum number of requests per second sent to the HyperCore
+            instance, summed over all module invocations (forks) running
+            on the same machine.
+          - If not set, the value of the C(SC_MAX_REQUESTS_PER_SECOND)
+            environment variable will be used.
+          - If neither is set, request rate is not limited.
+        required: false
+        type: float
+        version_added: 1.3.0
+      read_balancing:
+        description:
+          - Spread read (GET) requests over all nodes of the cluster.
+            Write requests are always sent to I(host).
+          - Node addresses are read from U(/rest/v1/Node) once and cached
+            in the C(SC_STATE_DIR) directory (or in the system temporary
+            directory) for all module invocations.
+          - With C(round_robin), nodes are used in turns.
+          - With C(least_latency), node with the lowest response time
+            measured by the module invocation is used.
+          - Node that is not responding is skipped for a while by all module
+            invocations and the request is retried on the next node, and
+            finally on I(host).
+          - If not set, the value of the C(SC_READ_BALANCING) environment
+            variable will be used.
+          - If neither is set, all requests are sent to I(host).
+        required: false
+        type: str
+        choices: [ round_robin, least_latency ]
+        version_added: 1.3.0
+      cache_ttl:
+        description:
+          - Time in seconds for which read-only (info) modules reuse
+            responses downloaded by other module invocations against
+            the same I(host).
+          - Responses are stored in the C(SC_STATE_DIR) directory, or in
+            the system temporary directory if C(SC_STATE_DIR) is not set.
+          - Any write request sent by the collection invalidates the cache.
+          - If not set, the value of the C(SC_CACHE_TTL) environment
+            variable will be used.
+          - If neither is set, responses are not cached between module
+            invocations.
+        required: false
+        type: float
+        version_added: 1.3.0
+      cache_endpoint_ttl:
+        description:
+          - 'Per-endpoint override of I(cache_ttl), for example
+            C({"/rest/v1/Node": 600, "/rest/v1/VirDomain": 10}).'
+          - Endpoint applies also to its sub-paths. Value C(0) disables
+            caching for the endpoint.
+          - Task tags (U(/rest/v1/TaskTag)) are never cached.
+          - If not set, the value of the C(SC_CACHE_ENDPOINT_TTL)
+            environment variable will be used.
+        required: false
+        type: dict
+        version_added: 1.3.0
+      cache_max_size:
+        description:
+          - Maximum size of the cache in bytes. Least recently used
+            responses are removed when the cache grows over this size.
+          - If not set, the value of the C(SC_CACHE_MAX_SIZE) environment
+            variable will be used.
+          - Default is 64 MiB.
+        required: false
+        type: int
+        version_added: 1.3.0
+      coalesce_window:
+        description:
+          - Time in seconds during which identical GET requests to the same
+            cluster are coalesced.
+          - The first module invocation sends the request and shares the
+            response. Other invocations (for example other forks) requesting
+            the same endpoint while the request is in flight, or up to
+            I(coalesce_window) seconds after, reuse that response.
+          - Any write request through the collection discards shared responses.
+          - Task tags are never coalesced.
+          - If not set, the value of the C(SC_COALESCE_WINDOW) environment
+            variable will be used.
+          - If not set, requests are not coalesced.
+        required: false
+        type: float
+        version_added: 1.3.0
 """
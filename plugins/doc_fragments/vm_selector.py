@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+    DOCUMENTATION = r"""
+options:
+  vm_selector:
+    description:
+      - Selects VMs by tags, name, power state and node.
+      - A VM is selected if it matches all of the set criteria.
+      - VMs are listed only once, selection is done in memory.
+    type: dict
+    required: false
+    suboptions:
+      tags:
+        description:
+          - Select VMs with these tags.
+        type: list
+        elements: str
+      tags_match:
+        description:
+          - With C(all), a VM must have all of the I(tags).
+          - With C(any), a VM must have at least one of the I(tags).
+        type: str
+        choices: [ any, all ]
+        default: all
+      name:
+        description:
+          - Shell-style pattern of VM name, for example C(web-*).
+          - Mutually exclusive with I(name_regex).
+        type: str
+      name_regex:
+        description:
+          - Regular expression, searched for in VM name.
+          - Mutually exclusive with I(name).
+        type: str
+      power_state:
+        description:
+          - Select VMs in one of these power states.
+        type: list
+        elements: str
+        choices: [ started, stopped, blocked, paused, shutdown, crashed ]
+      node:
+        description:
+          - Select VMs running on this node.
+          - Node is given by its UUID, LAN IP or backplane IP.
+        type: str
+"""
@@ -42,9 +42,70 @@ SHARED_SPECS = dict(
                 required=False,
                 fallback=(env_fallback, ["SC_TIMEOUT"]),
             ),
+            max_concurrent_requests=dict(
+                type="int",
+                required=False,
+                fallback=(env_fallback, ["SC_MAX_CONCURRENT_REQUESTS"]),
+            ),
+            max_requests_per_second=dict(
+                type="float",
+                required=False,
+                fallback=(env_fallback, ["SC_MAX_REQUESTS_PER_SECOND"]),
+            ),
+            read_balancing=dict(
+                type="str",
+                required=False,
+                choices=["round_robin", "least_latency"],
+                fallback=(env_fallback, ["SC_READ_BALANCING"]),
+            ),
+            cache_ttl=dict(
+                type="float",
+                required=False,
+                fallback=(env_fallback, ["SC_CACHE_TTL"]),
+            ),
+            cache_endpoint_ttl=dict(
+                type="dict",
+                required=False,
+                fallback=(env_fallback, ["SC_CACHE_ENDPOINT_TTL"]),
+            ),
+            cache_max_size=dict(
+                type="int",
+                required=False,
+                fallback=(env_fallback, ["SC_CACHE_MAX_SIZE"]),
+            ),
+            coalesce_window=dict(
+                type="float",
+                required=False,
+                fallback=(env_fallback, ["SC_COALESCE_WINDOW"]),
+            ),
         ),
         required_together=[("username", "password")],
     ),
+    vm_selector=dict(
+        type="dict",
+        required=False,
+        options=dict(
+            tags=dict(type="list", elements="str", required=False),
+            tags_match=dict(type="str", choices=["any", "all"], default="all"),
+            name=dict(type="str", required=False),
+            name_regex=dict(type="str", required=False),
+            power_state=dict(
+                type="list",
+                elements="str",
+                required=False,
+                choices=[
+                    "started",
+                    "stopped",
+                    "blocked",
+                    "paused",
+                    "shutdown",
+                    "crashed",
+                ],
+            ),
+            node=dict(type="str", required=False),
+        ),
+        mutually_exclusive=[("name", "name_regex")],
+    ),
 )
 
 
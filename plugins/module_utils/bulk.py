@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+from __future__ import annotations
+
+__metaclass__ = type
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from time import sleep, time
+from typing import Any, Callable, Hashable, Optional, Sequence, TypeVar
+
+from ..module_utils import errors
+from ..module_utils.rest_client import RestClient
+from ..module_utils.task_tag import TaskTag, TASK_POLL_INTERVAL
+from ..module_utils.typed_classes import TypedTaskTag
+
+DEFAULT_MAX_CONCURRENCY = 5
+
+T = TypeVar("T")
+
+
+def run_tasks(
+    rest_client: RestClient,
+    items: Sequence[T],
+    start: Callable[[T], Optional[TypedTaskTag]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    group: Optional[Callable[[T], Hashable]] = None,
+    max_group_concurrency: Optional[int] = None,
+) -> list[dict[str, Any]]:
+    """
+    Runs start(item) for all items and waits for the returned tasks.
+
+    At most max_concurrency operations are in progress at once - an operation occupies
+    its slot from the start request until its task has finished. Start requests are sent
+    from a thread pool, while all started tasks are polled by a single waiter loop.
+    A failed operation does not stop the others.
+
+    If group is given, at most max_group_concurrency operations of items with the same
+    group(item) (e.g. the same target server) are in progress at once. Items are started
+    in order, an item of a busy group is skipped until its group has a free slot.
+
+    Returns one result per item, in the order of items:
+    task_tag, created_uuid, state (COMPLETE or ERROR), error message,
+    start and finish time and duration.
+    """
+    if max_concurrency < 1:
+        raise errors.ScaleComputingError("max_concurrency must be at least 1.")
+    if max_group_concurrency is not None and max_group_concurrency < 1:
+        raise errors.ScaleComputingError("max_group_concurrency must be at least 1.")
+    groups = [group(item) if group else None for item in items]
+    group_limit = max_group_concurrency if group else None
+    # group -> number of operations in progress
+    running: dict[Hashable, int] = {}
+    results: list[dict[str, Any]] = [
+        dict(
+            task_tag=None,
+            created_uuid=None,
+            state=None,
+            error=None,
+            started=None,
+            finished=None,
+        )
+        for _item in items
+    ]
+
+    def finish(position: int, state: str, error: Optional[str] = None) -> None:
+        result = results[position]
+        result["state"] = state
+        result["error"] = error
+        result["finished"] = time()
+        result["duration"] = round(result["finished"] - result["started"], 3)
+        running[groups[position]] -= 1
+
+    def next_position() -> Optional[int]:
+        for queued, position in enumerate(queue):
+            if group_limit is None or running.get(groups[position], 0) < group_limit:
+                return queue.pop(queued)
+        return None
+
+    queue = list(range(len(items)))
+    starting: dict[Future[Optional[TypedTaskTag]], int] = {}
+    waiting: dict[str, int] = {}
+    last_poll = 0.0
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        while queue or starting or waiting:
+            while queue and len(starting) + len(waiting) < max_concurrency:
+                position = next_position()
+                if position is None:  # All queued items are in busy groups
+                    break
+                running[groups[position]] = running.get(groups[position], 0) + 1
+                results[position]["started"] = time()
+                starting[executor.submit(start, items[position])] = position
+            if starting:
+                # While tasks are pending, wake up in time for the next poll.
+                done, _not_done = wait(
+                    starting,
+                    timeout=TASK_POLL_INTERVAL if waiting else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    position = starting.pop(future)
+                    try:
+                        task = future.result()
+                        task_tag = TaskTag._task_tag(task)
+                    except errors.ScaleComputingError as e:
+                        finish(position, "ERROR", str(e))
+                        continue
+                    results[position]["task_tag"] = task_tag
+                    if task:
+                        results[position]["created_uuid"] = task.get("createdUUID")
+                    if task_tag:
+                        waiting[task_tag] = position
+                    else:  # Operation without a task - already done
+                        finish(position, "COMPLETE")
+            if not waiting:
+                continue
+            until_poll = last_poll + TASK_POLL_INTERVAL - time()
+            if until_poll > 0:
+                if starting:
+                    continue
+                sleep(until_poll)
+            last_poll = time()
+            for task_tag, state in TaskTag.poll_tasks(
+                rest_client, list(waiting)
+            ).items():
+                finish(
+                    waiting.pop(task_tag),
+                    "ERROR" if state == "ERROR" else "COMPLETE",
+                    "There was a problem during this task execution."
+                    if state == "ERROR"
+                    else None,
+                )
+    return results
+
+
+def update_records(
+    records: Sequence[dict[str, Any]],
+    results: Sequence[dict[str, Any]],
+    message: str,
+    describe: Callable[[dict[str, Any]], str],
+) -> None:
+    """
+    Copies task_tag and duration of every run_tasks result to its record.
+
+    If any operation failed, raises BulkError with all records, so modules can return
+    them on failure too. The error message is message formatted with the number of
+    failed and of all operations, followed by describe(record) and error of every
+    failed operation.
+    """
+    failed = []
+    for record, result in zip(records, results):
+        record["task_tag"] = result["task_tag"]
+        record["duration"] = result["duration"]
+        if result["state"] == "ERROR":
+            failed.append("{0}: {1}".format(describe(record), result["error"]))
+    if failed:
+        raise errors.BulkError(
+            "{0}: {1}".format(
+                message.format(len(failed), len(records)), "; ".join(failed)
+            ),
+            list(records),
+        )
@@ -10,7 +10,9 @@ __metaclass__ = type
 
 import json
 import ssl
-from typing import Any, Optional, Union
+from time import time
+from contextlib import nullcontext
+from typing import Any, Optional, Union, ContextManager
 from io import BufferedReader
 
 from ansible.module_utils.urls import Request, basic_auth_header
@@ -22,6 +24,9 @@ from .errors import (
     ApiResponseNotJson,
 )
 from ..module_utils.typed_classes import TypedClusterInstance
+from ..module_utils.limiter import ClusterLimiter
+from ..module_utils.load_balancer import ReadBalancer
+from ..module_utils.read_cache import ReadCache
 
 from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
 from ansible.module_utils.six.moves.urllib.parse import urlencode, quote
@@ -64,6 +69,13 @@ class Client:
         username: str,
         password: str,
         timeout: float,
+        max_concurrent_requests: Optional[int] = None,
+        max_requests_per_second: Optional[float] = None,
+        read_balancing: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        cache_endpoint_ttl: Optional[dict[str, float]] = None,
+        cache_max_size: Optional[int] = None,
+        coalesce_window: Optional[float] = None,
     ):
         if not (host or "").startswith(("https://", "http://")):
             raise ScaleComputingError(
@@ -78,6 +90,22 @@ class Client:
 
         self._auth_header: Optional[dict[str, bytes]] = None
         self._client = Request()
+        self.limiter = ClusterLimiter.get_limiter(
+            host,
+            max_concurrent_requests=max_concurrent_requests,
+            max_requests_per_second=max_requests_per_second,
+        )
+        self.balancer = ReadBalancer.get_balancer(host, read_balancing)
+        # Used by CachedRestClient and GET coalescing, invalidated by every write request.
+        self.read_cache = ReadCache.get_cache(
+            host,
+            username=username,
+            password=password,
+            ttl=cache_ttl,
+            endpoint_ttl=cache_endpoint_ttl,
+            max_size=cache_max_size,
+            coalesce_window=coalesce_window,
+        )
 
     @classmethod
     def get_client(cls, cluster_instance: TypedClusterInstance) -> Client:
@@ -86,8 +114,26 @@ class Client:
             cluster_instance["username"],
             cluster_instance["password"],
             cluster_instance["timeout"],
+            max_concurrent_requests=cluster_instance.get("max_concurrent_requests"),
+            max_requests_per_second=cluster_instance.get("max_requests_per_second"),
+            read_balancing=cluster_instance.get("read_balancing"),
+            cache_ttl=cluster_instance.get("cache_ttl"),
+            cache_endpoint_ttl=cluster_instance.get("cache_endpoint_ttl"),
+            cache_max_size=cluster_instance.get("cache_max_size"),
+            coalesce_window=cluster_instance.get("coalesce_window"),
         )
 
+    def throttle_result(self) -> dict[str, Any]:
+        """Limiter statistics, to be included in the module result."""
+        if self.limiter is None:
+            return {}
+        return dict(throttle=self.limiter.to_ansible())
+
+    def _throttle(self) -> ContextManager[Any]:
+        if self.limiter is None:
+            return nullcontext()
+        return self.limiter.acquire()
+
     @property
     def auth_header(self) -> dict[str, bytes]:
         if not self._auth_header:
@@ -112,50 +158,52 @@ class Client:
             timeout is None
         ):  # If timeout from request is not specifically provided, take it from the Client.
             timeout = self.timeout
-        try:
-            raw_resp = self._client.open(
-                method,
-                path,
-                data=data,
-                headers=headers,
-                validate_certs=False,
-                timeout=timeout,
-            )
-        except HTTPError as e:
-            # Wrong username/password, or expired access token
-            if e.code == 401:
-                raise AuthError(
-                    "Failed to authenticate with the instance: {0} {1}".format(
-                        e.code, e.reason
-                    ),
+        # Response is read inside the limiter, request is in-flight until then.
+        with self._throttle():
+            try:
+                raw_resp = self._client.open(
+                    method,
+                    path,
+                    data=data,
+                    headers=headers,
+                    validate_certs=False,
+                    timeout=timeout,
                 )
-            # Other HTTP error codes do not necessarily mean errors.
-            # This is for the caller to decide.
-            return Response(e.code, e.read(), e.headers)
-        except URLError as e:
-            # TODO: Add other errors here; we need to handle them in modules.
-            # TimeoutError is handled in the rest_client
-            if (
-                e.args
-                and isinstance(e.args, tuple)
-                and type(e.args[0]) == ConnectionRefusedError
-            ):
-                raise ConnectionRefusedError(e.reason)
-            elif (
-                e.args
-                and isinstance(e.args, tuple)
-                and type(e.args[0]) == ConnectionResetError
-            ):
-                raise ConnectionResetError(e.reason)
-            elif (
-                e.args
-                and isinstance(e.args, tuple)
-                and type(e.args[0])
-                in [ssl.SSLEOFError, ssl.SSLZeroReturnError, ssl.SSLSyscallError]
-            ):
-                raise type(e.args[0])(e)
-            raise ScaleComputingError(e.reason)
-        return Response(raw_resp.status, raw_resp.read(), raw_resp.headers)
+            except HTTPError as e:
+                # Wrong username/password, or expired access token
+                if e.code == 401:
+                    raise AuthError(
+                        "Failed to authenticate with the instance: {0} {1}".format(
+                            e.code, e.reason
+                        ),
+                    )
+                # Other HTTP error codes do not necessarily mean errors.
+                # This is for the caller to decide.
+                return Response(e.code, e.read(), e.headers)
+            except URLError as e:
+                # TODO: Add other errors here; we need to handle them in modules.
+                # TimeoutError is handled in the rest_client
+                if (
+                    e.args
+                    and isinstance(e.args, tuple)
+                    and type(e.args[0]) == ConnectionRefusedError
+                ):
+                    raise ConnectionRefusedError(e.reason)
+                elif (
+                    e.args
+                    and isinstance(e.args, tuple)
+                    and type(e.args[0]) == ConnectionResetError
+                ):
+                    raise ConnectionResetError(e.reason)
+                elif (
+                    e.args
+                    and isinstance(e.args, tuple)
+                    and type(e.args[0])
+                    in [ssl.SSLEOFError, ssl.SSLZeroReturnError, ssl.SSLSyscallError]
+                ):
+                    raise type(e.args[0])(e)
+                raise ScaleComputingError(e.reason)
+            return Response(raw_resp.status, raw_resp.read(), raw_resp.headers)
 
     def request(
         self,
@@ -172,12 +220,38 @@ class Client:
             raise AssertionError(
                 "Cannot have JSON and binary payload in a single request."
             )
+        if (
+            method == "GET"
+            and self.read_cache is not None
+            and self.read_cache.coalesce_window > 0
+            and headers is None
+            and not self.read_cache.is_never_cached(path)
+        ):
+            return self._coalesced_get(self.read_cache, path, query, timeout)
+        if method == "GET" or self.read_cache is None:
+            return self._send(method, path, query, data, headers, binary_data, timeout)
+        try:
+            return self._send(method, path, query, data, headers, binary_data, timeout)
+        finally:
+            # Invalidate also on error - the write might still have been applied.
+            self.read_cache.invalidate()
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        query: Optional[dict[Any, Any]],
+        data: Optional[dict[Any, Any]],
+        headers: Optional[dict[Any, Any]],
+        binary_data: Optional[Union[bytes, BufferedReader]],
+        timeout: Optional[float],
+    ) -> Response:
         escaped_path = quote(path.strip("/"))
         if escaped_path:
             escaped_path = "/" + escaped_path
-        url = "{0}{1}".format(self.host, escaped_path)
         if query:
-            url = "{0}?{1}".format(url, urlencode(query))
+            escaped_path = "{0}?{1}".format(escaped_path, urlencode(query))
+        url = "{0}{1}".format(self.host, escaped_path)
         headers = dict(headers or DEFAULT_HEADERS, **self.auth_header)
         if data is not None:
             headers["Content-type"] = "application/json"
@@ -193,8 +267,103 @@ class Client:
             return self._request(
                 method, url, data=binary_data, headers=headers, timeout=timeout
             )
+        if method == "GET" and self.balancer is not None:
+            return self._balanced_get(self.balancer, escaped_path, headers, timeout)
         return self._request(method, url, data=data, headers=headers, timeout=timeout)
 
+    def _coalesced_get(
+        self,
+        read_cache: ReadCache,
+        path: str,
+        query: Optional[dict[Any, Any]],
+        timeout: Optional[float],
+    ) -> Response:
+        """
+        Single-flight GET. The first process fetches the endpoint and publishes the response
+        in the shared read cache. Processes asking for the same endpoint meanwhile wait on
+        the entry lock, and together with processes asking within coalesce_window seconds
+        get the published response instead of sending their own request.
+        """
+        key = "GET {0}".format(path.strip("/"))
+        if query:
+            key = "{0}?{1}".format(key, urlencode(sorted(query.items())))
+        cached = read_cache.get(key, max_age=read_cache.coalesce_window)
+        if cached is None:
+            with read_cache.lock(key):
+                # Response might have been published while we were waiting for the lock.
+                cached = read_cache.get(key, max_age=read_cache.coalesce_window)
+                if cached is None:
+                    fetched_at = time()
+                    response = self._send("GET", path, query, None, None, None, timeout)
+                    # Only successful responses are shared, errors are seen by each process.
+                    if response.status == 200:
+                        try:
+                            data = (
+                                response.data.decode("utf-8")
+                                if isinstance(response.data, bytes)
+                                else response.data
+                            )
+                        except UnicodeDecodeError:  # binary content
+                            return response
+                        read_cache.store(
+                            key,
+                            dict(status=200, data=data, headers=response.headers),
+                            fetched_at,
+                        )
+                    return response
+        return Response(cached["status"], cached["data"], cached["headers"])
+
+    def _discover_nodes(
+        self,
+        balancer: ReadBalancer,
+        headers: dict[Any, Any],
+        timeout: Optional[float],
+    ) -> None:
+        response = self._request(
+            "GET", self.host + "/rest/v1/Node", headers=headers, timeout=timeout
+        )
+        if response.status != 200:
+            raise UnexpectedAPIResponse(response=response)
+        balancer.set_nodes(
+            [node["lanIP"] for node in response.json if node.get("lanIP")]
+        )
+
+    def _balanced_get(
+        self,
+        balancer: ReadBalancer,
+        path: str,
+        headers: dict[Any, Any],
+        timeout: Optional[float],
+    ) -> Response:
+        """GET from one of the cluster nodes. If a node is not responding, next node is tried."""
+        if balancer.needs_discovery():
+            self._discover_nodes(balancer, headers, timeout)
+        hosts = balancer.get_hosts()
+        for host in hosts[:-1]:
+            start = time()
+            try:
+                response = self._request(
+                    "GET", host + path, headers=headers, timeout=timeout
+                )
+            except AuthError:
+                raise
+            except (ScaleComputingError, OSError):
+                # OSError covers refused/reset connections, timeouts and SSL errors.
+                balancer.report_failure(host)
+                continue
+            if response.status >= 500:
+                balancer.report_failure(host)
+                continue
+            balancer.report_success(host, time() - start)
+            return response
+        # Last resort (normally the primary host) - errors are raised to the caller.
+        start = time()
+        response = self._request(
+            "GET", hosts[-1] + path, headers=headers, timeout=timeout
+        )
+        balancer.report_success(hosts[-1], time() - start)
+        return response
+
     def get(
         self,
         path: str,
@@ -8,15 +8,50 @@ from __future__ import annotations
 
 __metaclass__ = type
 
-from time import sleep
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep, time
+
+from ansible.module_utils.six.moves.urllib.parse import urlparse
+
 from ..module_utils.utils import PayloadMapper
 from ..module_utils.rest_client import RestClient
-from ..module_utils.errors import ScaleTimeoutError
+from ..module_utils.errors import ScaleComputingError, ScaleTimeoutError
 from ..module_utils.typed_classes import TypedClusterToAnsible, TypedTaskTag
-from typing import Any
+from typing import Any, Optional
+
+# Seconds between rounds of connection probes while the cluster shuts down.
+SHUTDOWN_PROBE_INTERVAL = 5.0
+SHUTDOWN_PROBE_TIMEOUT = 5.0
+SHUTDOWN_TIMEOUT = 3600
+
+
+def probe_connection(host: str, port: int, timeout: float) -> Optional[str]:
+    """
+    Opens (and closes) a TCP connection, nothing is sent.
+    Returns None if host accepts connections, otherwise how the connection failed:
+    refused (host is up, API is not), timeout (packets are dropped, host is usually off)
+    or unreachable (no route to host).
+    """
+    try:
+        connection = socket.create_connection((host, port), timeout=timeout)
+    except ConnectionRefusedError:
+        return "refused"
+    except (socket.timeout, TimeoutError):
+        return "timeout"
+    except OSError:
+        return "unreachable"
+    connection.close()
+    return None
 
 
 class Cluster(PayloadMapper):
+    __slots__ = (
+        "uuid",
+        "name",
+        "icos_version",
+    )
+
     def __init__(self, uuid: str, name: str, icos_version: str):
         self.uuid = uuid
         self.name = name
@@ -76,8 +111,50 @@ class Cluster(PayloadMapper):
 
     @staticmethod
     def shutdown(
-        rest_client: RestClient, force_shutdown: bool = False, check_mode: bool = False
-    ) -> None:
+        rest_client: RestClient,
+        force_shutdown: bool = False,
+        check_mode: bool = False,
+        timeout: float = SHUTDOWN_TIMEOUT,
+        probe_timeout: float = SHUTDOWN_PROBE_TIMEOUT,
+    ) -> dict[str, Any]:
+        """
+        Requests cluster shutdown and waits until no node accepts API connections.
+
+        Nodes are listed once, before the shutdown request. Their API ports (and the
+        API host, if it is not a node address) are then checked with connect-only probes,
+        each limited to probe_timeout seconds, so nodes that silently drop packets
+        do not block the wait. Nodes unreachable already before the shutdown are not waited for.
+        Returns shutdown duration and, for every node, when and how it went down.
+        Raises ScaleComputingError if some node is still reachable after timeout seconds.
+        """
+        api = urlparse(rest_client.client.host)
+        port = api.port or (443 if api.scheme == "https" else 80)
+        nodes = [
+            dict(node_uuid=node_dict["uuid"], address=node_dict["lanIP"])
+            for node_dict in rest_client.list_records("/rest/v1/Node")
+        ]
+        if api.hostname not in [node["address"] for node in nodes]:
+            nodes.append(dict(node_uuid=None, address=api.hostname))
+
+        def probe_all(pending: list[dict[str, Any]]) -> list[Optional[str]]:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                return list(
+                    executor.map(
+                        lambda node: probe_connection(
+                            node["address"], port, probe_timeout
+                        ),
+                        pending,
+                    )
+                )
+
+        for node, failure in zip(nodes, probe_all(nodes)):
+            node.update(
+                reachable_before_shutdown=failure is None,
+                down_after=None,
+                went_down=None,
+            )
+
+        started = time()
         try:
             rest_client.create_record(
                 "/rest/v1/Cluster/shutdown",
@@ -87,11 +164,26 @@ class Cluster(PayloadMapper):
         # To avoid timeout when there are a lot of VMs to shutdown
         except ScaleTimeoutError:
             pass
+        if check_mode:
+            return dict(duration=0.0, nodes=nodes)
 
-        try:
-            while True:
-                # get cluster until "[Errno 111] Connection refused"
-                Cluster.get(rest_client)
-                sleep(5)
-        except ConnectionRefusedError:
-            pass
+        while True:
+            pending = [
+                node
+                for node in nodes
+                if node["reachable_before_shutdown"] and node["went_down"] is None
+            ]
+            if not pending:
+                return dict(duration=round(time() - started, 1), nodes=nodes)
+            remaining = started + timeout - time()
+            if remaining <= 0:
+                raise ScaleComputingError(
+                    "Cluster did not shut down in {0} seconds, still reachable: {1}".format(
+                        timeout, ", ".join(node["address"] for node in pending)
+                    )
+                )
+            sleep(min(SHUTDOWN_PROBE_INTERVAL, remaining))
+            for node, failure in zip(pending, probe_all(pending)):
+                if failure:
+                    node["down_after"] = round(time() - started, 1)
+                    node["went_down"] = failure
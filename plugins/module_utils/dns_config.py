@@ -12,6 +12,13 @@ from ..module_utils import errors
 
 
 class DNSConfig(PayloadMapper):
+    __slots__ = (
+        "uuid",
+        "search_domains",
+        "server_ips",
+        "latest_task_tag",
+    )
+
     def __init__(
         self,
         uuid: str = None,
@@ -22,6 +22,15 @@ from typing import Union, Any, Dict, Optional
 
 
 class EmailAlert(PayloadMapper):
+    __slots__ = (
+        "uuid",
+        "alert_tag_uuid",
+        "email",
+        "resend_delay",
+        "silent_period",
+        "latest_task_tag",
+    )
+
     def __init__(
         self,
         uuid: Optional[str] = None,
@@ -7,7 +7,7 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-from typing import Union
+from typing import Any, Dict, List, Union
 from ansible.module_utils.urls import Request
 
 
@@ -111,3 +111,11 @@ class ScaleTimeoutError(ScaleComputingError):
     def __init__(self, data: Union[str, Exception]):
         self.message = f"Request timed out: {data}."
         super(ScaleTimeoutError, self).__init__(self.message)
+
+
+class BulkError(ScaleComputingError):
+    # Some operations of a bulk module failed, records describe all operations.
+    def __init__(self, message: str, records: List[Dict[str, Any]]):
+        self.message = message
+        self.records = records
+        super(BulkError, self).__init__(self.message)
@@ -11,8 +11,10 @@ __metaclass__ = type
 import operator
 import re
 from functools import total_ordering
+from time import sleep, time
 from ansible.module_utils.basic import AnsibleModule
 from typing import List
+from ..module_utils import errors
 from ..module_utils.utils import PayloadMapper
 from ..module_utils.rest_client import RestClient
 from ..module_utils.typed_classes import (
@@ -31,9 +33,10 @@ class HyperCoreVersion:
     - PATCH for cluster name
     """
 
-    def __init__(self, rest_client: RestClient):
+    def __init__(self, rest_client: RestClient, version: str = ""):
+        # version - icosVersion, if the Cluster record was already read
         self._rest_client = rest_client
-        self._version = ""
+        self._version = version
 
     @property
     def version(self) -> str:
@@ -154,6 +157,17 @@ class VersionSpec(VersionSpecBase):
 
 
 class Update(PayloadMapper):
+    __slots__ = (
+        "uuid",
+        "description",
+        "change_log",
+        "build_id",
+        "major_version",
+        "minor_version",
+        "revision",
+        "timestamp",
+    )
+
     def __init__(
         self,
         uuid: str,
@@ -251,7 +265,26 @@ class Update(PayloadMapper):
         )
 
 
+# Update status polling interval grows from MIN to MAX seconds while nothing changes.
+UPDATE_STATUS_MIN_INTERVAL = 2.0
+UPDATE_STATUS_MAX_INTERVAL = 30.0
+UPDATE_STATUS_BACKOFF = 1.5
+# masterState values after which the update is not running any more.
+UPDATE_FINISHED_STATES = ("COMPLETE", "TERMINATING")
+
+
 class UpdateStatus(PayloadMapper):
+    __slots__ = (
+        "prepare_status",
+        "update_status",
+        "from_build",
+        "to_build",
+        "to_version",
+        "percent",
+        "update_status_details",
+        "usernotes",
+    )
+
     def __init__(
         self,
         prepare_status: str,
@@ -338,3 +371,89 @@ class UpdateStatus(PayloadMapper):
         if response.status == 404:  # .get() lets 200 and 404 through
             return None
         return cls.from_hypercore(response.json)
+
+    def is_for(self, to_version: str) -> bool:
+        """Status file is kept after an update, it might describe a previous update."""
+        return (
+            self.to_version == to_version or self.to_build == to_version.split(".")[-1]
+        )
+
+    @classmethod
+    def wait(
+        cls,
+        rest_client: RestClient,
+        to_version: str,
+        timeout: float,
+    ) -> tuple[UpdateStatus, list[dict[str, Any]]]:
+        """
+        Polls update status until update to to_version has finished.
+
+        HyperCore API restarts during an update, so connection errors, timeouts and
+        5xx responses are recorded and polling continues.
+        Authentication errors and other unexpected responses are raised.
+        The polling interval grows while status does not change, and is reset on every change.
+        Returns the final status, and a timeline of status changes -
+        seconds since start, update_status, percent and details, or error while API is unreachable.
+        Raises ScaleComputingError if update has not finished in timeout seconds.
+        """
+        start = time()
+        timeline: list[dict[str, Any]] = []
+        last_event: Optional[tuple[Any, ...]] = None
+        interval = UPDATE_STATUS_MIN_INTERVAL
+        while True:
+            try:
+                status = cls.get(rest_client)
+                error = None
+            except errors.AuthError:
+                raise
+            except errors.UnexpectedAPIResponse as e:
+                # API restart is reported with 5xx, client errors will not go away.
+                if e.response_status < 500:
+                    raise
+                status = None
+                error = str(e)
+            except (errors.ScaleComputingError, OSError, ValueError) as e:
+                # Connection refused/reset, timeouts and partial responses while API restarts.
+                status = None
+                error = str(e) or type(e).__name__
+            if status is not None and not status.is_for(to_version):
+                status = None  # Update was not picked up yet.
+            if error:
+                event: tuple[Any, ...] = ("unreachable", error)
+            elif status:
+                event = (
+                    status.update_status,
+                    status.percent,
+                    status.update_status_details,
+                )
+            else:
+                event = ("pending",)
+            if event != last_event:
+                entry: dict[str, Any] = dict(time=round(time() - start, 1))
+                if error:
+                    entry.update(update_status=None, error=error)
+                elif status:
+                    entry.update(
+                        update_status=status.update_status,
+                        percent=status.percent,
+                        update_status_details=status.update_status_details,
+                    )
+                else:
+                    entry.update(update_status=None)
+                timeline.append(entry)
+                last_event = event
+                interval = UPDATE_STATUS_MIN_INTERVAL
+            else:
+                interval = min(
+                    interval * UPDATE_STATUS_BACKOFF, UPDATE_STATUS_MAX_INTERVAL
+                )
+            if status and status.update_status in UPDATE_FINISHED_STATES:
+                return status, timeline
+            remaining = start + timeout - time()
+            if remaining <= 0:
+                raise errors.ScaleComputingError(
+                    "Update to {0} did not finish in {1} seconds. Last status: {2}".format(
+                        to_version, timeout, timeline[-1]
+                    )
+                )
+            sleep(min(interval, remaining))
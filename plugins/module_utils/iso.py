@@ -13,6 +13,15 @@ from ..module_utils.utils import get_query
 
 
 class ISO(PayloadMapper):
+    __slots__ = (
+        "uuid",
+        "name",
+        "size",
+        "mounts",
+        "ready_for_insert",
+        "path",
+    )
+
     # Variables in ISO are written in ansible-native format
     def __init__(
         self, name, uuid=None, size=-1, mounts=None, ready_for_insert=False, path=None
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+from __future__ import annotations
+
+__metaclass__ = type
+
+import fcntl
+import os
+from contextlib import contextmanager
+from time import sleep, time
+from typing import Any, Iterator, Optional, IO
+
+from ..module_utils.errors import ScaleComputingError
+from ..module_utils.utils import get_state_dir
+
+# How often a process without a free slot checks the slots again.
+SLOT_POLL_INTERVAL = 0.05
+
+
+def open_lock_file(path: str) -> IO[str]:
+    # Lock files are private to the user, like the rest of the state dir.
+    return os.fdopen(os.open(path, os.O_RDWR | os.O_CREAT, 0o600), "r+")
+
+
+@contextmanager
+def file_lock(path: str, shared: bool = False) -> Iterator[IO[str]]:
+    """
+    Blocking advisory lock on a file, shared between processes on the same machine.
+    Lock is released by the kernel also if the process holding it dies.
+    """
+    with open_lock_file(path) as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield lock_file
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class ClusterLimiter:
+    """
+    Limits requests sent to a single HyperCore cluster across all module processes.
+    With forks=50 every fork is a separate AnsiballZ process, so limits are
+    implemented with lock files in the shared state dir:
+    - max_concurrent_requests - semaphore with one lock file per slot.
+    - max_requests_per_second - token bucket, where the bucket is a timestamp
+      of the next free request slot.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        max_concurrent_requests: Optional[int] = None,
+        max_requests_per_second: Optional[float] = None,
+    ):
+        if max_concurrent_requests is not None and max_concurrent_requests < 1:
+            raise ScaleComputingError("max_concurrent_requests must be at least 1.")
+        if max_requests_per_second is not None and max_requests_per_second <= 0:
+            raise ScaleComputingError("max_requests_per_second must be greater than 0.")
+        self.host = host
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_requests_per_second = max_requests_per_second
+        self.lock_dir = get_state_dir(host, "limiter")
+        # Statistics, reported back in module result.
+        self.requests = 0
+        self.wait_time = 0.0
+
+    @classmethod
+    def get_limiter(
+        cls,
+        host: str,
+        max_concurrent_requests: Optional[int] = None,
+        max_requests_per_second: Optional[float] = None,
+    ) -> Optional[ClusterLimiter]:
+        # Limiter is opt-in, without limits requests are sent as before.
+        if not max_concurrent_requests and not max_requests_per_second:
+            return None
+        return cls(
+            host,
+            max_concurrent_requests=max_concurrent_requests or None,
+            max_requests_per_second=max_requests_per_second or None,
+        )
+
+    @contextmanager
+    def acquire(self) -> Iterator[None]:
+        start = time()
+        slot = self._acquire_slot()
+        try:
+            self._wait_for_rate()
+            self.wait_time += time() - start
+            self.requests += 1
+            yield
+        finally:
+            if slot is not None:
+                fcntl.flock(slot, fcntl.LOCK_UN)
+                slot.close()
+
+    def _acquire_slot(self) -> Optional[IO[str]]:
+        if not self.max_concurrent_requests:
+            return None
+        while True:
+            for slot_id in range(self.max_concurrent_requests):
+                slot = open_lock_file(os.path.join(self.lock_dir, f"slot-{slot_id}"))
+                try:
+                    fcntl.flock(slot, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:  # Slot is taken by some other request
+                    slot.close()
+                    continue
+                return slot
+            sleep(SLOT_POLL_INTERVAL)
+
+    def _wait_for_rate(self) -> None:
+        if not self.max_requests_per_second:
+            return
+        interval = 1.0 / self.max_requests_per_second
+        with file_lock(os.path.join(self.lock_dir, "rate")) as rate_file:
+            rate_file.seek(0)
+            try:
+                next_free = float(rate_file.read() or 0)
+            except ValueError:  # Corrupted/partial content, start over
+                next_free = 0.0
+            now = time()
+            scheduled = max(now, next_free)
+            rate_file.seek(0)
+            rate_file.truncate()
+            rate_file.write(repr(scheduled + interval))
+            rate_file.flush()
+        # Sleep outside of the lock, so other processes can reserve their slots.
+        if scheduled > now:
+            sleep(scheduled - now)
+
+    def to_ansible(self) -> dict[str, Any]:
+        return dict(
+            max_concurrent_requests=self.max_concurrent_requests,
+            max_requests_per_second=self.max_requests_per_second,
+            requests=self.requests,
+            wait_time=round(self.wait_time, 3),
+        )
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+from __future__ import annotations
+
+__metaclass__ = type
+
+import json
+import os
+from time import time
+from typing import Any, Optional, Callable
+
+from ansible.module_utils.six.moves.urllib.parse import urlparse
+
+from ..module_utils.errors import ScaleComputingError
+from ..module_utils.limiter import file_lock
+from ..module_utils.utils import get_state_dir
+
+READ_BALANCING_STRATEGIES = ("round_robin", "least_latency")
+
+# Node list rarely changes, it is rediscovered after this many seconds.
+NODE_DISCOVERY_TTL = 300
+# Node that did not respond is skipped for this many seconds, then it is tried again.
+NODE_DOWN_PERIOD = 60
+# Weight of the newest sample in exponentially weighted average latency.
+LATENCY_SMOOTHING = 0.3
+
+
+class ReadBalancer:
+    """
+    Spreads GET requests over all nodes of a cluster.
+    Node addresses (lanIP from /rest/v1/Node) and node health are shared between
+    all forks through a json file in the shared state dir, so discovery is done
+    only once per NODE_DISCOVERY_TTL.
+    The shared state is read once per process and kept in memory. It is written only
+    after discovery and when health of a node changes (node went down or came back),
+    latency and round robin position are kept per process.
+    Writes are never balanced - Client sends them to the primary host.
+    """
+
+    def __init__(self, host: str, strategy: str):
+        if strategy not in READ_BALANCING_STRATEGIES:
+            raise ScaleComputingError(
+                "Invalid read_balancing value: '{0}'. Value must be one of {1}.".format(
+                    strategy, ", ".join(READ_BALANCING_STRATEGIES)
+                )
+            )
+        self.host = host
+        self.strategy = strategy
+        state_dir = get_state_dir(host, "balancer")
+        self.state_path = os.path.join(state_dir, "nodes.json")
+        self.lock_path = os.path.join(state_dir, "nodes.lock")
+        self._state: Optional[dict[str, Any]] = None
+        # Forks start round robin on different nodes.
+        self._next = os.getpid()
+
+    @classmethod
+    def get_balancer(
+        cls, host: str, strategy: Optional[str] = None
+    ) -> Optional[ReadBalancer]:
+        # Balancing is opt-in, without it all requests go to the primary host.
+        if not strategy:
+            return None
+        return cls(host, strategy)
+
+    def node_host(self, lan_ip: str) -> str:
+        # Keep scheme and port of the primary host - https://10.0.0.1:443 -> https://10.0.0.2:443
+        primary = urlparse(self.host)
+        if primary.port:
+            return "{0}://{1}:{2}".format(primary.scheme, lan_ip, primary.port)
+        return "{0}://{1}".format(primary.scheme, lan_ip)
+
+    @property
+    def state(self) -> dict[str, Any]:
+        if self._state is None:
+            self._state = self._read_state()
+        return self._state
+
+    def _update_state(self, update: Callable[[dict[str, Any]], None]) -> None:
+        """
+        Applies update to the state in memory and to the shared state.
+        Shared state is read-modify-written under a lock, so changes from other
+        processes are kept.
+        """
+        update(self.state)
+        with file_lock(self.lock_path):
+            state = self._read_state()
+            update(state)
+            tmp_path = "{0}.{1}".format(self.state_path, os.getpid())
+            with open(tmp_path, "w") as state_file:
+                json.dump(state, state_file)
+            os.replace(tmp_path, self.state_path)
+
+    def _read_state(self) -> dict[str, Any]:
+        try:
+            with open(self.state_path) as state_file:
+                state: dict[str, Any] = json.load(state_file)
+        except (OSError, ValueError):
+            state = {}
+        state.setdefault("discovered", 0)
+        state.setdefault("nodes", {})
+        return state
+
+    def needs_discovery(self) -> bool:
+        return (
+            not self.state["nodes"]
+            or time() - self.state["discovered"] > NODE_DISCOVERY_TTL
+        )
+
+    def set_nodes(self, lan_ips: list[str]) -> None:
+        discovered = time()
+
+        def update(state: dict[str, Any]) -> None:
+            old_nodes = state["nodes"]
+            state["nodes"] = {}
+            for lan_ip in lan_ips:
+                node = self.node_host(lan_ip)
+                # Keep known latency and health of nodes that are still present
+                state["nodes"][node] = old_nodes.get(
+                    node, dict(latency=None, down_until=0)
+                )
+            state["discovered"] = discovered
+
+        self._update_state(update)
+
+    def get_hosts(self) -> list[str]:
+        """
+        Returns hosts in the order in which they should be tried for the next GET.
+        Healthy nodes come first (ordered by strategy), primary host is always the last resort.
+        """
+        nodes = self.state["nodes"]
+        now = time()
+        hosts = [
+            node for node, info in sorted(nodes.items()) if info["down_until"] <= now
+        ]
+        if self.strategy == "least_latency":
+            # Nodes without measurement first, so every node gets measured.
+            hosts.sort(
+                key=lambda node: (
+                    nodes[node]["latency"] is not None,
+                    nodes[node]["latency"] or 0,
+                )
+            )
+        elif hosts:
+            start = self._next % len(hosts)
+            hosts = hosts[start:] + hosts[:start]
+            self._next = start + 1
+        if self.host not in hosts:
+            hosts.append(self.host)
+        return hosts
+
+    def report_success(self, node: str, latency: float) -> None:
+        info = self.state["nodes"].get(node)
+        if info is None:  # primary host, which is not a discovered node
+            return
+        if info["latency"] is None:
+            info["latency"] = latency
+        else:
+            info["latency"] = (
+                LATENCY_SMOOTHING * latency + (1 - LATENCY_SMOOTHING) * info["latency"]
+            )
+        if not info["down_until"]:
+            return
+
+        def update(state: dict[str, Any]) -> None:
+            # Node is back, share it with other processes.
+            shared = state["nodes"].get(node)
+            if shared is not None:
+                shared["down_until"] = 0
+
+        self._update_state(update)
+
+    def report_failure(self, node: str) -> None:
+        info = self.state["nodes"].get(node)
+        now = time()
+        if info is None or info["down_until"] > now:  # Already known to be down
+            return
+        down_until = now + NODE_DOWN_PERIOD
+
+        def update(state: dict[str, Any]) -> None:
+            shared = state["nodes"].get(node)
+            if shared is not None:
+                shared["down_until"] = down_until
+                shared["latency"] = None
+
+        self._update_state(update)
@@ -35,6 +35,18 @@ class NicType:
 
 
 class Nic(PayloadMapper):
+    __slots__ = (
+        "uuid",
+        "vm_uuid",
+        "type",
+        "mac",
+        "mac_new",
+        "vlan",
+        "vlan_new",
+        "connected",
+        "ipv4Addresses",
+    )
+
     def __init__(self):
         self.uuid = None
         self.vm_uuid = None
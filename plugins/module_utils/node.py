@@ -8,10 +8,21 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from ..module_utils import errors
+from ..module_utils.record_store import RecordStore
 from ..module_utils.utils import PayloadMapper
 
+NODE_ENDPOINT = "/rest/v1/Node"
+
 
 class Node(PayloadMapper):
+    __slots__ = (
+        "node_uuid",
+        "backplane_ip",
+        "lan_ip",
+        "peer_id",
+    )
+
     def __init__(self, node_uuid, backplane_ip, lan_ip, peer_id):
         self.node_uuid = node_uuid
         self.backplane_ip = backplane_ip
@@ -60,9 +71,49 @@ class Node(PayloadMapper):
         )
 
     @classmethod
-    def get_node(cls, query, rest_client, must_exist=False):
+    def get_node(cls, query, rest_client, must_exist=False, node_directory=None):
+        if node_directory:
+            return node_directory.get(query, must_exist=must_exist)
         hypercore_dict = rest_client.get_record(
-            "/rest/v1/Node", query, must_exist=must_exist
+            NODE_ENDPOINT, query, must_exist=must_exist
         )
         node_from_hypercore = cls.from_hypercore(hypercore_dict)
         return node_from_hypercore
+
+
+class NodeDirectory:
+    """
+    All cluster nodes, listed on the first lookup and indexed by the queried keys
+    (uuid, backplaneIP, lanIP, peerID or their combination).
+    Lookups match the same nodes as RestClient.get_record on /rest/v1/Node.
+    Create one per module invocation and pass it to Node.get_node.
+    """
+
+    def __init__(self, rest_client):
+        self.rest_client = rest_client
+        self._store = None
+
+    @property
+    def store(self):
+        if self._store is None:
+            self._store = RecordStore(self.rest_client.list_records(NODE_ENDPOINT))
+        return self._store
+
+    def get(self, query, must_exist=False):
+        node_dicts = self.store.find(query)
+        if len(node_dicts) > 1:
+            raise errors.ScaleComputingError(
+                "{0} records from endpoint {1} match the {2} query.".format(
+                    len(node_dicts), NODE_ENDPOINT, query
+                )
+            )
+        if must_exist and not node_dicts:
+            raise errors.ScaleComputingError(
+                "No records from endpoint {0} match the {1} query.".format(
+                    NODE_ENDPOINT, query
+                )
+            )
+        return Node.from_hypercore(node_dicts[0]) if node_dicts else None
+
+    def list(self):
+        return [Node.from_hypercore(node_dict) for node_dict in self.store]
@@ -21,6 +21,15 @@ from typing import Any, Optional
 
 
 class Oidc(PayloadMapper):
+    __slots__ = (
+        "uuid",
+        "client_id",
+        "config_url",
+        "certificate",
+        "shared_secret",
+        "scopes",
+    )
+
     def __init__(
         self,
         uuid: Optional[str] = None,
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+from __future__ import annotations
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from time import time
+from typing import Any, Iterator, IO, Optional
+
+from ..module_utils.limiter import file_lock
+from ..module_utils.utils import get_state_dir
+
+DEFAULT_CACHE_MAX_SIZE = 64 * 1024 * 1024  # bytes
+# Polled endpoints, their content must always be fresh.
+NEVER_CACHED_ENDPOINTS = ("/rest/v1/TaskTag",)
+# Modification time of this file is the time of the last write through the collection.
+INVALIDATED_MARKER = "invalidated"
+
+
+class ReadCache:
+    """
+    Cache of GET responses, shared by all module invocations against the same host.
+    Every endpoint is stored as one json file in the shared state dir.
+    File mtime is the time when the response was fetched, atime is the last use
+    (used for LRU eviction when the cache grows over max_size).
+    Any write request (POST, PATCH, PUT, DELETE) invalidates the whole cache of the host.
+
+    Entries are kept per credentials (hash of username and password), so a response
+    fetched with one account is never returned to a client that did not authenticate
+    with the same account. Invalidation marker is shared by all credentials of the host.
+    All files are created with mode 0600.
+
+    The same entries are used for single-flight coalescing of identical GET requests
+    (coalesce_window) - see Client._coalesced_get.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        username: str = "",
+        password: str = "",
+        ttl: Optional[float] = None,
+        endpoint_ttl: Optional[dict[str, float]] = None,
+        max_size: Optional[int] = None,
+        coalesce_window: Optional[float] = None,
+    ):
+        self.host = host
+        self.ttl = ttl or 0
+        # Longest prefix first, so the most specific TTL wins.
+        self.endpoint_ttl = sorted(
+            (
+                ("/" + endpoint.strip("/"), float(seconds))
+                for endpoint, seconds in (endpoint_ttl or {}).items()
+            ),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self.max_size = DEFAULT_CACHE_MAX_SIZE if max_size is None else max_size
+        self.coalesce_window = coalesce_window or 0
+        self.marker_path = os.path.join(
+            get_state_dir(host, "cache"), INVALIDATED_MARKER
+        )
+        self.cache_dir = get_state_dir(
+            host, "cache", self.credentials_key(username, password)
+        )
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def get_cache(
+        cls,
+        host: str,
+        username: str = "",
+        password: str = "",
+        ttl: Optional[float] = None,
+        endpoint_ttl: Optional[dict[str, float]] = None,
+        max_size: Optional[int] = None,
+        coalesce_window: Optional[float] = None,
+    ) -> Optional[ReadCache]:
+        # Persistent cache and coalescing are opt-in.
+        if not ttl and not endpoint_ttl and not coalesce_window:
+            return None
+        return cls(
+            host,
+            username=username,
+            password=password,
+            ttl=ttl,
+            endpoint_ttl=endpoint_ttl,
+            max_size=max_size,
+            coalesce_window=coalesce_window,
+        )
+
+    @staticmethod
+    def credentials_key(username: str, password: str) -> str:
+        credentials = "{0}\0{1}".format(username, password)
+        return hashlib.sha256(credentials.encode("utf-8")).hexdigest()[:32]
+
+    @staticmethod
+    def is_never_cached(endpoint: str) -> bool:
+        path = "/" + endpoint.strip("/")
+        return any(
+            path == prefix or path.startswith(prefix + "/")
+            for prefix in NEVER_CACHED_ENDPOINTS
+        )
+
+    def get_ttl(self, endpoint: str) -> float:
+        if self.is_never_cached(endpoint):
+            return 0
+        path = "/" + endpoint.strip("/")
+        for prefix, ttl in self.endpoint_ttl:
+            if path == prefix or path.startswith(prefix + "/"):
+                return ttl
+        return self.ttl
+
+    def _entry_path(self, endpoint: str) -> str:
+        key = hashlib.sha1(endpoint.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def _invalidated_at(self) -> float:
+        try:
+            return os.stat(self.marker_path).st_mtime
+        except OSError:
+            return 0
+
+    def get(self, endpoint: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """Returns cached records, or None if there is no fresh entry for endpoint."""
+        if max_age is None:
+            max_age = self.get_ttl(endpoint)
+        if max_age <= 0:
+            return None
+        path = self._entry_path(endpoint)
+        try:
+            stored_at = os.stat(path).st_mtime
+            if time() - stored_at > max_age or stored_at < self._invalidated_at():
+                self.misses += 1
+                return None
+            with open(path) as entry_file:
+                entry = json.load(entry_file)
+            # Mark entry as recently used, keep mtime as time of fetch.
+            os.utime(path, (time(), stored_at))
+        except (OSError, ValueError):  # Missing, evicted or partially written entry
+            self.misses += 1
+            return None
+        if entry.get("endpoint") != endpoint:  # hash collision
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry["records"]
+
+    def put(self, endpoint: str, records: Any, fetched_at: float) -> None:
+        """Stores records, if endpoint is cached."""
+        if self.get_ttl(endpoint) <= 0:
+            return
+        self.store(endpoint, records, fetched_at)
+
+    def store(self, key: str, records: Any, fetched_at: float) -> None:
+        """
+        Stores records that were fetched (request was sent) at fetched_at.
+        Records fetched before the last write are not stored, they might be stale.
+        """
+        if fetched_at < self._invalidated_at():
+            return
+        # Write to temporary file and rename, readers never see partial entry.
+        # mkstemp creates the file with mode 0600.
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(dict(endpoint=key, records=records), tmp_file)
+            os.utime(tmp_path, (time(), fetched_at))
+            os.replace(tmp_path, self._entry_path(key))
+        except OSError:
+            # Cache is best effort, failing to store an entry is not an error.
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._evict()
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[IO[str]]:
+        """Exclusive lock of a single entry, held while the entry is being fetched."""
+        with file_lock(self._entry_path(key)[: -len(".json")] + ".lock") as lock_file:
+            yield lock_file
+
+    def invalidate(self) -> None:
+        os.close(os.open(self.marker_path, os.O_WRONLY | os.O_CREAT, 0o600))
+        now = time()
+        os.utime(self.marker_path, (now, now))
+        for entry_path in self._entries():
+            try:
+                os.remove(entry_path)
+            except OSError:  # Already removed by other process
+                pass
+
+    def _entries(self) -> list[str]:
+        return [
+            os.path.join(self.cache_dir, name)
+            for name in os.listdir(self.cache_dir)
+            if name.endswith(".json")
+        ]
+
+    def _evict(self) -> None:
+        entries = []
+        total_size = 0
+        for entry_path in self._entries():
+            try:
+                stat = os.stat(entry_path)
+            except OSError:
+                continue
+            entries.append((stat.st_atime, stat.st_size, entry_path))
+            total_size += stat.st_size
+        # Least recently used first
+        for _atime, size, entry_path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
+            total_size -= size
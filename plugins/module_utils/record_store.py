@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+from __future__ import annotations
+
+__metaclass__ = type
+
+from typing import Any, Iterable, Iterator, Optional
+
+# Separator of nested key paths - "remoteClusterInfo.clusterName"
+PATH_SEPARATOR = "."
+
+# Returned by get_value for missing keys, so that None values can still be matched.
+_MISSING = object()
+
+
+def get_value(record: Any, key: str) -> Any:
+    """
+    Returns record[key]. Key with dots is a path into nested dicts,
+    "remoteClusterInfo.clusterName" -> record["remoteClusterInfo"]["clusterName"].
+    Returns _MISSING if the key (or any part of the path) does not exist.
+    """
+    if not isinstance(record, dict):
+        return _MISSING
+    if key in record:
+        return record[key]
+    if PATH_SEPARATOR not in key:
+        return _MISSING
+    value = record
+    for part in key.split(PATH_SEPARATOR):
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class RecordStore:
+    """
+    In-memory collection of records (dicts) with hash indexes.
+    Index for a combination of queried keys (uuid, name, slot+type, ...) is built on
+    the first query using those keys, later queries are dict lookups instead of scans.
+    Matching is the same as utils.is_superset - record matches the query if it contains
+    all queried keys with equal values. Keys can be nested paths.
+    Records must not be modified while the store is in use.
+    """
+
+    def __init__(self, records: Optional[Iterable[dict[Any, Any]]] = None):
+        self.records: list[dict[Any, Any]] = list(records or [])
+        self._indexes: dict[tuple[str, ...], dict[tuple[Any, ...], list[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[dict[Any, Any]]:
+        return iter(self.records)
+
+    def _index(self, keys: tuple[str, ...]) -> dict[tuple[Any, ...], list[int]]:
+        index = self._indexes.get(keys)
+        if index is None:
+            index = {}
+            for position, record in enumerate(self.records):
+                values = tuple(get_value(record, key) for key in keys)
+                if any(value is _MISSING for value in values):
+                    continue
+                if not _is_hashable(values):
+                    # Such record can't be matched by a hashable query value anyway.
+                    continue
+                index.setdefault(values, []).append(position)
+            self._indexes[keys] = index
+        return index
+
+    def positions(self, query: Optional[dict[str, Any]] = None) -> list[int]:
+        """Returns positions of all records matching the query, in ascending order."""
+        if not query:
+            return list(range(len(self.records)))
+        keys = tuple(sorted(query))
+        values = tuple(query[key] for key in keys)
+        if not _is_hashable(values):
+            # Lists/dicts in the query can't be indexed, compare each record.
+            return [
+                position
+                for position, record in enumerate(self.records)
+                if all(get_value(record, key) == query[key] for key in keys)
+            ]
+        return list(self._index(keys).get(values, []))
+
+    def find(self, query: Optional[dict[str, Any]] = None) -> list[dict[Any, Any]]:
+        """Returns all records matching the query, in the original order."""
+        return [self.records[position] for position in self.positions(query)]
+
+    def find_one(
+        self, query: Optional[dict[str, Any]] = None
+    ) -> Optional[dict[Any, Any]]:
+        """Returns the first record matching the query, or None."""
+        records = self.find(query)
+        return records[0] if records else None
@@ -21,6 +21,18 @@ from typing import Any, Optional
 
 
 class Registration(PayloadMapper):
+    __slots__ = (
+        "uuid",
+        "company_name",
+        "contact",
+        "phone",
+        "email",
+        "cluster_id",
+        "cluster_data",
+        "cluster_data_hash",
+        "cluster_data_hash_accepted",
+    )
+
     def __init__(
         self,
         uuid: Optional[str] = None,
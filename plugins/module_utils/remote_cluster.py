@@ -12,6 +12,14 @@ from ..module_utils.utils import PayloadMapper
 
 
 class RemoteCluster(PayloadMapper):
+    __slots__ = (
+        "name",
+        "connection_status",
+        "replication_ok",
+        "remote_node_ips",
+        "remote_node_uuids",
+    )
+
     def __init__(
         self,
         name,
@@ -10,12 +10,20 @@ __metaclass__ = type
 
 from ..module_utils.utils import PayloadMapper
 from ..module_utils.state import ReplicationState
-from ..module_utils.remote_cluster import RemoteCluster
 from ..module_utils.vm import VM
 from ..module_utils import errors
 
 
 class Replication(PayloadMapper):
+    __slots__ = (
+        "vm_uuid",
+        "vm_name",
+        "replication_uuid",
+        "state",
+        "remote_cluster",
+        "connection_uuid",
+    )
+
     def __init__(self):
         self.vm_uuid = None
         self.vm_name = None
@@ -25,18 +33,15 @@ class Replication(PayloadMapper):
         self.connection_uuid = None
 
     @classmethod
-    def _replication(cls, rest_client, replication_dict):
+    def _replication(cls, replication_dict, vm_names, cluster_names):
         # Adds remote_cluster name and vm_name to the replication dict
-        virtual_machine = VM.get_or_fail(
-            query={"uuid": replication_dict["sourceDomainUUID"]},
-            rest_client=rest_client,
-        )[0]
-        replication_dict[
-            "remote_cluster"
-        ] = RemoteCluster.get_cluster_name_from_replication_connection_uuid(
-            rest_client, replication_dict["connectionUUID"]
+        vm_uuid = replication_dict["sourceDomainUUID"]
+        if vm_uuid not in vm_names:
+            raise errors.VMNotFound({"uuid": vm_uuid})
+        replication_dict["remote_cluster"] = cluster_names.get(
+            replication_dict["connectionUUID"]
         )
-        replication_dict["vm_name"] = virtual_machine.name
+        replication_dict["vm_name"] = vm_names[vm_uuid]
         return replication_dict
 
     @classmethod
@@ -53,9 +58,21 @@ class Replication(PayloadMapper):
         )
         if not record:
             return []
+        # VMs and cluster connections are read once and joined in memory,
+        # not looked up for each replication.
+        vm_names = VM.get_name_index(rest_client)
+        cluster_names = {
+            cluster_connection["uuid"]: cluster_connection["remoteClusterInfo"][
+                "clusterName"
+            ]
+            for cluster_connection in rest_client.list_records(
+                endpoint="/rest/v1/RemoteClusterConnection",
+                query=None,
+            )
+        }
         return [
             cls.from_hypercore(
-                hypercore_data=cls._replication(rest_client, replication)
+                hypercore_data=cls._replication(replication, vm_names, cluster_names)
             )
             for replication in record
         ]
@@ -9,12 +9,14 @@ from __future__ import annotations
 from . import errors
 from . import utils
 from ..module_utils.client import Client
+from ..module_utils.record_store import RecordStore
 from ..module_utils.typed_classes import TypedTaskTag
 
 __metaclass__ = type
 
 from typing import Any, Optional, Union
 from io import BufferedReader
+from time import time
 import json
 
 
@@ -40,7 +42,11 @@ class RestClient:
             records = self.client.get(path=endpoint, timeout=timeout).json
         except TimeoutError as e:
             raise errors.ScaleTimeoutError(e)
-        return utils.filter_results(records, query)
+        return RecordStore(records).find(query)
+
+    def release(self, endpoint: str) -> None:
+        """Forget records of endpoint kept by the client. RestClient keeps nothing."""
+        pass
 
     def get_record(
         self,
@@ -142,10 +148,13 @@ class RestClient:
 class CachedRestClient(RestClient):
     # Use ONLY in case, that all task operations are read only. Should hould for all _info
     # modules.
+    # If Client has persistent read cache enabled (cluster_instance.cache_ttl),
+    # responses are also shared with other module invocations.
 
     def __init__(self, client: Client):
         super().__init__(client)
-        self.cache: dict[Any, Any] = dict()
+        # endpoint -> RecordStore, indexes are reused by repeated queries
+        self.cache: dict[str, RecordStore] = dict()
 
     def list_records(
         self,
@@ -153,13 +162,27 @@ class CachedRestClient(RestClient):
         query: Optional[dict[Any, Any]] = None,
         timeout: Optional[float] = None,
     ) -> list[Any]:
-        if endpoint in self.cache:
-            records = self.cache[endpoint]
-        else:
-            try:
-                records = self.client.get(path=endpoint, timeout=timeout).json
-            except TimeoutError as e:
-                raise errors.ScaleTimeoutError(e)
-            self.cache[endpoint] = records
-
-        return utils.filter_results(records, query)
+        if endpoint not in self.cache:
+            self.cache[endpoint] = RecordStore(self._get_records(endpoint, timeout))
+        return self.cache[endpoint].find(query)
+
+    def release(self, endpoint: str) -> None:
+        # After the last lookup, so that large listings can be garbage collected.
+        self.cache.pop(endpoint, None)
+
+    def _get_records(self, endpoint: str, timeout: Optional[float]) -> list[Any]:
+        # Persistent cache (if enabled) is shared with other module invocations.
+        read_cache = self.client.read_cache
+        if read_cache is not None:
+            records = read_cache.get(endpoint)
+            if records is not None:
+                return records  # type: ignore[no-any-return]
+        fetched_at = time()
+        try:
+            response = self.client.get(path=endpoint, timeout=timeout)
+        except TimeoutError as e:
+            raise errors.ScaleTimeoutError(e)
+        records = response.json
+        if read_cache is not None and response.status == 200:
+            read_cache.put(endpoint, records, fetched_at)
+        return records  # type: ignore[no-any-return]
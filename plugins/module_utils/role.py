@@ -17,6 +17,11 @@ from typing import Any, Optional
 
 
 class Role(PayloadMapper):
+    __slots__ = (
+        "uuid",
+        "name",
+    )
+
     def __init__(self, uuid: str, name: str):
         self.uuid = uuid
         self.name = name
@@ -68,6 +73,21 @@ class Role(PayloadMapper):
         role = cls.from_hypercore(hypercore_dict)
         return role
 
+    @classmethod
+    def get_role_map(cls, rest_client: RestClient) -> dict[str, Role]:
+        """
+        Returns all roles, indexed by uuid.
+        Use it when resolving roles of many users - it's a single GET request,
+        get_role_from_uuid is one request per role.
+        """
+        return {
+            hypercore_dict["uuid"]: cls(
+                uuid=hypercore_dict["uuid"],
+                name=hypercore_dict["name"],
+            )
+            for hypercore_dict in rest_client.list_records("/rest/v1/Role")
+        }
+
     @classmethod
     def get_role_from_name(
         cls, role_name: str, rest_client: RestClient, must_exist: bool = False
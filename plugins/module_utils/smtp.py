@@ -20,6 +20,18 @@ from typing import Union, Any, Dict, Optional
 
 
 class SMTP(PayloadMapper):
+    __slots__ = (
+        "uuid",
+        "server",
+        "port",
+        "use_ssl",
+        "use_auth",
+        "auth_user",
+        "auth_password",
+        "from_address",
+        "latest_task_tag",
+    )
+
     def __init__(
         self,
         uuid: Optional[str] = None,
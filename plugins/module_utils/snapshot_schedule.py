@@ -13,6 +13,12 @@ from ..module_utils.utils import get_query
 
 
 class SnapshotSchedule(PayloadMapper):
+    __slots__ = (
+        "name",
+        "uuid",
+        "recurrences",
+    )
+
     # Variables in SnapshotSchedule are written in ansible-native format
     def __init__(self, name, uuid=None, recurrences=None):
         self.name = name
@@ -118,6 +124,16 @@ class SnapshotSchedule(PayloadMapper):
 
 
 class Recurrence(PayloadMapper):
+    __slots__ = (
+        "name",
+        "frequency",
+        "start",
+        "local_retention",
+        "remote_retention",
+        "replication",
+        "uuid",
+    )
+
     # Variables in SnapshotSchedule are written in ansible-native format
     def __init__(
         self,
@@ -16,6 +16,11 @@ from typing import Any, Union, Optional
 
 
 class SupportTunnel(PayloadMapper):
+    __slots__ = (
+        "open",
+        "code",
+    )
+
     def __init__(self, open: bool, code: Optional[int]):
         self.open = open
         self.code = code
@@ -24,6 +24,17 @@ protocols = {"SYSLOG_PROTOCOL_TCP": "tcp", "SYSLOG_PROTOCOL_UDP": "udp"}
 
 
 class SyslogServer(PayloadMapper):
+    __slots__ = (
+        "uuid",
+        "alert_tag_uuid",
+        "host",
+        "port",
+        "protocol",
+        "resend_delay",
+        "silent_period",
+        "latest_task_tag",
+    )
+
     def __init__(
         self,
         uuid: Optional[str] = None,
@@ -9,12 +9,89 @@ from __future__ import annotations
 
 __metaclass__ = type
 
-from time import sleep
+from time import sleep, time
 
 from ..module_utils import errors
 from ..module_utils.rest_client import RestClient
 from ..module_utils.typed_classes import TypedTaskTag
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Callable, Tuple
+
+# Seconds between two status reads of the same task.
+TASK_POLL_INTERVAL = 1
+
+
+class TaskProgress:
+    """
+    Progress of a task, sampled on every status read while waiting for it.
+
+    The timeline keeps only samples where state, progress percentage or message
+    changed, so long tasks produce short timelines. Rate (percent per second) and
+    ETA (seconds) are estimated from the first sample with progress to the latest one.
+    Every kept sample is also passed as a progress line to log (e.g. AnsibleModule.log).
+    The task handle (taskTag and createdUUID) given to TaskTag.wait_task is kept in task,
+    also if the module does not wait for it.
+    """
+
+    def __init__(self, log: Optional[Callable[[str], None]] = None):
+        self.log = log
+        self.started = time()
+        self.task: Optional[TypedTaskTag] = None
+        self.task_tag: Optional[str] = None
+        self.duration = 0.0
+        self.rate: Optional[float] = None
+        self.eta: Optional[float] = None
+        self.timeline: List[Dict[str, Any]] = []
+        # Time and progress of the first sample with progress.
+        self._first: Optional[Tuple[float, float]] = None
+
+    def add(self, task_tag: str, task_status: Dict[str, Any]) -> None:
+        elapsed = time() - self.started
+        self.task_tag = task_tag
+        self.duration = round(elapsed, 3)
+        sample = dict(
+            time=self.duration,
+            state=task_status.get("state"),
+            progress=task_status.get("progressPercent"),
+            message=task_status.get("formattedMessage") or None,
+        )
+        progress = sample["progress"]
+        if isinstance(progress, (int, float)):
+            if self._first is None:
+                self._first = (elapsed, progress)
+            first_elapsed, first_progress = self._first
+            if elapsed > first_elapsed and progress > first_progress:
+                rate = (progress - first_progress) / (elapsed - first_elapsed)
+                self.rate = round(rate, 3)
+                self.eta = round(max(100 - progress, 0) / rate, 1)
+        if sample["state"] not in ("RUNNING", "QUEUED"):
+            self.eta = 0.0
+        if self.timeline and all(
+            self.timeline[-1][key] == sample[key]
+            for key in ("state", "progress", "message")
+        ):
+            return
+        self.timeline.append(sample)
+        if self.log:
+            self.log(self.format(sample))
+
+    def format(self, sample: Dict[str, Any]) -> str:
+        line = "Task {0}: {1}".format(self.task_tag, sample["state"])
+        if sample["progress"] is not None:
+            line += " {0}%".format(sample["progress"])
+        if self.rate is not None:
+            line += " ({0} %/s, ETA {1} s)".format(self.rate, self.eta)
+        if sample["message"]:
+            line += " - {0}".format(sample["message"])
+        return line
+
+    def to_ansible(self) -> Dict[str, Any]:
+        return dict(
+            task_tag=self.task_tag,
+            duration=self.duration,
+            rate=self.rate,
+            eta=self.eta,
+            timeline=self.timeline,
+        )
 
 
 class TaskTag:
@@ -24,24 +101,25 @@ class TaskTag:
         rest_client: RestClient,
         task: Optional[TypedTaskTag],
         check_mode: bool = False,
+        progress: Optional[TaskProgress] = None,
+        wait: bool = True,
     ) -> None:
         if check_mode:
             return
-        if task is None:
-            return
-        if type(task) != dict:
-            raise errors.ScaleComputingError("task should be dictionary.")
-        if "taskTag" not in task.keys():
-            raise errors.ScaleComputingError("taskTag is not in task dictionary.")
-        if not task["taskTag"]:
+        if progress:
+            progress.task = task
+        task_tag = cls._task_tag(task)
+        if not task_tag or not wait:
             return
 
         while True:
             task_status = rest_client.get_record(
-                "{0}/{1}".format("/rest/v1/TaskTag", task["taskTag"]), query={}
+                "{0}/{1}".format("/rest/v1/TaskTag", task_tag), query={}
             )
             if task_status is None:  # No such task_status is found
                 break
+            if progress:
+                progress.add(task_tag, task_status)
             if task_status.get("state", "") in (
                 "ERROR",
                 "UNINITIALIZED",
@@ -54,7 +132,79 @@ class TaskTag:
                 "QUEUED",
             ):  # TaskTag has finished
                 break
-            sleep(1)
+            sleep(TASK_POLL_INTERVAL)
+
+    @staticmethod
+    def _task_tag(task: Optional[TypedTaskTag]) -> Optional[str]:
+        # Returns task tag to wait for, or None if there is nothing to wait for.
+        if task is None:
+            return None
+        if not isinstance(task, dict):
+            raise errors.ScaleComputingError("task should be dictionary.")
+        if "taskTag" not in task.keys():
+            raise errors.ScaleComputingError("taskTag is not in task dictionary.")
+        return task["taskTag"] or None
+
+    @staticmethod
+    def poll_tasks(rest_client: RestClient, task_tags: List[str]) -> Dict[str, str]:
+        """
+        Reads status of all task_tags once.
+        Returns finished tasks - {task_tag: state}, state is "COMPLETE" (or other final state)
+        for successful tasks, "ERROR" for tasks that failed or were never initialized.
+        """
+        finished = dict()
+        for task_tag in task_tags:
+            task_status = rest_client.get_record(
+                "{0}/{1}".format("/rest/v1/TaskTag", task_tag), query={}
+            )
+            if task_status is None:  # No such task_status is found
+                finished[task_tag] = "COMPLETE"
+                continue
+            state = task_status.get("state", "")
+            if state in ("ERROR", "UNINITIALIZED"):
+                finished[task_tag] = "ERROR"
+            elif state not in ("RUNNING", "QUEUED"):
+                finished[task_tag] = state or "COMPLETE"
+        return finished
+
+    @classmethod
+    def wait_tasks(
+        cls,
+        rest_client: RestClient,
+        tasks: List[Optional[TypedTaskTag]],
+        check_mode: bool = False,
+        raise_errors: bool = True,
+    ) -> Dict[str, str]:
+        """
+        Waits for all tasks, with a single polling loop for all of them.
+        Unlike calling wait_task for each task, we sleep once per round, not once per task.
+        Raises ScaleComputingError after all tasks finished, if any of them failed,
+        unless raise_errors is False.
+        Returns final state of every awaited task tag.
+        """
+        states: Dict[str, str] = {}
+        if check_mode:
+            return states
+        pending = []
+        for task in tasks:
+            task_tag = cls._task_tag(task)
+            if task_tag and task_tag not in pending:
+                pending.append(task_tag)
+        failed: List[str] = []
+        while pending:
+            finished = cls.poll_tasks(rest_client, pending)
+            states.update(finished)
+            failed.extend(tag for tag, state in finished.items() if state == "ERROR")
+            pending = [tag for tag in pending if tag not in finished]
+            if pending:
+                sleep(TASK_POLL_INTERVAL)
+        if failed and raise_errors:
+            raise errors.ScaleComputingError(
+                "There was a problem during execution of tasks {0}.".format(
+                    ", ".join(failed)
+                )
+            )
+        return states
 
     @staticmethod
     def get_task_status(
@@ -62,7 +212,7 @@ class TaskTag:
     ) -> Optional[Dict[Any, Any]]:
         if not task:
             return None
-        if type(task) != dict:
+        if not isinstance(task, dict):
             raise errors.ScaleComputingError("task should be dictionary.")
         if "taskTag" not in task.keys():
             raise errors.ScaleComputingError("taskTag is not in task dictionary.")
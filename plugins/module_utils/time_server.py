@@ -20,6 +20,12 @@ from ..module_utils import errors
 #         - 0 or 1 of them (like DNS config)
 #         - hardcoded uuid (like DNS config)
 class TimeServer(PayloadMapper):
+    __slots__ = (
+        "uuid",
+        "host",
+        "latest_task_tag",
+    )
+
     def __init__(self, uuid: str = None, host: str = None, latest_task_tag: {} = None):
         self.uuid = uuid
         self.host = host
@@ -20,6 +20,12 @@ from ..module_utils import errors
 #         - 0 or 1 of them (like DNS config)
 #         - hardcoded uuid (like DNS config)
 class TimeZone(PayloadMapper):
+    __slots__ = (
+        "uuid",
+        "zone",
+        "latest_task_tag",
+    )
+
     def __init__(
         self,
         uuid: str = None,
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+from __future__ import annotations
+
+__metaclass__ = type
+
+from typing import Dict, FrozenSet, Optional, Tuple
+
+# Time zones supported by HyperCore, compiled from date_time_zonespec.csv
+# (ID, GMT offset and DST adjustment columns). Zones are grouped under
+# "<UTC offset> <DST adjustment>" lines, so the catalog stays small in the
+# module payload. Regenerate it when the CSV changes, unit tests compare both.
+_CATALOG = """
+-11:00 +00:00
+Pacific/Apia Pacific/Midway Pacific/Niue Pacific/Pago_Pago US/Samoa
+-10:00 +00:00
+Pacific/Fakaofo Pacific/Honolulu Pacific/Johnston Pacific/Rarotonga Pacific/Tahiti
+-10:00 +01:00
+America/Adak
+-09:30 +00:00
+Pacific/Marquesas
+-09:00 +00:00
+Pacific/Gambier US/Hawaii
+-09:00 +01:00
+America/Anchorage America/Juneau America/Nome America/Yakutat US/Alaska US/Aleutian
+-08:00 +00:00
+Pacific/Pitcairn
+-08:00 +01:00
+America/Dawson America/Los_Angeles America/Tijuana America/Vancouver America/Whitehorse
+US/Pacific US/Pacific-New
+-07:00 +00:00
+America/Dawson_Creek America/Hermosillo America/Phoenix US/Arizona
+-07:00 +01:00
+America/Boise America/Cambridge_Bay America/Chihuahua America/Denver America/Edmonton
+America/Inuvik America/Mazatlan America/Shiprock America/Yellowknife US/Mountain
+-06:00 +00:00
+America/Belize America/Costa_Rica America/El_Salvador America/Guatemala America/Managua
+America/Regina America/Swift_Current America/Tegucigalpa Pacific/Galapagos
+-06:00 +01:00
+America/Cancun America/Chicago America/Menominee America/Merida America/Mexico_City
+America/Monterrey America/North_Dakota/Center America/Rainy_River America/Rankin_Inlet
+America/Winnipeg Pacific/Easter US/Central US/Indiana-Starke US/Michigan
+-05:00 +00:00
+America/Bogota America/Cayman America/Eirunepe America/Guayaquil
+America/Indiana/Indianapolis America/Indiana/Knox America/Indiana/Marengo
+America/Indiana/Vevay America/Indianapolis America/Jamaica America/Lima America/Panama
+America/Port-au-Prince America/Rio_Branco
+-05:00 +01:00
+America/Detroit America/Grand_Turk America/Havana America/Iqaluit
+America/Kentucky/Louisville America/Kentucky/Monticello America/Louisville
+America/Montreal America/Nassau America/New_York America/Nipigon America/Pangnirtung
+America/Thunder_Bay US/Eastern US/East-Indiana
+-04:00 +00:00
+America/Anguilla America/Antigua America/Aruba America/Barbados America/Boa_Vista
+America/Caracas America/Curacao America/Dominica America/Grenada America/Guadeloupe
+America/Guyana America/La_Paz America/Manaus America/Martinique America/Montserrat
+America/Port_of_Spain America/Porto_Velho America/Puerto_Rico America/Santo_Domingo
+America/St_Kitts America/St_Lucia America/St_Thomas America/St_Vincent America/Thule
+America/Tortola
+-04:00 +01:00
+America/Asuncion America/Cuiaba America/Glace_Bay America/Goose_Bay America/Halifax
+America/Santiago Antarctica/Palmer Atlantic/Bermuda Atlantic/Stanley
+-03:30 +01:00
+America/St_Johns
+-03:00 +00:00
+America/Belem America/Buenos_Aires America/Catamarca America/Cayenne America/Cordoba
+America/Jujuy America/Mendoza America/Montevideo America/Paramaribo America/Rosario
+-03:00 +01:00
+America/Araguaina America/Fortaleza America/Godthab America/Maceio America/Miquelon
+America/Recife America/Sao_Paulo
+-02:00 +00:00
+America/Noronha Atlantic/South_Georgia
+-01:00 +00:00
+Atlantic/Cape_Verde
+-01:00 +01:00
+America/Scoresbysund Atlantic/Azores
++00:00 +00:00
+Africa/Abidjan Africa/Accra Africa/Bamako Africa/Banjul Africa/Bissau Africa/Casablanca
+Africa/Conakry Africa/Dakar Africa/El_Aaiun Africa/Freetown Africa/Lome Africa/Monrovia
+Africa/Nouakchott Africa/Ouagadougou Africa/Sao_Tome Africa/Timbuktu
+America/Danmarkshavn Atlantic/Reykjavik Atlantic/St_Helena UTC
++00:00 +01:00
+Atlantic/Canary Atlantic/Faeroe Atlantic/Madeira Europe/Belfast Europe/Dublin
+Europe/Lisbon Europe/London
++01:00 +00:00
+Africa/Algiers Africa/Bangui Africa/Brazzaville Africa/Douala Africa/Kinshasa
+Africa/Lagos Africa/Libreville Africa/Luanda Africa/Malabo Africa/Ndjamena Africa/Niamey
+Africa/Porto-Novo Africa/Tunis
++01:00 +01:00
+Africa/Ceuta Africa/Windhoek Arctic/Longyearbyen Atlantic/Jan_Mayen Europe/Amsterdam
+Europe/Andorra Europe/Belgrade Europe/Berlin Europe/Bratislava Europe/Brussels
+Europe/Budapest Europe/Copenhagen Europe/Gibraltar Europe/Ljubljana Europe/Luxembourg
+Europe/Madrid Europe/Malta Europe/Monaco Europe/Oslo Europe/Paris Europe/Prague
+Europe/Rome Europe/San_Marino Europe/Sarajevo Europe/Skopje Europe/Stockholm
+Europe/Tirane Europe/Vaduz Europe/Vatican Europe/Vienna Europe/Warsaw Europe/Zagreb
+Europe/Zurich
++02:00 +00:00
+Africa/Blantyre Africa/Bujumbura Africa/Gaborone Africa/Harare Africa/Johannesburg
+Africa/Kigali Africa/Lubumbashi Africa/Lusaka Africa/Maputo Africa/Maseru Africa/Mbabane
+Africa/Tripoli Europe/Tallinn Europe/Vilnius
++02:00 +01:00
+Africa/Cairo Asia/Amman Asia/Beirut Asia/Damascus Asia/Gaza Asia/Istanbul Asia/Jerusalem
+Asia/Nicosia Europe/Athens Europe/Bucharest Europe/Chisinau Europe/Helsinki
+Europe/Istanbul Europe/Kaliningrad Europe/Kiev Europe/Minsk Europe/Nicosia Europe/Riga
+Europe/Simferopol Europe/Sofia Europe/Uzhgorod Europe/Zaporozhye
++03:00 +00:00
+Africa/Addis_Ababa Africa/Asmera Africa/Dar_es_Salaam Africa/Djibouti Africa/Kampala
+Africa/Khartoum Africa/Mogadishu Africa/Nairobi Antarctica/Syowa Asia/Aden Asia/Bahrain
+Asia/Kuwait Asia/Qatar Asia/Riyadh Indian/Antananarivo Indian/Comoro Indian/Mayotte
++03:00 +01:00
+Asia/Baghdad Europe/Moscow
++03:30 +00:00
+Asia/Tehran
++04:00 +00:00
+Asia/Dubai Asia/Muscat Indian/Mahe Indian/Mauritius Indian/Reunion
++04:00 +01:00
+Asia/Aqtau Asia/Baku Asia/Tbilisi Asia/Yerevan Europe/Samara
++04:30 +00:00
+Asia/Kabul
++05:00 +00:00
+Asia/Ashgabat Asia/Dushanbe Asia/Karachi Asia/Oral Asia/Samarkand Asia/Tashkent
+Indian/Kerguelen Indian/Maldives
++05:00 +01:00
+Asia/Aqtobe Asia/Bishkek Asia/Yekaterinburg
++05:30 +00:00
+Asia/Calcutta
++05:45 +00:00
+Asia/Katmandu
++06:00 +00:00
+Antarctica/Mawson Antarctica/Vostok Asia/Colombo Asia/Dhaka Asia/Qyzylorda Asia/Thimphu
+Indian/Chagos
++06:00 +01:00
+Asia/Almaty Asia/Novosibirsk Asia/Omsk
++06:30 +00:00
+Asia/Rangoon Indian/Cocos
++07:00 +00:00
+Antarctica/Davis Asia/Bangkok Asia/Hovd Asia/Jakarta Asia/Phnom_Penh Asia/Pontianak
+Asia/Saigon Asia/Vientiane Indian/Christmas
++07:00 +01:00
+Asia/Krasnoyarsk
++08:00 +00:00
+Antarctica/Casey Asia/Brunei Asia/Chongqing Asia/Harbin Asia/Hong_Kong Asia/Kashgar
+Asia/Kuala_Lumpur Asia/Kuching Asia/Macao Asia/Macau Asia/Makassar Asia/Manila
+Asia/Shanghai Asia/Singapore Asia/Taipei Asia/Ujung_Pandang Asia/Ulaanbaatar Asia/Urumqi
+Australia/Perth
++08:00 +01:00
+Asia/Irkutsk
++09:00 +00:00
+Asia/Choibalsan Asia/Dili Asia/Jayapura Asia/Pyongyang Asia/Seoul Asia/Tokyo
+Pacific/Palau
++09:00 +01:00
+Asia/Yakutsk
++09:30 +00:00
+Australia/Darwin
++09:30 +01:00
+Australia/Adelaide Australia/Broken_Hill
++10:00 +00:00
+Antarctica/DumontDUrville Australia/Brisbane Australia/Lindeman Pacific/Guam
+Pacific/Port_Moresby Pacific/Saipan Pacific/Truk Pacific/Yap
++10:00 +01:00
+Asia/Sakhalin Asia/Vladivostok Australia/Hobart Australia/Melbourne Australia/Sydney
++10:30 +00:30
+Australia/Lord_Howe
++11:00 +00:00
+Pacific/Efate Pacific/Guadalcanal Pacific/Kosrae Pacific/Noumea Pacific/Ponape
++11:00 +01:00
+Asia/Magadan
++11:30 +00:00
+Pacific/Norfolk
++12:00 +00:00
+Pacific/Fiji Pacific/Funafuti Pacific/Kwajalein Pacific/Majuro Pacific/Nauru
+Pacific/Tarawa Pacific/Wake Pacific/Wallis
++12:00 +01:00
+Antarctica/McMurdo Antarctica/South_Pole Asia/Anadyr Asia/Kamchatka Pacific/Auckland
++12:45 +01:00
+Pacific/Chatham
++13:00 +00:00
+Pacific/Enderbury Pacific/Tongatapu
++14:00 +00:00
+Pacific/Kiritimati
+"""
+
+_zones: Optional[FrozenSet[str]] = None
+_offsets: Optional[Dict[str, Tuple[str, str]]] = None
+
+
+def _load() -> Dict[str, Tuple[str, str]]:
+    """Parses the catalog on first use."""
+    global _offsets
+    if _offsets is None:
+        offsets: Dict[str, Tuple[str, str]] = {}
+        group = ("+00:00", "+00:00")
+        for line in _CATALOG.split("\n"):
+            if line.startswith(("+", "-")):
+                utc_offset, dst_adjustment = line.split()
+                group = (utc_offset, dst_adjustment)
+            else:
+                for zone in line.split():
+                    offsets[zone] = group
+        _offsets = offsets
+    return _offsets
+
+
+def _to_minutes(offset: str) -> int:
+    minutes = int(offset[1:3]) * 60 + int(offset[4:6])
+    return -minutes if offset[0] == "-" else minutes
+
+
+def _from_minutes(minutes: int) -> str:
+    sign = "-" if minutes < 0 else "+"
+    return "{0}{1:02d}:{2:02d}".format(sign, *divmod(abs(minutes), 60))
+
+
+def get_zones() -> FrozenSet[str]:
+    global _zones
+    if _zones is None:
+        _zones = frozenset(_load())
+    return _zones
+
+
+def is_supported(zone: Optional[str]) -> bool:
+    return zone in get_zones()
+
+
+def get_offset(zone: Optional[str]) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Returns standard and daylight saving time UTC offsets of the zone,
+    or None for unknown zone. Daylight saving offset is None if the zone
+    does not observe DST.
+    """
+    offsets = _load()
+    if zone is None or zone not in offsets:
+        return None
+    utc_offset, dst_adjustment = offsets[zone]
+    dst_minutes = _to_minutes(dst_adjustment)
+    return dict(
+        standard=utc_offset,
+        daylight_saving=(
+            _from_minutes(_to_minutes(utc_offset) + dst_minutes)
+            if dst_minutes
+            else None
+        ),
+    )
@@ -20,6 +20,13 @@ class TypedClusterInstance(TypedDict):
     username: str
     password: str
     timeout: float
+    max_concurrent_requests: Optional[int]
+    max_requests_per_second: Optional[float]
+    read_balancing: Optional[str]
+    cache_ttl: Optional[float]
+    cache_endpoint_ttl: Optional[dict[str, float]]
+    cache_max_size: Optional[int]
+    coalesce_window: Optional[float]
 
 
 # Registration to ansible return dict.
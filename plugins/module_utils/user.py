@@ -16,6 +16,14 @@ from typing import Optional
 
 
 class User(PayloadMapper):
+    __slots__ = (
+        "uuid",
+        "username",
+        "full_name",
+        "role_uuids",
+        "session_limit",
+    )
+
     def __init__(
         self,
         uuid: str,
@@ -50,16 +58,20 @@ class User(PayloadMapper):
     def to_hypercore(self):
         pass
 
-    def to_ansible(self, rest_client: RestClient) -> TypedUserToAnsible:
+    def to_ansible(
+        self, rest_client: RestClient, role_map: Optional[dict[str, Role]] = None
+    ) -> TypedUserToAnsible:
+        # role_map from Role.get_role_map can be shared by many users.
+        if role_map is None:
+            role_map = Role.get_role_map(rest_client)
         return dict(
             uuid=self.uuid,
             username=self.username,
             full_name=self.full_name,
             roles=[
-                Role.get_role_from_uuid(
-                    role_uuid, rest_client, must_exist=False
-                ).to_ansible()
+                role_map[role_uuid].to_ansible()
                 for role_uuid in self.role_uuids
+                if role_uuid in role_map
             ],
             session_limit=self.session_limit,
         )
@@ -9,10 +9,14 @@ from abc import abstractmethod
 
 __metaclass__ = type
 
+import os
+import re
+import tempfile
 import uuid
 
-from ..module_utils.errors import InvalidUuidFormatError
-from typing import Union, Any
+from ..module_utils.errors import InvalidUuidFormatError, ScaleComputingError
+from ..module_utils.record_store import RecordStore
+from typing import Union, Any, Iterator, TypeVar
 from ..module_utils.typed_classes import (
     TypedTaskTag,
     TypedRegistrationToAnsible,
@@ -24,6 +28,10 @@ from ..module_utils.typed_classes import (
 
 MIN_PYTHON_VERSION = (3, 8)
 
+# Directory shared by all module processes started from the same controller.
+# Used for cross-process coordination (locks, shared state) between forks.
+STATE_DIR_ENV = "SC_STATE_DIR"
+
 
 # Used in case of check mode
 MOCKED_TASK_TAG = TypedTaskTag(
@@ -39,6 +47,30 @@ def validate_uuid(value):
         raise InvalidUuidFormatError(value)
 
 
+def get_state_dir(host: str, *subdirs: str) -> str:
+    """
+    Returns (and creates) directory for shared state of the given HyperCore host.
+    Directory is shared between all forks of the same user on the same machine, so it
+    can be used for file locks and for data that should outlive a single module invocation.
+    """
+    base_dir = os.environ.get(STATE_DIR_ENV) or os.path.join(
+        tempfile.gettempdir(), "scale_computing_hypercore-{0}".format(os.getuid())
+    )
+    os.makedirs(base_dir, mode=0o700, exist_ok=True)
+    # makedirs does not change an existing directory, it could be created by someone else.
+    base_stat = os.stat(base_dir)
+    if base_stat.st_uid != os.getuid() or base_stat.st_mode & 0o077:
+        raise ScaleComputingError(
+            "State directory {0} must be owned by the current user "
+            "and not accessible to others.".format(base_dir)
+        )
+    # https://10.5.11.200:443 -> https_10.5.11.200_443
+    host_dir = re.sub(r"[^A-Za-z0-9.-]+", "_", host or "").strip("_")
+    path = os.path.join(base_dir, host_dir, *subdirs)
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    return path
+
+
 def get_query(
     input: dict[Any, Any], *field_names: str, ansible_hypercore_map: dict[Any, Any]
 ):
@@ -72,8 +104,11 @@ class PayloadMapper:
     """
     Represent abstract class from which each 'endpoint class' will inherit from.
     Every class that will represent module object will (most likely) have to implement those methods.
+    Subclasses declare their attributes in __slots__, so objects have no per-instance __dict__.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def to_ansible(self):
         """
@@ -127,8 +162,24 @@ def is_superset(superset, candidate):
     return True
 
 
+T = TypeVar("T")
+
+
+def drain(records: list[T]) -> Iterator[T]:
+    """
+    Yields items of list records one by one and removes them from the list.
+    Raw records are released as soon as they are converted, instead of being kept
+    until the whole list is converted. The list is empty afterwards.
+    """
+    records.reverse()
+    while records:
+        yield records.pop()
+
+
 def filter_results(results, filter_data) -> list[Any]:
-    return [element for element in results if is_superset(element, filter_data)]
+    # Same matching as is_superset, but filter_data keys can also be nested paths.
+    # For repeated queries over the same results, keep a RecordStore instead.
+    return RecordStore(results).find(filter_data)
 
 
 def is_changed(
@@ -24,6 +24,14 @@ REQUEST_TIMEOUT_TIME = 3600
 
 
 class VirtualDisk(PayloadMapper):
+    __slots__ = (
+        "name",
+        "uuid",
+        "block_size",
+        "size",
+        "replication_factor",
+    )
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -28,6 +28,7 @@ from ..module_utils.utils import (
     filter_results,
 )
 from ..module_utils.task_tag import TaskTag
+from ..module_utils.record_store import RecordStore
 from ..module_utils import errors
 from ..module_utils.snapshot_schedule import SnapshotSchedule
 
@@ -107,6 +108,30 @@ REBOOT_LOOKUP = dict(
 
 
 class VM(PayloadMapper):
+    __slots__ = (
+        "operating_system",
+        "uuid",
+        "node_uuid",
+        "name",
+        "tags",
+        "description",
+        "mem",
+        "power_state",
+        "numVCPU",
+        "boot_devices",
+        "attach_guest_tools_iso",
+        "node_affinity",
+        "snapshot_schedule",
+        "reboot",
+        "was_shutdown_tried",
+        "machine_type",
+        "replication_source_vm_uuid",
+        "_nics",
+        "_nic_store",
+        "_disks",
+        "_disk_store",
+    )
+
     # Fields cloudInitData, desiredDisposition and latestTaskTag are left out and won't be transferred between
     # ansible and hypercore transformations
     # power_state inside VM holds ansible-native value (meaning, it can take either started or stopped).
@@ -153,6 +178,24 @@ class VM(PayloadMapper):
         self.machine_type = machine_type
         self.replication_source_vm_uuid = replication_source_vm_uuid
 
+    @property
+    def nics(self):
+        return self._nics
+
+    @nics.setter
+    def nics(self, nics):
+        self._nics = nics
+        self._nic_store = None
+
+    @property
+    def disks(self):
+        return self._disks
+
+    @disks.setter
+    def disks(self, disks):
+        self._disks = disks
+        self._disk_store = None
+
     @property
     def nic_list(self):
         return self.nics
@@ -161,6 +204,21 @@ class VM(PayloadMapper):
     def disk_list(self):
         return self.disks
 
+    # Nics and disks in ansible format, in the same order as self.nics and self.disks.
+    # Built on first lookup, indexes for (vlan), (mac), (disk_slot, type), ... are
+    # reused by all later lookups on this VM.
+    @property
+    def nic_store(self):
+        if self._nic_store is None:
+            self._nic_store = RecordStore(nic.to_ansible() for nic in self.nics)
+        return self._nic_store
+
+    @property
+    def disk_store(self):
+        if self._disk_store is None:
+            self._disk_store = RecordStore(disk.to_ansible() for disk in self.disks)
+        return self._disk_store
+
     @classmethod
     def from_ansible(cls, ansible_data):
         vm_dict = ansible_data
@@ -183,7 +241,7 @@ class VM(PayloadMapper):
         )
 
     @classmethod
-    def from_hypercore(cls, vm_dict, rest_client):
+    def from_hypercore(cls, vm_dict, rest_client, node_directory=None):
         # In case we call RestClient.get_record and there is no results
         if vm_dict is None:
             return None
@@ -191,10 +249,12 @@ class VM(PayloadMapper):
         preferred_node = Node.get_node(
             query={"uuid": vm_dict["affinityStrategy"]["preferredNodeUUID"]},
             rest_client=rest_client,
+            node_directory=node_directory,
         )
         backup_node = Node.get_node(
             query={"uuid": vm_dict["affinityStrategy"]["backupNodeUUID"]},
             rest_client=rest_client,
+            node_directory=node_directory,
         )
 
         node_affinity = dict(
@@ -357,9 +417,25 @@ class VM(PayloadMapper):
             for virtual_machine in record
         ]
 
+    @staticmethod
+    def get_name_index(rest_client):
+        """
+        Returns {vm_uuid: vm_name} for all VMs.
+        Reads only raw records, so it's much cheaper than VM.from_hypercore for every VM.
+        """
+        return {
+            vm_dict["uuid"]: vm_dict["name"]
+            for vm_dict in rest_client.list_records("/rest/v1/VirDomain")
+        }
+
     @classmethod
     def get_by_name(
-        cls, ansible_dict, rest_client, must_exist=False, name_field="vm_name"
+        cls,
+        ansible_dict,
+        rest_client,
+        must_exist=False,
+        name_field="vm_name",
+        node_directory=None,
     ):
         """
         With given dict from playbook, finds the existing vm by name from the HyperCore api and constructs object VM if
@@ -373,7 +449,9 @@ class VM(PayloadMapper):
         hypercore_dict = rest_client.get_record(
             "/rest/v1/VirDomain", query, must_exist=must_exist
         )
-        vm_from_hypercore = cls.from_hypercore(hypercore_dict, rest_client)
+        vm_from_hypercore = cls.from_hypercore(
+            hypercore_dict, rest_client, node_directory=node_directory
+        )
         return vm_from_hypercore
 
     @classmethod
@@ -463,35 +541,26 @@ class VM(PayloadMapper):
     # search by vlan or mac as specified in US-11:
     # (https://gitlab.xlab.si/scale-ansible-collection/scale-ansible-collection-docs/-/blob/develop/docs/user-stories/us11-manage-vnics.md)
     def find_nic(self, vlan=None, mac=None, vlan_new=None, mac_new=None):
+        key, value, value_new = (
+            ("vlan", vlan, vlan_new) if vlan is not None else ("mac", mac, mac_new)
+        )
+        positions = self.nic_store.positions({key: value})
+        if len(positions) > 1:
+            raise DeviceNotUnique("nic - vm.py - find_nic()")
+        existing_hypercore_nic = self.nics[positions[0]] if positions else None
         existing_hypercore_nic_with_new = None
-        existing_hypercore_nic = None
-        if vlan is not None:
-            all_vlans = [nic.vlan for nic in self.nic_list]
-            if all_vlans.count(vlan) > 1:
-                raise DeviceNotUnique("nic - vm.py - find_nic()")
-            for nic in self.nic_list:
-                if nic.vlan == vlan:
-                    existing_hypercore_nic = nic
-                elif vlan_new is not None and nic.vlan == vlan_new:
-                    existing_hypercore_nic_with_new = nic
-        else:
-            all_macs = [nic.mac for nic in self.nic_list]
-            if all_macs.count(mac) > 1:
-                raise DeviceNotUnique("nic - vm.py - find_nic()")
-            for nic in self.nic_list:
-                if nic.mac == mac:
-                    existing_hypercore_nic = nic
-                elif mac_new is not None and nic.mac == mac_new:
-                    existing_hypercore_nic_with_new = nic
+        if value_new is not None and value_new != value:
+            positions_new = self.nic_store.positions({key: value_new})
+            if positions_new:
+                existing_hypercore_nic_with_new = self.nics[positions_new[-1]]
         return existing_hypercore_nic, existing_hypercore_nic_with_new
 
     def find_disk(self, slot):
-        all_slots = [disk.slot for disk in self.disk_list]
-        if all_slots.count(slot) > 1:
+        positions = self.disk_store.positions(dict(disk_slot=slot))
+        if len(positions) > 1:
             raise DeviceNotUnique("disk - vm.py - find_disk()")
-        for disk in self.disk_list:
-            if disk.slot == slot:
-                return disk
+        if positions:
+            return self.disks[positions[0]]
 
     def post_vm_payload(self, rest_client, ansible_dict):
         # The rest of the keys from VM_PAYLOAD_KEYS will get set properly automatically
@@ -606,17 +675,19 @@ class VM(PayloadMapper):
         return super().__str__()
 
     def get_specific_nic(self, query):
-        results = [nic.to_ansible() for nic in self.nics]
-        return VM.filter_specific_objects(results, query, "Nic")
+        return VM.filter_specific_objects(self.nic_store, query, "Nic")
 
     def get_specific_disk(self, query):
-        results = [vm_disk.to_ansible() for vm_disk in self.disks]
-        return VM.filter_specific_objects(results, query, "Disk")
+        return VM.filter_specific_objects(self.disk_store, query, "Disk")
 
     @staticmethod
     def filter_specific_objects(results, query, object_type):
         # Type is type of the device, for example disk or nic
-        filtered_results = filter_results(results, query)
+        # results can be a RecordStore, to reuse its indexes for repeated lookups.
+        if isinstance(results, RecordStore):
+            filtered_results = results.find(query)
+        else:
+            filtered_results = filter_results(results, query)
         if len(filtered_results) > 1:
             raise errors.ScaleComputingError(
                 "{0} isn't uniquely identifyed by {1} in the VM.".format(
@@ -700,7 +771,9 @@ class VM(PayloadMapper):
 
     @classmethod
     def get_vm_device_list(cls, vm_hypercore_dict):
-        all_vm_devices = vm_hypercore_dict["netDevs"] + vm_hypercore_dict["blockDevs"]
+        all_vm_devices = RecordStore(
+            vm_hypercore_dict["netDevs"] + vm_hypercore_dict["blockDevs"]
+        )
         vm_device_list = []
         for vm_device_uuid in vm_hypercore_dict["bootDevices"]:
             vm_device_hypercore = cls.filter_specific_objects(
@@ -818,6 +891,8 @@ class VM(PayloadMapper):
 
 
 class ManageVMParams(VM):
+    __slots__ = ()
+
     @staticmethod
     def _build_payload(module, rest_client):
         payload = {}
@@ -1191,6 +1266,8 @@ class ManageVMDisks:
 
 
 class ManageVMNics(Nic):
+    __slots__ = ()
+
     @classmethod
     def get_by_uuid(cls, rest_client, nic_uuid):
         return Nic.from_hypercore(
@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+from __future__ import annotations
+
+__metaclass__ = type
+
+from typing import Any, Iterable, Optional
+
+from ..module_utils.vm_selector import get_tags
+
+# A move must lower utilization of the most loaded node by at least this fraction.
+MIN_IMPROVEMENT = 0.02
+
+
+class NodeLoad:
+    """VMs, memory and vCPUs placed on a node (as preferred or as backup node)."""
+
+    __slots__ = (
+        "uuid",
+        "lan_ip",
+        "weight",
+        "limit",
+        "memory",
+        "vcpu",
+        "vms",
+        "groups",
+        "backup_memory",
+        "backup_groups",
+    )
+
+    def __init__(
+        self, uuid: str, lan_ip: str, weight: float, limit: Optional[float]
+    ) -> None:
+        self.uuid = uuid
+        self.lan_ip = lan_ip
+        self.weight = weight
+        self.limit = limit
+        self.memory = 0
+        self.vcpu = 0
+        self.vms = 0
+        self.groups: dict[str, int] = {}
+        self.backup_memory = 0
+        self.backup_groups: dict[str, int] = {}
+
+    @property
+    def utilization(self) -> float:
+        return self.memory / self.weight
+
+    def fits(self, memory: int) -> bool:
+        return self.limit is None or self.memory + memory <= self.limit
+
+    def conflicts(self, groups: Iterable[str], backup: bool = False) -> int:
+        counts = self.backup_groups if backup else self.groups
+        return sum(counts.get(group, 0) for group in groups)
+
+    def add(self, vm: PlacedVM, sign: int = 1) -> None:
+        self.memory += sign * vm.memory
+        self.vcpu += sign * vm.vcpu
+        self.vms += sign
+        for group in vm.groups:
+            self.groups[group] = self.groups.get(group, 0) + sign
+
+    def add_backup(self, vm: PlacedVM) -> None:
+        self.backup_memory += vm.memory
+        for group in vm.groups:
+            self.backup_groups[group] = self.backup_groups.get(group, 0) + 1
+
+    def summary(self) -> dict[str, Any]:
+        return dict(memory=self.memory, vcpu=self.vcpu, vms=self.vms)
+
+
+class PlacedVM:
+    __slots__ = (
+        "uuid",
+        "name",
+        "memory",
+        "vcpu",
+        "groups",
+        "movable",
+        "original",
+        "preferred",
+        "backup",
+        "affinity",
+    )
+
+    def __init__(
+        self,
+        vm_dict: dict[str, Any],
+        movable: bool,
+        anti_affinity_tags: set[str],
+        node_uuids: set[str],
+    ) -> None:
+        affinity = vm_dict.get("affinityStrategy") or {}
+        # Affinity as set on HyperCore - strict flag, preferred and backup node.
+        self.affinity: tuple[bool, str, str] = (
+            bool(affinity.get("strictAffinity")),
+            affinity.get("preferredNodeUUID") or "",
+            affinity.get("backupNodeUUID") or "",
+        )
+        self.uuid: str = vm_dict["uuid"]
+        self.name: str = vm_dict["name"]
+        self.memory: int = vm_dict["mem"]
+        self.vcpu: int = vm_dict["numVCPU"]
+        self.groups = sorted(set(get_tags(vm_dict)) & anti_affinity_tags)
+        self.movable = movable and not affinity.get("strictAffinity")
+        # Preferred node, or the node VM runs on if preferred node is not set.
+        self.original: Optional[str] = next(
+            (
+                node_uuid
+                for node_uuid in (
+                    affinity.get("preferredNodeUUID"),
+                    vm_dict.get("nodeUUID"),
+                )
+                if node_uuid in node_uuids
+            ),
+            None,
+        )
+        self.preferred = self.original
+        backup = affinity.get("backupNodeUUID")
+        self.backup: Optional[str] = backup if backup in node_uuids else None
+
+
+class PlacementPlan:
+    """
+    Balanced assignment of preferred and backup nodes.
+
+    Memory is balanced relative to node memory (memSize), or in bytes if memSize is
+    not known for all nodes. VMs are moved from the most loaded node only while this
+    lowers its utilization, so VMs are not moved without a reason.
+    VMs that share an anti-affinity tag are spread over different nodes where possible.
+    Pinned VMs, VMs with strict affinity and VMs that were not selected keep
+    their nodes, but their memory is counted.
+    Nodes with allowRunningVMs=false get no VMs.
+    Nodes are never filled over their memory limit. VMs without a node that do not
+    fit on any node stay unplaced (see unplaced), their affinity is not changed.
+    """
+
+    def __init__(
+        self,
+        node_dicts: list[dict[str, Any]],
+        vm_dicts: list[dict[str, Any]],
+        movable_uuids: set[str],
+        anti_affinity_tags: Optional[list[str]] = None,
+        max_memory_percent: int = 100,
+        max_moves: Optional[int] = None,
+    ) -> None:
+        all_nodes = set(node_dict["uuid"] for node_dict in node_dicts)
+        usable = [
+            node_dict
+            for node_dict in node_dicts
+            if node_dict.get("allowRunningVMs", True)
+        ]
+        by_memory_size = all(node_dict.get("memSize") for node_dict in usable)
+        self.nodes: dict[str, NodeLoad] = dict(
+            (
+                node_dict["uuid"],
+                NodeLoad(
+                    node_dict["uuid"],
+                    node_dict["lanIP"],
+                    node_dict["memSize"] if by_memory_size else 1,
+                    node_dict["memSize"] * max_memory_percent / 100
+                    if node_dict.get("memSize")
+                    else None,
+                ),
+            )
+            for node_dict in usable
+        )
+        self.max_moves = max_moves
+        self.moves = 0
+        self.unplaced: list[PlacedVM] = []
+        tags = set(anti_affinity_tags or [])
+        self.vms = [
+            PlacedVM(vm_dict, vm_dict["uuid"] in movable_uuids, tags, all_nodes)
+            for vm_dict in vm_dicts
+        ]
+        for vm in self.vms:
+            if vm.preferred in self.nodes:
+                self.nodes[vm.preferred].add(vm)
+        self.before = dict(
+            (node_uuid, node.summary()) for node_uuid, node in self.nodes.items()
+        )
+
+    def can_move(self, vm: PlacedVM, node_uuid: str) -> bool:
+        # Moving an already moved VM (or moving it back) does not add a move.
+        return (
+            self.max_moves is None
+            or vm.preferred != vm.original
+            or self.moves < self.max_moves
+        )
+
+    def move(self, vm: PlacedVM, node_uuid: str) -> None:
+        if vm.preferred in self.nodes:
+            self.nodes[vm.preferred].add(vm, -1)
+        # VMs without a node are placed, not moved.
+        if vm.original is not None:
+            self.moves += (node_uuid != vm.original) - (vm.preferred != vm.original)
+        vm.preferred = node_uuid
+        self.nodes[node_uuid].add(vm)
+
+    def best_node(
+        self, vm: PlacedVM, exclude: Optional[str] = None
+    ) -> Optional[NodeLoad]:
+        """Node with the fewest anti-affinity conflicts, then the lowest utilization."""
+        candidates = [
+            node
+            for node in self.nodes.values()
+            if node.uuid != exclude and node.fits(vm.memory)
+        ]
+        if not candidates:
+            return None
+        return min(
+            candidates,
+            key=lambda node: (
+                node.conflicts(vm.groups),
+                (node.memory + vm.memory) / node.weight,
+            ),
+        )
+
+    def place_unplaced(self) -> None:
+        for vm in sorted(self.vms, key=lambda vm: -vm.memory):
+            if not vm.movable or vm.preferred in self.nodes:
+                continue
+            node = self.best_node(vm)
+            if node is None:
+                self.unplaced.append(vm)
+                continue
+            self.move(vm, node.uuid)
+
+    def spread_groups(self) -> None:
+        for vm in sorted(self.vms, key=lambda vm: -vm.memory):
+            if not vm.movable or not vm.groups or vm.preferred not in self.nodes:
+                continue
+            current = self.nodes[vm.preferred]
+            # Conflicts on current node, without the VM itself.
+            conflicts = current.conflicts(vm.groups) - len(vm.groups)
+            if not conflicts:
+                continue
+            node = self.best_node(vm, exclude=current.uuid)
+            if (
+                node
+                and node.conflicts(vm.groups) < conflicts
+                and self.can_move(vm, node.uuid)
+            ):
+                self.move(vm, node.uuid)
+
+    def balance(self) -> None:
+        for _iteration in range(len(self.vms) * max(len(self.nodes), 1)):
+            hot = max(self.nodes.values(), key=lambda node: node.utilization)
+            best: Optional[tuple[float, PlacedVM, NodeLoad]] = None
+            for vm in self.vms:
+                if not vm.movable or vm.preferred != hot.uuid:
+                    continue
+                hot_conflicts = hot.conflicts(vm.groups) - len(vm.groups)
+                for node in self.nodes.values():
+                    if (
+                        node is hot
+                        or not node.fits(vm.memory)
+                        or node.conflicts(vm.groups) > hot_conflicts
+                        or not self.can_move(vm, node.uuid)
+                    ):
+                        continue
+                    peak = max(
+                        (hot.memory - vm.memory) / hot.weight,
+                        (node.memory + vm.memory) / node.weight,
+                    )
+                    if best is None or peak < best[0]:
+                        best = (peak, vm, node)
+            if best is None or best[0] > hot.utilization * (1 - MIN_IMPROVEMENT):
+                return
+            self.move(best[1], best[2].uuid)
+
+    def assign_backups(self) -> None:
+        for vm in self.vms:
+            if vm.backup in self.nodes and vm.backup != vm.preferred:
+                self.nodes[vm.backup].add_backup(vm)
+        for vm in sorted(self.vms, key=lambda vm: -vm.memory):
+            if (
+                not vm.movable
+                or vm.preferred not in self.nodes
+                or (vm.backup in self.nodes and vm.backup != vm.preferred)
+            ):
+                continue
+            candidates = [
+                node for node in self.nodes.values() if node.uuid != vm.preferred
+            ]
+            if not candidates:
+                vm.backup = None
+                continue
+            node = min(
+                candidates,
+                key=lambda node: (
+                    node.conflicts(vm.groups, backup=True),
+                    (node.backup_memory + node.memory + vm.memory) / node.weight,
+                ),
+            )
+            vm.backup = node.uuid
+            node.add_backup(vm)
+
+    def plan(self) -> list[PlacedVM]:
+        """Computes the placement, returns movable VMs whose affinity has to change."""
+        if self.nodes:
+            self.place_unplaced()
+            self.spread_groups()
+            self.balance()
+            self.assign_backups()
+        return [
+            vm
+            for vm in self.vms
+            if vm.movable
+            and vm not in self.unplaced
+            and (vm.preferred or "", vm.backup or "") != vm.affinity[1:]
+        ]
+
+    def node_summary(self) -> list[dict[str, Any]]:
+        return [
+            dict(
+                node_uuid=node.uuid,
+                lan_ip=node.lan_ip,
+                memory_limit=int(node.limit) if node.limit is not None else None,
+                before=self.before[node.uuid],
+                after=node.summary(),
+            )
+            for node in self.nodes.values()
+        ]
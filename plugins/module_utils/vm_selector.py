@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+from __future__ import annotations
+
+__metaclass__ = type
+
+import re
+from fnmatch import fnmatchcase
+from typing import Any, Iterable, Optional
+
+from ..module_utils import errors
+from ..module_utils.rest_client import RestClient
+from ..module_utils.vm import FROM_HYPERCORE_TO_ANSIBLE_POWER_STATE
+
+GLOB_CHARACTERS = "*?["
+
+
+def get_tags(vm_dict: dict[str, Any]) -> list[str]:
+    """VirDomain tags are stored as comma separated string."""
+    return [tag for tag in (vm_dict.get("tags") or "").split(",") if tag]
+
+
+class VMIndex:
+    """
+    Raw VirDomain records from one listing, indexed by name and by tag.
+    """
+
+    def __init__(self, vm_dicts: Iterable[dict[str, Any]]):
+        self.records: list[dict[str, Any]] = list(vm_dicts)
+        self.by_name: dict[str, list[int]] = {}
+        self.by_tag: dict[str, list[int]] = {}
+        for position, vm_dict in enumerate(self.records):
+            self.by_name.setdefault(vm_dict["name"], []).append(position)
+            for tag in get_tags(vm_dict):
+                self.by_tag.setdefault(tag, []).append(position)
+
+    @classmethod
+    def get(cls, rest_client: RestClient) -> VMIndex:
+        return cls(rest_client.list_records("/rest/v1/VirDomain"))
+
+    def get_by_names(
+        self, names: Iterable[str], must_exist: bool = False
+    ) -> list[dict[str, Any]]:
+        """Returns VMs with given names, in the order of names."""
+        vm_dicts: list[dict[str, Any]] = []
+        missing = []
+        for name in names:
+            positions = self.by_name.get(name)
+            if not positions:
+                missing.append(name)
+                continue
+            vm_dicts.extend(self.records[position] for position in positions)
+        if missing and must_exist:
+            raise errors.VMNotFound(", ".join(missing))
+        return vm_dicts
+
+    def tagged(self, tags: Iterable[str], match_all: bool) -> list[int]:
+        """Returns sorted positions of VMs with all (or any) of the tags."""
+        position_lists = [self.by_tag.get(tag, []) for tag in set(tags)]
+        if not position_lists:
+            return []
+        if match_all:
+            position_lists.sort(key=len)
+            positions = set(position_lists[0])
+            for other in position_lists[1:]:
+                positions.intersection_update(other)
+        else:
+            positions = set().union(*position_lists)
+        return sorted(positions)
+
+
+class VMSelector:
+    """
+    Selects VMs by tags, name (shell-style pattern or regular expression),
+    power state and node. All set criteria must match.
+    Tags and exact names are looked up in VMIndex, other criteria are checked
+    only on those candidates.
+    """
+
+    def __init__(
+        self,
+        tags: Optional[list[str]] = None,
+        tags_match: str = "all",
+        name: Optional[str] = None,
+        name_regex: Optional[str] = None,
+        power_state: Optional[list[str]] = None,
+        node: Optional[str] = None,
+    ):
+        self.tags = tags
+        self.tags_match = tags_match
+        self.name = name
+        try:
+            self.name_regex = re.compile(name_regex) if name_regex else None
+        except re.error as e:
+            raise errors.ScaleComputingError(
+                "Invalid name_regex {0}: {1}".format(name_regex, e)
+            )
+        self.power_state = power_state
+        self.node = node
+
+    @classmethod
+    def from_ansible(cls, ansible_data: dict[str, Any]) -> VMSelector:
+        return cls(
+            tags=ansible_data.get("tags"),
+            tags_match=ansible_data.get("tags_match") or "all",
+            name=ansible_data.get("name"),
+            name_regex=ansible_data.get("name_regex"),
+            power_state=ansible_data.get("power_state"),
+            node=ansible_data.get("node"),
+        )
+
+    def get_node_uuids(self, rest_client: RestClient) -> set[str]:
+        """Node can be given by uuid, LAN IP or backplane IP."""
+        node_uuids = set()
+        for node_dict in rest_client.list_records("/rest/v1/Node"):
+            if self.node in (
+                node_dict["uuid"],
+                node_dict["lanIP"],
+                node_dict["backplaneIP"],
+            ):
+                node_uuids.add(node_dict["uuid"])
+        if not node_uuids:
+            raise errors.ScaleComputingError("Node - {0} - not found".format(self.node))
+        return node_uuids
+
+    def candidates(self, index: VMIndex) -> list[int]:
+        if self.tags:
+            return index.tagged(self.tags, self.tags_match == "all")
+        if self.name and not any(char in self.name for char in GLOB_CHARACTERS):
+            return index.by_name.get(self.name, [])
+        return list(range(len(index.records)))
+
+    def matches(
+        self, vm_dict: dict[str, Any], node_uuids: Optional[set[str]] = None
+    ) -> bool:
+        if self.name and not fnmatchcase(vm_dict["name"], self.name):
+            return False
+        if self.name_regex and not self.name_regex.search(vm_dict["name"]):
+            return False
+        if (
+            self.power_state
+            and FROM_HYPERCORE_TO_ANSIBLE_POWER_STATE.get(vm_dict["state"])
+            not in self.power_state
+        ):
+            return False
+        if node_uuids is not None and vm_dict["nodeUUID"] not in node_uuids:
+            return False
+        return True
+
+    def select(
+        self, rest_client: RestClient, index: Optional[VMIndex] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Returns raw VirDomain records of selected VMs, in the order of VM listing.
+        VMs are listed once, pass index to reuse an existing listing.
+        """
+        if index is None:
+            index = VMIndex.get(rest_client)
+        node_uuids = self.get_node_uuids(rest_client) if self.node else None
+        return [
+            index.records[position]
+            for position in self.candidates(index)
+            if self.matches(index.records[position], node_uuids)
+        ]
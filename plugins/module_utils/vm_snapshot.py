@@ -10,16 +10,30 @@ __metaclass__ = type
 
 from .rest_client import RestClient
 
-from ..module_utils.utils import PayloadMapper
+from ..module_utils.utils import PayloadMapper, drain
 
 from ..module_utils.typed_classes import (
+    TypedTaskTag,
     TypedVMSnapshotToAnsible,
     TypedVMSnapshotFromAnsible,
 )
-from typing import List, Any, Dict, Optional
+from typing import List, Any, Dict, Iterator, Optional
 
 
 class VMSnapshot(PayloadMapper):
+    __slots__ = (
+        "snapshot_uuid",
+        "vm",
+        "timestamp",
+        "label",
+        "type",
+        "automated_trigger_timestamp",
+        "local_retain_until_timestamp",
+        "remote_retain_until_timestamp",
+        "block_count_diff_from_serial_number",
+        "replication",
+    )
+
     def __init__(
         self,
         snapshot_uuid: Optional[str] = None,
@@ -136,6 +150,45 @@ class VMSnapshot(PayloadMapper):
 
         return snapshots
 
+    @classmethod
+    def iter_snapshots_by_params(
+        cls,
+        params: dict[
+            Any, Any
+        ],  # params must be a dict with keys: "vm_name", "serial", "label"
+        rest_client: RestClient,
+    ) -> Iterator[TypedVMSnapshotToAnsible]:
+        """
+        Yields snapshots matching params, one by one.
+        Filters are applied to raw records in a single pass, only matching
+        snapshots are converted.
+        """
+        vm_uuids = None
+        if params["vm_name"]:
+            # Resolve vm_name to domainUUID first, snapshots of other VMs are skipped
+            # without looking into nested domain data.
+            vm_uuids = {
+                vm["uuid"]
+                for vm in rest_client.list_records(
+                    "/rest/v1/VirDomain", {"name": params["vm_name"]}
+                )
+            }
+            if not vm_uuids:
+                return
+        serial = params["serial"]
+        label = params["label"]
+        # Raw records are released one by one, as they are filtered and converted.
+        for hypercore_dict in drain(
+            rest_client.list_records("/rest/v1/VirDomainSnapshot")
+        ):
+            if vm_uuids is not None and hypercore_dict["domainUUID"] not in vm_uuids:
+                continue
+            if serial and hypercore_dict["domain"]["snapshotSerialNumber"] != serial:
+                continue
+            if label and hypercore_dict["label"] != label:
+                continue
+            yield cls.from_hypercore(hypercore_data=hypercore_dict).to_ansible()  # type: ignore
+
     @classmethod
     def filter_snapshots_by_params(
         cls,
@@ -144,21 +197,23 @@ class VMSnapshot(PayloadMapper):
         ],  # params must be a dict with keys: "vm_name", "serial", "label"
         rest_client: RestClient,
     ) -> List[Optional[TypedVMSnapshotToAnsible]]:
-        vm_snapshots = cls.get_snapshots_by_query({}, rest_client)
-        if not params["vm_name"] and not params["serial"] and not params["label"]:
-            return (
-                vm_snapshots  # return all snapshots if none of the params are present
-            )
-
-        # else filter results by label, vm.name, vm.snapshotSerialNumber
-        new_snaps = vm_snapshots[
-            :
-        ]  # for some unknown reason, using just "vm_snapshots" returns empty list: []
-        if params["vm_name"]:
-            new_snaps = [vm_snap for vm_snap in new_snaps if vm_snap["vm"]["name"] == params["vm_name"]]  # type: ignore
-        if params["serial"]:
-            new_snaps = [vm_snap for vm_snap in new_snaps if vm_snap["vm"]["snapshot_serial_number"] == params["serial"]]  # type: ignore
-        if params["label"]:
-            new_snaps = [vm_snap for vm_snap in new_snaps if vm_snap["label"] == params["label"]]  # type: ignore
+        # Returns all snapshots if none of the params are present.
+        return list(cls.iter_snapshots_by_params(params, rest_client))
+
+    @staticmethod
+    def create_snapshot(
+        vm_uuid: str, label: str, rest_client: RestClient, check_mode: bool = False
+    ) -> TypedTaskTag:
+        return rest_client.create_record(
+            "/rest/v1/VirDomainSnapshot",
+            dict(domainUUID=vm_uuid, label=label),
+            check_mode,
+        )
 
-        return new_snaps
+    @staticmethod
+    def delete_snapshot(
+        snapshot_uuid: str, rest_client: RestClient, check_mode: bool = False
+    ) -> TypedTaskTag:
+        return rest_client.delete_record(
+            "/rest/v1/VirDomainSnapshot/{0}".format(snapshot_uuid), check_mode
+        )
@@ -0,0 +1,780 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r"""
+module: cluster_config
+
+author:
+  - XLAB Steampunk (@xlab-steampunk)
+short_description: Configure HyperCore cluster in a single step
+description:
+  - Use this module to fully configure a new HyperCore cluster, or partially reconfigure an existing one.
+  - Current configuration of all sections in I(config) is read concurrently,
+    one combined diff is computed, and changes are applied concurrently.
+    Each section is applied with the same API calls as the corresponding module.
+  - Sections missing from I(config) are not changed.
+    To remove email alert recipients or syslog servers, set the section to an empty list.
+version_added: 1.3.0
+extends_documentation_fragment:
+  - scale_computing.hypercore.cluster_instance
+seealso:
+  - module: scale_computing.hypercore.cluster_name
+  - module: scale_computing.hypercore.registration
+  - module: scale_computing.hypercore.dns_config
+  - module: scale_computing.hypercore.oidc_config
+  - module: scale_computing.hypercore.time_server
+  - module: scale_computing.hypercore.time_zone
+  - module: scale_computing.hypercore.smtp
+  - module: scale_computing.hypercore.email_alert
+  - module: scale_computing.hypercore.syslog_server
+options:
+  config:
+    description:
+      - Full or partial cluster configuration.
+      - Same format as C(scale_computing_hypercore_cluster_config) variable of the C(cluster_config) role.
+    type: dict
+    required: true
+    suboptions:
+      name:
+        description:
+          - Cluster name.
+          - Same HyperCore versions as for M(scale_computing.hypercore.cluster_name) are required
+            to change it.
+          - See also M(scale_computing.hypercore.cluster_name).
+        type: str
+      registration:
+        description:
+          - Cluster registration data.
+          - See also M(scale_computing.hypercore.registration).
+        type: dict
+        suboptions:
+          company_name:
+            description: Company name
+            type: str
+            required: true
+          contact:
+            description: Technical contact first and second name
+            type: str
+            required: true
+          phone:
+            description: Technical contact phone number
+            type: str
+            required: true
+          email:
+            description: Technical contact email address
+            type: str
+            required: true
+      dns:
+        description:
+          - DNS configuration. Missing I(server_ips) or I(search_domains) are not changed.
+          - See also M(scale_computing.hypercore.dns_config).
+        type: dict
+        suboptions:
+          server_ips:
+            description: DNS resolver IPs.
+            type: list
+            elements: str
+          search_domains:
+            description: DNS search domains.
+            type: list
+            elements: str
+      oidc:
+        description:
+          - OpenID connect configuration.
+          - I(shared_secret) cannot be read back from HyperCore API.
+            If it is set, the configuration is always sent.
+          - See also M(scale_computing.hypercore.oidc_config).
+        type: dict
+        suboptions:
+          client_id:
+            description: OIDC client ID.
+            type: str
+            required: true
+          shared_secret:
+            description: OIDC client secret.
+            type: str
+          certificate:
+            description: OIDC client certificate, PEM encoded.
+            type: str
+          config_url:
+            description: OIDC configuration URL.
+            type: str
+            required: true
+          scopes:
+            description: OIDC client scopes.
+            type: str
+            required: true
+      time_server:
+        description:
+          - Cluster NTP time server.
+          - See also M(scale_computing.hypercore.time_server).
+        type: str
+      time_zone:
+        description:
+          - Cluster time zone.
+          - Must be a time zone supported by M(scale_computing.hypercore.time_zone).
+          - See also M(scale_computing.hypercore.time_zone).
+        type: str
+      smtp:
+        description:
+          - SMTP server configuration. Missing values are not changed.
+          - See also M(scale_computing.hypercore.smtp).
+        type: dict
+        suboptions:
+          server:
+            description: SMTP server (IP or DNS name).
+            type: str
+            required: true
+          port:
+            description: SMTP server TCP port.
+            type: int
+            required: true
+          use_ssl:
+            description: Use SSL/TLS encryption between HyperCore and SMTP server.
+            type: bool
+          auth_user:
+            description: Username to authenticate against SMTP server.
+            type: str
+          auth_password:
+            description: Password to authenticate against SMTP server.
+            type: str
+          from_address:
+            description: The "From" email address for email alerts.
+            type: str
+      email_alerts:
+        description:
+          - Email addresses that will receive email alerts. Other recipients are removed.
+          - See also M(scale_computing.hypercore.email_alert).
+        type: list
+        elements: str
+      syslog_servers:
+        description:
+          - Syslog servers. Other syslog servers are removed.
+          - See also M(scale_computing.hypercore.syslog_server).
+        type: list
+        elements: dict
+        suboptions:
+          host:
+            description: Syslog server IP address or DNS name.
+            type: str
+            required: true
+          port:
+            description: The IP port syslog server is listening to.
+            type: int
+            default: 514
+          protocol:
+            description: Syslog IP protocol.
+            type: str
+            choices: [ udp, tcp ]
+            default: udp
+  max_concurrency:
+    description:
+      - Maximum number of concurrent API read requests, and of configuration changes in progress.
+    type: int
+    default: 5
+notes:
+  - C(check_mode) is supported. The diff and the list of operations are returned,
+    but no changes are applied.
+"""
+
+EXAMPLES = r"""
+- name: Configure cluster
+  scale_computing.hypercore.cluster_config:
+    config:
+      name: cluster-a
+      dns:
+        server_ips:
+          - 10.0.0.1
+          - 10.0.0.2
+        search_domains:
+          - example.com
+      time_server: pool.ntp.org
+      time_zone: Europe/Ljubljana
+      smtp:
+        server: smtp.example.com
+        port: 25
+        from_address: cluster-a@example.com
+      email_alerts:
+        - admin@example.com
+      syslog_servers:
+        - host: 10.0.0.10
+          port: 514
+          protocol: udp
+  register: result
+"""
+
+RETURN = r"""
+operations:
+  description:
+    - Configuration changes, in the order they were started.
+  returned: success, or when some of the operations failed
+  type: list
+  elements: dict
+  contains:
+    section:
+      description: Section of I(config)
+      type: str
+      sample: dns
+    description:
+      description: What was changed
+      type: str
+      sample: update DNS configuration
+    task_tag:
+      description: Task tag of the change, if API returned one. Not returned in check mode.
+      type: str
+      sample: "1234"
+    duration:
+      description: Seconds from the request until the task finished. Not returned in check mode.
+      type: float
+      sample: 1.204
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils.basic import AnsibleModule
+
+from ..module_utils import arguments, errors
+from ..module_utils.bulk import run_tasks, update_records
+from ..module_utils.client import Client
+from ..module_utils.cluster import Cluster
+from ..module_utils.dns_config import DNSConfig
+from ..module_utils.email_alert import EmailAlert
+from ..module_utils.hypercore_version import HyperCoreVersion
+from ..module_utils.oidc import Oidc
+from ..module_utils.registration import Registration
+from ..module_utils.rest_client import RestClient
+from ..module_utils.smtp import SMTP
+from ..module_utils.syslog_server import SyslogServer, protocols
+from ..module_utils.time_server import TimeServer
+from ..module_utils.time_zone import TimeZone
+from ..module_utils import time_zone_catalog
+from ..module_utils.typed_classes import TypedTaskTag
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ENDPOINTS = dict(
+    name="/rest/v1/Cluster",
+    registration="/rest/v1/Registration",
+    dns="/rest/v1/DNSConfig",
+    oidc="/rest/v1/OIDCConfig",
+    time_server="/rest/v1/TimeSource",
+    time_zone="/rest/v1/TimeZone",
+    smtp="/rest/v1/AlertSMTPConfig",
+    email_alerts="/rest/v1/AlertEmailTarget",
+    syslog_servers="/rest/v1/AlertSyslogTarget",
+)
+# Sections where an empty list is a valid configuration.
+LIST_SECTIONS = ("email_alerts", "syslog_servers")
+# Same as cluster_name module.
+HYPERCORE_VERSION_REQUIREMENTS = ">=9.1.21 <9.2.0 || >=9.2.11"
+SYSLOG_PROTOCOLS = dict((value, key) for key, value in protocols.items())
+
+# (section, description, start) - start() sends the request and returns its task tag.
+Operation = Tuple[str, str, Callable[[], Optional[TypedTaskTag]]]
+Plan = Tuple[Any, Any, List[Operation]]
+
+
+def get_sections(config: Dict[str, Any]) -> List[str]:
+    """Sections to configure - same as the cluster_config role, empty values are skipped."""
+    return [
+        section
+        for section in ENDPOINTS
+        if config.get(section)
+        or (section in LIST_SECTIONS and config.get(section) == [])
+    ]
+
+
+def read_sections(
+    rest_client: RestClient, sections: List[str], max_concurrency: int
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Lists records of all sections concurrently."""
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        records = executor.map(
+            lambda section: rest_client.list_records(ENDPOINTS[section]), sections
+        )
+        return dict(zip(sections, records))
+
+
+def _entry_list(entries: List[str]) -> List[str]:
+    # Same as dns_config module - no empty values and no duplicates.
+    return list(dict.fromkeys(filter(None, entries)))
+
+
+def plan_name(
+    rest_client: RestClient, desired: str, records: List[Dict[str, Any]]
+) -> Plan:
+    cluster = Cluster.from_hypercore(records[0])
+    if cluster.name == desired:
+        return cluster.name, desired, []
+    hcversion = HyperCoreVersion(rest_client, cluster.icos_version)
+    if not hcversion.verify(HYPERCORE_VERSION_REQUIREMENTS):
+        raise errors.ScaleComputingError(
+            "HyperCore server version={0} does not match required version {1}".format(
+                hcversion.version, HYPERCORE_VERSION_REQUIREMENTS
+            )
+        )
+    return (
+        cluster.name,
+        desired,
+        [
+            (
+                "name",
+                "set cluster name",
+                lambda: cluster.update_name(rest_client, desired),
+            )
+        ],
+    )
+
+
+def plan_registration(
+    rest_client: RestClient, desired: Dict[str, Any], records: List[Dict[str, Any]]
+) -> Plan:
+    current = Registration.from_hypercore(records[0]) if records else None
+    registration = Registration.from_ansible(desired)  # type: ignore
+    before = current.to_ansible() if current else None
+    after = registration.to_ansible()
+    if before == after:
+        return before, after, []
+    if current:
+        operation: Operation = (
+            "registration",
+            "update registration",
+            lambda: registration.send_update_request(rest_client),
+        )
+    else:
+        operation = (
+            "registration",
+            "create registration",
+            lambda: registration.send_create_request(rest_client),
+        )
+    return before, after, [operation]
+
+
+def plan_dns(
+    rest_client: RestClient, desired: Dict[str, Any], records: List[Dict[str, Any]]
+) -> Plan:
+    current = DNSConfig.from_hypercore(records[0]) if records else None  # type: ignore
+    before = (
+        dict(server_ips=current.server_ips, search_domains=current.search_domains)
+        if current
+        else None
+    )
+    after = dict(
+        server_ips=_entry_list(
+            desired["server_ips"]
+            if desired.get("server_ips") is not None
+            else (current.server_ips if current else [])
+        ),
+        search_domains=_entry_list(
+            desired["search_domains"]
+            if desired.get("search_domains") is not None
+            else (current.search_domains if current else [])
+        ),
+    )
+    if before == after:
+        return before, after, []
+    payload = dict(searchDomains=after["search_domains"], serverIPs=after["server_ips"])
+    if current:
+        endpoint = "/rest/v1/DNSConfig/{0}".format(current.uuid)
+        operation: Operation = (
+            "dns",
+            "update DNS configuration",
+            lambda: rest_client.update_record(endpoint, payload, False),
+        )
+    else:
+        operation = (
+            "dns",
+            "create DNS configuration",
+            lambda: rest_client.create_record("/rest/v1/DNSConfig", payload, False),
+        )
+    return before, after, [operation]
+
+
+def plan_oidc(
+    rest_client: RestClient, desired: Dict[str, Any], records: List[Dict[str, Any]]
+) -> Plan:
+    current = Oidc.from_hypercore(records[0]) if records else None
+    oidc = Oidc.from_ansible(desired)  # type: ignore
+    before = current.to_ansible() if current else None
+    after = oidc.to_ansible()
+    certificate_changed = bool(
+        oidc.certificate and (not current or current.certificate != oidc.certificate)
+    )
+    # Shared secret is write-only, we cannot know if it changed.
+    if before == after and not certificate_changed and not oidc.shared_secret:
+        return before, after, []
+    if current:
+        operation: Operation = (
+            "oidc",
+            "update OIDC configuration",
+            lambda: oidc.send_update_request(rest_client),
+        )
+    else:
+        operation = (
+            "oidc",
+            "create OIDC configuration",
+            lambda: oidc.send_create_request(rest_client),
+        )
+    return before, after, [operation]
+
+
+def plan_time_server(
+    rest_client: RestClient, desired: str, records: List[Dict[str, Any]]
+) -> Plan:
+    current = TimeServer.from_hypercore(records[0]) if records else None  # type: ignore
+    before = current.host if current else None
+    if before == desired:
+        return before, desired, []
+    payload = dict(host=desired)
+    if current:
+        endpoint = "/rest/v1/TimeSource/{0}".format(current.uuid)
+        operation: Operation = (
+            "time_server",
+            "update time server",
+            lambda: rest_client.update_record(endpoint, payload, False),
+        )
+    else:
+        operation = (
+            "time_server",
+            "create time server",
+            lambda: rest_client.create_record("/rest/v1/TimeSource", payload, False),
+        )
+    return before, desired, [operation]
+
+
+def plan_time_zone(
+    rest_client: RestClient, desired: str, records: List[Dict[str, Any]]
+) -> Plan:
+    if not time_zone_catalog.is_supported(desired):
+        raise errors.ScaleComputingError(
+            "Time Zone: Time zone {0} not supported.".format(desired)
+        )
+    current = TimeZone.from_hypercore(records[0]) if records else None  # type: ignore
+    before = current.zone if current else None
+    if before == desired:
+        return before, desired, []
+    payload = dict(timeZone=desired)
+    if current:
+        endpoint = "/rest/v1/TimeZone/{0}".format(current.uuid)
+        operation: Operation = (
+            "time_zone",
+            "update time zone",
+            lambda: rest_client.update_record(endpoint, payload, False),
+        )
+    else:
+        operation = (
+            "time_zone",
+            "create time zone",
+            lambda: rest_client.create_record("/rest/v1/TimeZone", payload, False),
+        )
+    return before, desired, [operation]
+
+
+def plan_smtp(
+    rest_client: RestClient, desired: Dict[str, Any], records: List[Dict[str, Any]]
+) -> Plan:
+    current = SMTP.from_hypercore(records[0]) if records else SMTP()
+    fields = ("server", "port", "use_ssl", "auth_user", "auth_password", "from_address")
+    before = (
+        dict((field, getattr(current, field)) for field in fields) if records else None
+    )
+    after = dict(
+        (
+            field,
+            desired[field]
+            if desired.get(field) is not None
+            else getattr(current, field),
+        )
+        for field in fields
+    )
+    changed = before != after
+    payload = dict(
+        smtpServer=after["server"],
+        port=after["port"],
+        useSSL=bool(after["use_ssl"]),
+        authUser=after["auth_user"] or "",
+        authPassword=after.pop("auth_password") or "",
+        fromAddress=after["from_address"] or "",
+    )
+    # Password is compared (API returns an empty one), but not shown in diff.
+    if before:
+        before.pop("auth_password")
+    if not changed:
+        return before, after, []
+    if records:
+        endpoint = "/rest/v1/AlertSMTPConfig/{0}".format(current.uuid)
+        operation: Operation = (
+            "smtp",
+            "update SMTP configuration",
+            lambda: rest_client.update_record(endpoint, payload, False),
+        )
+    else:
+        operation = (
+            "smtp",
+            "create SMTP configuration",
+            lambda: rest_client.create_record(
+                "/rest/v1/AlertSMTPConfig", payload, False
+            ),
+        )
+    return before, after, [operation]
+
+
+def _no_task(function: Callable[[], Any]) -> Callable[[], Optional[TypedTaskTag]]:
+    # For module_utils methods that wait for their task, or do not return it.
+    def start() -> Optional[TypedTaskTag]:
+        function()
+        return None
+
+    return start
+
+
+def plan_email_alerts(
+    rest_client: RestClient, desired: List[str], records: List[Dict[str, Any]]
+) -> Plan:
+    current = [EmailAlert.from_hypercore(record) for record in records]
+    before = [email_alert.email for email_alert in current]
+    after = list(dict.fromkeys(desired))
+    operations: List[Operation] = []
+    for email_alert in current:
+        if email_alert.email not in after:
+            operations.append(
+                (
+                    "email_alerts",
+                    "remove {0}".format(email_alert.email),
+                    _no_task(lambda email_alert=email_alert: email_alert.delete(rest_client)),  # type: ignore
+                )
+            )
+    for email in after:
+        if email not in before:
+            operations.append(
+                (
+                    "email_alerts",
+                    "add {0}".format(email),
+                    _no_task(
+                        lambda email=email: EmailAlert.create(  # type: ignore
+                            rest_client, dict(emailAddress=email)
+                        )
+                    ),
+                )
+            )
+    return before, after, operations
+
+
+def plan_syslog_servers(
+    rest_client: RestClient,
+    desired: List[Dict[str, Any]],
+    records: List[Dict[str, Any]],
+) -> Plan:
+    current = dict(
+        (syslog_server.host, syslog_server)
+        for syslog_server in (SyslogServer.from_hypercore(record) for record in records)
+        if syslog_server
+    )
+    before = [
+        dict(host=host, port=server.port, protocol=server.protocol)
+        for host, server in current.items()
+    ]
+    after = [
+        dict(
+            host=server["host"],
+            port=server.get("port") or 514,
+            protocol=server.get("protocol") or "udp",
+        )
+        for server in desired
+    ]
+    desired_hosts = [server["host"] for server in after]
+    operations: List[Operation] = []
+    for host, syslog_server in current.items():
+        if host not in desired_hosts:
+            operations.append(
+                (
+                    "syslog_servers",
+                    "remove {0}".format(host),
+                    _no_task(
+                        lambda syslog_server=syslog_server: syslog_server.delete(  # type: ignore
+                            rest_client
+                        )
+                    ),
+                )
+            )
+    for server in after:
+        payload = dict(
+            host=server["host"],
+            port=server["port"],
+            protocol=SYSLOG_PROTOCOLS[server["protocol"]],
+        )
+        existing = current.get(server["host"])
+        if existing is None:
+            operations.append(
+                (
+                    "syslog_servers",
+                    "add {0}".format(server["host"]),
+                    _no_task(
+                        lambda payload=payload: SyslogServer.create(  # type: ignore
+                            rest_client, payload
+                        )
+                    ),
+                )
+            )
+        elif (existing.port, existing.protocol) != (server["port"], server["protocol"]):
+            operations.append(
+                (
+                    "syslog_servers",
+                    "update {0}".format(server["host"]),
+                    _no_task(
+                        lambda existing=existing, payload=payload: existing.update(  # type: ignore
+                            rest_client, payload
+                        )
+                    ),
+                )
+            )
+    return before, after, operations
+
+
+PLANNERS: Dict[str, Callable[[RestClient, Any, List[Dict[str, Any]]], Plan]] = dict(
+    name=plan_name,
+    registration=plan_registration,
+    dns=plan_dns,
+    oidc=plan_oidc,
+    time_server=plan_time_server,
+    time_zone=plan_time_zone,
+    smtp=plan_smtp,
+    email_alerts=plan_email_alerts,
+    syslog_servers=plan_syslog_servers,
+)
+
+
+def run(
+    module: AnsibleModule, rest_client: RestClient
+) -> Tuple[bool, List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    config = module.params["config"]
+    max_concurrency = module.params["max_concurrency"]
+    if max_concurrency < 1:
+        raise errors.ScaleComputingError("max_concurrency must be at least 1.")
+    sections = get_sections(config)
+    current = read_sections(rest_client, sections, max_concurrency)
+
+    diff: Dict[str, Dict[str, Any]] = dict(before={}, after={})
+    operations: List[Operation] = []
+    for section in sections:
+        before, after, section_operations = PLANNERS[section](
+            rest_client, config[section], current[section]
+        )
+        diff["before"][section] = before
+        diff["after"][section] = after
+        operations.extend(section_operations)
+
+    records: List[Dict[str, Any]] = [
+        dict(section=section, description=description)
+        for section, description, _start in operations
+    ]
+    if module.check_mode or not operations:
+        return bool(operations), records, diff
+
+    results = run_tasks(
+        rest_client,
+        operations,
+        lambda operation: operation[2](),
+        max_concurrency=max_concurrency,
+    )
+    update_records(
+        records,
+        results,
+        "Failed to apply {0} of {1} cluster configuration changes",
+        lambda record: "{0} ({1})".format(record["section"], record["description"]),
+    )
+    return True, records, diff
+
+
+def main() -> None:
+    module = AnsibleModule(
+        supports_check_mode=True,
+        argument_spec=dict(
+            arguments.get_spec("cluster_instance"),
+            config=dict(
+                type="dict",
+                required=True,
+                options=dict(
+                    name=dict(type="str"),
+                    registration=dict(
+                        type="dict",
+                        options=dict(
+                            company_name=dict(type="str", required=True),
+                            contact=dict(type="str", required=True),
+                            phone=dict(type="str", required=True),
+                            email=dict(type="str", required=True),
+                        ),
+                    ),
+                    dns=dict(
+                        type="dict",
+                        options=dict(
+                            server_ips=dict(type="list", elements="str"),
+                            search_domains=dict(type="list", elements="str"),
+                        ),
+                    ),
+                    oidc=dict(
+                        type="dict",
+                        options=dict(
+                            client_id=dict(type="str", required=True),
+                            shared_secret=dict(type="str", no_log=True),
+                            certificate=dict(type="str", no_log=True),
+                            config_url=dict(type="str", required=True),
+                            scopes=dict(type="str", required=True),
+                        ),
+                    ),
+                    time_server=dict(type="str"),
+                    time_zone=dict(type="str"),
+                    smtp=dict(
+                        type="dict",
+                        options=dict(
+                            server=dict(type="str", required=True),
+                            port=dict(type="int", required=True),
+                            use_ssl=dict(type="bool"),
+                            auth_user=dict(type="str"),
+                            auth_password=dict(type="str", no_log=True),
+                            from_address=dict(type="str"),
+                        ),
+                    ),
+                    email_alerts=dict(type="list", elements="str"),
+                    syslog_servers=dict(
+                        type="list",
+                        elements="dict",
+                        options=dict(
+                            host=dict(type="str", required=True),
+                            port=dict(type="int", default=514),
+                            protocol=dict(
+                                type="str", choices=["udp", "tcp"], default="udp"
+                            ),
+                        ),
+                    ),
+                ),
+            ),
+            max_concurrency=dict(type="int", default=5),
+        ),
+    )
+
+    try:
+        client = Client.get_client(module.params["cluster_instance"])
+        rest_client = RestClient(client)
+        changed, records, diff = run(module, rest_client)
+        module.exit_json(
+            changed=changed,
+            operations=records,
+            diff=diff,
+            **client.throttle_result(),
+        )
+    except errors.BulkError as e:
+        module.fail_json(msg=str(e), operations=e.records)
+    except errors.ScaleComputingError as e:
+        module.fail_json(msg=str(e))
+
+
+if __name__ == "__main__":
+    main()
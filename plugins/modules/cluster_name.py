@@ -111,7 +111,9 @@ def main() -> None:
         hcversion = HyperCoreVersion(rest_client)
         hcversion.check_version(module, HYPERCORE_VERSION_REQUIREMENTS)
         changed, record, diff = run(module, rest_client)
-        module.exit_json(changed=changed, record=record, diff=diff)
+        module.exit_json(
+            changed=changed, record=record, diff=diff, **client.throttle_result()
+        )
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
@@ -28,6 +28,19 @@ options:
         - Defaults to false.
       type: bool
       default: false
+  wait_timeout:
+    description:
+      - Maximum number of seconds to wait for all nodes to shut down.
+      - Nodes are checked with connect-only probes of their API port.
+    type: int
+    default: 3600
+    version_added: 1.3.0
+  probe_timeout:
+    description:
+      - Timeout of a single connection probe, in seconds.
+    type: int
+    default: 5
+    version_added: 1.3.0
 notes:
   - C(check_mode) is not supported.
 """
@@ -44,6 +57,44 @@ shutdown:
   returned: always
   type: bool
   sample: true
+duration:
+  description: Seconds from the shutdown request until the last node stopped accepting connections.
+  returned: success
+  type: float
+  sample: 184.2
+  version_added: 1.3.0
+nodes:
+  description:
+    - Shutdown of every node, and of the API host if it is not a node address.
+  returned: success
+  type: list
+  elements: dict
+  version_added: 1.3.0
+  contains:
+    node_uuid:
+      description: Unique identifier of the node. C(null) for the API host.
+      type: str
+      sample: 51e6d073-7566-4273-9196-58720117bd7f
+    address:
+      description: Probed address, LAN IP of the node.
+      type: str
+      sample: 10.0.0.1
+    reachable_before_shutdown:
+      description: Was the node accepting connections before shutdown. Unreachable nodes are not waited for.
+      type: bool
+      sample: true
+    down_after:
+      description: Seconds from the shutdown request until the node stopped accepting connections.
+      type: float
+      sample: 184.2
+    went_down:
+      description:
+        - How the first failed probe failed.
+        - C(refused) - host was up, but API stopped.
+        - C(timeout) - host stopped responding, usually powered off.
+        - C(unreachable) - no route to host.
+      type: str
+      sample: refused
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -52,11 +103,17 @@ from ..module_utils import arguments, errors
 from ..module_utils.client import Client
 from ..module_utils.rest_client import RestClient
 from ..module_utils.cluster import Cluster
+from typing import Any, Dict, Tuple
 
 
-def run(module: AnsibleModule, rest_client: RestClient) -> bool:
-    Cluster.shutdown(rest_client, module.params["force_shutdown"])
-    return True
+def run(module: AnsibleModule, rest_client: RestClient) -> Tuple[bool, Dict[str, Any]]:
+    result = Cluster.shutdown(
+        rest_client,
+        module.params["force_shutdown"],
+        timeout=module.params["wait_timeout"],
+        probe_timeout=module.params["probe_timeout"],
+    )
+    return True, result
 
 
 def main() -> None:
@@ -65,14 +122,18 @@ def main() -> None:
         argument_spec=dict(
             arguments.get_spec("cluster_instance"),
             force_shutdown=dict(type="bool", default=False),
+            wait_timeout=dict(type="int", default=3600),
+            probe_timeout=dict(type="int", default=5),
         ),
     )
 
     try:
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = RestClient(client)
-        shutdown = run(module, rest_client)
-        module.exit_json(changed=True, shutdown=shutdown)
+        shutdown, result = run(module, rest_client)
+        module.exit_json(
+            changed=True, shutdown=shutdown, **result, **client.throttle_result()
+        )
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
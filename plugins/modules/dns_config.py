@@ -276,7 +276,9 @@ def main() -> None:
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = RestClient(client)
         changed, new_state, diff = run(module, rest_client)
-        module.exit_json(changed=changed, new_state=new_state, diff=diff)
+        module.exit_json(
+            changed=changed, new_state=new_state, diff=diff, **client.throttle_result()
+        )
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
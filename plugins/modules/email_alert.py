@@ -285,7 +285,9 @@ def main() -> None:
         rest_client = RestClient(client)
         validate_params(module)
         changed, record, diff = run(module, rest_client)
-        module.exit_json(changed=changed, record=record, diff=diff)
+        module.exit_json(
+            changed=changed, record=record, diff=diff, **client.throttle_result()
+        )
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
@@ -104,7 +104,7 @@ def main() -> None:
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = RestClient(client)
         records = run(rest_client)
-        module.exit_json(changed=False, records=records)
+        module.exit_json(changed=False, records=records, **client.throttle_result())
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
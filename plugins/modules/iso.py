@@ -48,6 +48,16 @@ options:
       - Only relevant if you want to post an iso image to the HyperCore API (setting C(state=present)).
       - path to ISO image on ansible controller.
       - It must not be http or smb link
+  wait:
+    description:
+      - Wait until the ISO image is marked as ready for insert, or until it is deleted.
+      - With I(wait=false), the module returns right after the request, with I(task_tag)
+        that can be awaited later with M(scale_computing.hypercore.task_wait).
+        I(record) is read right after the request.
+      - ISO image data is always uploaded before the module returns.
+    type: bool
+    default: true
+    version_added: 1.3.0
 notes:
   - C(check_mode) is not supported.
   - Return value C(record) is added in version 1.2.0, and deprecates return value C(results).
@@ -144,6 +154,23 @@ results:
       description: Unique identifier
       type: str
       sample: 171afce9-2452-4294-9bc4-6e8ae49f7e4c
+task_tag:
+  description:
+    - Task tag of the last started task, C(null) if nothing was started.
+    - Can be passed to M(scale_computing.hypercore.task_wait).
+  returned: success
+  type: dict
+  version_added: 1.3.0
+  sample:
+    createdUUID: ""
+    taskTag: "1234"
+task_progress:
+  description:
+    - Progress of the task, sampled while waiting for it.
+    - See M(scale_computing.hypercore.task_wait) for the description of values.
+  returned: success
+  type: dict
+  version_added: 1.3.0
 """
 
 
@@ -154,7 +181,7 @@ import json
 from ..module_utils import errors, arguments
 from ..module_utils.client import Client
 from ..module_utils.rest_client import RestClient
-from ..module_utils.task_tag import TaskTag
+from ..module_utils.task_tag import TaskTag, TaskProgress
 from ..module_utils.iso import ISO
 
 """
@@ -170,7 +197,7 @@ in such case.
 ISO_TIMEOUT_TIME = 3600
 
 
-def ensure_present(module, rest_client):
+def ensure_present(module, rest_client, progress=None):
     iso_image = ISO.get_by_name(module.params, rest_client)
     if iso_image and iso_image.ready_for_insert:
         # ISO object with image uploaded already present, so there is nothing to do
@@ -218,28 +245,32 @@ def ensure_present(module, rest_client):
         payload=dict(readyForInsert=True),
         check_mode=module.check_mode,
     )
-    TaskTag.wait_task(rest_client, task_tag_update)
+    TaskTag.wait_task(
+        rest_client, task_tag_update, progress=progress, wait=module.params["wait"]
+    )
     iso_image = ISO.get_by_name(module.params, rest_client).to_ansible()
     return True, iso_image, dict(before=None, after=iso_image)
 
 
-def ensure_absent(module, rest_client):
+def ensure_absent(module, rest_client, progress=None):
     iso_image = ISO.get_by_name(module.params, rest_client)
     if iso_image:
         task_tag_delete = rest_client.delete_record(
             endpoint="{0}/{1}".format("/rest/v1/ISO", iso_image.uuid),
             check_mode=module.check_mode,
         )
-        TaskTag.wait_task(rest_client, task_tag_delete)
+        TaskTag.wait_task(
+            rest_client, task_tag_delete, progress=progress, wait=module.params["wait"]
+        )
         output = iso_image.to_ansible()
         return True, output, dict(before=output, after=None)
     return False, {}, dict()
 
 
-def run(module, rest_client):
+def run(module, rest_client, progress=None):
     if module.params["state"] == "absent":
-        return ensure_absent(module, rest_client)
-    return ensure_present(module, rest_client)
+        return ensure_absent(module, rest_client, progress)
+    return ensure_present(module, rest_client, progress)
 
 
 def main():
@@ -259,6 +290,7 @@ def main():
             source=dict(
                 type="str",
             ),
+            wait=dict(type="bool", default=True),
         ),
         required_if=[
             ("state", "present", ("source",)),
@@ -276,8 +308,17 @@ def main():
     try:
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = RestClient(client)
-        changed, record, diff = run(module, rest_client)
-        module.exit_json(changed=changed, record=record, results=[record], diff=diff)
+        progress = TaskProgress(log=module.log)
+        changed, record, diff = run(module, rest_client, progress)
+        module.exit_json(
+            changed=changed,
+            record=record,
+            results=[record],
+            diff=diff,
+            task_tag=progress.task,
+            task_progress=progress.to_ansible(),
+            **client.throttle_result(),
+        )
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
@@ -91,7 +91,7 @@ from ansible.module_utils.basic import AnsibleModule
 
 from ..module_utils import errors, arguments
 from ..module_utils.client import Client
-from ..module_utils.rest_client import RestClient
+from ..module_utils.rest_client import CachedRestClient
 from ..module_utils.utils import get_query
 from ..module_utils.iso import ISO
 
@@ -118,9 +118,9 @@ def main():
 
     try:
         client = Client.get_client(module.params["cluster_instance"])
-        rest_client = RestClient(client)
+        rest_client = CachedRestClient(client)
         records = run(module, rest_client)
-        module.exit_json(changed=False, records=records)
+        module.exit_json(changed=False, records=records, **client.throttle_result())
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
@@ -58,16 +58,13 @@ records:
 from ansible.module_utils.basic import AnsibleModule
 
 from ..module_utils import arguments, errors
-from ..module_utils.rest_client import RestClient
+from ..module_utils.rest_client import CachedRestClient
 from ..module_utils.client import Client
-from ..module_utils.node import Node
+from ..module_utils.node import NodeDirectory
 
 
 def run(rest_client):
-    return [
-        Node.from_hypercore(hypercore_data=hypercore_dict).to_ansible()
-        for hypercore_dict in rest_client.list_records("/rest/v1/Node")
-    ]
+    return [node.to_ansible() for node in NodeDirectory(rest_client).list()]
 
 
 def main():
@@ -78,9 +75,9 @@ def main():
 
     try:
         client = Client.get_client(module.params["cluster_instance"])
-        rest_client = RestClient(client)
+        rest_client = CachedRestClient(client)
         records = run(rest_client)
-        module.exit_json(changed=False, records=records)
+        module.exit_json(changed=False, records=records, **client.throttle_result())
 
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
@@ -80,7 +80,7 @@ def main() -> None:
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = CachedRestClient(client=client)
         changed, record = run(module, rest_client)
-        module.exit_json(changed=changed, record=record)
+        module.exit_json(changed=changed, record=record, **client.throttle_result())
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
@@ -89,7 +89,7 @@ def main() -> None:
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = CachedRestClient(client)
         record = run(module, rest_client)
-        module.exit_json(changed=False, record=record)
+        module.exit_json(changed=False, record=record, **client.throttle_result())
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
@@ -78,25 +78,22 @@ from ansible.module_utils.basic import AnsibleModule
 
 from ..module_utils import arguments, errors
 from ..module_utils.rest_client import RestClient
-from ..module_utils.utils import filter_results
 from ..module_utils.client import Client
 from ..module_utils.remote_cluster import RemoteCluster
 
 
 def run(module, rest_client):
-    records = [
+    # Nested key path - name is stored in remoteClusterInfo.clusterName
+    if module.params["remote_cluster"]:
+        query = {"remoteClusterInfo.clusterName": module.params["remote_cluster"]}
+    else:
+        query = {}
+    return [
         RemoteCluster.from_hypercore(hypercore_data=hypercore_dict).to_ansible()
         for hypercore_dict in rest_client.list_records(
-            "/rest/v1/RemoteClusterConnection"
+            "/rest/v1/RemoteClusterConnection", query
         )
     ]
-    # Since get_query doesn't work for nested parameters (name -> remoteClusterInfo.clusterName) we have this workaround
-    # In case of additional modules needing this functionality, get_query (and is_superset()) will have to be updated
-    if module.params["remote_cluster"]:
-        ansible_query = dict(name=module.params["remote_cluster"])
-    else:
-        ansible_query = {}
-    return filter_results(records, ansible_query)
 
 
 def main():
@@ -115,7 +112,7 @@ def main():
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = RestClient(client)
         records = run(module, rest_client)
-        module.exit_json(changed=False, records=records)
+        module.exit_json(changed=False, records=records, **client.throttle_result())
 
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
@@ -249,7 +249,9 @@ def main():
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = RestClient(client)
         changed, record, diff = run(module, rest_client)
-        module.exit_json(changed=changed, record=record, diff=diff)
+        module.exit_json(
+            changed=changed, record=record, diff=diff, **client.throttle_result()
+        )
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
@@ -147,7 +147,9 @@ def main() -> None:
     try:
         client = Client.get_client(module.params["cluster_instance"])
         changed, record, diff = run(module, client)
-        module.exit_json(changed=changed, record=record, diff=diff)
+        module.exit_json(
+            changed=changed, record=record, diff=diff, **client.throttle_result()
+        )
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
@@ -61,7 +61,7 @@ def main() -> None:
     try:
         client = Client.get_client(module.params["cluster_instance"])
         record = run(client)
-        module.exit_json(record=record)
+        module.exit_json(record=record, **client.throttle_result())
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
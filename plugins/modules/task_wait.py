@@ -21,6 +21,8 @@ description:
     object, a dict with keys C(createdUUID) and C(taskTag) is returned. Depending on taskTag's status, the object's
     request might be still in queue or may be already executed. This module ensures that the object's request is not
     on queue anymore, and execution is finished.
+  - Many task tags can be awaited at once with I(task_tags), for example task tags returned
+    by modules with I(wait=false). All tasks are polled in a single loop.
 version_added: 1.0.0
 extends_documentation_fragment:
   - scale_computing.hypercore.cluster_instance
@@ -30,7 +32,17 @@ options:
     type: dict
     description:
       - Result when calling C(POST), C(PATCH) or C(DELETE) method on the HyperCore object.
-    required: true
+      - Mutually exclusive with I(task_tags).
+  task_tags:
+    type: list
+    elements: raw
+    description:
+      - Task tags to wait for, in the same format as I(task_tag).
+      - Empty values (from modules that did not start any task) are skipped.
+      - The module fails after all tasks finished, if any of them failed.
+        Records of all tasks are returned also in that case.
+      - Mutually exclusive with I(task_tag).
+    version_added: 1.3.0
 """
 
 
@@ -40,23 +52,125 @@ EXAMPLES = r"""
     task_tag:
       createdUUID: c2d38319-db6b-4cdf-93c6-d628b47c7809
       taskTag: 1483
+
+- name: Start exports of many VMs without waiting
+  scale_computing.hypercore.vm_export:
+    vm_name: "{{ item }}"
+    smb:
+      server: 10.5.11.39
+      path: /share/{{ item }}
+      username: user
+      password: pass
+    wait: false
+  loop: "{{ vm_names }}"
+  register: exports
+
+- name: Wait for all exports at the end
+  scale_computing.hypercore.task_wait:
+    task_tags: "{{ exports.results | map(attribute='task_tag') | list }}"
+  register: collected
 """
 
 
-RETURN = r""" # """  # https://docs.ansible.com/ansible/latest/dev_guide/developing_modules_documenting.html
+RETURN = r"""
+records:
+  description:
+    - Final state of every task from I(task_tags), in the same order.
+    - Empty values from I(task_tags) are skipped.
+  returned: when I(task_tags) is set, also when some of the tasks failed
+  type: list
+  elements: dict
+  version_added: 1.3.0
+  contains:
+    task_tag:
+      description: Task tag
+      type: str
+      sample: "1483"
+    created_uuid:
+      description: UUID of the object created by the task
+      type: str
+      sample: c2d38319-db6b-4cdf-93c6-d628b47c7809
+    state:
+      description: Final task state, C(ERROR) for failed tasks
+      type: str
+      sample: COMPLETE
+task_progress:
+  description:
+    - Progress of the task from I(task_tag), sampled while waiting for it.
+    - Every sample in I(timeline) is also written to the module log.
+  returned: success
+  type: dict
+  version_added: 1.3.0
+  contains:
+    task_tag:
+      description: Task tag of the awaited task, C(null) if there was no task to wait for
+      type: str
+      sample: "1234"
+    duration:
+      description: Seconds from the start of waiting until the last status read
+      type: float
+      sample: 184.104
+    rate:
+      description: Progress percent per second, C(null) if task did not report progress
+      type: float
+      sample: 0.545
+    eta:
+      description: Estimated seconds until the task finishes, C(0) for finished tasks
+      type: float
+      sample: 0.0
+    timeline:
+      description:
+        - Samples of task state, progress percentage and message,
+          only samples different from the previous one are kept.
+      type: list
+      elements: dict
+      sample:
+        - time: 0.251
+          state: RUNNING
+          progress: 10
+          message: null
+        - time: 165.3
+          state: COMPLETE
+          progress: 100
+          message: null
+"""
 
 
 from ansible.module_utils.basic import AnsibleModule
 
-from ..module_utils.task_tag import TaskTag
+from ..module_utils.task_tag import TaskTag, TaskProgress
 from ..module_utils import errors, arguments
 from ..module_utils.client import Client
 from ..module_utils.rest_client import RestClient
 
 
-def run(module, rest_client):
-    TaskTag.wait_task(rest_client, module.params["task_tag"])
-    return False, None, None
+def wait_tasks(module, rest_client):
+    tasks = [task for task in module.params["task_tags"] if TaskTag._task_tag(task)]
+    states = TaskTag.wait_tasks(rest_client, tasks, raise_errors=False)
+    records = [
+        dict(
+            task_tag=task["taskTag"],
+            created_uuid=task.get("createdUUID"),
+            state=states[task["taskTag"]],
+        )
+        for task in tasks
+    ]
+    failed = [record["task_tag"] for record in records if record["state"] == "ERROR"]
+    if failed:
+        raise errors.BulkError(
+            "There was a problem during execution of {0} of {1} tasks: {2}.".format(
+                len(failed), len(records), ", ".join(failed)
+            ),
+            records,
+        )
+    return records
+
+
+def run(module, rest_client, progress=None):
+    if module.params["task_tags"] is not None:
+        return False, None, None, wait_tasks(module, rest_client)
+    TaskTag.wait_task(rest_client, module.params["task_tag"], progress=progress)
+    return False, None, None, None
 
 
 def main():
@@ -66,16 +180,31 @@ def main():
             arguments.get_spec("cluster_instance"),
             task_tag=dict(
                 type="dict",
-                required=True,
+            ),
+            task_tags=dict(
+                type="list",
+                elements="raw",
             ),
         ),
+        mutually_exclusive=[("task_tag", "task_tags")],
+        required_one_of=[("task_tag", "task_tags")],
     )
 
     try:
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = RestClient(client)
-        changed, record, diff = run(module, rest_client)
-        module.exit_json(changed=changed, record=record, diff=diff)
+        progress = TaskProgress(log=module.log)
+        changed, record, diff, records = run(module, rest_client, progress)
+        module.exit_json(
+            changed=changed,
+            record=record,
+            diff=diff,
+            records=records,
+            task_progress=progress.to_ansible(),
+            **client.throttle_result(),
+        )
+    except errors.BulkError as e:
+        module.fail_json(msg=str(e), records=e.records)
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
@@ -28,404 +28,10 @@ options:
   zone:
     type: str
     required: True
-    choices:
-      - Africa/Abidjan
-      - Africa/Accra
-      - Africa/Addis_Ababa
-      - Africa/Algiers
-      - Africa/Asmera
-      - Africa/Bamako
-      - Africa/Bangui
-      - Africa/Banjul
-      - Africa/Bissau
-      - Africa/Blantyre
-      - Africa/Brazzaville
-      - Africa/Bujumbura
-      - Africa/Cairo
-      - Africa/Casablanca
-      - Africa/Ceuta
-      - Africa/Conakry
-      - Africa/Dakar
-      - Africa/Dar_es_Salaam
-      - Africa/Djibouti
-      - Africa/Douala
-      - Africa/El_Aaiun
-      - Africa/Freetown
-      - Africa/Gaborone
-      - Africa/Harare
-      - Africa/Johannesburg
-      - Africa/Kampala
-      - Africa/Khartoum
-      - Africa/Kigali
-      - Africa/Kinshasa
-      - Africa/Lagos
-      - Africa/Libreville
-      - Africa/Lome
-      - Africa/Luanda
-      - Africa/Lubumbashi
-      - Africa/Lusaka
-      - Africa/Malabo
-      - Africa/Maputo
-      - Africa/Maseru
-      - Africa/Mbabane
-      - Africa/Mogadishu
-      - Africa/Monrovia
-      - Africa/Nairobi
-      - Africa/Ndjamena
-      - Africa/Niamey
-      - Africa/Nouakchott
-      - Africa/Ouagadougou
-      - Africa/Porto-Novo
-      - Africa/Sao_Tome
-      - Africa/Timbuktu
-      - Africa/Tripoli
-      - Africa/Tunis
-      - Africa/Windhoek
-      - America/Adak
-      - America/Anchorage
-      - America/Anguilla
-      - America/Antigua
-      - America/Araguaina
-      - America/Aruba
-      - America/Asuncion
-      - America/Barbados
-      - America/Belem
-      - America/Belize
-      - America/Boa_Vista
-      - America/Bogota
-      - America/Boise
-      - America/Buenos_Aires
-      - America/Cambridge_Bay
-      - America/Cancun
-      - America/Caracas
-      - America/Catamarca
-      - America/Cayenne
-      - America/Cayman
-      - America/Chicago
-      - America/Chihuahua
-      - America/Cordoba
-      - America/Costa_Rica
-      - America/Cuiaba
-      - America/Curacao
-      - America/Danmarkshavn
-      - America/Dawson
-      - America/Dawson_Creek
-      - America/Denver
-      - America/Detroit
-      - America/Dominica
-      - America/Edmonton
-      - America/Eirunepe
-      - America/El_Salvador
-      - America/Fortaleza
-      - America/Glace_Bay
-      - America/Godthab
-      - America/Goose_Bay
-      - America/Grand_Turk
-      - America/Grenada
-      - America/Guadeloupe
-      - America/Guatemala
-      - America/Guayaquil
-      - America/Guyana
-      - America/Halifax
-      - America/Havana
-      - America/Hermosillo
-      - America/Indiana/Indianapolis
-      - America/Indiana/Knox
-      - America/Indiana/Marengo
-      - America/Indiana/Vevay
-      - America/Indianapolis
-      - America/Inuvik
-      - America/Iqaluit
-      - America/Jamaica
-      - America/Jujuy
-      - America/Juneau
-      - America/Kentucky/Louisville
-      - America/Kentucky/Monticello
-      - America/La_Paz
-      - America/Lima
-      - America/Los_Angeles
-      - America/Louisville
-      - America/Maceio
-      - America/Managua
-      - America/Manaus
-      - America/Martinique
-      - America/Mazatlan
-      - America/Mendoza
-      - America/Menominee
-      - America/Merida
-      - America/Mexico_City
-      - America/Miquelon
-      - America/Monterrey
-      - America/Montevideo
-      - America/Montreal
-      - America/Montserrat
-      - America/Nassau
-      - America/New_York
-      - America/Nipigon
-      - America/Nome
-      - America/Noronha
-      - America/North_Dakota/Center
-      - America/Panama
-      - America/Pangnirtung
-      - America/Paramaribo
-      - America/Phoenix
-      - America/Port-au-Prince
-      - America/Port_of_Spain
-      - America/Porto_Velho
-      - America/Puerto_Rico
-      - America/Rainy_River
-      - America/Rankin_Inlet
-      - America/Recife
-      - America/Regina
-      - America/Rio_Branco
-      - America/Rosario
-      - America/Santiago
-      - America/Santo_Domingo
-      - America/Sao_Paulo
-      - America/Scoresbysund
-      - America/Shiprock
-      - America/St_Johns
-      - America/St_Kitts
-      - America/St_Lucia
-      - America/St_Thomas
-      - America/St_Vincent
-      - America/Swift_Current
-      - America/Tegucigalpa
-      - America/Thule
-      - America/Thunder_Bay
-      - America/Tijuana
-      - America/Tortola
-      - America/Vancouver
-      - America/Whitehorse
-      - America/Winnipeg
-      - America/Yakutat
-      - America/Yellowknife
-      - Antarctica/Casey
-      - Antarctica/Davis
-      - Antarctica/DumontDUrville
-      - Antarctica/Mawson
-      - Antarctica/McMurdo
-      - Antarctica/Palmer
-      - Antarctica/South_Pole
-      - Antarctica/Syowa
-      - Antarctica/Vostok
-      - Arctic/Longyearbyen
-      - Asia/Aden
-      - Asia/Almaty
-      - Asia/Amman
-      - Asia/Anadyr
-      - Asia/Aqtau
-      - Asia/Aqtobe
-      - Asia/Ashgabat
-      - Asia/Baghdad
-      - Asia/Bahrain
-      - Asia/Baku
-      - Asia/Bangkok
-      - Asia/Beirut
-      - Asia/Bishkek
-      - Asia/Brunei
-      - Asia/Calcutta
-      - Asia/Choibalsan
-      - Asia/Chongqing
-      - Asia/Colombo
-      - Asia/Damascus
-      - Asia/Dhaka
-      - Asia/Dili
-      - Asia/Dubai
-      - Asia/Dushanbe
-      - Asia/Gaza
-      - Asia/Harbin
-      - Asia/Hong_Kong
-      - Asia/Hovd
-      - Asia/Irkutsk
-      - Asia/Istanbul
-      - Asia/Jakarta
-      - Asia/Jayapura
-      - Asia/Jerusalem
-      - Asia/Kabul
-      - Asia/Kamchatka
-      - Asia/Karachi
-      - Asia/Kashgar
-      - Asia/Katmandu
-      - Asia/Krasnoyarsk
-      - Asia/Kuala_Lumpur
-      - Asia/Kuching
-      - Asia/Kuwait
-      - Asia/Macao
-      - Asia/Macau
-      - Asia/Magadan
-      - Asia/Makassar
-      - Asia/Manila
-      - Asia/Muscat
-      - Asia/Nicosia
-      - Asia/Novosibirsk
-      - Asia/Omsk
-      - Asia/Oral
-      - Asia/Phnom_Penh
-      - Asia/Pontianak
-      - Asia/Pyongyang
-      - Asia/Qyzylorda
-      - Asia/Qatar
-      - Asia/Rangoon
-      - Asia/Riyadh
-      - Asia/Saigon
-      - Asia/Sakhalin
-      - Asia/Samarkand
-      - Asia/Seoul
-      - Asia/Shanghai
-      - Asia/Singapore
-      - Asia/Taipei
-      - Asia/Tashkent
-      - Asia/Tbilisi
-      - Asia/Tehran
-      - Asia/Thimphu
-      - Asia/Tokyo
-      - Asia/Ujung_Pandang
-      - Asia/Ulaanbaatar
-      - Asia/Urumqi
-      - Asia/Vientiane
-      - Asia/Vladivostok
-      - Asia/Yakutsk
-      - Asia/Yekaterinburg
-      - Asia/Yerevan
-      - Atlantic/Azores
-      - Atlantic/Bermuda
-      - Atlantic/Canary
-      - Atlantic/Cape_Verde
-      - Atlantic/Faeroe
-      - Atlantic/Jan_Mayen
-      - Atlantic/Madeira
-      - Atlantic/Reykjavik
-      - Atlantic/South_Georgia
-      - Atlantic/St_Helena
-      - Atlantic/Stanley
-      - Australia/Adelaide
-      - Australia/Brisbane
-      - Australia/Broken_Hill
-      - Australia/Darwin
-      - Australia/Hobart
-      - Australia/Lindeman
-      - Australia/Lord_Howe
-      - Australia/Melbourne
-      - Australia/Perth
-      - Australia/Sydney
-      - Europe/Amsterdam
-      - Europe/Andorra
-      - Europe/Athens
-      - Europe/Belfast
-      - Europe/Belgrade
-      - Europe/Berlin
-      - Europe/Bratislava
-      - Europe/Brussels
-      - Europe/Bucharest
-      - Europe/Budapest
-      - Europe/Chisinau
-      - Europe/Copenhagen
-      - Europe/Dublin
-      - Europe/Gibraltar
-      - Europe/Helsinki
-      - Europe/Istanbul
-      - Europe/Kaliningrad
-      - Europe/Kiev
-      - Europe/Lisbon
-      - Europe/Ljubljana
-      - Europe/London
-      - Europe/Luxembourg
-      - Europe/Madrid
-      - Europe/Malta
-      - Europe/Minsk
-      - Europe/Monaco
-      - Europe/Moscow
-      - Europe/Nicosia
-      - Europe/Oslo
-      - Europe/Paris
-      - Europe/Prague
-      - Europe/Riga
-      - Europe/Rome
-      - Europe/Samara
-      - Europe/San_Marino
-      - Europe/Sarajevo
-      - Europe/Simferopol
-      - Europe/Skopje
-      - Europe/Sofia
-      - Europe/Stockholm
-      - Europe/Tallinn
-      - Europe/Tirane
-      - Europe/Uzhgorod
-      - Europe/Vaduz
-      - Europe/Vatican
-      - Europe/Vienna
-      - Europe/Vilnius
-      - Europe/Warsaw
-      - Europe/Zagreb
-      - Europe/Zaporozhye
-      - Europe/Zurich
-      - Indian/Antananarivo
-      - Indian/Chagos
-      - Indian/Christmas
-      - Indian/Cocos
-      - Indian/Comoro
-      - Indian/Kerguelen
-      - Indian/Mahe
-      - Indian/Maldives
-      - Indian/Mauritius
-      - Indian/Mayotte
-      - Indian/Reunion
-      - Pacific/Apia
-      - Pacific/Auckland
-      - Pacific/Chatham
-      - Pacific/Easter
-      - Pacific/Efate
-      - Pacific/Enderbury
-      - Pacific/Fakaofo
-      - Pacific/Fiji
-      - Pacific/Funafuti
-      - Pacific/Galapagos
-      - Pacific/Gambier
-      - Pacific/Guadalcanal
-      - Pacific/Guam
-      - Pacific/Honolulu
-      - Pacific/Johnston
-      - Pacific/Kiritimati
-      - Pacific/Kosrae
-      - Pacific/Kwajalein
-      - Pacific/Majuro
-      - Pacific/Marquesas
-      - Pacific/Midway
-      - Pacific/Nauru
-      - Pacific/Niue
-      - Pacific/Norfolk
-      - Pacific/Noumea
-      - Pacific/Pago_Pago
-      - Pacific/Palau
-      - Pacific/Pitcairn
-      - Pacific/Ponape
-      - Pacific/Port_Moresby
-      - Pacific/Rarotonga
-      - Pacific/Saipan
-      - Pacific/Tahiti
-      - Pacific/Tarawa
-      - Pacific/Tongatapu
-      - Pacific/Truk
-      - Pacific/Wake
-      - Pacific/Wallis
-      - Pacific/Yap
-      - US/Alaska
-      - US/Aleutian
-      - US/Arizona
-      - US/Central
-      - US/Eastern
-      - US/East-Indiana
-      - US/Hawaii
-      - US/Indiana-Starke
-      - US/Michigan
-      - US/Mountain
-      - US/Pacific
-      - US/Pacific-New
-      - US/Samoa
-      - UTC
     description:
       - A time zone string used to replace the existing one.
+      - Must be a time zone supported by HyperCore, for example C(US/Eastern) or C(Europe/Ljubljana).
+        Supported time zones are listed in C(plugins/module_utils/date_time_zonespec.csv).
       - If the given time zone already exist in the Time Zone configuration,
         there will be no changes made.
 notes:
@@ -436,7 +42,7 @@ notes:
 EXAMPLES = r"""
 - name: Change time zone
   scale_computing.hypercore.time_zone:
-    source: Europe/Ljubljana
+    zone: Europe/Ljubljana
 """
 
 RETURN = r"""
@@ -472,6 +78,22 @@ record:
         sessionID: 7157e957-bfad-4506-8713-124d5eb2397d
         state: COMPLETE
         taskTag: 687
+offset:
+  description:
+    - UTC offsets of the configured time zone.
+    - C(null) if time zone is not configured or not known to the module.
+  returned: success
+  type: dict
+  version_added: 1.3.0
+  contains:
+    standard:
+      description: UTC offset of standard time
+      type: str
+      sample: "-05:00"
+    daylight_saving:
+      description: UTC offset of daylight saving time, C(null) if the time zone does not observe it
+      type: str
+      sample: "-04:00"
 """
 
 from typing import Tuple
@@ -482,416 +104,22 @@ from ..module_utils import arguments, errors
 from ..module_utils.client import Client
 from ..module_utils.rest_client import RestClient
 from ..module_utils.time_zone import TimeZone
-
-# List is based on date_time_zonespec.csv.
-SUPPORTED_ZONES = [
-    "Africa/Abidjan",
-    "Africa/Accra",
-    "Africa/Addis_Ababa",
-    "Africa/Algiers",
-    "Africa/Asmera",
-    "Africa/Bamako",
-    "Africa/Bangui",
-    "Africa/Banjul",
-    "Africa/Bissau",
-    "Africa/Blantyre",
-    "Africa/Brazzaville",
-    "Africa/Bujumbura",
-    "Africa/Cairo",
-    "Africa/Casablanca",
-    "Africa/Ceuta",
-    "Africa/Conakry",
-    "Africa/Dakar",
-    "Africa/Dar_es_Salaam",
-    "Africa/Djibouti",
-    "Africa/Douala",
-    "Africa/El_Aaiun",
-    "Africa/Freetown",
-    "Africa/Gaborone",
-    "Africa/Harare",
-    "Africa/Johannesburg",
-    "Africa/Kampala",
-    "Africa/Khartoum",
-    "Africa/Kigali",
-    "Africa/Kinshasa",
-    "Africa/Lagos",
-    "Africa/Libreville",
-    "Africa/Lome",
-    "Africa/Luanda",
-    "Africa/Lubumbashi",
-    "Africa/Lusaka",
-    "Africa/Malabo",
-    "Africa/Maputo",
-    "Africa/Maseru",
-    "Africa/Mbabane",
-    "Africa/Mogadishu",
-    "Africa/Monrovia",
-    "Africa/Nairobi",
-    "Africa/Ndjamena",
-    "Africa/Niamey",
-    "Africa/Nouakchott",
-    "Africa/Ouagadougou",
-    "Africa/Porto-Novo",
-    "Africa/Sao_Tome",
-    "Africa/Timbuktu",
-    "Africa/Tripoli",
-    "Africa/Tunis",
-    "Africa/Windhoek",
-    "America/Adak",
-    "America/Anchorage",
-    "America/Anguilla",
-    "America/Antigua",
-    "America/Araguaina",
-    "America/Aruba",
-    "America/Asuncion",
-    "America/Barbados",
-    "America/Belem",
-    "America/Belize",
-    "America/Boa_Vista",
-    "America/Bogota",
-    "America/Boise",
-    "America/Buenos_Aires",
-    "America/Cambridge_Bay",
-    "America/Cancun",
-    "America/Caracas",
-    "America/Catamarca",
-    "America/Cayenne",
-    "America/Cayman",
-    "America/Chicago",
-    "America/Chihuahua",
-    "America/Cordoba",
-    "America/Costa_Rica",
-    "America/Cuiaba",
-    "America/Curacao",
-    "America/Danmarkshavn",
-    "America/Dawson",
-    "America/Dawson_Creek",
-    "America/Denver",
-    "America/Detroit",
-    "America/Dominica",
-    "America/Edmonton",
-    "America/Eirunepe",
-    "America/El_Salvador",
-    "America/Fortaleza",
-    "America/Glace_Bay",
-    "America/Godthab",
-    "America/Goose_Bay",
-    "America/Grand_Turk",
-    "America/Grenada",
-    "America/Guadeloupe",
-    "America/Guatemala",
-    "America/Guayaquil",
-    "America/Guyana",
-    "America/Halifax",
-    "America/Havana",
-    "America/Hermosillo",
-    "America/Indiana/Indianapolis",
-    "America/Indiana/Knox",
-    "America/Indiana/Marengo",
-    "America/Indiana/Vevay",
-    "America/Indianapolis",
-    "America/Inuvik",
-    "America/Iqaluit",
-    "America/Jamaica",
-    "America/Jujuy",
-    "America/Juneau",
-    "America/Kentucky/Louisville",
-    "America/Kentucky/Monticello",
-    "America/La_Paz",
-    "America/Lima",
-    "America/Los_Angeles",
-    "America/Louisville",
-    "America/Maceio",
-    "America/Managua",
-    "America/Manaus",
-    "America/Martinique",
-    "America/Mazatlan",
-    "America/Mendoza",
-    "America/Menominee",
-    "America/Merida",
-    "America/Mexico_City",
-    "America/Miquelon",
-    "America/Monterrey",
-    "America/Montevideo",
-    "America/Montreal",
-    "America/Montserrat",
-    "America/Nassau",
-    "America/New_York",
-    "America/Nipigon",
-    "America/Nome",
-    "America/Noronha",
-    "America/North_Dakota/Center",
-    "America/Panama",
-    "America/Pangnirtung",
-    "America/Paramaribo",
-    "America/Phoenix",
-    "America/Port-au-Prince",
-    "America/Port_of_Spain",
-    "America/Porto_Velho",
-    "America/Puerto_Rico",
-    "America/Rainy_River",
-    "America/Rankin_Inlet",
-    "America/Recife",
-    "America/Regina",
-    "America/Rio_Branco",
-    "America/Rosario",
-    "America/Santiago",
-    "America/Santo_Domingo",
-    "America/Sao_Paulo",
-    "America/Scoresbysund",
-    "America/Shiprock",
-    "America/St_Johns",
-    "America/St_Kitts",
-    "America/St_Lucia",
-    "America/St_Thomas",
-    "America/St_Vincent",
-    "America/Swift_Current",
-    "America/Tegucigalpa",
-    "America/Thule",
-    "America/Thunder_Bay",
-    "America/Tijuana",
-    "America/Tortola",
-    "America/Vancouver",
-    "America/Whitehorse",
-    "America/Winnipeg",
-    "America/Yakutat",
-    "America/Yellowknife",
-    "Antarctica/Casey",
-    "Antarctica/Davis",
-    "Antarctica/DumontDUrville",
-    "Antarctica/Mawson",
-    "Antarctica/McMurdo",
-    "Antarctica/Palmer",
-    "Antarctica/South_Pole",
-    "Antarctica/Syowa",
-    "Antarctica/Vostok",
-    "Arctic/Longyearbyen",
-    "Asia/Aden",
-    "Asia/Almaty",
-    "Asia/Amman",
-    "Asia/Anadyr",
-    "Asia/Aqtau",
-    "Asia/Aqtobe",
-    "Asia/Ashgabat",
-    "Asia/Baghdad",
-    "Asia/Bahrain",
-    "Asia/Baku",
-    "Asia/Bangkok",
-    "Asia/Beirut",
-    "Asia/Bishkek",
-    "Asia/Brunei",
-    "Asia/Calcutta",
-    "Asia/Choibalsan",
-    "Asia/Chongqing",
-    "Asia/Colombo",
-    "Asia/Damascus",
-    "Asia/Dhaka",
-    "Asia/Dili",
-    "Asia/Dubai",
-    "Asia/Dushanbe",
-    "Asia/Gaza",
-    "Asia/Harbin",
-    "Asia/Hong_Kong",
-    "Asia/Hovd",
-    "Asia/Irkutsk",
-    "Asia/Istanbul",
-    "Asia/Jakarta",
-    "Asia/Jayapura",
-    "Asia/Jerusalem",
-    "Asia/Kabul",
-    "Asia/Kamchatka",
-    "Asia/Karachi",
-    "Asia/Kashgar",
-    "Asia/Katmandu",
-    "Asia/Krasnoyarsk",
-    "Asia/Kuala_Lumpur",
-    "Asia/Kuching",
-    "Asia/Kuwait",
-    "Asia/Macao",
-    "Asia/Macau",
-    "Asia/Magadan",
-    "Asia/Makassar",
-    "Asia/Manila",
-    "Asia/Muscat",
-    "Asia/Nicosia",
-    "Asia/Novosibirsk",
-    "Asia/Omsk",
-    "Asia/Oral",
-    "Asia/Phnom_Penh",
-    "Asia/Pontianak",
-    "Asia/Pyongyang",
-    "Asia/Qyzylorda",
-    "Asia/Qatar",
-    "Asia/Rangoon",
-    "Asia/Riyadh",
-    "Asia/Saigon",
-    "Asia/Sakhalin",
-    "Asia/Samarkand",
-    "Asia/Seoul",
-    "Asia/Shanghai",
-    "Asia/Singapore",
-    "Asia/Taipei",
-    "Asia/Tashkent",
-    "Asia/Tbilisi",
-    "Asia/Tehran",
-    "Asia/Thimphu",
-    "Asia/Tokyo",
-    "Asia/Ujung_Pandang",
-    "Asia/Ulaanbaatar",
-    "Asia/Urumqi",
-    "Asia/Vientiane",
-    "Asia/Vladivostok",
-    "Asia/Yakutsk",
-    "Asia/Yekaterinburg",
-    "Asia/Yerevan",
-    "Atlantic/Azores",
-    "Atlantic/Bermuda",
-    "Atlantic/Canary",
-    "Atlantic/Cape_Verde",
-    "Atlantic/Faeroe",
-    "Atlantic/Jan_Mayen",
-    "Atlantic/Madeira",
-    "Atlantic/Reykjavik",
-    "Atlantic/South_Georgia",
-    "Atlantic/St_Helena",
-    "Atlantic/Stanley",
-    "Australia/Adelaide",
-    "Australia/Brisbane",
-    "Australia/Broken_Hill",
-    "Australia/Darwin",
-    "Australia/Hobart",
-    "Australia/Lindeman",
-    "Australia/Lord_Howe",
-    "Australia/Melbourne",
-    "Australia/Perth",
-    "Australia/Sydney",
-    "Europe/Amsterdam",
-    "Europe/Andorra",
-    "Europe/Athens",
-    "Europe/Belfast",
-    "Europe/Belgrade",
-    "Europe/Berlin",
-    "Europe/Bratislava",
-    "Europe/Brussels",
-    "Europe/Bucharest",
-    "Europe/Budapest",
-    "Europe/Chisinau",
-    "Europe/Copenhagen",
-    "Europe/Dublin",
-    "Europe/Gibraltar",
-    "Europe/Helsinki",
-    "Europe/Istanbul",
-    "Europe/Kaliningrad",
-    "Europe/Kiev",
-    "Europe/Lisbon",
-    "Europe/Ljubljana",
-    "Europe/London",
-    "Europe/Luxembourg",
-    "Europe/Madrid",
-    "Europe/Malta",
-    "Europe/Minsk",
-    "Europe/Monaco",
-    "Europe/Moscow",
-    "Europe/Nicosia",
-    "Europe/Oslo",
-    "Europe/Paris",
-    "Europe/Prague",
-    "Europe/Riga",
-    "Europe/Rome",
-    "Europe/Samara",
-    "Europe/San_Marino",
-    "Europe/Sarajevo",
-    "Europe/Simferopol",
-    "Europe/Skopje",
-    "Europe/Sofia",
-    "Europe/Stockholm",
-    "Europe/Tallinn",
-    "Europe/Tirane",
-    "Europe/Uzhgorod",
-    "Europe/Vaduz",
-    "Europe/Vatican",
-    "Europe/Vienna",
-    "Europe/Vilnius",
-    "Europe/Warsaw",
-    "Europe/Zagreb",
-    "Europe/Zaporozhye",
-    "Europe/Zurich",
-    "Indian/Antananarivo",
-    "Indian/Chagos",
-    "Indian/Christmas",
-    "Indian/Cocos",
-    "Indian/Comoro",
-    "Indian/Kerguelen",
-    "Indian/Mahe",
-    "Indian/Maldives",
-    "Indian/Mauritius",
-    "Indian/Mayotte",
-    "Indian/Reunion",
-    "Pacific/Apia",
-    "Pacific/Auckland",
-    "Pacific/Chatham",
-    "Pacific/Easter",
-    "Pacific/Efate",
-    "Pacific/Enderbury",
-    "Pacific/Fakaofo",
-    "Pacific/Fiji",
-    "Pacific/Funafuti",
-    "Pacific/Galapagos",
-    "Pacific/Gambier",
-    "Pacific/Guadalcanal",
-    "Pacific/Guam",
-    "Pacific/Honolulu",
-    "Pacific/Johnston",
-    "Pacific/Kiritimati",
-    "Pacific/Kosrae",
-    "Pacific/Kwajalein",
-    "Pacific/Majuro",
-    "Pacific/Marquesas",
-    "Pacific/Midway",
-    "Pacific/Nauru",
-    "Pacific/Niue",
-    "Pacific/Norfolk",
-    "Pacific/Noumea",
-    "Pacific/Pago_Pago",
-    "Pacific/Palau",
-    "Pacific/Pitcairn",
-    "Pacific/Ponape",
-    "Pacific/Port_Moresby",
-    "Pacific/Rarotonga",
-    "Pacific/Saipan",
-    "Pacific/Tahiti",
-    "Pacific/Tarawa",
-    "Pacific/Tongatapu",
-    "Pacific/Truk",
-    "Pacific/Wake",
-    "Pacific/Wallis",
-    "Pacific/Yap",
-    "US/Alaska",
-    "US/Aleutian",
-    "US/Arizona",
-    "US/Central",
-    "US/Eastern",
-    "US/East-Indiana",
-    "US/Hawaii",
-    "US/Indiana-Starke",
-    "US/Michigan",
-    "US/Mountain",
-    "US/Pacific",
-    "US/Pacific-New",
-    "US/Samoa",
-    "UTC",
-]
+from ..module_utils import time_zone_catalog
 
 
 # Remove implementation not needed
 def modify_time_zone(
     module: AnsibleModule, rest_client: RestClient
 ) -> Tuple[bool, dict, dict]:
-    # GET method to get the Time Server by UUID
-    time_zone = TimeZone.get_by_uuid(module.params, rest_client)
-
     # Get new time zone
     new_time_zone_entry = module.params["zone"]
+    if not time_zone_catalog.is_supported(new_time_zone_entry):
+        raise errors.ScaleComputingError(
+            "Time Zone: Time zone {0} not supported.".format(new_time_zone_entry)
+        )
+
+    # GET method to get the Time Server by UUID
+    time_zone = TimeZone.get_by_uuid(module.params, rest_client)
 
     # If Time Zone doesn't exist, create one
     if not time_zone:
@@ -919,9 +147,6 @@ def modify_time_zone(
     if not change:
         return change, record, diff
 
-    if new_time_zone_entry not in SUPPORTED_ZONES:
-        raise errors.ScaleComputingError("Time Zone: Time zone not supported.")
-
     # Set the task tag:
     # update_record -> PATCH
     update_task_tag = rest_client.update_record(
@@ -951,7 +176,6 @@ def main() -> None:
             zone=dict(
                 type="str",
                 required=True,
-                choices=SUPPORTED_ZONES,
             ),
         ),
     )
@@ -960,7 +184,13 @@ def main() -> None:
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = RestClient(client)
         changed, record, diff = run(module, rest_client)
-        module.exit_json(changed=changed, record=record, diff=diff)
+        module.exit_json(
+            changed=changed,
+            record=record,
+            diff=diff,
+            offset=time_zone_catalog.get_offset(module.params["zone"]),
+            **client.throttle_result(),
+        )
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
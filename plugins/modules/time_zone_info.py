@@ -65,6 +65,22 @@ record:
         sessionID: 7157e957-bfad-4506-8713-124d5eb2397d
         state: COMPLETE
         taskTag: 687
+offset:
+  description:
+    - UTC offsets of the configured time zone.
+    - C(null) if time zone is not configured or not known to the module.
+  returned: success
+  type: dict
+  version_added: 1.3.0
+  contains:
+    standard:
+      description: UTC offset of standard time
+      type: str
+      sample: "-05:00"
+    daylight_saving:
+      description: UTC offset of daylight saving time, C(null) if the time zone does not observe it
+      type: str
+      sample: "-04:00"
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -73,6 +89,7 @@ from ..module_utils import errors, arguments
 from ..module_utils.client import Client
 from ..module_utils.rest_client import RestClient
 from ..module_utils.time_zone import TimeZone
+from ..module_utils import time_zone_catalog
 
 
 def run(rest_client: RestClient):
@@ -91,7 +108,12 @@ def main():
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = RestClient(client)
         record = run(rest_client)
-        module.exit_json(changed=False, record=record)
+        module.exit_json(
+            changed=False,
+            record=record,
+            offset=time_zone_catalog.get_offset(record.get("zone")),
+            **client.throttle_result(),
+        )
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
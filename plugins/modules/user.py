@@ -205,17 +205,19 @@ def update_user(
     module: AnsibleModule, rest_client: RestClient, user: User
 ) -> Tuple[bool, TypedUserToAnsible, TypedDiff]:
     data = data_for_update_user(module, rest_client, user)
+    # Roles are read once and shared by before and after state.
+    role_map = Role.get_role_map(rest_client)
     if data:
         user.update(rest_client, data)
         user_after = User.get_user_from_uuid(user.uuid, rest_client, must_exist=True)
-        user_after_to_ansible = user_after.to_ansible(rest_client)  # type: ignore # user_after is never None
-        user_to_ansible = user.to_ansible(rest_client)
+        user_after_to_ansible = user_after.to_ansible(rest_client, role_map)  # type: ignore # user_after is never None
+        user_to_ansible = user.to_ansible(rest_client, role_map)
         return (
             True,
             user_after_to_ansible,
             dict(before=user_to_ansible, after=user_after_to_ansible),
         )
-    user_to_ansible = user.to_ansible(rest_client)
+    user_to_ansible = user.to_ansible(rest_client, role_map)
     return (
         False,
         user_to_ansible,
@@ -283,7 +285,9 @@ def main() -> None:
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = CachedRestClient(client)
         changed, record, diff = run(module, rest_client)
-        module.exit_json(changed=changed, record=record, diff=diff)
+        module.exit_json(
+            changed=changed, record=record, diff=diff, **client.throttle_result()
+        )
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
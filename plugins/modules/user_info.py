@@ -79,6 +79,7 @@ from ansible.module_utils.basic import AnsibleModule
 from ..module_utils import arguments, errors
 from ..module_utils.rest_client import RestClient
 from ..module_utils.client import Client
+from ..module_utils.role import Role
 from ..module_utils.user import User
 from ..module_utils.utils import get_query
 from ..module_utils.typed_classes import TypedUserToAnsible
@@ -91,11 +92,16 @@ def run(
     query = get_query(
         module.params, "username", ansible_hypercore_map=dict(username="username")
     )
+    users = rest_client.list_records("/rest/v1/User", query)
+    if not users:
+        return []
+    # Roles are read once, not once per role of every user.
+    role_map = Role.get_role_map(rest_client)
     return [
         User.from_hypercore(hypercore_data=hypercore_dict).to_ansible(  # type: ignore
-            rest_client
+            rest_client, role_map
         )
-        for hypercore_dict in rest_client.list_records("/rest/v1/User", query)
+        for hypercore_dict in users
     ]
 
 
@@ -111,7 +117,7 @@ def main() -> None:
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = RestClient(client)
         records = run(module, rest_client)
-        module.exit_json(changed=False, records=records)
+        module.exit_json(changed=False, records=records, **client.throttle_result())
 
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
@@ -17,6 +17,8 @@ author:
 short_description: Install an update on the cluster.
 description:
   - From available hypercore version updates install selected update on the cluster.
+  - With I(wait=true), the module waits until the update finishes.
+    Update status is polled from the module, also while HyperCore API restarts during the update.
 version_added: 1.2.0
 extends_documentation_fragment:
   - scale_computing.hypercore.cluster_instance
@@ -29,6 +31,23 @@ options:
       - Hypercore version update to be installed on the cluster.
     type: str
     required: true
+  wait:
+    description:
+      - Wait until the update is finished.
+      - Update status is polled every few seconds while it changes, and less often
+        (up to every 30 seconds) while it does not change.
+      - Connection errors, timeouts and server errors (5xx) while HyperCore API restarts are recorded in I(timeline),
+        polling continues. Authentication and other client errors fail the module.
+    type: bool
+    default: false
+    version_added: 1.3.0
+  wait_timeout:
+    description:
+      - Maximum number of seconds to wait for the update to finish, if I(wait=true).
+      - The module fails if the update is not finished in time.
+    type: int
+    default: 10800
+    version_added: 1.3.0
 notes:
   - C(check_mode) is not supported.
 """
@@ -38,6 +57,13 @@ EXAMPLES = r"""
   scale_computing.hypercore.version_update:
     icos_version: 9.2.11.210763
   register: result
+
+- name: Update hypercore version and wait until update is finished
+  scale_computing.hypercore.version_update:
+    icos_version: 9.2.11.210763
+    wait: true
+    wait_timeout: 7200
+  register: result
 """
 
 RETURN = r"""
@@ -79,22 +105,99 @@ record:
       description: Unix timestamp when the update was released
       type: int
       sample: 0
+update_status:
+  description:
+    - Update status after the update finished.
+    - Same format as I(record) returned by M(scale_computing.hypercore.version_update_status_info).
+  returned: when I(wait=true) and update was applied
+  type: dict
+  version_added: 1.3.0
+  sample:
+    from_build: 207183
+    percent: 100
+    prepare_status: ""
+    update_status: COMPLETE
+    update_status_details: Update Complete. Press 'Reload' to reconnect
+    usernotes: Press 'Reload' to reconnect
+    to_build: 209840
+    to_version: 9.1.18.209840
+timeline:
+  description:
+    - Changes of update status while waiting, in order.
+    - An entry with I(error) is recorded when HyperCore API is not reachable, for example while it restarts.
+  returned: when I(wait=true) and update was applied
+  type: list
+  elements: dict
+  version_added: 1.3.0
+  contains:
+    time:
+      description: Seconds since waiting started
+      type: float
+      sample: 62.4
+    update_status:
+      description: Update status, null while update has not started or API is unreachable
+      type: str
+      sample: IN PROGRESS
+    percent:
+      description: Update progress
+      type: str
+      sample: "40"
+    update_status_details:
+      description: Details of update status
+      type: str
+      sample: Updating node 10.5.11.170
+    error:
+      description: Error from the status request, if API was unreachable
+      type: str
+      sample: "[Errno 111] Connection refused"
+duration:
+  description: Seconds from applying the update until it finished.
+  returned: when I(wait=true) and update was applied
+  type: float
+  version_added: 1.3.0
+  sample: 1834.2
+task_tag:
+  description:
+    - Task tag of the update request.
+    - The task finishes when the update is started, use I(wait=true) or
+      M(scale_computing.hypercore.version_update_status_info) to follow the update itself.
+  returned: when update was applied
+  type: dict
+  version_added: 1.3.0
+  sample:
+    createdUUID: ""
+    taskTag: "1234"
 """
 
+from time import time
+
 from ansible.module_utils.basic import AnsibleModule
 
 from ..module_utils import arguments, errors
 from ..module_utils.client import Client
 from ..module_utils.rest_client import RestClient
 from ..module_utils.cluster import Cluster
-from ..module_utils.hypercore_version import Update
+from ..module_utils.hypercore_version import Update, UpdateStatus
 from ..module_utils.typed_classes import TypedUpdateToAnsible
 from typing import Tuple, Dict, Any, Optional
 
 
+def wait_for_update(
+    module: AnsibleModule, rest_client: RestClient, started: float
+) -> Dict[str, Any]:
+    update_status, timeline = UpdateStatus.wait(
+        rest_client, module.params["icos_version"], module.params["wait_timeout"]
+    )
+    return dict(
+        update_status=update_status.to_ansible(),
+        timeline=timeline,
+        duration=round(time() - started, 1),
+    )
+
+
 def run(
     module: AnsibleModule, rest_client: RestClient
-) -> Tuple[bool, Optional[TypedUpdateToAnsible], Dict[Any, Any]]:
+) -> Tuple[bool, Optional[TypedUpdateToAnsible], Dict[Any, Any], Dict[str, Any]]:
     cluster = Cluster.get(rest_client)
     if cluster.icos_version == module.params["icos_version"]:
         return (
@@ -104,9 +207,11 @@ def run(
                 before=dict(icos_version=cluster.icos_version),
                 after=dict(icos_version=cluster.icos_version),
             ),
+            dict(),
         )
     update = Update.get(rest_client, module.params["icos_version"], must_exist=True)
-    update.apply(rest_client)  # type: ignore
+    started = time()
+    task = update.apply(rest_client)  # type: ignore
     return (
         True,
         update.to_ansible(),  # type: ignore
@@ -114,6 +219,12 @@ def run(
             before=dict(icos_version=cluster.icos_version),
             after=dict(icos_version=update.uuid),  # type: ignore
         ),
+        dict(
+            wait_for_update(module, rest_client, started)
+            if module.params["wait"]
+            else {},
+            task_tag=task,
+        ),
     )
 
 
@@ -123,14 +234,22 @@ def main() -> None:
         argument_spec=dict(
             arguments.get_spec("cluster_instance"),
             icos_version=dict(type="str", required=True),
+            wait=dict(type="bool", default=False),
+            wait_timeout=dict(type="int", default=10800),
         ),
     )
 
     try:
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = RestClient(client)
-        changed, record, diff = run(module, rest_client)
-        module.exit_json(changed=changed, record=record, diff=diff)
+        changed, record, diff, wait_result = run(module, rest_client)
+        module.exit_json(
+            changed=changed,
+            record=record,
+            diff=diff,
+            **wait_result,
+            **client.throttle_result(),
+        )
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
@@ -191,7 +191,13 @@ def main() -> None:
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = RestClient(client)
         records, next, latest = run(rest_client)
-        module.exit_json(changed=False, records=records, next=next, latest=latest)
+        module.exit_json(
+            changed=False,
+            records=records,
+            next=next,
+            latest=latest,
+            **client.throttle_result(),
+        )
 
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
@@ -101,7 +101,7 @@ def main() -> None:
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = RestClient(client)
         record = run(rest_client)
-        module.exit_json(record=record)
+        module.exit_json(record=record, **client.throttle_result())
 
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
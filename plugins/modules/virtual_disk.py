@@ -39,6 +39,16 @@ options:
     choices: [ present, absent]
     type: str
     required: True
+  wait:
+    description:
+      - Wait until the upload or delete task is finished.
+      - With I(wait=false), the module returns right after the request, with I(task_tag)
+        that can be awaited later with M(scale_computing.hypercore.task_wait).
+        I(record) is read right after the request, and it is C(null) for deleted disks.
+      - Disk data is always uploaded before the module returns.
+    type: bool
+    default: true
+    version_added: 1.3.0
 """
 
 
@@ -84,6 +94,23 @@ record:
       description: Unique identifier
       type: str
       sample: 7983b298-c37a-4c99-8dfe-b2952e81b092
+task_tag:
+  description:
+    - Task tag of the last started task, C(null) if nothing was started.
+    - Can be passed to M(scale_computing.hypercore.task_wait).
+  returned: success
+  type: dict
+  version_added: 1.3.0
+  sample:
+    createdUUID: ""
+    taskTag: "1234"
+task_progress:
+  description:
+    - Progress of the task, sampled while waiting for it.
+    - See M(scale_computing.hypercore.task_wait) for the description of values.
+  returned: success
+  type: dict
+  version_added: 1.3.0
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -101,7 +128,7 @@ from ..module_utils.rest_client import RestClient
 from ..module_utils.utils import is_changed
 from ..module_utils.virtual_disk import VirtualDisk
 from ..module_utils.state import State
-from ..module_utils.task_tag import TaskTag
+from ..module_utils.task_tag import TaskTag, TaskProgress
 
 from ..module_utils.hypercore_version import (
     HyperCoreVersion,
@@ -125,8 +152,9 @@ def wait_task_and_get_updated(
     module: AnsibleModule,
     task: Optional[TypedTaskTag],
     must_exist: bool = False,
+    progress: Optional[TaskProgress] = None,
 ) -> Optional[TypedVirtualDiskToAnsible]:
-    TaskTag.wait_task(rest_client, task)
+    TaskTag.wait_task(rest_client, task, progress=progress, wait=module.params["wait"])
     updated_disk = VirtualDisk.get_by_name(
         rest_client, name=module.params["name"], must_exist=must_exist
     )
@@ -137,6 +165,7 @@ def ensure_present(
     module: AnsibleModule,
     rest_client: RestClient,
     virtual_disk_obj: Optional[VirtualDisk],
+    progress: Optional[TaskProgress] = None,
 ) -> Tuple[bool, Optional[TypedVirtualDiskToAnsible], TypedDiff]:
     before = None
     after = None
@@ -150,14 +179,19 @@ def ensure_present(
                 f"Invalid size for file: {module.params['source']}"
             )
         task = VirtualDisk.send_upload_request(rest_client, file_size, module)
-        after = wait_task_and_get_updated(rest_client, module, task, must_exist=False)
-        return is_changed(before, after), after, dict(before=before, after=after)
+        after = wait_task_and_get_updated(
+            rest_client, module, task, must_exist=False, progress=progress
+        )
+        # Without waiting, the new disk may not be listed yet.
+        changed = is_changed(before, after) or not module.params["wait"]
+        return changed, after, dict(before=before, after=after)
 
 
 def ensure_absent(
     module: AnsibleModule,
     rest_client: RestClient,
     virtual_disk_obj: Optional[VirtualDisk],
+    progress: Optional[TaskProgress] = None,
 ) -> Tuple[bool, Optional[TypedVirtualDiskToAnsible], TypedDiff]:
     before = None
     after = None
@@ -166,18 +200,25 @@ def ensure_absent(
     else:
         before = virtual_disk_obj.to_ansible()
         task = virtual_disk_obj.send_delete_request(rest_client)
-        after = wait_task_and_get_updated(rest_client, module, task, must_exist=False)
+        if not module.params["wait"]:
+            TaskTag.wait_task(rest_client, task, progress=progress, wait=False)
+            return True, None, dict(before=before, after=None)
+        after = wait_task_and_get_updated(
+            rest_client, module, task, must_exist=False, progress=progress
+        )
         return is_changed(before, after), after, dict(before=before, after=after)
 
 
 # Virtual disk can only be created or deleted; No update actions available.
 def run(
-    module: AnsibleModule, rest_client: RestClient
+    module: AnsibleModule,
+    rest_client: RestClient,
+    progress: Optional[TaskProgress] = None,
 ) -> Tuple[bool, Optional[TypedVirtualDiskToAnsible], TypedDiff]:
     virtual_disk_obj = VirtualDisk.get_by_name(rest_client, name=module.params["name"])
     if module.params["state"] == State.present:
-        return ensure_present(module, rest_client, virtual_disk_obj)
-    return ensure_absent(module, rest_client, virtual_disk_obj)
+        return ensure_present(module, rest_client, virtual_disk_obj, progress)
+    return ensure_absent(module, rest_client, virtual_disk_obj, progress)
 
 
 def main() -> None:
@@ -200,6 +241,7 @@ def main() -> None:
                 type="str",
                 required=True,
             ),
+            wait=dict(type="bool", default=True),
         ),
         required_if=[("state", "present", ("source",), False)],
     )
@@ -209,8 +251,16 @@ def main() -> None:
         rest_client = RestClient(client)
         hcversion = HyperCoreVersion(rest_client)
         hcversion.check_version(module, HYPERCORE_VERSION_REQUIREMENTS)
-        changed, record, diff = run(module, rest_client)
-        module.exit_json(changed=changed, record=record, diff=diff)
+        progress = TaskProgress(log=module.log)
+        changed, record, diff = run(module, rest_client, progress)
+        module.exit_json(
+            changed=changed,
+            record=record,
+            diff=diff,
+            task_tag=progress.task,
+            task_progress=progress.to_ansible(),
+            **client.throttle_result(),
+        )
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
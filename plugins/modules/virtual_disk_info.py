@@ -115,7 +115,7 @@ def main() -> None:
         hcversion = HyperCoreVersion(rest_client)
         hcversion.check_version(module, HYPERCORE_VERSION_REQUIREMENTS)
         records = run(module, rest_client)
-        module.exit_json(changed=False, records=records)
+        module.exit_json(changed=False, records=records, **client.throttle_result())
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
@@ -683,7 +683,13 @@ def main():
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = RestClient(client)
         changed, record, diff, reboot = run(module, rest_client)
-        module.exit_json(changed=changed, record=record, diff=diff, vm_rebooted=reboot)
+        module.exit_json(
+            changed=changed,
+            record=record,
+            diff=diff,
+            vm_rebooted=reboot,
+            **client.throttle_result(),
+        )
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
@@ -46,6 +46,14 @@ options:
     type: bool
     default: false
     version_added: 1.3.0
+  wait:
+    description:
+      - Wait until the clone task is finished.
+      - With I(wait=false), the module returns right after the clone is started,
+        with I(task_tag) that can be awaited later with M(scale_computing.hypercore.task_wait).
+    type: bool
+    default: true
+    version_added: 1.3.0
 notes:
   - C(check_mode) is not supported.
 """
@@ -75,6 +83,23 @@ msg:
   returned: success
   type: str
   sample: Virtual machine - VM-TEST - cloning complete to - VM-TEST-clone
+task_tag:
+  description:
+    - Task tag of the started clone task, C(null) if nothing was started.
+    - Can be passed to M(scale_computing.hypercore.task_wait).
+  returned: success
+  type: dict
+  version_added: 1.3.0
+  sample:
+    createdUUID: ""
+    taskTag: "1234"
+task_progress:
+  description:
+    - Progress of the clone task, sampled while waiting for it.
+    - See M(scale_computing.hypercore.task_wait) for the description of values.
+  returned: success
+  type: dict
+  version_added: 1.3.0
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -82,10 +107,10 @@ from ..module_utils import arguments, errors
 from ..module_utils.client import Client
 from ..module_utils.rest_client import RestClient
 from ..module_utils.vm import VM
-from ..module_utils.task_tag import TaskTag
+from ..module_utils.task_tag import TaskTag, TaskProgress
 
 
-def run(module, rest_client):
+def run(module, rest_client, progress=None):
     # Check if clone_vm already exists
     if VM.get(query={"name": module.params["vm_name"]}, rest_client=rest_client):
         return (
@@ -96,7 +121,12 @@ def run(module, rest_client):
         query={"name": module.params["source_vm_name"]}, rest_client=rest_client
     )[0]
     task = virtual_machine_obj.clone_vm(rest_client, module.params)
-    TaskTag.wait_task(rest_client, task)
+    TaskTag.wait_task(rest_client, task, progress=progress, wait=module.params["wait"])
+    if not module.params["wait"]:
+        return (
+            True,
+            f"Virtual machine - {module.params['source_vm_name']} - cloning started to - {module.params['vm_name']}.",
+        )
     task_status = TaskTag.get_task_status(rest_client, task)
     if task_status and task_status.get("state", "") == "COMPLETE":
         return (
@@ -137,14 +167,22 @@ def main():
                 default=False,
                 required=False,
             ),
+            wait=dict(type="bool", default=True),
         ),
     )
 
     try:
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = RestClient(client=client)
-        changed, msg = run(module, rest_client)
-        module.exit_json(changed=changed, msg=msg)
+        progress = TaskProgress(log=module.log)
+        changed, msg = run(module, rest_client, progress)
+        module.exit_json(
+            changed=changed,
+            msg=msg,
+            task_tag=progress.task,
+            task_progress=progress.to_ansible(),
+            **client.throttle_result(),
+        )
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
@@ -0,0 +1,364 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r"""
+module: vm_export_bulk
+
+author:
+  - XLAB Steampunk (@xlab-steampunk)
+short_description: Export many VMs to SMB servers at once
+description:
+  - Use this module to export every selected VM to a SMB server.
+  - VMs are selected by name (I(vm_names)) or with I(vm_selector).
+    If both are set, VMs matching either of them are selected.
+  - Export location of every VM is built from I(targets) path template.
+    If more targets are given, VMs are assigned to targets in turn.
+  - Exports are submitted with bounded concurrency, both for the whole cluster
+    (I(max_concurrency)) and for every SMB server (I(max_target_concurrency)),
+    and all export tasks are awaited together.
+  - A new export is made on every run, the module is not idempotent.
+version_added: 1.3.0
+extends_documentation_fragment:
+  - scale_computing.hypercore.cluster_instance
+  - scale_computing.hypercore.vm_selector
+seealso:
+  - module: scale_computing.hypercore.vm_export
+  - module: scale_computing.hypercore.vm_import
+options:
+  vm_names:
+    type: list
+    elements: str
+    description:
+      - Names of VMs to export.
+      - The module fails before starting any export if some VM does not exist.
+    required: false
+  targets:
+    type: list
+    elements: dict
+    description:
+      - SMB servers and locations, where the VMs are exported to.
+    required: true
+    suboptions:
+      server:
+        type: str
+        description:
+          - SMB server, IP or DNS name.
+        required: true
+      path:
+        type: str
+        description:
+          - Template of location on the SMB server, where a VM is exported to.
+            It must start with '/'.
+          - Placeholders C({vm_name}), C({vm_uuid}), C({date}) (C(YYYY-MM-DD))
+            and C({time}) (C(HHMMSS)) are replaced with VM name, VM UUID and
+            UTC date and time of the module start.
+        required: true
+      file_name:
+        type: str
+        description:
+          - Template of xml file name, with the same placeholders as I(path).
+          - If not specified, file name will be the same as directory name from I(path).
+      username:
+        type: str
+        description:
+          - Username.
+        required: true
+      password:
+        type: str
+        description:
+          - Password.
+        required: true
+  max_concurrency:
+    type: int
+    description:
+      - Maximum number of exports in progress at the same time.
+    default: 5
+  max_target_concurrency:
+    type: int
+    description:
+      - Maximum number of exports to the same SMB server in progress at the same time.
+    default: 2
+notes:
+  - C(check_mode) is supported. Export locations of selected VMs are returned, but VMs are not exported.
+"""
+
+
+EXAMPLES = r"""
+- name: Nightly export of all production VMs to two SMB servers
+  scale_computing.hypercore.vm_export_bulk:
+    vm_selector:
+      tags:
+        - production
+    targets:
+      - server: backup-1.example.com
+        path: /backup/{date}/{vm_name}
+        username: user
+        password: pass
+      - server: backup-2.example.com
+        path: /backup/{date}/{vm_name}
+        username: user
+        password: pass
+    max_concurrency: 8
+    max_target_concurrency: 4
+  register: exports
+
+- name: Export listed VMs
+  scale_computing.hypercore.vm_export_bulk:
+    vm_names:
+      - demo-vm-1
+      - demo-vm-2
+    targets:
+      - server: 10.5.11.39
+        path: /share/{vm_name}-{date}-{time}
+        file_name: "{vm_name}.xml"
+        username: user
+        password: pass
+"""
+
+RETURN = r"""
+records:
+  description:
+    - One record for every selected VM.
+  returned: success, or when some of the operations failed
+  type: list
+  elements: dict
+  contains:
+    vm_name:
+      description: Name of the VM
+      type: str
+      sample: demo-vm-1
+    vm_uuid:
+      description: Unique identifier of the VM
+      type: str
+      sample: 5e50977c-14ce-450c-8a1a-bf5c0afbcf43
+    server:
+      description: SMB server the VM is exported to
+      type: str
+      sample: backup-1.example.com
+    path:
+      description: Location on the SMB server the VM is exported to
+      type: str
+      sample: /backup/2023-05-01/demo-vm-1
+    file_name:
+      description: Name of the xml file, C(null) if not specified
+      type: str
+      sample: demo-vm-1.xml
+    size:
+      description: Capacity of VM disks (CD-ROMs excluded) in bytes
+      type: int
+      sample: 10737418240
+    task_tag:
+      description: Task tag of the export. Not returned in check mode.
+      type: str
+      sample: "1234"
+    duration:
+      description: Seconds from the export request until the task finished. Not returned in check mode.
+      type: float
+      sample: 184.104
+    throughput:
+      description:
+        - Disk capacity exported per second, in bytes. Not returned in check mode.
+        - Upper bound of the actual throughput, as only allocated data is exported.
+      type: int
+      sample: 58322106
+duration:
+  description: Seconds needed to export all VMs.
+  returned: success
+  type: float
+  sample: 1835.812
+"""
+
+
+from time import gmtime, strftime, time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ansible.module_utils.basic import AnsibleModule
+
+from ..module_utils import errors, arguments
+from ..module_utils.bulk import run_tasks, update_records
+from ..module_utils.client import Client
+from ..module_utils.rest_client import RestClient
+from ..module_utils.typed_classes import TypedTaskTag
+from ..module_utils.vm import VM
+from ..module_utils.vm_selector import VMIndex, VMSelector
+
+
+def select_vms(module: AnsibleModule, rest_client: RestClient) -> List[Dict[str, Any]]:
+    """Returns raw VirDomain records of selected VMs, from one VM listing."""
+    index = VMIndex.get(rest_client)
+    selected = index.get_by_names(module.params["vm_names"] or [], must_exist=True)
+    if module.params["vm_selector"]:
+        uuids = set(vm_dict["uuid"] for vm_dict in selected)
+        selected.extend(
+            vm_dict
+            for vm_dict in VMSelector.from_ansible(module.params["vm_selector"]).select(
+                rest_client, index
+            )
+            if vm_dict["uuid"] not in uuids
+        )
+    return selected
+
+
+def format_template(
+    template: Optional[str], vm_dict: Dict[str, Any], started: float
+) -> Optional[str]:
+    if template is None:
+        return None
+    try:
+        return template.format(
+            vm_name=vm_dict["name"],
+            vm_uuid=vm_dict["uuid"],
+            date=strftime("%Y-%m-%d", gmtime(started)),
+            time=strftime("%H%M%S", gmtime(started)),
+        )
+    except (KeyError, IndexError, ValueError) as e:
+        raise errors.ScaleComputingError(
+            "Invalid template {0}: {1}".format(template, e)
+        )
+
+
+def get_size(vm_dict: Dict[str, Any]) -> int:
+    return sum(
+        block_dev.get("capacity") or 0
+        for block_dev in vm_dict.get("blockDevs") or []
+        if block_dev.get("type") != "IDE_CDROM"
+    )
+
+
+def plan_exports(
+    module: AnsibleModule, vms: List[Dict[str, Any]], started: float
+) -> List[Dict[str, Any]]:
+    """Assigns VMs to targets in turn and builds their export locations."""
+    targets = module.params["targets"]
+    records: List[Dict[str, Any]] = []
+    for position, vm_dict in enumerate(vms):
+        target = targets[position % len(targets)]
+        records.append(
+            dict(
+                vm_name=vm_dict["name"],
+                vm_uuid=vm_dict["uuid"],
+                server=target["server"],
+                path=format_template(target["path"], vm_dict, started),
+                file_name=format_template(target["file_name"], vm_dict, started),
+                size=get_size(vm_dict),
+            )
+        )
+    return records
+
+
+def export_vm(
+    rest_client: RestClient,
+    vm_dict: Dict[str, Any],
+    record: Dict[str, Any],
+    target: Dict[str, Any],
+) -> TypedTaskTag:
+    vm = VM(  # type: ignore
+        uuid=vm_dict["uuid"],
+        name=vm_dict["name"],
+        memory=vm_dict["mem"],
+        vcpu=vm_dict["numVCPU"],
+    )
+    return vm.export_vm(  # type: ignore
+        rest_client,
+        dict(
+            smb=dict(
+                server=record["server"],
+                path=record["path"],
+                file_name=record["file_name"],
+                username=target["username"],
+                password=target["password"],
+            ),
+            http_uri=None,
+        ),
+    )
+
+
+def run(
+    module: AnsibleModule, rest_client: RestClient
+) -> Tuple[bool, List[Dict[str, Any]], float]:
+    started = time()
+    targets = module.params["targets"]
+    if not targets:
+        raise errors.ScaleComputingError("At least one target is required.")
+    vms = select_vms(module, rest_client)
+    records = plan_exports(module, vms, started)
+    if module.check_mode or not records:
+        return bool(records), records, 0.0
+
+    results = run_tasks(
+        rest_client,
+        list(range(len(records))),
+        lambda position: export_vm(
+            rest_client,
+            vms[position],
+            records[position],
+            targets[position % len(targets)],
+        ),
+        max_concurrency=module.params["max_concurrency"],
+        # Exports to the same server share its storage, whatever the share or path.
+        group=lambda position: records[position]["server"].lower(),
+        max_group_concurrency=module.params["max_target_concurrency"],
+    )
+    for record, result in zip(records, results):
+        record["throughput"] = (
+            int(record["size"] / result["duration"]) if result["duration"] else None
+        )
+    update_records(
+        records,
+        results,
+        "Failed to export {0} of {1} VMs",
+        lambda record: record["vm_name"],
+    )
+    return True, records, round(time() - started, 3)
+
+
+def main() -> None:
+    module = AnsibleModule(
+        supports_check_mode=True,
+        argument_spec=dict(
+            arguments.get_spec("cluster_instance", "vm_selector"),
+            vm_names=dict(type="list", elements="str", required=False),
+            targets=dict(
+                type="list",
+                elements="dict",
+                required=True,
+                options=dict(
+                    server=dict(type="str", required=True),
+                    path=dict(type="str", required=True),
+                    file_name=dict(type="str"),
+                    username=dict(type="str", required=True),
+                    password=dict(type="str", no_log=True, required=True),
+                ),
+            ),
+            max_concurrency=dict(type="int", default=5),
+            max_target_concurrency=dict(type="int", default=2),
+        ),
+        required_one_of=[("vm_names", "vm_selector")],
+    )
+
+    try:
+        client = Client.get_client(module.params["cluster_instance"])
+        rest_client = RestClient(client)
+        changed, records, duration = run(module, rest_client)
+        module.exit_json(
+            changed=changed,
+            records=records,
+            duration=duration,
+            **client.throttle_result(),
+        )
+    except errors.BulkError as e:
+        module.fail_json(msg=str(e), records=e.records)
+    except errors.ScaleComputingError as e:
+        module.fail_json(msg=str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -73,6 +73,14 @@ options:
         description:
           - File name to be imported from the specified URI location.
         required: true
+  wait:
+    description:
+      - Wait until the import task is finished.
+      - With I(wait=false), the module returns right after the import is started,
+        with I(task_tag) that can be awaited later with M(scale_computing.hypercore.task_wait).
+    type: bool
+    default: true
+    version_added: 1.3.0
 notes:
   - C(check_mode) is not supported.
 """
@@ -138,6 +146,23 @@ msg:
   returned: success
   type: str
   sample: Virtual machine - VM-TEST - import complete.
+task_tag:
+  description:
+    - Task tag of the started import task, C(null) if nothing was started.
+    - Can be passed to M(scale_computing.hypercore.task_wait).
+  returned: success
+  type: dict
+  version_added: 1.3.0
+  sample:
+    createdUUID: ""
+    taskTag: "1234"
+task_progress:
+  description:
+    - Progress of the import task, sampled while waiting for it.
+    - See M(scale_computing.hypercore.task_wait) for the description of values.
+  returned: success
+  type: dict
+  version_added: 1.3.0
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -145,17 +170,22 @@ from ..module_utils import arguments, errors
 from ..module_utils.client import Client
 from ..module_utils.rest_client import RestClient
 from ..module_utils.vm import VM
-from ..module_utils.task_tag import TaskTag
+from ..module_utils.task_tag import TaskTag, TaskProgress
 
 
-def run(module, rest_client):
+def run(module, rest_client, progress=None):
     virtual_machine_obj_list = VM.get(
         query={"name": module.params["vm_name"]}, rest_client=rest_client
     )
     if len(virtual_machine_obj_list) > 0:
         return False, f"Virtual machine - {module.params['vm_name']} - already exists."
     task = VM.import_vm(rest_client, module.params)
-    TaskTag.wait_task(rest_client, task)
+    TaskTag.wait_task(rest_client, task, progress=progress, wait=module.params["wait"])
+    if not module.params["wait"]:
+        return (
+            True,
+            f"Virtual machine - {module.params['vm_name']} - import started.",
+        )
     task_status = TaskTag.get_task_status(rest_client, task)
     if task_status and task_status.get("state", "") == "COMPLETE":
         return True, f"Virtual machine - {module.params['vm_name']} - import complete."
@@ -219,6 +249,7 @@ def main():
                     meta_data=dict(type="str"),
                 ),
             ),
+            wait=dict(type="bool", default=True),
         ),
         mutually_exclusive=[("smb", "http_uri")],
         required_one_of=[("smb", "http_uri")],
@@ -227,8 +258,15 @@ def main():
     try:
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = RestClient(client=client)
-        changed, msg = run(module, rest_client)
-        module.exit_json(changed=changed, msg=msg)
+        progress = TaskProgress(log=module.log)
+        changed, msg = run(module, rest_client, progress)
+        module.exit_json(
+            changed=changed,
+            msg=msg,
+            task_tag=progress.task,
+            task_progress=progress.to_ansible(),
+            **client.throttle_result(),
+        )
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
@@ -17,9 +17,11 @@ author:
 short_description: Retrieve information about the VMs.
 description:
   - Retrieve information about all or single VM present on the cluster.
+  - With I(vm_selector), information about all VMs matching the selector is retrieved.
 version_added: 1.0.0
 extends_documentation_fragment:
   - scale_computing.hypercore.cluster_instance
+  - scale_computing.hypercore.vm_selector
 seealso: []
 options:
   vm_name:
@@ -27,6 +29,7 @@ options:
       - VM's name.
       - Serves as unique identifier across endpoint U(VirDomain).
       - If specified, the VM with that name will get returned. Otherwise, all VMs are going to get returned.
+      - Mutually exclusive with I(vm_selector).
     type: str
 """
 
@@ -39,6 +42,17 @@ EXAMPLES = r"""
 - name: Retrieve all VMs.
   scale_computing.hypercore.vm_info:
   register: result
+
+- name: Retrieve running VMs tagged production or staging
+  scale_computing.hypercore.vm_info:
+    vm_selector:
+      tags:
+        - production
+        - staging
+      tags_match: any
+      power_state:
+        - started
+  register: result
 """
 
 RETURN = r"""
@@ -147,19 +161,28 @@ from ansible.module_utils.basic import AnsibleModule
 from ..module_utils import arguments, errors
 from ..module_utils.client import Client
 from ..module_utils.vm import VM
-from ..module_utils.utils import get_query
+from ..module_utils.vm_selector import VMSelector
+from ..module_utils.utils import drain, get_query
 from ..module_utils.rest_client import CachedRestClient
 
 
 def run(module, rest_client):
-    query = get_query(
-        module.params,
-        "vm_name",
-        ansible_hypercore_map=dict(vm_name="name"),
-    )
+    if module.params["vm_selector"]:
+        vm_dicts = VMSelector.from_ansible(module.params["vm_selector"]).select(
+            rest_client
+        )
+    else:
+        query = get_query(
+            module.params,
+            "vm_name",
+            ansible_hypercore_map=dict(vm_name="name"),
+        )
+        vm_dicts = rest_client.list_records("/rest/v1/VirDomain", query)
+    # VM list is not needed anymore, raw records are released one by one as converted.
+    rest_client.release("/rest/v1/VirDomain")
     return [
         VM.from_hypercore(vm_dict, rest_client).to_ansible()
-        for vm_dict in rest_client.list_records("/rest/v1/VirDomain", query)
+        for vm_dict in drain(vm_dicts)
     ]
 
 
@@ -167,16 +190,17 @@ def main():
     module = AnsibleModule(
         supports_check_mode=True,
         argument_spec=dict(
-            arguments.get_spec("cluster_instance"),
+            arguments.get_spec("cluster_instance", "vm_selector"),
             vm_name=dict(type="str"),
         ),
+        mutually_exclusive=[("vm_name", "vm_selector")],
     )
 
     try:
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = CachedRestClient(client)
         records = run(module, rest_client)
-        module.exit_json(changed=False, records=records)
+        module.exit_json(changed=False, records=records, **client.throttle_result())
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
@@ -313,6 +313,7 @@ def main():
             records=records,
             diff=diff,
             vm_rebooted=reboot,
+            **client.throttle_result(),
         )
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
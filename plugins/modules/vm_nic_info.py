@@ -114,7 +114,7 @@ def main():
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = RestClient(client)
         changed, records = run(module, rest_client)
-        module.exit_json(changed=changed, records=records)
+        module.exit_json(changed=changed, records=records, **client.throttle_result())
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
@@ -131,12 +131,12 @@ from ..module_utils import arguments, errors
 from ..module_utils.client import Client
 from ..module_utils.rest_client import RestClient
 from ..module_utils.vm import VM
-from ..module_utils.node import Node
+from ..module_utils.node import Node, NodeDirectory
 from ..module_utils.utils import get_query
 from ..module_utils.task_tag import TaskTag
 
 
-def get_node_uuid(module, node, rest_client):
+def get_node_uuid(module, node, rest_client, node_directory=None):
     if module.params[node] and any(
         value == "" for value in module.params[node].values()
     ):  # delete node
@@ -159,15 +159,19 @@ def get_node_uuid(module, node, rest_client):
                 peer_id="peerID",
             ),
         )
-        node = Node.get_node(query, rest_client, must_exist=True)
+        node = Node.get_node(
+            query, rest_client, must_exist=True, node_directory=node_directory
+        )
         node_uuid = node.node_uuid
         return node_uuid
 
 
-def set_parameters_for_payload(module, vm, rest_client):
+def set_parameters_for_payload(module, vm, rest_client, node_directory=None):
     strict_affinity = module.params["strict_affinity"]
-    preferred_node_uuid = get_node_uuid(module, "preferred_node", rest_client)
-    backup_node_uuid = get_node_uuid(module, "backup_node", rest_client)
+    preferred_node_uuid = get_node_uuid(
+        module, "preferred_node", rest_client, node_directory
+    )
+    backup_node_uuid = get_node_uuid(module, "backup_node", rest_client, node_directory)
     if preferred_node_uuid is None:  # node is not provided
         preferred_node_uuid = vm.node_affinity["preferred_node"]["node_uuid"]
         if vm.node_affinity["preferred_node"]["node_uuid"]:  # Check if exists
@@ -175,6 +179,7 @@ def set_parameters_for_payload(module, vm, rest_client):
                 {"uuid": vm.node_affinity["preferred_node"]["node_uuid"]},
                 rest_client,
                 must_exist=True,
+                node_directory=node_directory,
             )
     if backup_node_uuid is None:  # node is not provided
         backup_node_uuid = vm.node_affinity["backup_node"]["node_uuid"]
@@ -183,17 +188,20 @@ def set_parameters_for_payload(module, vm, rest_client):
                 {"uuid": vm.node_affinity["backup_node"]["node_uuid"]},
                 rest_client,
                 must_exist=True,
+                node_directory=node_directory,
             )
     return strict_affinity, preferred_node_uuid, backup_node_uuid
 
 
 def run(module, rest_client):
+    # Nodes are listed once, on the first lookup, and shared by all lookups below.
+    node_directory = NodeDirectory(rest_client)
     vm = VM.get_by_name(
-        module.params, rest_client, must_exist=True
+        module.params, rest_client, must_exist=True, node_directory=node_directory
     )  # get vm from vm_name
 
     strict_affinity, preferred_node_uuid, backup_node_uuid = set_parameters_for_payload(
-        module, vm, rest_client
+        module, vm, rest_client, node_directory
     )
 
     if strict_affinity is True and preferred_node_uuid == "" and backup_node_uuid == "":
@@ -221,17 +229,21 @@ def run(module, rest_client):
     endpoint = "{0}/{1}".format("/rest/v1/VirDomain", vm.uuid)
     task_tag = rest_client.update_record(endpoint, payload, module.check_mode)
     TaskTag.wait_task(rest_client, task_tag)
-    vm_after = VM.get_by_name(module.params, rest_client, must_exist=True)
+    vm_after = VM.get_by_name(
+        module.params, rest_client, must_exist=True, node_directory=node_directory
+    )
     if module.check_mode:
         vm_after.node_affinity = dict(
             strict_affinity=strict_affinity,
             preferred_node=Node.get_node(
-                {"uuid": preferred_node_uuid}, rest_client
+                {"uuid": preferred_node_uuid},
+                rest_client,
+                node_directory=node_directory,
             ).to_ansible()
             if preferred_node_uuid != ""
             else None,
             backup_node=Node.get_node(
-                {"uuid": backup_node_uuid}, rest_client
+                {"uuid": backup_node_uuid}, rest_client, node_directory=node_directory
             ).to_ansible()
             if backup_node_uuid != ""
             else None,
@@ -283,7 +295,9 @@ def main():
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = RestClient(client)
         changed, msg, diff = run(module, rest_client)
-        module.exit_json(changed=changed, msg=msg, diff=diff)
+        module.exit_json(
+            changed=changed, msg=msg, diff=diff, **client.throttle_result()
+        )
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
@@ -0,0 +1,292 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r"""
+module: vm_node_rebalance
+
+author:
+  - XLAB Steampunk (@xlab-steampunk)
+short_description: Balance VM node affinity over cluster nodes
+description:
+  - Use this module to spread VMs over cluster nodes by setting their preferred and backup node.
+  - All nodes and VMs are read once. Memory and vCPUs of VMs are summed per preferred node
+    (or per current node, if VM has no preferred node).
+  - VMs are moved from the most loaded node while this lowers its memory utilization,
+    then every VM without a valid backup node gets the least loaded other node as backup node.
+  - Only VMs with changed preferred or backup node are updated, with bounded concurrency.
+  - VMs with strict affinity keep their nodes. Set strict affinity with M(scale_computing.hypercore.vm_node_affinity).
+version_added: 1.3.0
+extends_documentation_fragment:
+  - scale_computing.hypercore.cluster_instance
+  - scale_computing.hypercore.vm_selector
+seealso:
+  - module: scale_computing.hypercore.vm_node_affinity
+  - module: scale_computing.hypercore.node_info
+options:
+  pinned_vms:
+    type: list
+    elements: str
+    description:
+      - Names of VMs that keep their preferred and backup node.
+      - VMs that are not selected by I(vm_selector) keep their nodes too.
+      - Memory of kept VMs is counted in node load.
+    default: []
+  anti_affinity_tags:
+    type: list
+    elements: str
+    description:
+      - VMs that share one of these tags are placed on different nodes where possible,
+        both as preferred and as backup node.
+    default: []
+  max_memory_percent:
+    type: int
+    description:
+      - VMs are not moved to a node if memory of its VMs would exceed this percent of node memory.
+      - VMs without a node that do not fit on any node are left unchanged and returned in I(unplaced).
+    default: 90
+  max_moves:
+    type: int
+    description:
+      - Maximum number of VMs that get a different preferred node.
+      - By default the number of moves is not limited.
+  max_concurrency:
+    type: int
+    description:
+      - Maximum number of VM updates in progress at the same time.
+    default: 5
+notes:
+  - C(check_mode) is supported. The planned placement is returned, but VMs are not updated.
+"""
+
+
+EXAMPLES = r"""
+- name: Spread all VMs, keep database VMs on different nodes
+  scale_computing.hypercore.vm_node_rebalance:
+    anti_affinity_tags:
+      - database
+    max_memory_percent: 85
+  register: result
+
+- name: Plan moves of at most 5 production VMs
+  scale_computing.hypercore.vm_node_rebalance:
+    vm_selector:
+      tags:
+        - production
+    pinned_vms:
+      - license-server
+    max_moves: 5
+  check_mode: true
+"""
+
+RETURN = r"""
+records:
+  description:
+    - One record for every VM with changed preferred or backup node.
+  returned: success, or when some of the operations failed
+  type: list
+  elements: dict
+  contains:
+    vm_name:
+      description: Name of the VM
+      type: str
+      sample: demo-vm-1
+    vm_uuid:
+      description: Unique identifier of the VM
+      type: str
+      sample: 5e50977c-14ce-450c-8a1a-bf5c0afbcf43
+    before:
+      description: Preferred and backup node UUID before the change
+      type: dict
+      sample:
+        preferred_node_uuid: 412a3e85-8c21-4138-a36e-789eae3548a3
+        backup_node_uuid: ""
+    after:
+      description: Preferred and backup node UUID after the change
+      type: dict
+      sample:
+        preferred_node_uuid: 3dd52913-4e60-46fa-8ac6-07ba0b2155d2
+        backup_node_uuid: 412a3e85-8c21-4138-a36e-789eae3548a3
+    task_tag:
+      description: Task tag of the VM update. Not returned in check mode.
+      type: str
+      sample: "1234"
+    duration:
+      description: Seconds from the update request until the task finished. Not returned in check mode.
+      type: float
+      sample: 1.104
+nodes:
+  description:
+    - Load of every node that can run VMs, before and after the change.
+  returned: success
+  type: list
+  elements: dict
+  contains:
+    node_uuid:
+      description: Unique identifier of the node
+      type: str
+      sample: 412a3e85-8c21-4138-a36e-789eae3548a3
+    lan_ip:
+      description: LAN IP of the node
+      type: str
+      sample: 10.0.0.1
+    memory_limit:
+      description: Bytes of memory available to VMs, by I(max_memory_percent). C(null) if node memory is not known.
+      type: int
+      sample: 61847529062
+    before:
+      description: Memory (bytes), vCPUs and number of VMs with this preferred node, before the change
+      type: dict
+      sample:
+        memory: 42949672960
+        vcpu: 24
+        vms: 12
+    after:
+      description: Memory (bytes), vCPUs and number of VMs with this preferred node, after the change
+      type: dict
+      sample:
+        memory: 34359738368
+        vcpu: 20
+        vms: 10
+unplaced:
+  description:
+    - Names of VMs without a preferred or running node that do not fit on any node
+      within I(max_memory_percent). Their node affinity is not changed.
+  returned: success
+  type: list
+  elements: str
+  sample:
+    - demo-vm-2
+"""
+
+
+from ansible.module_utils.basic import AnsibleModule
+
+from ..module_utils import errors, arguments
+from ..module_utils.bulk import run_tasks, update_records
+from ..module_utils.client import Client
+from ..module_utils.rest_client import RestClient
+from ..module_utils.vm_placement import PlacedVM, PlacementPlan
+from ..module_utils.vm_selector import VMIndex, VMSelector
+from typing import Any, Dict, List, Set, Tuple
+
+
+def get_movable_uuids(
+    module: AnsibleModule, rest_client: RestClient, index: VMIndex
+) -> Set[str]:
+    if module.params["vm_selector"]:
+        selected = VMSelector.from_ansible(module.params["vm_selector"]).select(
+            rest_client, index
+        )
+    else:
+        selected = index.records
+    pinned = set(
+        vm_dict["uuid"]
+        for vm_dict in index.get_by_names(module.params["pinned_vms"], must_exist=True)
+    )
+    return set(vm_dict["uuid"] for vm_dict in selected) - pinned
+
+
+def update_affinity(rest_client: RestClient, vm: PlacedVM) -> Any:
+    strict_affinity, _preferred, _backup = vm.affinity
+    return rest_client.update_record(
+        "/rest/v1/VirDomain/{0}".format(vm.uuid),
+        dict(
+            affinityStrategy=dict(
+                strictAffinity=strict_affinity,
+                preferredNodeUUID=vm.preferred or "",
+                backupNodeUUID=vm.backup or "",
+            )
+        ),
+        False,
+    )
+
+
+def run(
+    module: AnsibleModule, rest_client: RestClient
+) -> Tuple[bool, List[Dict[str, Any]], List[Dict[str, Any]], List[str]]:
+    if module.params["max_memory_percent"] < 1:
+        raise errors.ScaleComputingError("max_memory_percent must be at least 1.")
+    node_dicts = rest_client.list_records("/rest/v1/Node")
+    index = VMIndex.get(rest_client)
+    plan = PlacementPlan(
+        node_dicts,
+        index.records,
+        get_movable_uuids(module, rest_client, index),
+        anti_affinity_tags=module.params["anti_affinity_tags"],
+        max_memory_percent=module.params["max_memory_percent"],
+        max_moves=module.params["max_moves"],
+    )
+    changed_vms = plan.plan()
+    records: List[Dict[str, Any]] = [
+        dict(
+            vm_name=vm.name,
+            vm_uuid=vm.uuid,
+            before=dict(
+                preferred_node_uuid=vm.affinity[1], backup_node_uuid=vm.affinity[2]
+            ),
+            after=dict(
+                preferred_node_uuid=vm.preferred or "",
+                backup_node_uuid=vm.backup or "",
+            ),
+        )
+        for vm in changed_vms
+    ]
+    unplaced = [vm.name for vm in plan.unplaced]
+    if module.check_mode or not changed_vms:
+        return bool(changed_vms), records, plan.node_summary(), unplaced
+
+    results = run_tasks(
+        rest_client,
+        changed_vms,
+        lambda vm: update_affinity(rest_client, vm),
+        max_concurrency=module.params["max_concurrency"],
+    )
+    update_records(
+        records,
+        results,
+        "Failed to update {0} of {1} VMs",
+        lambda record: record["vm_name"],
+    )
+    return True, records, plan.node_summary(), unplaced
+
+
+def main() -> None:
+    module = AnsibleModule(
+        supports_check_mode=True,
+        argument_spec=dict(
+            arguments.get_spec("cluster_instance", "vm_selector"),
+            pinned_vms=dict(type="list", elements="str", default=[]),
+            anti_affinity_tags=dict(type="list", elements="str", default=[]),
+            max_memory_percent=dict(type="int", default=90),
+            max_moves=dict(type="int", required=False),
+            max_concurrency=dict(type="int", default=5),
+        ),
+    )
+
+    try:
+        client = Client.get_client(module.params["cluster_instance"])
+        rest_client = RestClient(client)
+        changed, records, nodes, unplaced = run(module, rest_client)
+        module.exit_json(
+            changed=changed,
+            records=records,
+            nodes=nodes,
+            unplaced=unplaced,
+            **client.throttle_result(),
+        )
+    except errors.BulkError as e:
+        module.fail_json(msg=str(e), records=e.records)
+    except errors.ScaleComputingError as e:
+        module.fail_json(msg=str(e))
+
+
+if __name__ == "__main__":
+    main()
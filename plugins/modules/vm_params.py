@@ -186,7 +186,9 @@ def main():
         client = Client.get_client(module.params["cluster_instance"])
         rest_client = RestClient(client)
         changed, reboot, diff = run(module, rest_client)
-        module.exit_json(changed=changed, vm_rebooted=reboot, diff=diff)
+        module.exit_json(
+            changed=changed, vm_rebooted=reboot, diff=diff, **client.throttle_result()
+        )
     except ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
@@ -68,7 +68,7 @@ from ansible.module_utils.basic import AnsibleModule
 
 from ..module_utils import arguments, errors
 from ..module_utils.client import Client
-from ..module_utils.rest_client import RestClient
+from ..module_utils.rest_client import CachedRestClient
 from ..module_utils.vm import VM
 from ..module_utils.replication import Replication
 
@@ -108,9 +108,9 @@ def main():
 
     try:
         client = Client.get_client(module.params["cluster_instance"])
-        rest_client = RestClient(client)
+        rest_client = CachedRestClient(client)
         changed, records = run(module, rest_client)
-        module.exit_json(changed=changed, records=records)
+        module.exit_json(changed=changed, records=records, **client.throttle_result())
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
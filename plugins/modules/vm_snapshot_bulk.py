@@ -0,0 +1,198 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r"""
+module: vm_snapshot_bulk
+
+author:
+  - XLAB Steampunk (@xlab-steampunk)
+short_description: Create snapshots of many VMs at once
+description:
+  - Use this module to create a snapshot of every selected VM on HyperCore API.
+  - VMs are selected by name (I(vm_names)) or with I(vm_selector).
+    If both are set, VMs matching either of them are selected.
+  - Snapshot creations are submitted with bounded concurrency (see I(max_concurrency)),
+    and all snapshot tasks are awaited together.
+  - A new snapshot is created on every run, the module is not idempotent.
+version_added: 1.3.0
+extends_documentation_fragment:
+  - scale_computing.hypercore.cluster_instance
+  - scale_computing.hypercore.vm_selector
+seealso:
+  - module: scale_computing.hypercore.vm_snapshot_info
+  - module: scale_computing.hypercore.vm_snapshot_prune
+options:
+  vm_names:
+    type: list
+    elements: str
+    description:
+      - Names of VMs to snapshot.
+      - The module fails before creating any snapshot if some VM does not exist.
+    required: false
+  label:
+    type: str
+    description:
+      - Label of the created snapshots.
+    required: true
+  max_concurrency:
+    type: int
+    description:
+      - Maximum number of snapshot creations in progress at the same time.
+    default: 5
+notes:
+  - C(check_mode) is supported. Selected VMs are returned, but snapshots are not created.
+"""
+
+
+EXAMPLES = r"""
+- name: Snapshot all production VMs before maintenance
+  scale_computing.hypercore.vm_snapshot_bulk:
+    vm_selector:
+      tags:
+        - production
+    label: pre-maintenance-2023-05-01
+    max_concurrency: 10
+  register: snapshots
+
+- name: Snapshot listed VMs
+  scale_computing.hypercore.vm_snapshot_bulk:
+    vm_names:
+      - demo-vm-1
+      - demo-vm-2
+    label: before-upgrade
+"""
+
+RETURN = r"""
+records:
+  description:
+    - One record for every selected VM.
+  returned: success, or when some of the operations failed
+  type: list
+  elements: dict
+  contains:
+    vm_name:
+      description: Name of the VM
+      type: str
+      sample: demo-vm-1
+    vm_uuid:
+      description: Unique identifier of the VM
+      type: str
+      sample: 5e50977c-14ce-450c-8a1a-bf5c0afbcf43
+    snapshot_uuid:
+      description: Unique identifier of the created snapshot. Not returned in check mode.
+      type: str
+      sample: 28d6ff95-2c31-4a1a-b3d9-47535164d6de
+    task_tag:
+      description: Task tag of the snapshot creation. Not returned in check mode.
+      type: str
+      sample: "1234"
+    duration:
+      description: Seconds from the create request until the task finished. Not returned in check mode.
+      type: float
+      sample: 2.104
+duration:
+  description: Seconds needed to create all snapshots.
+  returned: success
+  type: float
+  sample: 35.812
+"""
+
+
+from time import time
+
+from ansible.module_utils.basic import AnsibleModule
+
+from ..module_utils import errors, arguments
+from ..module_utils.bulk import run_tasks, update_records
+from ..module_utils.client import Client
+from ..module_utils.rest_client import RestClient
+from ..module_utils.vm_selector import VMIndex, VMSelector
+from ..module_utils.vm_snapshot import VMSnapshot
+from typing import Any, Dict, List, Tuple
+
+
+def select_vms(module: AnsibleModule, rest_client: RestClient) -> List[Dict[str, Any]]:
+    """Returns raw VirDomain records of selected VMs, from one VM listing."""
+    index = VMIndex.get(rest_client)
+    selected = index.get_by_names(module.params["vm_names"] or [], must_exist=True)
+    if module.params["vm_selector"]:
+        uuids = set(vm_dict["uuid"] for vm_dict in selected)
+        selected.extend(
+            vm_dict
+            for vm_dict in VMSelector.from_ansible(module.params["vm_selector"]).select(
+                rest_client, index
+            )
+            if vm_dict["uuid"] not in uuids
+        )
+    return selected
+
+
+def run(
+    module: AnsibleModule, rest_client: RestClient
+) -> Tuple[bool, List[Dict[str, Any]], float]:
+    started = time()
+    vms = select_vms(module, rest_client)
+    records: List[Dict[str, Any]] = [
+        dict(vm_name=vm_dict["name"], vm_uuid=vm_dict["uuid"]) for vm_dict in vms
+    ]
+    if module.check_mode or not records:
+        return bool(records), records, 0.0
+
+    label = module.params["label"]
+    results = run_tasks(
+        rest_client,
+        records,
+        lambda record: VMSnapshot.create_snapshot(
+            record["vm_uuid"], label, rest_client
+        ),
+        max_concurrency=module.params["max_concurrency"],
+    )
+    for record, result in zip(records, results):
+        record["snapshot_uuid"] = result["created_uuid"]
+    update_records(
+        records,
+        results,
+        "Failed to create {0} of {1} snapshots",
+        lambda record: record["vm_name"],
+    )
+    return True, records, round(time() - started, 3)
+
+
+def main() -> None:
+    module = AnsibleModule(
+        supports_check_mode=True,
+        argument_spec=dict(
+            arguments.get_spec("cluster_instance", "vm_selector"),
+            vm_names=dict(type="list", elements="str", required=False),
+            label=dict(type="str", required=True),
+            max_concurrency=dict(type="int", default=5),
+        ),
+        required_one_of=[("vm_names", "vm_selector")],
+    )
+
+    try:
+        client = Client.get_client(module.params["cluster_instance"])
+        rest_client = RestClient(client)
+        changed, records, duration = run(module, rest_client)
+        module.exit_json(
+            changed=changed,
+            records=records,
+            duration=duration,
+            **client.throttle_result(),
+        )
+    except errors.BulkError as e:
+        module.fail_json(msg=str(e), records=e.records)
+    except errors.ScaleComputingError as e:
+        module.fail_json(msg=str(e))
+
+
+if __name__ == "__main__":
+    main()
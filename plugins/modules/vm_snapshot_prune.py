@@ -0,0 +1,264 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r"""
+module: vm_snapshot_prune
+
+author:
+  - XLAB Steampunk (@xlab-steampunk)
+short_description: Remove VM snapshots according to retention rules
+description:
+  - Use this module to remove old VM snapshots on HyperCore API.
+  - All snapshots are listed once, snapshots to remove are computed per VM
+    from the retention rules I(keep_last) and I(max_age_days).
+  - A snapshot is kept if any of the rules keeps it.
+    With both rules set, snapshots beyond the I(keep_last) newest
+    are removed only if they are also older than I(max_age_days).
+  - Only snapshots matching I(snapshot_types) and I(label_patterns) are considered,
+    all other snapshots are never removed and do not count towards I(keep_last).
+  - Snapshots are removed with bounded concurrency, see I(max_concurrency).
+version_added: 1.3.0
+extends_documentation_fragment:
+  - scale_computing.hypercore.cluster_instance
+seealso:
+  - module: scale_computing.hypercore.vm_snapshot_info
+options:
+  vm_name:
+    type: str
+    description:
+      - Prune only snapshots of the VM with this name.
+      - If not set, snapshots of all VMs are pruned.
+    required: false
+  keep_last:
+    type: int
+    description:
+      - Number of newest matching snapshots to keep for each VM.
+    required: false
+  max_age_days:
+    type: float
+    description:
+      - Remove matching snapshots older than this many days.
+    required: false
+  label_patterns:
+    type: list
+    elements: str
+    description:
+      - Shell-style patterns (for example C(nightly-*)).
+      - Only snapshots with a label matching at least one pattern are considered.
+      - If not set, snapshots with any label are considered.
+    required: false
+  snapshot_types:
+    type: list
+    elements: str
+    description:
+      - Types of snapshots that are considered.
+    choices: [ USER, AUTOMATED, SUPPORT ]
+    default: [ USER ]
+  max_concurrency:
+    type: int
+    description:
+      - Maximum number of snapshot deletions in progress at the same time.
+    default: 5
+notes:
+  - C(check_mode) is supported. Snapshots that would be removed are returned, but not removed.
+"""
+
+
+EXAMPLES = r"""
+- name: Keep only the 3 newest manual snapshots of every VM
+  scale_computing.hypercore.vm_snapshot_prune:
+    keep_last: 3
+
+- name: Remove nightly snapshots older than 2 weeks, but always keep the newest one
+  scale_computing.hypercore.vm_snapshot_prune:
+    vm_name: demo-vm
+    keep_last: 1
+    max_age_days: 14
+    label_patterns:
+      - nightly-*
+  register: pruned
+
+- name: Show which snapshots would be removed
+  scale_computing.hypercore.vm_snapshot_prune:
+    max_age_days: 30
+  check_mode: true
+  register: to_prune
+"""
+
+RETURN = r"""
+records:
+  description:
+    - Removed VM snapshots (in check mode, snapshots that would be removed).
+    - Same format as records returned by M(scale_computing.hypercore.vm_snapshot_info),
+      with additional task information.
+  returned: success, or when some of the operations failed
+  type: list
+  elements: dict
+  contains:
+    snapshot_uuid:
+      description: Snapshot's unique identifier
+      type: str
+      sample: 28d6ff95-2c31-4a1a-b3d9-47535164d6de
+    label:
+      description: User-readable label describing the snapshot
+      type: str
+      sample: nightly-2023-05-01
+    timestamp:
+      description: Unix timestamp of when snapshot was created
+      type: int
+      sample: 1679397326
+    vm:
+      description: source VM
+      type: dict
+      sample:
+        name: demo-vm
+        snapshot_serial_number: 3
+        uuid: 5e50977c-14ce-450c-8a1a-bf5c0afbcf43
+    task_tag:
+      description: Task tag of the delete operation. Not returned in check mode.
+      type: str
+      sample: "1234"
+    duration:
+      description: Seconds from the delete request until the task finished. Not returned in check mode.
+      type: float
+      sample: 2.104
+kept:
+  description: Number of matching snapshots that were kept.
+  returned: success
+  type: int
+  sample: 12
+"""
+
+
+from fnmatch import fnmatchcase
+from time import time
+
+from ansible.module_utils.basic import AnsibleModule
+
+from ..module_utils import errors, arguments
+from ..module_utils.bulk import run_tasks, update_records
+from ..module_utils.client import Client
+from ..module_utils.rest_client import RestClient
+from ..module_utils.vm_snapshot import VMSnapshot
+from typing import Any, Dict, List, Tuple
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+def is_candidate(snapshot: Dict[str, Any], module: AnsibleModule) -> bool:
+    if snapshot["type"] not in module.params["snapshot_types"]:
+        return False
+    label_patterns = module.params["label_patterns"]
+    if not label_patterns:
+        return True
+    return any(
+        fnmatchcase(snapshot["label"] or "", pattern) for pattern in label_patterns
+    )
+
+
+def get_prune_set(
+    module: AnsibleModule, snapshots: List[Dict[str, Any]], now: float
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Returns snapshots to remove and the number of kept candidates."""
+    by_vm: Dict[str, List[Dict[str, Any]]] = dict()
+    for snapshot in snapshots:
+        if is_candidate(snapshot, module):
+            by_vm.setdefault(snapshot["vm"]["uuid"], []).append(snapshot)
+
+    keep_last = module.params["keep_last"]
+    max_age_days = module.params["max_age_days"]
+    to_remove: List[Dict[str, Any]] = []
+    kept = 0
+    for vm_snapshots in by_vm.values():
+        # Newest first
+        vm_snapshots.sort(key=lambda snapshot: snapshot["timestamp"], reverse=True)
+        for position, snapshot in enumerate(vm_snapshots):
+            keep = False
+            if keep_last is not None and position < keep_last:
+                keep = True
+            if (
+                max_age_days is not None
+                and now - snapshot["timestamp"] <= max_age_days * SECONDS_PER_DAY
+            ):
+                keep = True
+            if keep:
+                kept += 1
+            else:
+                to_remove.append(snapshot)
+    return to_remove, kept
+
+
+def run(
+    module: AnsibleModule, rest_client: RestClient
+) -> Tuple[bool, List[Dict[str, Any]], int]:
+    snapshots: List[Dict[str, Any]] = [
+        dict(snapshot)
+        for snapshot in VMSnapshot.iter_snapshots_by_params(
+            dict(vm_name=module.params["vm_name"], serial=None, label=None),
+            rest_client,
+        )
+    ]
+    records, kept = get_prune_set(module, snapshots, time())
+    if module.check_mode or not records:
+        return bool(records), records, kept
+
+    results = run_tasks(
+        rest_client,
+        records,
+        lambda snapshot: VMSnapshot.delete_snapshot(
+            snapshot["snapshot_uuid"], rest_client
+        ),
+        max_concurrency=module.params["max_concurrency"],
+    )
+    update_records(
+        records,
+        results,
+        "Failed to remove {0} of {1} snapshots",
+        lambda record: "{0} ({1})".format(record["snapshot_uuid"], record["label"]),
+    )
+    return True, records, kept
+
+
+def main() -> None:
+    module = AnsibleModule(
+        supports_check_mode=True,
+        argument_spec=dict(
+            arguments.get_spec("cluster_instance"),
+            vm_name=dict(type="str", required=False),
+            keep_last=dict(type="int", required=False),
+            max_age_days=dict(type="float", required=False),
+            label_patterns=dict(type="list", elements="str", required=False),
+            snapshot_types=dict(
+                type="list",
+                elements="str",
+                choices=["USER", "AUTOMATED", "SUPPORT"],
+                default=["USER"],
+            ),
+            max_concurrency=dict(type="int", default=5),
+        ),
+        required_one_of=[("keep_last", "max_age_days")],
+    )
+
+    try:
+        client = Client.get_client(module.params["cluster_instance"])
+        rest_client = RestClient(client)
+        changed, records, kept = run(module, rest_client)
+        module.exit_json(
+            changed=changed, records=records, kept=kept, **client.throttle_result()
+        )
+    except errors.BulkError as e:
+        module.fail_json(msg=str(e), records=e.records)
+    except errors.ScaleComputingError as e:
+        module.fail_json(msg=str(e))
+
+
+if __name__ == "__main__":
+    main()
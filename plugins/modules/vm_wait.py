@@ -0,0 +1,253 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r"""
+module: vm_wait
+
+author:
+  - XLAB Steampunk (@xlab-steampunk)
+short_description: Wait until many VMs reach a power state
+description:
+  - Use this module to wait until every selected VM is in one of the I(power_state) states,
+    for example until all VMs are stopped before a cluster update.
+  - VMs are selected by name (I(vm_names)) or with I(vm_selector).
+    If both are set, VMs matching either of them are selected.
+    If neither is set, all VMs are selected.
+  - Only power state of VMs is checked while waiting, with one VM listing per poll.
+    The polling interval grows while no VM changes state, and is reset on every change.
+  - A VM is done once it is seen in one of the I(power_state) states.
+    VMs deleted while waiting are done too.
+version_added: 1.3.0
+extends_documentation_fragment:
+  - scale_computing.hypercore.cluster_instance
+  - scale_computing.hypercore.vm_selector
+seealso:
+  - module: scale_computing.hypercore.vm_info
+  - module: scale_computing.hypercore.vm_params
+options:
+  vm_names:
+    type: list
+    elements: str
+    description:
+      - Names of VMs to wait for.
+      - The module fails if some VM does not exist.
+    required: false
+  power_state:
+    type: list
+    elements: str
+    description:
+      - Wait until VMs are in one of these power states.
+    choices: [ started, stopped, blocked, paused, shutdown, crashed ]
+    required: true
+  timeout:
+    type: int
+    description:
+      - Maximum number of seconds to wait.
+      - The module fails if some VM is not in one of the I(power_state) states by then.
+    default: 300
+notes:
+  - C(check_mode) is supported. The module does not change anything.
+"""
+
+
+EXAMPLES = r"""
+- name: Wait until all VMs are stopped
+  scale_computing.hypercore.vm_wait:
+    power_state:
+      - stopped
+      - crashed
+    timeout: 600
+
+- name: Wait until production VMs are running
+  scale_computing.hypercore.vm_wait:
+    vm_selector:
+      tags:
+        - production
+    power_state:
+      - started
+  register: result
+"""
+
+RETURN = r"""
+records:
+  description:
+    - One record for every selected VM.
+  returned: success
+  type: list
+  elements: dict
+  contains:
+    vm_name:
+      description: Name of the VM
+      type: str
+      sample: demo-vm-1
+    vm_uuid:
+      description: Unique identifier of the VM
+      type: str
+      sample: 5e50977c-14ce-450c-8a1a-bf5c0afbcf43
+    power_state:
+      description: Last seen power state of the VM. C(null) if the VM was deleted.
+      type: str
+      sample: stopped
+    time_to_state:
+      description: Seconds from start until the VM was seen in one of the I(power_state) states.
+      type: float
+      sample: 12.4
+duration:
+  description: Seconds spent waiting.
+  returned: success
+  type: float
+  sample: 35.812
+"""
+
+
+from time import sleep, time
+
+from ansible.module_utils.basic import AnsibleModule
+
+from ..module_utils import errors, arguments
+from ..module_utils.client import Client
+from ..module_utils.rest_client import RestClient
+from ..module_utils.vm import FROM_HYPERCORE_TO_ANSIBLE_POWER_STATE
+from ..module_utils.vm_selector import VMIndex, VMSelector
+from typing import Any, Dict, List, Optional, Tuple
+
+VM_STATE_MIN_INTERVAL = 1.0
+VM_STATE_MAX_INTERVAL = 15.0
+VM_STATE_BACKOFF = 1.5
+
+
+def select_vms(module: AnsibleModule, rest_client: RestClient) -> List[Dict[str, Any]]:
+    """Returns raw VirDomain records of selected VMs, from one VM listing."""
+    index = VMIndex.get(rest_client)
+    if not module.params["vm_names"] and not module.params["vm_selector"]:
+        return index.records
+    selected = index.get_by_names(module.params["vm_names"] or [], must_exist=True)
+    if module.params["vm_selector"]:
+        uuids = set(vm_dict["uuid"] for vm_dict in selected)
+        selected.extend(
+            vm_dict
+            for vm_dict in VMSelector.from_ansible(module.params["vm_selector"]).select(
+                rest_client, index
+            )
+            if vm_dict["uuid"] not in uuids
+        )
+    return selected
+
+
+def get_power_states(rest_client: RestClient) -> Dict[str, Optional[str]]:
+    """Power state of every VM by uuid - only this is kept from the VM listing."""
+    return dict(
+        (vm_dict["uuid"], FROM_HYPERCORE_TO_ANSIBLE_POWER_STATE.get(vm_dict["state"]))
+        for vm_dict in rest_client.list_records("/rest/v1/VirDomain")
+    )
+
+
+def wait_for_states(
+    rest_client: RestClient,
+    records: List[Dict[str, Any]],
+    power_states: List[str],
+    timeout: float,
+    started: float,
+) -> None:
+    """
+    Polls VM power states until every record has time_to_state set.
+    Raises ScaleComputingError if some VM is not done in timeout seconds.
+    """
+    interval = VM_STATE_MIN_INTERVAL
+    while True:
+        pending = [record for record in records if record["time_to_state"] is None]
+        if not pending:
+            return
+        remaining = started + timeout - time()
+        if remaining <= 0:
+            raise errors.ScaleComputingError(
+                "{0} of {1} VMs did not reach power state {2} in {3} seconds: {4}".format(
+                    len(pending),
+                    len(records),
+                    ", ".join(power_states),
+                    timeout,
+                    ", ".join(
+                        "{0} ({1})".format(record["vm_name"], record["power_state"])
+                        for record in pending
+                    ),
+                )
+            )
+        sleep(min(interval, remaining))
+        current = get_power_states(rest_client)
+        now = time()
+        changed = False
+        for record in pending:
+            power_state = current.get(record["vm_uuid"])
+            if power_state != record["power_state"]:
+                record["power_state"] = power_state
+                changed = True
+            if power_state is None or power_state in power_states:
+                record["time_to_state"] = round(now - started, 1)
+        if changed:
+            interval = VM_STATE_MIN_INTERVAL
+        else:
+            interval = min(interval * VM_STATE_BACKOFF, VM_STATE_MAX_INTERVAL)
+
+
+def run(
+    module: AnsibleModule, rest_client: RestClient
+) -> Tuple[bool, List[Dict[str, Any]], float]:
+    started = time()
+    power_states = module.params["power_state"]
+    records: List[Dict[str, Any]] = []
+    for vm_dict in select_vms(module, rest_client):
+        power_state = FROM_HYPERCORE_TO_ANSIBLE_POWER_STATE.get(vm_dict["state"])
+        records.append(
+            dict(
+                vm_name=vm_dict["name"],
+                vm_uuid=vm_dict["uuid"],
+                power_state=power_state,
+                time_to_state=0.0 if power_state in power_states else None,
+            )
+        )
+    wait_for_states(
+        rest_client, records, power_states, module.params["timeout"], started
+    )
+    return False, records, round(time() - started, 3)
+
+
+def main() -> None:
+    module = AnsibleModule(
+        supports_check_mode=True,
+        argument_spec=dict(
+            arguments.get_spec("cluster_instance", "vm_selector"),
+            vm_names=dict(type="list", elements="str", required=False),
+            power_state=dict(
+                type="list",
+                elements="str",
+                required=True,
+                choices=list(FROM_HYPERCORE_TO_ANSIBLE_POWER_STATE.values()),
+            ),
+            timeout=dict(type="int", default=300),
+        ),
+    )
+
+    try:
+        client = Client.get_client(module.params["cluster_instance"])
+        rest_client = RestClient(client)
+        changed, records, duration = run(module, rest_client)
+        module.exit_json(
+            changed=changed,
+            records=records,
+            duration=duration,
+            **client.throttle_result(),
+        )
+    except errors.ScaleComputingError as e:
+        module.fail_json(msg=str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Synthetic HyperCore API records for benchmarks.
+Records have the same shape as records returned by HyperCore REST API.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import random
+import uuid as uuid_lib
+
+
+def _uuid(rng):
+    return str(uuid_lib.UUID(int=rng.getrandbits(128)))
+
+
+def nodes(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        dict(
+            uuid=_uuid(rng),
+            backplaneIP="10.0.0.{0}".format(i + 1),
+            lanIP="10.1.0.{0}".format(i + 1),
+            peerID=i + 1,
+        )
+        for i in range(count)
+    ]
+
+
+def vms(count, node_list, schedule_list=None, seed=0):
+    rng = random.Random(seed)
+    schedule_uuids = [schedule["uuid"] for schedule in schedule_list or []]
+    records = []
+    for i in range(count):
+        vm_uuid = _uuid(rng)
+        disks = [
+            dict(
+                uuid=_uuid(rng),
+                virDomainUUID=vm_uuid,
+                type="VIRTIO_DISK",
+                cacheMode="WRITETHROUGH",
+                capacity=10737418240,
+                slot=slot,
+                name="",
+                disableSnapshotting=False,
+                tieringPriorityFactor=8,
+                mountPoints=[],
+                readOnly=False,
+            )
+            for slot in range(2)
+        ]
+        nics = [
+            dict(
+                uuid=_uuid(rng),
+                virDomainUUID=vm_uuid,
+                vlan=rng.choice([0, 10, 20]),
+                type="VIRTIO",
+                macAddress="7C:4C:58:{0:02X}:{1:02X}:{2:02X}".format(
+                    i % 256, (i // 256) % 256, rng.randrange(256)
+                ),
+                connected=True,
+                ipv4Addresses=[],
+            )
+        ]
+        node = node_list[i % len(node_list)]
+        records.append(
+            dict(
+                uuid=vm_uuid,
+                nodeUUID=node["uuid"],
+                name="vm-{0:05d}".format(i),
+                tags=",".join(rng.sample(["prod", "dev", "web", "db", "backup"], 2)),
+                description="Synthetic VM {0}".format(i),
+                mem=4294967296,
+                state=rng.choice(["RUNNING", "RUNNING", "SHUTOFF"]),
+                numVCPU=rng.choice([1, 2, 4]),
+                netDevs=nics,
+                blockDevs=disks,
+                bootDevices=[disks[0]["uuid"], nics[0]["uuid"]],
+                attachGuestToolsISO=False,
+                operatingSystem="os_other",
+                affinityStrategy=dict(
+                    strictAffinity=False,
+                    preferredNodeUUID=node["uuid"],
+                    backupNodeUUID="",
+                ),
+                snapshotScheduleUUID=rng.choice(schedule_uuids + [""])
+                if schedule_uuids
+                else "",
+                machineType="scale-7.2",
+                sourceVirDomainUUID="",
+                cloudInitData=dict(userData="", metaData=""),
+                latestTaskTag=dict(),
+                desiredDisposition="RUNNING",
+            )
+        )
+    return records
+
+
+def snapshots(count, vm_list, seed=0):
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        vm = vm_list[i % len(vm_list)]
+        serial = i // len(vm_list) + 1
+        records.append(
+            dict(
+                uuid=_uuid(rng),
+                domainUUID=vm["uuid"],
+                # API embeds the whole VM record into every snapshot
+                domain=dict(vm, snapshotSerialNumber=serial),
+                label="snapshot-{0}".format(serial),
+                type=rng.choice(["USER", "AUTOMATED"]),
+                timestamp=1672531200 + i * 60,
+                automatedTriggerTimestamp=0,
+                localRetainUntilTimestamp=0,
+                remoteRetainUntilTimestamp=0,
+                blockCountDiffFromSerialNumber=-1,
+                replication=True,
+            )
+        )
+    return records
+
+
+def snapshot_schedules(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        dict(
+            uuid=_uuid(rng),
+            name="schedule-{0}".format(i),
+            rrules=[
+                dict(
+                    uuid=_uuid(rng),
+                    name="rule-{0}-{1}".format(i, j),
+                    rrule="FREQ=DAILY;INTERVAL={0}".format(j + 1),
+                    dtstart="2023-01-01 00:00:00",
+                    localRetentionDurationSeconds=86400 * (j + 1),
+                    remoteRetentionDurationSeconds=86400 * (j + 1),
+                    replication=True,
+                )
+                for j in range(2)
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+def roles(count, seed=0):
+    rng = random.Random(seed)
+    return [dict(uuid=_uuid(rng), name="Role {0}".format(i)) for i in range(count)]
+
+
+def users(count, role_list, seed=0):
+    rng = random.Random(seed)
+    return [
+        dict(
+            uuid=_uuid(rng),
+            username="user-{0}".format(i),
+            fullName="User {0}".format(i),
+            roleUUIDs=[role["uuid"] for role in rng.sample(role_list, 2)],
+            sessionLimit=0,
+        )
+        for i in range(count)
+    ]
+
+
+def remote_cluster_connections(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        dict(
+            uuid=_uuid(rng),
+            remoteClusterInfo=dict(clusterName="remote-{0}".format(i)),
+            connectionStatus="ESTABLISHED",
+            replicationOK=True,
+            remoteNodeIPs=["10.2.{0}.1".format(i)],
+            remoteNodeUUIDs=[_uuid(rng)],
+        )
+        for i in range(count)
+    ]
+
+
+def replications(vm_list, connection_list, seed=0):
+    rng = random.Random(seed)
+    return [
+        dict(
+            uuid=_uuid(rng),
+            sourceDomainUUID=vm["uuid"],
+            enable=rng.choice([True, False]),
+            connectionUUID=rng.choice(connection_list)["uuid"],
+            label="",
+        )
+        for vm in vm_list
+    ]
+
+
+def cluster(vm_count, seed=0):
+    """
+    Returns {endpoint: records} of a cluster with vm_count VMs.
+    Number of other objects scales with number of VMs.
+    """
+    node_list = nodes(max(3, vm_count // 1000), seed)
+    schedule_list = snapshot_schedules(max(5, vm_count // 100), seed)
+    vm_list = vms(vm_count, node_list, schedule_list, seed)
+    role_list = roles(12, seed)
+    connection_list = remote_cluster_connections(3, seed)
+    return {
+        "/rest/v1/Node": node_list,
+        "/rest/v1/VirDomain": vm_list,
+        "/rest/v1/VirDomainSnapshot": snapshots(vm_count, vm_list, seed),
+        "/rest/v1/VirDomainSnapshotSchedule": schedule_list,
+        "/rest/v1/Role": role_list,
+        "/rest/v1/User": users(max(10, vm_count // 10), role_list, seed),
+        "/rest/v1/RemoteClusterConnection": connection_list,
+        "/rest/v1/VirDomainReplication/": replications(
+            vm_list[: vm_count // 2], connection_list, seed
+        ),
+    }
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+End-to-end benchmarks - wall time and API request counts of module runs
+against the local HyperCore API simulator, over HTTP with the real Client.
+
+Run from the collection root, with ansible_collections parent directory on PYTHONPATH:
+
+    python tests/benchmark/e2e_benchmarks.py --latency 0.01 --output e2e.json
+    python tests/benchmark/e2e_benchmarks.py --latency 0.01 --compare e2e.json
+
+The simulator is started in-process, unless --host points to a running one.
+Request counts do not depend on the machine, so with --compare the exit code is 1
+if any scenario sends more requests than before, or is slower than --threshold times.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from urllib.request import Request, urlopen
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import dataset  # noqa: E402
+import simulator  # noqa: E402
+from fakes import FakeModule  # noqa: E402
+
+from ansible.inventory.data import InventoryData  # noqa: E402
+from ansible.parsing.dataloader import DataLoader  # noqa: E402
+
+from ansible_collections.scale_computing.hypercore.plugins.inventory import (  # noqa: E402
+    hypercore as hypercore_inventory,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.client import (  # noqa: E402
+    Client,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.rest_client import (  # noqa: E402
+    CachedRestClient,
+    RestClient,
+)
+from ansible_collections.scale_computing.hypercore.plugins.modules import (  # noqa: E402
+    vm_info,
+    vm_snapshot_bulk,
+    vm_snapshot_info,
+    vm_snapshot_prune,
+)
+
+USERNAME = "admin"
+PASSWORD = "admin"
+
+
+def scenario_vm_info(host):
+    vm_info.run(
+        FakeModule(dict(vm_name=None, vm_selector=None)),
+        CachedRestClient(Client(host, USERNAME, PASSWORD, 60)),
+    )
+
+
+def scenario_vm_info_selector(host):
+    vm_info.run(
+        FakeModule(dict(vm_name=None, vm_selector=dict(tags=["prod", "db"]))),
+        CachedRestClient(Client(host, USERNAME, PASSWORD, 60)),
+    )
+
+
+def scenario_vm_snapshot_info(host):
+    vm_snapshot_info.run(
+        FakeModule(dict(vm_name=None, label=None, serial=None)),
+        RestClient(Client(host, USERNAME, PASSWORD, 60)),
+    )
+
+
+def scenario_inventory(host):
+    config = tempfile.NamedTemporaryFile(
+        "w", suffix=".yml", prefix="hypercore", delete=False
+    )
+    config.write("plugin: scale_computing.hypercore.hypercore\n")
+    config.close()
+    os.environ.update(SC_HOST=host, SC_USERNAME=USERNAME, SC_PASSWORD=PASSWORD)
+    try:
+        hypercore_inventory.InventoryModule().parse(
+            InventoryData(), DataLoader(), config.name
+        )
+    finally:
+        os.unlink(config.name)
+
+
+def scenario_vm_snapshot_bulk(host):
+    vm_snapshot_bulk.run(
+        FakeModule(
+            dict(
+                vm_names=None,
+                vm_selector=dict(name="vm-0000*"),
+                label="e2e",
+                max_concurrency=5,
+            )
+        ),
+        RestClient(Client(host, USERNAME, PASSWORD, 60)),
+    )
+
+
+def scenario_vm_snapshot_prune(host):
+    vm_snapshot_prune.run(
+        FakeModule(
+            dict(
+                vm_name=None,
+                keep_last=None,
+                max_age_days=0,
+                label_patterns=["e2e"],
+                snapshot_types=["USER"],
+                max_concurrency=5,
+            )
+        ),
+        RestClient(Client(host, USERNAME, PASSWORD, 60)),
+    )
+
+
+# Scenarios run in this order, later scenarios see changes of earlier ones.
+SCENARIOS = dict(
+    vm_info=scenario_vm_info,
+    vm_info_selector=scenario_vm_info_selector,
+    vm_snapshot_info=scenario_vm_snapshot_info,
+    inventory=scenario_inventory,
+    vm_snapshot_bulk=scenario_vm_snapshot_bulk,
+    vm_snapshot_prune=scenario_vm_snapshot_prune,
+)
+
+
+def control(host, path, method="GET"):
+    with urlopen(Request(host + path, method=method, data=b"")) as response:
+        return json.load(response)
+
+
+def run_scenarios(host, names):
+    results = {}
+    for name in names:
+        control(host, "/simulator/reset", "POST")
+        start = time.perf_counter()
+        SCENARIOS[name](host)
+        duration = time.perf_counter() - start
+        stats = control(host, "/simulator/stats")
+        results[name] = dict(
+            time_s=round(duration, 3),
+            requests=stats["total"],
+            requests_by_endpoint=stats["requests"],
+            bytes_sent=stats["bytes_sent"],
+        )
+        print(
+            "{0:<20} {1:>8.3f} s {2:>6} requests {3:>10.2f} MiB".format(
+                name, duration, stats["total"], stats["bytes_sent"] / 1024 / 1024
+            ),
+            flush=True,
+        )
+    return results
+
+
+def compare(results, stored, threshold):
+    regressions = []
+    for name, result in results.items():
+        old = stored["scenarios"].get(name)
+        if not old:
+            continue
+        if result["requests"] > old["requests"]:
+            regressions.append((name, "requests", old["requests"], result["requests"]))
+        if old["time_s"] and result["time_s"] / old["time_s"] > threshold:
+            regressions.append((name, "time_s", old["time_s"], result["time_s"]))
+    for name, metric, old, new in regressions:
+        print("REGRESSION {0} {1}: {2} -> {3}".format(name, metric, old, new))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=list(SCENARIOS),
+        help="Run only this scenario. Can be repeated.",
+    )
+    parser.add_argument(
+        "--host", help="URL of a running simulator. Default is to start one."
+    )
+    parser.add_argument("--vms", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--task-duration", type=float, default=0.5)
+    parser.add_argument("--throughput", type=float)
+    parser.add_argument("--output", help="Store results as JSON to this file.")
+    parser.add_argument("--compare", help="Compare with results in this JSON file.")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args()
+
+    host = args.host
+    server = None
+    if not host:
+        cluster = simulator.Cluster(
+            dataset.cluster(args.vms),
+            simulator.SimulatorConfig(
+                latency=args.latency,
+                task_duration=args.task_duration,
+                throughput=args.throughput,
+            ),
+        )
+        server = simulator.make_server(cluster)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host = server.url
+    try:
+        scenarios = run_scenarios(host, args.scenario or list(SCENARIOS))
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+
+    results = dict(
+        vms=args.vms,
+        latency=args.latency,
+        task_duration=args.task_duration,
+        throughput=args.throughput,
+        scenarios=scenarios,
+    )
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+            output.write("\n")
+    if args.compare:
+        with open(args.compare) as stored_file:
+            stored = json.load(stored_file)
+        if compare(results["scenarios"], stored, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""In-memory stand-ins for Client and AnsibleModule, used by benchmarks."""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.client import (
+    Response,
+)
+
+
+class FakeClient:
+    """Serves records from memory, as JSON response bodies - like Client does."""
+
+    read_cache = None
+
+    def __init__(self, endpoints):
+        self.bodies = dict(
+            (endpoint, json.dumps(records)) for endpoint, records in endpoints.items()
+        )
+
+    def get(self, path, query=None, timeout=None):
+        return Response(200, self.bodies.get(path, "[]"))
+
+    def throttle_result(self):
+        return {}
+
+
+class FakeModule:
+    def __init__(self, params, check_mode=False):
+        self.params = params
+        self.check_mode = check_mode
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Memory benchmark of large VM and snapshot listings.
+
+Compares peak memory (tracemalloc) of vm_info and vm_snapshot_info conversion paths,
+where raw records are released while converting, with the previous approach that kept
+all raw records until the whole listing was converted. Also reports per-object size of
+model objects with __slots__ and of the same objects with an instance __dict__.
+
+Run from the collection root, with ansible_collections parent directory on PYTHONPATH:
+
+    python tests/benchmark/memory_listings.py --vms 5000 --snapshots 10000
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import dataset  # noqa: E402
+from fakes import FakeClient, FakeModule  # noqa: E402
+
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.rest_client import (  # noqa: E402
+    CachedRestClient,
+    RestClient,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.vm import (  # noqa: E402
+    VM,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.vm_snapshot import (  # noqa: E402
+    VMSnapshot,
+)
+from ansible_collections.scale_computing.hypercore.plugins.modules import (  # noqa: E402
+    vm_info,
+)
+
+MIB = 1024 * 1024
+
+
+def measure(function):
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def object_size(obj):
+    """Size of the object and of its attribute storage."""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def dict_based_size(obj):
+    """Size of an equivalent object of a plain class with an instance __dict__."""
+
+    class DictBased:
+        pass
+
+    copy = DictBased()
+    for cls in type(obj).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            setattr(copy, name, getattr(obj, name, None))
+    return object_size(copy)
+
+
+def vm_listing(client, released):
+    rest_client = CachedRestClient(client)
+    if released:
+        return vm_info.run(
+            FakeModule(dict(vm_name=None, vm_selector=None)), rest_client
+        )
+    vm_dicts = rest_client.list_records("/rest/v1/VirDomain")
+    return [
+        VM.from_hypercore(vm_dict, rest_client).to_ansible() for vm_dict in vm_dicts
+    ]
+
+
+def snapshot_listing(client, released):
+    rest_client = RestClient(client)
+    if released:
+        return VMSnapshot.filter_snapshots_by_params(
+            dict(vm_name=None, serial=None, label=None), rest_client
+        )
+    return [
+        VMSnapshot.from_hypercore(snapshot_dict).to_ansible()
+        for snapshot_dict in rest_client.list_records("/rest/v1/VirDomainSnapshot")
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--vms", type=int, default=5000)
+    parser.add_argument("--snapshots", type=int, default=10000)
+    parser.add_argument("--output", help="Write results as JSON to this file.")
+    args = parser.parse_args()
+
+    node_list = dataset.nodes(4)
+    vm_list = dataset.vms(args.vms, node_list)
+    client = FakeClient(
+        {
+            "/rest/v1/Node": node_list,
+            "/rest/v1/VirDomain": vm_list,
+            "/rest/v1/VirDomainSnapshot": dataset.snapshots(args.snapshots, vm_list),
+        }
+    )
+
+    results = dict(vms=args.vms, snapshots=args.snapshots, objects={}, listings={})
+    vm = VM.from_hypercore(vm_list[0], CachedRestClient(client))
+    samples = dict(
+        VM=vm,
+        Disk=vm.disks[0],
+        Nic=vm.nics[0],
+        VMSnapshot=VMSnapshot.from_hypercore(
+            json.loads(client.bodies["/rest/v1/VirDomainSnapshot"])[0]
+        ),
+    )
+    for name, obj in samples.items():
+        results["objects"][name] = dict(
+            slots=object_size(obj), instance_dict=dict_based_size(obj)
+        )
+    for name, function in (
+        ("vm_info", vm_listing),
+        ("vm_snapshot_info", snapshot_listing),
+    ):
+        results["listings"][name] = dict(
+            retained_mib=round(measure(lambda: function(client, False)) / MIB, 1),
+            released_mib=round(measure(lambda: function(client, True)) / MIB, 1),
+        )
+
+    print("Object size in bytes (__slots__ / instance __dict__):")
+    for name, sizes in results["objects"].items():
+        print(
+            "  {0:<12} {1:>5} / {2:>5}".format(
+                name, sizes["slots"], sizes["instance_dict"]
+            )
+        )
+    print("Peak memory in MiB (raw records retained / released while converting):")
+    for name, peaks in results["listings"].items():
+        print(
+            "  {0:<18} {1:>7} / {2:>7}".format(
+                name, peaks["retained_mib"], peaks["released_mib"]
+            )
+        )
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Benchmark suite - time and peak memory of conversion and info module code paths
+on synthetic clusters with 100, 1000 and 10000 VMs.
+
+Run from the collection root, with ansible_collections parent directory on PYTHONPATH:
+
+    python tests/benchmark/run_benchmarks.py --output tests/benchmark/results/1.1.0.json
+    python tests/benchmark/run_benchmarks.py --compare tests/benchmark/results/1.1.0.json
+
+With --compare, results are compared with stored results, and the exit code is 1 if
+any benchmark got slower (or uses more memory) than --threshold times stored value.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import dataset  # noqa: E402
+from fakes import FakeClient, FakeModule  # noqa: E402
+
+from ansible.inventory.data import InventoryData  # noqa: E402
+from ansible.parsing.dataloader import DataLoader  # noqa: E402
+
+from ansible_collections.scale_computing.hypercore.plugins.inventory import (  # noqa: E402
+    hypercore as hypercore_inventory,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.rest_client import (  # noqa: E402
+    CachedRestClient,
+    RestClient,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (  # noqa: E402
+    filter_results,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.vm import (  # noqa: E402
+    VM,
+)
+from ansible_collections.scale_computing.hypercore.plugins.modules import (  # noqa: E402
+    user_info,
+    vm_info,
+    vm_replication_info,
+    vm_snapshot_info,
+)
+
+SCALES = (100, 1000, 10000)
+MIB = 1024 * 1024
+COLLECTION_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+
+def bench_vm_conversion(records, client):
+    vm_dicts = records["/rest/v1/VirDomain"]
+
+    def run():
+        rest_client = CachedRestClient(client)
+        return [
+            VM.from_hypercore(vm_dict, rest_client).to_ansible() for vm_dict in vm_dicts
+        ]
+
+    return run
+
+
+def bench_filter_results(records, client):
+    vm_dicts = records["/rest/v1/VirDomain"]
+    names = [vm_dicts[position]["name"] for position in range(0, len(vm_dicts), 10)]
+
+    def run():
+        # One query on a fresh list, as modules do it.
+        return [filter_results(vm_dicts, dict(name=name)) for name in names[:10]]
+
+    return run
+
+
+def bench_inventory_parse(records, client):
+    config = tempfile.NamedTemporaryFile(
+        "w", suffix=".yml", prefix="hypercore", delete=False
+    )
+    config.write("plugin: scale_computing.hypercore.hypercore\n")
+    config.close()
+
+    def run():
+        inventory = InventoryData()
+        plugin = hypercore_inventory.InventoryModule()
+        original_client = hypercore_inventory.Client
+        hypercore_inventory.Client = lambda *args: client
+        try:
+            plugin.parse(inventory, DataLoader(), config.name)
+        finally:
+            hypercore_inventory.Client = original_client
+        return inventory
+
+    return run
+
+
+def bench_vm_info(records, client):
+    def run():
+        return vm_info.run(
+            FakeModule(dict(vm_name=None, vm_selector=None)), CachedRestClient(client)
+        )
+
+    return run
+
+
+def bench_user_info(records, client):
+    def run():
+        return user_info.run(FakeModule(dict(username=None)), RestClient(client))
+
+    return run
+
+
+def bench_vm_replication_info(records, client):
+    def run():
+        return vm_replication_info.run(
+            FakeModule(dict(vm_name=None)), CachedRestClient(client)
+        )
+
+    return run
+
+
+def bench_vm_snapshot_info(records, client):
+    def run():
+        return vm_snapshot_info.run(
+            FakeModule(dict(vm_name=None, label=None, serial=None)),
+            RestClient(client),
+        )
+
+    return run
+
+
+BENCHMARKS = dict(
+    vm_conversion=bench_vm_conversion,
+    filter_results=bench_filter_results,
+    inventory_parse=bench_inventory_parse,
+    vm_info=bench_vm_info,
+    user_info=bench_user_info,
+    vm_replication_info=bench_vm_replication_info,
+    vm_snapshot_info=bench_vm_snapshot_info,
+)
+
+
+def measure_time(function, repeat):
+    """Best wall time of repeat runs, in seconds."""
+    best = None
+    for _i in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        duration = time.perf_counter() - start
+        best = duration if best is None else min(best, duration)
+    return best
+
+
+def measure_memory(function):
+    """Peak memory allocated during one run, in MiB."""
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak / MIB
+
+
+def get_collection_version():
+    with open(os.path.join(COLLECTION_ROOT, "galaxy.yml")) as galaxy:
+        for line in galaxy:
+            if line.startswith("version:"):
+                return line.split(":", 1)[1].strip()
+    return None
+
+
+def run_suite(names, scales, repeat):
+    results = dict(
+        collection_version=get_collection_version(),
+        python=platform.python_version(),
+        benchmarks=dict((name, {}) for name in names),
+    )
+    for scale in scales:
+        records = dataset.cluster(scale)
+        client = FakeClient(records)
+        for name in names:
+            function = BENCHMARKS[name](records, client)
+            result = dict(
+                time_s=round(measure_time(function, repeat), 4),
+                peak_mib=round(measure_memory(function), 2),
+            )
+            results["benchmarks"][name][str(scale)] = result
+            print(
+                "{0:<22} {1:>6} VMs {2:>10.4f} s {3:>10.2f} MiB".format(
+                    name, scale, result["time_s"], result["peak_mib"]
+                ),
+                flush=True,
+            )
+    return results
+
+
+def compare(results, stored, threshold):
+    """Prints ratios to stored results, returns list of regressions."""
+    regressions = []
+    print(
+        "\nCompared to {0} (collection {1}):".format(
+            stored.get("python"), stored.get("collection_version")
+        )
+    )
+    for name, scales in results["benchmarks"].items():
+        for scale, result in scales.items():
+            old = stored["benchmarks"].get(name, {}).get(scale)
+            if not old:
+                continue
+            for metric in ("time_s", "peak_mib"):
+                if not old[metric]:
+                    continue
+                ratio = result[metric] / old[metric]
+                marker = ""
+                if ratio > threshold:
+                    marker = "  REGRESSION"
+                    regressions.append((name, scale, metric, ratio))
+                print(
+                    "{0:<22} {1:>6} {2:<8} {3:>6.2f}x{4}".format(
+                        name, scale, metric, ratio, marker
+                    )
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--benchmark",
+        action="append",
+        choices=sorted(BENCHMARKS),
+        help="Run only this benchmark. Can be repeated.",
+    )
+    parser.add_argument(
+        "--scale",
+        action="append",
+        type=int,
+        help="Number of VMs. Can be repeated. Default: {0}.".format(
+            ", ".join(str(scale) for scale in SCALES)
+        ),
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Store results as JSON to this file.")
+    parser.add_argument("--compare", help="Compare with results in this JSON file.")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args()
+
+    results = run_suite(
+        args.benchmark or list(BENCHMARKS), args.scale or SCALES, args.repeat
+    )
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+            output.write("\n")
+    if args.compare:
+        with open(args.compare) as stored_file:
+            stored = json.load(stored_file)
+        if compare(results, stored, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,625 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Local HyperCore REST API simulator, for end-to-end performance and load testing.
+
+Serves /rest/v1/* endpoints used by the collection from in-memory state,
+seeded with a synthetic cluster from dataset.py. Writes return task tags,
+and are applied when their task finishes (after --task-duration seconds).
+Latency, throughput and errors can be injected.
+
+    python tests/benchmark/simulator.py --port 8080 --vms 1000 --latency 0.02
+    SC_HOST=http://127.0.0.1:8080 SC_USERNAME=admin SC_PASSWORD=admin ansible-playbook ...
+
+Request counts are available on GET /simulator/stats, and reset with POST /simulator/reset.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import base64
+import copy
+import itertools
+import json
+import os
+import random
+import re
+import ssl
+import sys
+import threading
+import time
+import uuid as uuid_lib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import dataset  # noqa: E402
+
+API_PREFIX = "/rest/v1/"
+# Device endpoints are views of devices embedded in VirDomain records.
+DEVICE_FIELDS = dict(VirDomainBlockDevice="blockDevs", VirDomainNetDevice="netDevs")
+POWER_ACTIONS = dict(
+    START="RUNNING",
+    REBOOT="RUNNING",
+    RESET="RUNNING",
+    SHUTDOWN="SHUTOFF",
+    STOP="SHUTOFF",
+)
+UUID_PATTERN = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
+)
+CHUNK_SIZE = 64 * 1024
+
+
+class SimulatorConfig:
+    def __init__(
+        self,
+        latency=0.0,
+        latency_jitter=0.0,
+        task_duration=0.5,
+        throughput=None,
+        error_rate=0.0,
+        error_status=500,
+        error_pattern=None,
+        task_error_rate=0.0,
+        username=None,
+        password=None,
+        seed=0,
+    ):
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.task_duration = task_duration
+        # Bytes per second, for request and response bodies. None is unlimited.
+        self.throughput = throughput
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.error_pattern = re.compile(error_pattern) if error_pattern else None
+        self.task_error_rate = task_error_rate
+        self.username = username
+        self.password = password
+        self.seed = seed
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super(ApiError, self).__init__(message)
+        self.status = status
+
+
+class Cluster:
+    """
+    State of the simulated cluster - collections of records by uuid, and tasks.
+    All methods must be called with lock held.
+    """
+
+    def __init__(self, endpoints, config):
+        self.config = config
+        self.lock = threading.Lock()
+        self.rng = random.Random(config.seed)
+        self.collections = {}
+        for endpoint, records in endpoints.items():
+            name = endpoint[len(API_PREFIX):].strip("/")
+            self.collections[name] = dict(
+                (record["uuid"], copy.deepcopy(record)) for record in records
+            )
+        self.tasks = {}
+        self.pending = []
+        self.task_counter = itertools.count(1)
+        self.stats = Counter()
+
+    def new_uuid(self):
+        return str(uuid_lib.UUID(int=self.rng.getrandbits(128)))
+
+    # Tasks
+
+    def submit(self, apply, created_uuid=""):
+        """Creates a task, apply() is called when the task finishes."""
+        task_tag = str(next(self.task_counter))
+        failing = self.rng.random() < self.config.task_error_rate
+        self.tasks[task_tag] = dict(
+            taskTag=task_tag,
+            state="RUNNING",
+            progressPercent=0,
+            formattedDescription="Simulated task",
+            formattedMessage="",
+            created=time.time(),
+        )
+        self.pending.append(
+            (time.time() + self.config.task_duration, task_tag, apply, failing)
+        )
+        return dict(taskTag=task_tag, createdUUID=created_uuid)
+
+    def advance(self):
+        """Finishes tasks that are due, in submission order."""
+        now = time.time()
+        while self.pending and self.pending[0][0] <= now:
+            _finish_at, task_tag, apply, failing = self.pending.pop(0)
+            task = self.tasks[task_tag]
+            task["progressPercent"] = 100
+            if failing:
+                task["state"] = "ERROR"
+                task["formattedMessage"] = "Simulated task failure"
+                continue
+            try:
+                apply()
+                task["state"] = "COMPLETE"
+            except ApiError as e:
+                task["state"] = "ERROR"
+                task["formattedMessage"] = str(e)
+        duration = self.config.task_duration
+        for finish_at, task_tag, _apply, _failing in self.pending:
+            progress = 1 - (finish_at - now) / duration if duration else 1
+            self.tasks[task_tag]["progressPercent"] = int(100 * max(0, progress))
+
+    # Records
+
+    def collection(self, name):
+        return self.collections.setdefault(name, {})
+
+    def list_records(self, name):
+        if name in DEVICE_FIELDS:
+            field = DEVICE_FIELDS[name]
+            return [
+                device
+                for vm in self.collection("VirDomain").values()
+                for device in vm.get(field, [])
+            ]
+        return list(self.collection(name).values())
+
+    def find(self, name, uuid):
+        for record in self.list_records(name):
+            if record["uuid"] == uuid:
+                return record
+        raise ApiError(404, "{0} {1} not found".format(name, uuid))
+
+    def find_vm(self, vm_uuid):
+        vm = self.collection("VirDomain").get(vm_uuid)
+        if vm is None:
+            raise ApiError(404, "VirDomain {0} not found".format(vm_uuid))
+        return vm
+
+    def new_vm(self, vm_dict):
+        vm = dict(
+            dict(
+                name="",
+                tags="",
+                description="",
+                mem=0,
+                numVCPU=1,
+                state="SHUTOFF",
+                netDevs=[],
+                blockDevs=[],
+                bootDevices=[],
+                attachGuestToolsISO=False,
+                operatingSystem="os_other",
+                affinityStrategy=dict(
+                    strictAffinity=False, preferredNodeUUID="", backupNodeUUID=""
+                ),
+                snapshotScheduleUUID="",
+                machineType="scale-7.2",
+                sourceVirDomainUUID="",
+                cloudInitData=dict(userData="", metaData=""),
+                latestTaskTag=dict(),
+                desiredDisposition="SHUTOFF",
+            ),
+            **copy.deepcopy(vm_dict),
+        )
+        vm["uuid"] = self.new_uuid()
+        nodes = list(self.collection("Node"))
+        vm.setdefault("nodeUUID", nodes[0] if nodes else "")
+        for field in DEVICE_FIELDS.values():
+            vm[field] = [
+                dict(device, uuid=self.new_uuid(), virDomainUUID=vm["uuid"])
+                for device in vm[field]
+            ]
+        return vm
+
+    def create(self, name, payload):
+        if name == "VirDomain":
+            vm = self.new_vm(payload.get("dom", payload))
+            return self.submit(
+                lambda: self.collection(name).__setitem__(vm["uuid"], vm), vm["uuid"]
+            )
+        record = dict(payload, uuid=self.new_uuid())
+        if name == "VirDomainSnapshot":
+            vm = self.find_vm(record.get("domainUUID"))
+            serial = 1 + sum(
+                1
+                for snapshot in self.collection(name).values()
+                if snapshot["domainUUID"] == vm["uuid"]
+            )
+            record.update(
+                domain=dict(vm, snapshotSerialNumber=serial),
+                type="USER",
+                timestamp=int(time.time()),
+                automatedTriggerTimestamp=0,
+                localRetainUntilTimestamp=0,
+                remoteRetainUntilTimestamp=0,
+                blockCountDiffFromSerialNumber=-1,
+                replication=True,
+            )
+        if name in DEVICE_FIELDS:
+            vm = self.find_vm(record.get("virDomainUUID"))
+            return self.submit(
+                lambda: vm[DEVICE_FIELDS[name]].append(record), record["uuid"]
+            )
+        return self.submit(
+            lambda: self.collection(name).__setitem__(record["uuid"], record),
+            record["uuid"],
+        )
+
+    def update(self, name, uuid, payload):
+        record = self.find(name, uuid)
+        return self.submit(lambda: record.update(payload))
+
+    def delete(self, name, uuid):
+        record = self.find(name, uuid)
+        if name in DEVICE_FIELDS:
+            devices = self.find_vm(record["virDomainUUID"])[DEVICE_FIELDS[name]]
+            return self.submit(lambda: devices.remove(record))
+        return self.submit(lambda: self.collection(name).pop(uuid, None))
+
+    def vm_action(self, actions):
+        vms = [self.find_vm(action["virDomainUUID"]) for action in actions]
+
+        def apply():
+            for vm, action in zip(vms, actions):
+                state = POWER_ACTIONS.get(action["actionType"], vm["state"])
+                vm["state"] = vm["desiredDisposition"] = state
+
+        return self.submit(apply)
+
+    def clone_vm(self, vm_uuid, payload):
+        source = self.find_vm(vm_uuid)
+        template = payload.get("template", {})
+        vm = self.new_vm(
+            dict(
+                dict(source, tags="", state="SHUTOFF", sourceVirDomainUUID=vm_uuid),
+                **template,
+            )
+        )
+        return self.submit(
+            lambda: self.collection("VirDomain").__setitem__(vm["uuid"], vm),
+            vm["uuid"],
+        )
+
+    def import_vm(self, payload):
+        vm = self.new_vm(payload.get("template", {}))
+        return self.submit(
+            lambda: self.collection("VirDomain").__setitem__(vm["uuid"], vm),
+            vm["uuid"],
+        )
+
+    def export_vm(self, vm_uuid):
+        self.find_vm(vm_uuid)
+        return self.submit(lambda: None)
+
+    def upload_iso(self, uuid, size):
+        iso = self.find("ISO", uuid)
+        iso["size"] = size
+        return {}
+
+    def upload_virtual_disk(self, query, size):
+        record = dict(
+            uuid=self.new_uuid(),
+            name=query.get("filename", ""),
+            blockSize=1048576,
+            capacityBytes=size,
+            replicationFactor=2,
+            totalAllocationBytes=size,
+        )
+        return self.submit(
+            lambda: self.collection("VirtualDisk").__setitem__(record["uuid"], record),
+            record["uuid"],
+        )
+
+    def task_status(self, task_tag):
+        task = self.tasks.get(task_tag)
+        return [dict(task)] if task else []
+
+
+def route_name(method, parts):
+    """Request key for statistics - ids are replaced with placeholders."""
+    return "{0} /rest/v1/{1}".format(
+        method,
+        "/".join(
+            "{id}" if UUID_PATTERN.match(part) or part.isdigit() else part
+            for part in parts
+        ),
+    )
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "HyperCoreSimulator/1.0"
+
+    # Set on the handler class by make_server.
+    cluster = None
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_POST(self):
+        self.handle_request("POST")
+
+    def do_PATCH(self):
+        self.handle_request("PATCH")
+
+    def do_PUT(self):
+        self.handle_request("PUT")
+
+    def do_DELETE(self):
+        self.handle_request("DELETE")
+
+    def throttle(self, size):
+        throughput = self.cluster.config.throughput
+        if throughput:
+            time.sleep(size / throughput)
+
+    def read_body(self):
+        remaining = int(self.headers.get("Content-Length") or 0)
+        chunks = []
+        while remaining > 0:
+            chunk = self.rfile.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            self.throttle(len(chunk))
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        body = b"".join(chunks)
+        with self.cluster.lock:
+            self.cluster.stats["bytes_received"] += len(body)
+        return body
+
+    def send_json(self, status, data):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        for start in range(0, len(body), CHUNK_SIZE):
+            chunk = body[start:start + CHUNK_SIZE]
+            self.throttle(len(chunk))
+            self.wfile.write(chunk)
+        with self.cluster.lock:
+            self.cluster.stats["bytes_sent"] += len(body)
+
+    def authorized(self):
+        config = self.cluster.config
+        header = self.headers.get("Authorization") or ""
+        if header.startswith("Basic "):
+            if config.username is None:
+                return True
+            credentials = base64.b64decode(header[6:]).decode("utf-8")
+            return credentials == "{0}:{1}".format(config.username, config.password)
+        return "sessionID=" in (self.headers.get("Cookie") or "")
+
+    def handle_request(self, method):
+        url = urlsplit(self.path)
+        path = unquote(url.path)
+        query = dict(parse_qsl(url.query))
+        if path.startswith("/simulator/"):
+            self.read_body()
+            return self.handle_control(method, path)
+
+        config = self.cluster.config
+        delay = config.latency
+        if config.latency_jitter:
+            delay += random.uniform(0, config.latency_jitter)
+        if delay:
+            time.sleep(delay)
+
+        body = self.read_body()
+        parts = [part for part in path[len(API_PREFIX):].split("/") if part]
+        if not path.startswith(API_PREFIX) or not parts:
+            return self.send_json(404, dict(error="Unknown path {0}".format(path)))
+        key = route_name(method, parts)
+        with self.cluster.lock:
+            self.cluster.stats["requests"] += 1
+            self.cluster.stats[key] += 1
+            inject = (
+                config.error_rate
+                and (config.error_pattern is None or config.error_pattern.search(key))
+                and self.cluster.rng.random() < config.error_rate
+            )
+            if inject:
+                self.cluster.stats["errors_injected"] += 1
+        if inject:
+            return self.send_json(
+                config.error_status, dict(error="Simulated error on {0}".format(key))
+            )
+        if parts == ["login"]:
+            return self.send_json(200, dict(sessionID=str(uuid_lib.uuid4())))
+        if parts == ["logout"]:
+            return self.send_json(200, {})
+        if not self.authorized():
+            return self.send_json(401, dict(error="Unauthorized"))
+
+        try:
+            payload = json.loads(body) if body and method in ("POST", "PATCH") else {}
+            with self.cluster.lock:
+                self.cluster.advance()
+                status, data = self.dispatch(method, parts, query, payload, len(body))
+        except ApiError as e:
+            status, data = e.status, dict(error=str(e))
+        except (ValueError, KeyError, TypeError) as e:
+            status, data = 400, dict(error="Bad request: {0}".format(e))
+        self.send_json(status, data)
+
+    def dispatch(self, method, parts, query, payload, body_size):
+        cluster = self.cluster
+        name = parts[0]
+        rest = parts[1:]
+        if name == "TaskTag" and method == "GET":
+            if not rest:
+                return 200, [dict(task) for task in cluster.tasks.values()]
+            return 200, cluster.task_status(rest[0])
+        if name == "VirDomain":
+            if rest == ["action"] and method == "POST":
+                return 200, cluster.vm_action(payload)
+            if rest == ["import"] and method == "POST":
+                return 200, cluster.import_vm(payload)
+            if len(rest) == 2 and method == "POST":
+                if rest[1] == "clone":
+                    return 200, cluster.clone_vm(rest[0], payload)
+                if rest[1] == "export":
+                    return 200, cluster.export_vm(rest[0])
+        if name == "ISO" and len(rest) == 2 and rest[1] == "data" and method == "PUT":
+            return 200, cluster.upload_iso(rest[0], body_size)
+        if name == "VirtualDisk" and rest == ["upload"] and method == "PUT":
+            return 200, cluster.upload_virtual_disk(query, body_size)
+
+        if method == "GET" and not rest:
+            return 200, cluster.list_records(name)
+        if method == "GET" and len(rest) == 1:
+            return 200, [cluster.find(name, rest[0])]
+        if method == "POST" and not rest:
+            return 200, cluster.create(name, payload)
+        if method == "PATCH" and len(rest) == 1:
+            return 200, cluster.update(name, rest[0], payload)
+        if method == "DELETE" and len(rest) == 1:
+            return 200, cluster.delete(name, rest[0])
+        raise ApiError(404, "Unsupported {0} {1}".format(method, "/".join(parts)))
+
+    def handle_control(self, method, path):
+        cluster = self.cluster
+        if path == "/simulator/stats" and method == "GET":
+            with cluster.lock:
+                stats = dict(cluster.stats)
+                pending_tasks = len(cluster.pending)
+            return self.send_json(
+                200,
+                dict(
+                    requests=dict(
+                        (key, count) for key, count in stats.items() if " " in key
+                    ),
+                    total=stats.get("requests", 0),
+                    errors_injected=stats.get("errors_injected", 0),
+                    bytes_received=stats.get("bytes_received", 0),
+                    bytes_sent=stats.get("bytes_sent", 0),
+                    pending_tasks=pending_tasks,
+                ),
+            )
+        if path == "/simulator/reset" and method == "POST":
+            with cluster.lock:
+                cluster.stats.clear()
+            return self.send_json(200, {})
+        return self.send_json(404, dict(error="Unknown path {0}".format(path)))
+
+
+def make_server(
+    cluster, host="127.0.0.1", port=0, certfile=None, keyfile=None, verbose=False
+):
+    """
+    Returns a server bound to host and port (0 picks a free port).
+    Serve with serve_forever(), possibly from a thread. Use HTTPS if certfile is set.
+    """
+    handler = type("ClusterHandler", (Handler,), dict(cluster=cluster))
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.verbose = verbose
+    scheme = "http"
+    if certfile:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(certfile, keyfile)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        scheme = "https"
+    server.url = "{0}://{1}:{2}".format(scheme, host, server.server_address[1])
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--vms", type=int, default=100, help="Number of VMs.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds added to every request."
+    )
+    parser.add_argument(
+        "--latency-jitter",
+        type=float,
+        default=0.0,
+        help="Up to this many seconds are randomly added to latency.",
+    )
+    parser.add_argument(
+        "--task-duration",
+        type=float,
+        default=0.5,
+        help="Seconds from a write request until its task finishes.",
+    )
+    parser.add_argument(
+        "--throughput",
+        type=float,
+        help="Bytes per second for request and response bodies. Default is unlimited.",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of API requests answered with --error-status.",
+    )
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument(
+        "--error-pattern",
+        help="Inject errors only into requests matching this regular expression, "
+        "for example 'POST /rest/v1/VirDomainSnapshot'.",
+    )
+    parser.add_argument(
+        "--task-error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of tasks that finish in ERROR state.",
+    )
+    parser.add_argument("--username", help="Required username. Default is any.")
+    parser.add_argument("--password")
+    parser.add_argument("--certfile", help="Serve HTTPS with this certificate.")
+    parser.add_argument("--keyfile")
+    parser.add_argument("--verbose", action="store_true", help="Log every request.")
+    args = parser.parse_args()
+
+    config = SimulatorConfig(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        task_duration=args.task_duration,
+        throughput=args.throughput,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        error_pattern=args.error_pattern,
+        task_error_rate=args.task_error_rate,
+        username=args.username,
+        password=args.password,
+        seed=args.seed,
+    )
+    cluster = Cluster(dataset.cluster(args.vms, args.seed), config)
+    server = make_server(
+        cluster,
+        args.host,
+        args.port,
+        certfile=args.certfile,
+        keyfile=args.keyfile,
+        verbose=args.verbose,
+    )
+    print("Simulating {0} VMs on {1}".format(args.vms, server.url), flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
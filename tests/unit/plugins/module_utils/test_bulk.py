@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+# # Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+import threading
+
+import pytest
+
+from ansible_collections.scale_computing.hypercore.plugins.module_utils import (
+    bulk,
+    errors,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.task_tag import (
+    TaskTag,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
+    MIN_PYTHON_VERSION,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < MIN_PYTHON_VERSION,
+    reason=f"requires python{MIN_PYTHON_VERSION[0]}.{MIN_PYTHON_VERSION[1]} or higher",
+)
+
+
+class TaskStates:
+    """TaskTag endpoint mock - every task is RUNNING for given number of polls."""
+
+    def __init__(self, polls_until_done, final_states=None):
+        self.polls_until_done = dict(polls_until_done)
+        self.final_states = final_states or {}
+        self.polled = []
+
+    def get_record(self, endpoint, query=None):
+        task_tag = endpoint.split("/")[-1]
+        self.polled.append(task_tag)
+        if self.polls_until_done[task_tag] > 0:
+            self.polls_until_done[task_tag] -= 1
+            return dict(state="RUNNING")
+        return dict(state=self.final_states.get(task_tag, "COMPLETE"))
+
+
+class TestPollTasks:
+    def test_poll_tasks(self, rest_client):
+        states = dict(t1="RUNNING", t2="COMPLETE", t3="ERROR", t4="QUEUED")
+        rest_client.get_record.side_effect = lambda endpoint, query: (
+            None
+            if endpoint.endswith("t5")
+            else dict(state=states[endpoint.split("/")[-1]])
+        )
+        assert TaskTag.poll_tasks(rest_client, ["t1", "t2", "t3", "t4", "t5"]) == dict(
+            t2="COMPLETE", t3="ERROR", t5="COMPLETE"
+        )
+
+
+class TestWaitTasks:
+    def test_wait_tasks_single_sleep_per_round(self, rest_client, mocker):
+        sleep_mock = mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.module_utils.task_tag.sleep"
+        )
+        states = TaskStates(dict(t1=2, t2=1, t3=0))
+        rest_client.get_record.side_effect = states.get_record
+
+        TaskTag.wait_tasks(
+            rest_client,
+            [dict(taskTag="t1"), dict(taskTag="t2"), dict(taskTag=""), None],
+        )
+
+        assert sleep_mock.call_count == 2
+        assert states.polled == ["t1", "t2", "t1", "t2", "t1"]
+
+    def test_wait_tasks_error(self, rest_client, mocker):
+        mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.module_utils.task_tag.sleep"
+        )
+        states = TaskStates(dict(t1=1, t2=0), final_states=dict(t2="ERROR"))
+        rest_client.get_record.side_effect = states.get_record
+
+        with pytest.raises(errors.ScaleComputingError, match="t2"):
+            TaskTag.wait_tasks(rest_client, [dict(taskTag="t1"), dict(taskTag="t2")])
+        # Failure of t2 doesn't stop waiting for t1
+        assert states.polls_until_done["t1"] == 0
+
+    def test_wait_tasks_check_mode(self, rest_client):
+        TaskTag.wait_tasks(rest_client, [dict(taskTag="t1")], check_mode=True)
+        rest_client.get_record.assert_not_called()
+
+
+class TestRunTasks:
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, mocker):
+        mocker.patch.object(bulk, "sleep")
+        mocker.patch.object(bulk, "TASK_POLL_INTERVAL", 0)
+
+    def test_run_tasks(self, rest_client):
+        states = TaskStates(dict(t1=1, t3=0))
+        rest_client.get_record.side_effect = states.get_record
+
+        def start(item):
+            if item == "b":
+                return dict(taskTag="", createdUUID="b-uuid")  # finished without a task
+            if item == "c":
+                raise errors.ScaleComputingError("bad request")
+            return dict(taskTag={"a": "t1", "d": "t3"}[item], createdUUID="")
+
+        results = bulk.run_tasks(rest_client, ["a", "b", "c", "d"], start)
+
+        assert [
+            (result["task_tag"], result["state"], result["error"]) for result in results
+        ] == [
+            ("t1", "COMPLETE", None),
+            (None, "COMPLETE", None),
+            (None, "ERROR", "bad request"),
+            ("t3", "COMPLETE", None),
+        ]
+        assert all(result["duration"] >= 0 for result in results)
+        assert results[1]["created_uuid"] == "b-uuid"
+
+    def test_task_error(self, rest_client):
+        states = TaskStates(dict(t1=0), final_states=dict(t1="ERROR"))
+        rest_client.get_record.side_effect = states.get_record
+
+        results = bulk.run_tasks(rest_client, ["a"], lambda item: dict(taskTag="t1"))
+
+        assert results[0]["state"] == "ERROR"
+        assert results[0]["error"]
+
+    def test_max_concurrency(self, rest_client):
+        lock = threading.Lock()
+        in_progress = set()
+        max_in_progress = []
+        states = TaskStates({"t{0}".format(i): 2 for i in range(10)})
+
+        def get_record(endpoint, query=None):
+            task = states.get_record(endpoint, query)
+            if task["state"] == "COMPLETE":
+                with lock:
+                    in_progress.discard(endpoint.split("/")[-1])
+            return task
+
+        def start(item):
+            with lock:
+                in_progress.add("t{0}".format(item))
+                max_in_progress.append(len(in_progress))
+            return dict(taskTag="t{0}".format(item))
+
+        rest_client.get_record.side_effect = get_record
+
+        results = bulk.run_tasks(rest_client, list(range(10)), start, max_concurrency=3)
+
+        assert all(result["state"] == "COMPLETE" for result in results)
+        assert max(max_in_progress) <= 3
+
+    def test_invalid_max_concurrency(self, rest_client):
+        with pytest.raises(errors.ScaleComputingError):
+            bulk.run_tasks(rest_client, [], lambda item: None, max_concurrency=0)
+
+    def test_max_group_concurrency(self, rest_client):
+        lock = threading.Lock()
+        in_progress = set()
+        max_in_progress = dict(a=0, b=0)
+        started = []
+        states = TaskStates({"t{0}".format(i): 2 for i in range(10)})
+
+        def get_record(endpoint, query=None):
+            task = states.get_record(endpoint, query)
+            if task["state"] == "COMPLETE":
+                with lock:
+                    in_progress.discard(int(endpoint.split("/")[-1][1:]))
+            return task
+
+        def start(item):
+            with lock:
+                started.append(item)
+                in_progress.add(item)
+                group = "a" if item < 7 else "b"
+                max_in_progress[group] = max(
+                    max_in_progress[group],
+                    sum(1 for i in in_progress if ("a" if i < 7 else "b") == group),
+                )
+            return dict(taskTag="t{0}".format(item))
+
+        rest_client.get_record.side_effect = get_record
+
+        results = bulk.run_tasks(
+            rest_client,
+            list(range(10)),
+            start,
+            max_concurrency=4,
+            group=lambda item: "a" if item < 7 else "b",
+            max_group_concurrency=2,
+        )
+
+        assert all(result["state"] == "COMPLETE" for result in results)
+        assert max(max_in_progress.values()) <= 2
+        # Items of group b are started while group a is busy.
+        assert sorted(started[:4]) == [0, 1, 7, 8]
+
+    def test_invalid_max_group_concurrency(self, rest_client):
+        with pytest.raises(errors.ScaleComputingError):
+            bulk.run_tasks(
+                rest_client,
+                [],
+                lambda item: None,
+                group=lambda item: item,
+                max_group_concurrency=0,
+            )
+
+
+class TestUpdateRecords:
+    def test_update_records(self):
+        records = [dict(name="a"), dict(name="b")]
+
+        bulk.update_records(
+            records,
+            [
+                dict(task_tag="t1", state="COMPLETE", error=None, duration=1.0),
+                dict(task_tag=None, state="COMPLETE", error=None, duration=0.0),
+            ],
+            "Failed to update {0} of {1} items",
+            lambda record: record["name"],
+        )
+
+        assert records == [
+            dict(name="a", task_tag="t1", duration=1.0),
+            dict(name="b", task_tag=None, duration=0.0),
+        ]
+
+    def test_update_records_failed(self):
+        records = [dict(name="a"), dict(name="b"), dict(name="c")]
+
+        with pytest.raises(errors.BulkError) as exc_info:
+            bulk.update_records(
+                records,
+                [
+                    dict(task_tag="t1", state="ERROR", error="bad", duration=1.0),
+                    dict(task_tag="t2", state="COMPLETE", error=None, duration=2.0),
+                    dict(task_tag=None, state="ERROR", error="worse", duration=0.0),
+                ],
+                "Failed to update {0} of {1} items",
+                lambda record: record["name"],
+            )
+
+        assert str(exc_info.value) == (
+            "Failed to update 2 of 3 items: a: bad; c: worse"
+        )
+        # Records of successful operations are kept.
+        assert exc_info.value.records == records
+        assert records[1] == dict(name="b", task_tag="t2", duration=2.0)
@@ -2,14 +2,17 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import socket
 import sys
 
 import pytest
 
+from ansible_collections.scale_computing.hypercore.plugins.module_utils import cluster
 from ansible_collections.scale_computing.hypercore.plugins.module_utils.cluster import (
     Cluster,
 )
 from ansible_collections.scale_computing.hypercore.plugins.module_utils.errors import (
+    ScaleComputingError,
     ScaleTimeoutError,
 )
 from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
@@ -112,27 +115,140 @@ class TestCluster:
             False,
         )
 
-    def test_cluster_shutdown(self, rest_client):
-        force_shutdown = True
-        rest_client.create_record.side_effect = ScaleTimeoutError("Timeout error")
-        rest_client.get_record.side_effect = ConnectionRefusedError
 
-        Cluster.shutdown(rest_client, force_shutdown)
+class TestProbeConnection:
+    @pytest.mark.parametrize(
+        "error,expected",
+        [
+            (ConnectionRefusedError(), "refused"),
+            (socket.timeout(), "timeout"),
+            (OSError(113, "No route to host"), "unreachable"),
+        ],
+    )
+    def test_probe_connection_failed(self, mocker, error, expected):
+        mocker.patch.object(cluster.socket, "create_connection", side_effect=error)
+
+        assert cluster.probe_connection("10.0.0.1", 443, 2) == expected
+
+    def test_probe_connection(self, mocker):
+        create_connection = mocker.patch.object(cluster.socket, "create_connection")
+
+        assert cluster.probe_connection("10.0.0.1", 443, 2) is None
+        create_connection.assert_called_once_with(("10.0.0.1", 443), timeout=2)
+        create_connection.return_value.close.assert_called_once_with()
+
+
+class TestClusterShutdown:
+    @pytest.fixture
+    def clock(self, mocker):
+        # Fake clock, sleep advances it.
+        now = [1000.0]
+        mocker.patch.object(cluster, "time", side_effect=lambda: now[0])
+        return mocker.patch.object(
+            cluster,
+            "sleep",
+            side_effect=lambda seconds: now.__setitem__(0, now[0] + seconds),
+        )
+
+    @pytest.fixture
+    def probes(self, mocker):
+        # Probe results by address - one per round, the last one is repeated.
+        results = {}
+
+        def probe(address, port, timeout):
+            assert (port, timeout) == (443, cluster.SHUTDOWN_PROBE_TIMEOUT)
+            if len(results[address]) > 1:
+                return results[address].pop(0)
+            return results[address][0]
+
+        mocker.patch.object(cluster, "probe_connection", side_effect=probe)
+        return results
+
+    @pytest.fixture
+    def api(self, rest_client):
+        rest_client.client.host = "https://10.0.0.1"
+        rest_client.list_records.return_value = [
+            dict(uuid="node-1", lanIP="10.0.0.1"),
+            dict(uuid="node-2", lanIP="10.0.0.2"),
+            dict(uuid="node-3", lanIP="10.0.0.3"),
+        ]
+        return rest_client
+
+    @pytest.mark.parametrize("force_shutdown", [True, False])
+    def test_shutdown(self, api, clock, probes, force_shutdown):
+        api.create_record.side_effect = ScaleTimeoutError("Timeout error")
+        probes.update(
+            {
+                "10.0.0.1": [None, None, "refused"],
+                "10.0.0.2": [None, None, None, "timeout"],
+                "10.0.0.3": ["timeout"],
+            }
+        )
 
-        rest_client.create_record.assert_called_with(
+        result = Cluster.shutdown(api, force_shutdown)
+
+        api.create_record.assert_called_once_with(
             "/rest/v1/Cluster/shutdown",
-            {"forceShutdown": True},
+            {"forceShutdown": force_shutdown},
             False,
         )
+        api.list_records.assert_called_once_with("/rest/v1/Node")
+        assert result == dict(
+            duration=15.0,
+            nodes=[
+                dict(
+                    node_uuid="node-1",
+                    address="10.0.0.1",
+                    reachable_before_shutdown=True,
+                    down_after=10.0,
+                    went_down="refused",
+                ),
+                dict(
+                    node_uuid="node-2",
+                    address="10.0.0.2",
+                    reachable_before_shutdown=True,
+                    down_after=15.0,
+                    went_down="timeout",
+                ),
+                dict(
+                    node_uuid="node-3",
+                    address="10.0.0.3",
+                    reachable_before_shutdown=False,
+                    down_after=None,
+                    went_down=None,
+                ),
+            ],
+        )
 
-    def test_cluster_shutdown_default_force_shutdown(self, rest_client):
-        rest_client.create_record.side_effect = ScaleTimeoutError("Timeout error")
-        rest_client.get_record.side_effect = ConnectionRefusedError
+    def test_shutdown_api_host_not_a_node(self, api, clock, probes):
+        api.client.host = "https://cluster.example.com"
+        probes.update(
+            {
+                "10.0.0.1": ["refused"],
+                "10.0.0.2": ["refused"],
+                "10.0.0.3": ["refused"],
+                "cluster.example.com": [None, "timeout"],
+            }
+        )
 
-        Cluster.shutdown(rest_client)
+        result = Cluster.shutdown(api)
 
-        rest_client.create_record.assert_called_with(
-            "/rest/v1/Cluster/shutdown",
-            {"forceShutdown": False},
-            False,
+        assert result["nodes"][-1] == dict(
+            node_uuid=None,
+            address="cluster.example.com",
+            reachable_before_shutdown=True,
+            down_after=5.0,
+            went_down="timeout",
         )
+
+    def test_shutdown_timeout(self, api, clock, probes):
+        probes.update({"10.0.0.1": [None], "10.0.0.2": [None, "refused"]})
+        api.list_records.return_value = api.list_records.return_value[:2]
+
+        with pytest.raises(
+            ScaleComputingError,
+            match="Cluster did not shut down in 12 seconds, still reachable: 10.0.0.1",
+        ):
+            Cluster.shutdown(api, timeout=12)
+
+        assert [call.args[0] for call in clock.call_args_list] == [5.0, 5.0, 2.0]
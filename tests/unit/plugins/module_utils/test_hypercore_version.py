@@ -11,6 +11,14 @@ import sys
 import pytest
 import json
 
+from ansible_collections.scale_computing.hypercore.plugins.module_utils import (
+    hypercore_version,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.errors import (
+    AuthError,
+    ScaleComputingError,
+    UnexpectedAPIResponse,
+)
 from ansible_collections.scale_computing.hypercore.plugins.module_utils.hypercore_version import (
     HyperCoreVersion,
     Version,
@@ -405,3 +413,113 @@ class TestUpdateStatus:
         rest_client.client.get.assert_called_with("update/update_status.json")
 
         assert update_status is None
+
+
+def _update_status_response(master_state, percent, to_build="209840"):
+    return Response(
+        status=200,
+        data=json.dumps(
+            dict(
+                prepareStatus="",
+                updateStatus=dict(
+                    masterState=master_state,
+                    fromBuild="207183",
+                    toBuild=to_build,
+                    toVersion="9.1.18." + to_build,
+                    percent=percent,
+                    status=dict(statusdetails="details", usernotes=""),
+                ),
+            )
+        ),
+    )
+
+
+class TestUpdateStatusWait:
+    @pytest.fixture
+    def clock(self, mocker):
+        # Fake clock, sleep advances it.
+        now = [1000.0]
+        mocker.patch.object(hypercore_version, "time", side_effect=lambda: now[0])
+        sleep_mock = mocker.patch.object(
+            hypercore_version,
+            "sleep",
+            side_effect=lambda seconds: now.__setitem__(0, now[0] + seconds),
+        )
+        return sleep_mock
+
+    def test_is_for(self):
+        status = UpdateStatus.from_hypercore(
+            json.loads(_update_status_response("COMPLETE", "100").data)
+        )
+        assert status.is_for("9.1.18.209840")
+        assert not status.is_for("9.2.11.210763")
+
+    def test_wait_through_api_restart(self, rest_client, clock):
+        rest_client.client.get.side_effect = [
+            # Status of a previous update
+            _update_status_response("COMPLETE", "100", to_build="207183"),
+            _update_status_response("IN PROGRESS", "10"),
+            _update_status_response("IN PROGRESS", "10"),
+            ConnectionRefusedError("Connection refused"),
+            ConnectionRefusedError("Connection refused"),
+            _update_status_response("IN PROGRESS", "90"),
+            _update_status_response("COMPLETE", "100"),
+        ]
+
+        status, timeline = UpdateStatus.wait(rest_client, "9.1.18.209840", 3600)
+
+        assert status.update_status == "COMPLETE"
+        assert [entry["update_status"] for entry in timeline] == [
+            None,
+            "IN PROGRESS",
+            None,
+            "IN PROGRESS",
+            "COMPLETE",
+        ]
+        assert timeline[2]["error"] == "Connection refused"
+        assert timeline[3]["percent"] == "90"
+        # Interval grows while status is unchanged, and is reset on change.
+        assert [call.args[0] for call in clock.call_args_list] == [
+            2.0,
+            2.0,
+            3.0,
+            2.0,
+            3.0,
+            2.0,
+        ]
+
+    def test_wait_through_server_error(self, rest_client, clock):
+        rest_client.client.get.side_effect = [
+            UnexpectedAPIResponse(Response(503, "Service Unavailable", None)),
+            _update_status_response("COMPLETE", "100"),
+        ]
+
+        status, timeline = UpdateStatus.wait(rest_client, "9.1.18.209840", 3600)
+
+        assert status.update_status == "COMPLETE"
+        assert "503" in timeline[0]["error"]
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            AuthError("Failed to authenticate with the instance: 401 Unauthorized"),
+            UnexpectedAPIResponse(Response(403, "Forbidden", None)),
+        ],
+    )
+    def test_wait_client_error(self, rest_client, clock, error):
+        rest_client.client.get.side_effect = error
+
+        with pytest.raises(type(error)):
+            UpdateStatus.wait(rest_client, "9.1.18.209840", 3600)
+
+        clock.assert_not_called()
+
+    def test_wait_timeout(self, rest_client, clock):
+        rest_client.client.get.return_value = _update_status_response(
+            "IN PROGRESS", "50"
+        )
+
+        with pytest.raises(ScaleComputingError, match="did not finish in 60 seconds"):
+            UpdateStatus.wait(rest_client, "9.1.18.209840", 60)
+
+        assert sum(call.args[0] for call in clock.call_args_list) == 60
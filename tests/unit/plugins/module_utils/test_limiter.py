@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# # Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import fcntl
+import os
+import sys
+
+import pytest
+
+from ansible_collections.scale_computing.hypercore.plugins.module_utils import (
+    client,
+    errors,
+    limiter,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
+    MIN_PYTHON_VERSION,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < MIN_PYTHON_VERSION,
+    reason=f"requires python{MIN_PYTHON_VERSION[0]}.{MIN_PYTHON_VERSION[1]} or higher",
+)
+
+
+@pytest.fixture
+def state_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("SC_STATE_DIR", str(tmp_path))
+    return tmp_path
+
+
+class TestGetLimiter:
+    def test_no_limits(self, state_dir):
+        assert limiter.ClusterLimiter.get_limiter("https://host", None, None) is None
+
+    def test_with_limits(self, state_dir):
+        cluster_limiter = limiter.ClusterLimiter.get_limiter("https://host:443", 2, 5)
+        assert cluster_limiter.max_concurrent_requests == 2
+        assert cluster_limiter.max_requests_per_second == 5
+        assert cluster_limiter.lock_dir == os.path.join(
+            str(state_dir), "https_host_443", "limiter"
+        )
+
+    @pytest.mark.parametrize(
+        "max_concurrent_requests,max_requests_per_second", [(-1, None), (None, -0.5)]
+    )
+    def test_invalid_limits(
+        self, state_dir, max_concurrent_requests, max_requests_per_second
+    ):
+        with pytest.raises(errors.ScaleComputingError):
+            limiter.ClusterLimiter(
+                "https://host", max_concurrent_requests, max_requests_per_second
+            )
+
+
+class TestAcquire:
+    def test_acquire_counts_requests(self, state_dir):
+        cluster_limiter = limiter.ClusterLimiter("https://host", 1, None)
+        with cluster_limiter.acquire():
+            pass
+        with cluster_limiter.acquire():
+            pass
+        assert cluster_limiter.requests == 2
+        assert cluster_limiter.to_ansible() == dict(
+            max_concurrent_requests=1,
+            max_requests_per_second=None,
+            requests=2,
+            wait_time=round(cluster_limiter.wait_time, 3),
+        )
+
+    def test_slot_taken_by_other_process(self, state_dir, mocker):
+        cluster_limiter = limiter.ClusterLimiter("https://host", 2, None)
+        # Simulate other process holding slot-0
+        with open(os.path.join(cluster_limiter.lock_dir, "slot-0"), "a+") as other:
+            fcntl.flock(other, fcntl.LOCK_EX)
+            with cluster_limiter.acquire():
+                with pytest.raises(OSError):
+                    with open(
+                        os.path.join(cluster_limiter.lock_dir, "slot-1"), "a+"
+                    ) as probe:
+                        fcntl.flock(probe, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(other, fcntl.LOCK_UN)
+
+    def test_wait_for_free_slot(self, state_dir, mocker):
+        cluster_limiter = limiter.ClusterLimiter("https://host", 1, None)
+        other = open(os.path.join(cluster_limiter.lock_dir, "slot-0"), "a+")
+        fcntl.flock(other, fcntl.LOCK_EX)
+
+        def release_slot(seconds):
+            fcntl.flock(other, fcntl.LOCK_UN)
+            other.close()
+
+        sleep_mock = mocker.patch.object(limiter, "sleep", side_effect=release_slot)
+        with cluster_limiter.acquire():
+            pass
+        sleep_mock.assert_called_once_with(limiter.SLOT_POLL_INTERVAL)
+
+    def test_lock_file_mode(self, state_dir):
+        cluster_limiter = limiter.ClusterLimiter("https://host", 1, 1000)
+        with cluster_limiter.acquire():
+            pass
+        for name in ("slot-0", "rate"):
+            path = os.path.join(cluster_limiter.lock_dir, name)
+            assert os.stat(path).st_mode & 0o777 == 0o600
+
+    def test_rate_limit(self, state_dir, mocker):
+        cluster_limiter = limiter.ClusterLimiter("https://host", None, 2)
+        mocker.patch.object(limiter, "time", return_value=100.0)
+        sleep_mock = mocker.patch.object(limiter, "sleep")
+        for _ in range(3):
+            with cluster_limiter.acquire():
+                pass
+        # 2 requests per second - second request waits 0.5s, third 1s.
+        assert [call.args[0] for call in sleep_mock.call_args_list] == [0.5, 1.0]
+        with open(os.path.join(cluster_limiter.lock_dir, "rate")) as rate_file:
+            assert float(rate_file.read()) == 101.5
+
+
+class TestClientThrottle:
+    def test_throttle_result_without_limiter(self):
+        c = client.Client("https://instance.com", "user", "pass", None)
+        assert c.limiter is None
+        assert c.throttle_result() == {}
+
+    def test_get_client_with_limits(self, state_dir, mocker):
+        c = client.Client.get_client(
+            dict(
+                host="https://instance.com",
+                username="user",
+                password="pass",
+                timeout=None,
+                max_concurrent_requests=3,
+                max_requests_per_second=None,
+            )
+        )
+        request_mock = mocker.patch.object(client, "Request").return_value
+        c._client = request_mock
+        raw_response = mocker.MagicMock(status=200, headers={})
+        raw_response.read.return_value = "{}"
+        request_mock.open.return_value = raw_response
+
+        c.request("GET", "rest/v1/Node")
+
+        assert c.throttle_result() == dict(
+            throttle=dict(
+                max_concurrent_requests=3,
+                max_requests_per_second=None,
+                requests=1,
+                wait_time=round(c.limiter.wait_time, 3),
+            )
+        )
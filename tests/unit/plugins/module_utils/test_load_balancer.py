@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+# # Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+
+import pytest
+
+from ansible_collections.scale_computing.hypercore.plugins.module_utils import (
+    client,
+    errors,
+    load_balancer,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
+    MIN_PYTHON_VERSION,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < MIN_PYTHON_VERSION,
+    reason=f"requires python{MIN_PYTHON_VERSION[0]}.{MIN_PYTHON_VERSION[1]} or higher",
+)
+
+
+@pytest.fixture
+def state_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("SC_STATE_DIR", str(tmp_path))
+    return tmp_path
+
+
+class TestReadBalancer:
+    def test_get_balancer_disabled(self, state_dir):
+        assert load_balancer.ReadBalancer.get_balancer("https://host", None) is None
+
+    def test_invalid_strategy(self, state_dir):
+        with pytest.raises(errors.ScaleComputingError, match="Invalid read_balancing"):
+            load_balancer.ReadBalancer("https://host", "random")
+
+    @pytest.mark.parametrize(
+        "host,expected",
+        [
+            ("https://10.0.0.1", "https://10.0.0.9"),
+            ("https://10.0.0.1:8443", "https://10.0.0.9:8443"),
+        ],
+    )
+    def test_node_host(self, state_dir, host, expected):
+        balancer = load_balancer.ReadBalancer(host, "round_robin")
+        assert balancer.node_host("10.0.0.9") == expected
+
+    def test_needs_discovery(self, state_dir, mocker):
+        balancer = load_balancer.ReadBalancer("https://10.0.0.1", "round_robin")
+        assert balancer.needs_discovery() is True
+        balancer.set_nodes(["10.0.0.1", "10.0.0.2"])
+        assert balancer.needs_discovery() is False
+        # State is shared with other processes (other instances).
+        other = load_balancer.ReadBalancer("https://10.0.0.1", "round_robin")
+        assert other.needs_discovery() is False
+        mocker.patch.object(
+            load_balancer,
+            "time",
+            return_value=load_balancer.time() + load_balancer.NODE_DISCOVERY_TTL + 1,
+        )
+        assert balancer.needs_discovery() is True
+
+    def test_round_robin(self, state_dir):
+        balancer = load_balancer.ReadBalancer("https://10.0.0.1", "round_robin")
+        balancer.set_nodes(["10.0.0.1", "10.0.0.2", "10.0.0.3"])
+        hosts = balancer.get_hosts()
+        assert sorted(hosts) == [
+            "https://10.0.0.1",
+            "https://10.0.0.2",
+            "https://10.0.0.3",
+        ]
+        assert balancer.get_hosts()[0] == hosts[1]
+        assert balancer.get_hosts()[0] == hosts[2]
+        assert balancer.get_hosts()[0] == hosts[0]
+
+    def test_health_is_shared(self, state_dir, mocker):
+        balancer = load_balancer.ReadBalancer("https://vip", "least_latency")
+        balancer.set_nodes(["10.0.0.1", "10.0.0.2"])
+        update_state = mocker.spy(balancer, "_update_state")
+        balancer.get_hosts()
+        balancer.report_success("https://10.0.0.1", 0.1)
+        # Latency is kept in memory, nothing is written.
+        update_state.assert_not_called()
+        other = load_balancer.ReadBalancer("https://vip", "least_latency")
+        assert other.state["nodes"]["https://10.0.0.1"]["latency"] is None
+
+        balancer.report_failure("https://10.0.0.2")
+        assert update_state.call_count == 1
+        other = load_balancer.ReadBalancer("https://vip", "least_latency")
+        assert other.get_hosts() == ["https://10.0.0.1", "https://vip"]
+
+        balancer.report_success("https://10.0.0.2", 0.2)
+        assert update_state.call_count == 2
+        other = load_balancer.ReadBalancer("https://vip", "least_latency")
+        assert "https://10.0.0.2" in other.get_hosts()
+
+    def test_least_latency(self, state_dir):
+        balancer = load_balancer.ReadBalancer("https://vip", "least_latency")
+        balancer.set_nodes(["10.0.0.1", "10.0.0.2", "10.0.0.3"])
+        balancer.report_success("https://10.0.0.1", 0.5)
+        balancer.report_success("https://10.0.0.2", 0.1)
+        # Node without measurement is tried first, primary host is always last.
+        assert balancer.get_hosts() == [
+            "https://10.0.0.3",
+            "https://10.0.0.2",
+            "https://10.0.0.1",
+            "https://vip",
+        ]
+        balancer.report_success("https://10.0.0.3", 0.3)
+        assert balancer.get_hosts()[0] == "https://10.0.0.2"
+
+    def test_failed_node_is_skipped(self, state_dir, mocker):
+        balancer = load_balancer.ReadBalancer("https://10.0.0.1", "round_robin")
+        balancer.set_nodes(["10.0.0.1", "10.0.0.2"])
+        balancer.report_failure("https://10.0.0.2")
+        assert balancer.get_hosts() == ["https://10.0.0.1"]
+        assert balancer.get_hosts() == ["https://10.0.0.1"]
+        # After NODE_DOWN_PERIOD node is tried again.
+        mocker.patch.object(
+            load_balancer,
+            "time",
+            return_value=load_balancer.time() + load_balancer.NODE_DOWN_PERIOD + 1,
+        )
+        assert "https://10.0.0.2" in balancer.get_hosts()
+
+
+class TestClientBalancedGet:
+    @staticmethod
+    def get_client(mocker, responses):
+        c = client.Client(
+            "https://10.0.0.1", "user", "pass", None, read_balancing="round_robin"
+        )
+        request_mock = mocker.patch.object(c, "_request")
+        request_mock.side_effect = responses
+        return c, request_mock
+
+    def test_discovery_and_round_robin(self, state_dir, mocker):
+        nodes = client.Response(
+            200, '[{"lanIP": "10.0.0.1"}, {"lanIP": "10.0.0.2"}]', None
+        )
+        ok = client.Response(200, "[]", None)
+        c, request_mock = self.get_client(mocker, [nodes, ok, ok, ok])
+
+        c.get("/rest/v1/VirDomain")
+        c.get("/rest/v1/VirDomain")
+        c.post("/rest/v1/VirDomain", data={})
+
+        urls = [call.args[1] for call in request_mock.call_args_list]
+        assert urls[0] == "https://10.0.0.1/rest/v1/Node"
+        # GETs go to both nodes in turn.
+        assert sorted(urls[1:3]) == [
+            "https://10.0.0.1/rest/v1/VirDomain",
+            "https://10.0.0.2/rest/v1/VirDomain",
+        ]
+        # Writes always go to the primary host.
+        assert urls[3] == "https://10.0.0.1/rest/v1/VirDomain"
+
+    def test_failover(self, state_dir, mocker):
+        c, request_mock = self.get_client(
+            mocker,
+            [
+                client.Response(
+                    200, '[{"lanIP": "10.0.0.2"}, {"lanIP": "10.0.0.3"}]', None
+                ),
+                ConnectionRefusedError("refused"),
+                client.Response(503, "", None),
+                client.Response(200, '[{"uuid": "vm"}]', None),
+            ],
+        )
+
+        assert c.get("/rest/v1/VirDomain").json == [{"uuid": "vm"}]
+
+        urls = [call.args[1] for call in request_mock.call_args_list]
+        assert urls[0] == "https://10.0.0.1/rest/v1/Node"
+        assert sorted(urls[1:3]) == [
+            "https://10.0.0.2/rest/v1/VirDomain",
+            "https://10.0.0.3/rest/v1/VirDomain",
+        ]
+        assert urls[3] == "https://10.0.0.1/rest/v1/VirDomain"
+        # Both nodes are marked down, next GET goes directly to primary host.
+        assert c.balancer.get_hosts() == ["https://10.0.0.1"]
+
+    def test_auth_error_is_not_retried(self, state_dir, mocker):
+        c, request_mock = self.get_client(
+            mocker,
+            [
+                client.Response(200, '[{"lanIP": "10.0.0.2"}]', None),
+                errors.AuthError("bad password"),
+            ],
+        )
+        with pytest.raises(errors.AuthError):
+            c.get("/rest/v1/VirDomain")
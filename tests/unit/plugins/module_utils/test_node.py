@@ -6,7 +6,11 @@ import sys
 
 import pytest
 
-from ansible_collections.scale_computing.hypercore.plugins.module_utils.node import Node
+from ansible_collections.scale_computing.hypercore.plugins.module_utils import errors
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.node import (
+    Node,
+    NodeDirectory,
+)
 from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
     MIN_PYTHON_VERSION,
 )
@@ -104,3 +108,74 @@ class TestNode:
             lan_ip="10.0.0.1",
             peer_id=1,
         )
+
+    def test_get_node_lists_nodes_once(self, rest_client):
+        rest_client.list_records.return_value = NODES
+        node_directory = NodeDirectory(rest_client)
+
+        Node.get_node({"uuid": "node-1"}, rest_client, node_directory=node_directory)
+        Node.get_node(
+            {"lanIP": "10.0.0.11"}, rest_client, node_directory=node_directory
+        )
+        Node.get_node({"uuid": ""}, rest_client, node_directory=node_directory)
+
+        rest_client.list_records.assert_called_once_with("/rest/v1/Node")
+        rest_client.get_record.assert_not_called()
+
+
+NODES = [
+    dict(uuid="node-1", backplaneIP="10.0.0.1", lanIP="10.0.0.11", peerID=1),
+    dict(uuid="node-2", backplaneIP="10.0.0.2", lanIP="10.0.0.12", peerID=2),
+    dict(uuid="node-3", backplaneIP="10.0.0.3", lanIP="10.0.0.12", peerID=3),
+]
+
+
+class TestNodeDirectory:
+    @pytest.mark.parametrize(
+        "query,expected_uuid",
+        [
+            ({"uuid": "node-2"}, "node-2"),
+            ({"backplaneIP": "10.0.0.3"}, "node-3"),
+            ({"lanIP": "10.0.0.11"}, "node-1"),
+            ({"peerID": 2}, "node-2"),
+            ({"lanIP": "10.0.0.12", "peerID": 3}, "node-3"),
+        ],
+    )
+    def test_get(self, rest_client, query, expected_uuid):
+        rest_client.list_records.return_value = NODES
+
+        assert NodeDirectory(rest_client).get(query).node_uuid == expected_uuid
+
+    def test_lazy(self, rest_client):
+        NodeDirectory(rest_client)
+
+        rest_client.list_records.assert_not_called()
+
+    def test_get_missing(self, rest_client):
+        rest_client.list_records.return_value = NODES
+        directory = NodeDirectory(rest_client)
+
+        assert directory.get({"uuid": ""}) is None
+        with pytest.raises(
+            errors.ScaleComputingError,
+            match="No records from endpoint /rest/v1/Node match",
+        ):
+            directory.get({"uuid": "node-4"}, must_exist=True)
+
+    def test_get_not_unique(self, rest_client):
+        rest_client.list_records.return_value = NODES
+
+        with pytest.raises(
+            errors.ScaleComputingError,
+            match="2 records from endpoint /rest/v1/Node match",
+        ):
+            NodeDirectory(rest_client).get({"lanIP": "10.0.0.12"})
+
+    def test_list(self, rest_client):
+        rest_client.list_records.return_value = NODES
+
+        assert [node.node_uuid for node in NodeDirectory(rest_client).list()] == [
+            "node-1",
+            "node-2",
+            "node-3",
+        ]
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+# # Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import fcntl
+import os
+import sys
+
+import pytest
+
+from ansible_collections.scale_computing.hypercore.plugins.module_utils import (
+    client,
+    read_cache,
+    rest_client,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
+    MIN_PYTHON_VERSION,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < MIN_PYTHON_VERSION,
+    reason=f"requires python{MIN_PYTHON_VERSION[0]}.{MIN_PYTHON_VERSION[1]} or higher",
+)
+
+
+@pytest.fixture
+def state_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("SC_STATE_DIR", str(tmp_path))
+    return tmp_path
+
+
+class TestReadCache:
+    def test_get_cache_disabled(self, state_dir):
+        assert read_cache.ReadCache.get_cache("https://host") is None
+
+    @pytest.mark.parametrize(
+        "endpoint,expected_ttl",
+        [
+            ("/rest/v1/VirDomain", 5),
+            ("/rest/v1/VirDomain/7a1b", 5),
+            ("/rest/v1/VirDomainSnapshot", 30),
+            ("/rest/v1/Node", 600),
+            ("/rest/v1/ISO", 0),
+            ("/rest/v1/TaskTag/123", 0),
+        ],
+    )
+    def test_get_ttl(self, state_dir, endpoint, expected_ttl):
+        cache = read_cache.ReadCache(
+            "https://host",
+            ttl=30,
+            endpoint_ttl={
+                "/rest/v1/VirDomain": 5,
+                "/rest/v1/Node/": 600,
+                "/rest/v1/ISO": 0,
+                "/rest/v1/TaskTag": 100,
+            },
+        )
+        assert cache.get_ttl(endpoint) == expected_ttl
+
+    def test_put_and_get(self, state_dir):
+        cache = read_cache.ReadCache("https://host", ttl=30)
+        assert cache.get("/rest/v1/Node") is None
+        cache.put("/rest/v1/Node", [{"uuid": "node-1"}], read_cache.time())
+        # Other process sees the same entry.
+        other = read_cache.ReadCache("https://host", ttl=30)
+        assert other.get("/rest/v1/Node") == [{"uuid": "node-1"}]
+        assert (other.hits, other.misses) == (1, 0)
+        # Different host has its own cache.
+        assert (
+            read_cache.ReadCache("https://other", ttl=30).get("/rest/v1/Node") is None
+        )
+
+    def test_per_credentials(self, state_dir):
+        cache = read_cache.ReadCache("https://host", "user", "pass", ttl=30)
+        cache.put("/rest/v1/Node", [{"uuid": "node-1"}], read_cache.time())
+        assert read_cache.ReadCache("https://host", "user", "pass", ttl=30).get(
+            "/rest/v1/Node"
+        ) == [{"uuid": "node-1"}]
+        for username, password in (("other", "pass"), ("user", "wrong")):
+            other = read_cache.ReadCache("https://host", username, password, ttl=30)
+            assert other.get("/rest/v1/Node") is None
+
+    def test_invalidate_all_credentials(self, state_dir):
+        cache = read_cache.ReadCache("https://host", "user", "pass", ttl=30)
+        cache.put("/rest/v1/Node", [], read_cache.time() - 1)
+        read_cache.ReadCache("https://host", "other", "pass", ttl=30).invalidate()
+        assert cache.get("/rest/v1/Node") is None
+
+    def test_file_mode(self, state_dir):
+        cache = read_cache.ReadCache("https://host", "user", "pass", ttl=30)
+        cache.put("/rest/v1/Node", [], read_cache.time())
+        with cache.lock("/rest/v1/Node"):
+            pass
+        cache.invalidate()
+        cache.put("/rest/v1/Node", [], read_cache.time())
+        paths = [
+            cache._entry_path("/rest/v1/Node"),
+            cache._entry_path("/rest/v1/Node")[: -len(".json")] + ".lock",
+            cache.marker_path,
+        ]
+        for path in paths:
+            assert os.stat(path).st_mode & 0o777 == 0o600
+
+    def test_expired(self, state_dir, mocker):
+        cache = read_cache.ReadCache("https://host", ttl=30)
+        now = read_cache.time()
+        cache.put("/rest/v1/Node", [], now - 31)
+        assert cache.get("/rest/v1/Node") is None
+        cache.put("/rest/v1/Node", [], now - 29)
+        assert cache.get("/rest/v1/Node") == []
+
+    def test_invalidate(self, state_dir):
+        cache = read_cache.ReadCache("https://host", ttl=30)
+        fetched_at = read_cache.time() - 1
+        cache.put("/rest/v1/Node", [], fetched_at)
+        cache.invalidate()
+        assert cache.get("/rest/v1/Node") is None
+        # Response fetched before the write is not stored.
+        cache.put("/rest/v1/Node", [], fetched_at)
+        assert cache.get("/rest/v1/Node") is None
+
+    def test_lru_eviction(self, state_dir):
+        cache = read_cache.ReadCache("https://host", ttl=30, max_size=250)
+        now = read_cache.time()
+        records = [{"name": "x" * 50}]
+        cache.put("/rest/v1/A", records, now)
+        cache.put("/rest/v1/B", records, now)
+        entry_a = cache._entry_path("/rest/v1/A")
+        entry_b = cache._entry_path("/rest/v1/B")
+        # A is used more recently than B
+        os.utime(entry_b, (now - 10, now))
+        os.utime(entry_a, (now - 5, now))
+        cache.put("/rest/v1/C", records, now)
+        assert not os.path.exists(entry_b)
+        assert cache.get("/rest/v1/A") == records
+        assert cache.get("/rest/v1/C") == records
+
+
+class TestCachedRestClientPersistentCache:
+    def test_shared_between_invocations(self, state_dir, mocker):
+        responses = []
+        for _ in range(2):
+            client_obj = client.Client(
+                "https://thehost", "user", "pass", None, cache_ttl=60
+            )
+            client_mock = mocker.patch.object(client_obj, "get")
+            client_mock.return_value = client.Response(200, '[{"name": "vm0"}]', "")
+            cached_client = rest_client.CachedRestClient(client=client_obj)
+            responses.append(cached_client.list_records("/rest/v1/VirDomain"))
+            responses.append(client_mock.call_count)
+        # Second module invocation is served from persistent cache.
+        assert responses == [[{"name": "vm0"}], 1, [{"name": "vm0"}], 0]
+
+    def test_write_invalidates(self, state_dir, mocker):
+        client_obj = client.Client(
+            "https://thehost", "user", "pass", None, cache_ttl=60
+        )
+        client_obj.read_cache.put("/rest/v1/VirDomain", [], read_cache.time() - 1)
+        mocker.patch.object(client_obj, "_send").return_value = client.Response(
+            200, '{"taskTag": "1"}', ""
+        )
+
+        client_obj.post("/rest/v1/VirDomain", data={})
+
+        assert client_obj.read_cache.get("/rest/v1/VirDomain") is None
+
+    def test_error_response_not_cached(self, state_dir, mocker):
+        client_obj = client.Client(
+            "https://thehost", "user", "pass", None, cache_ttl=60
+        )
+        mocker.patch.object(client_obj, "get").return_value = client.Response(
+            404, "[]", ""
+        )
+        cached_client = rest_client.CachedRestClient(client=client_obj)
+        cached_client.list_records("/rest/v1/VirDomain/missing")
+        assert client_obj.read_cache.get("/rest/v1/VirDomain/missing") is None
+
+
+class TestCoalescedGet:
+    @staticmethod
+    def get_client(mocker, responses, **kwargs):
+        c = client.Client(
+            "https://thehost", "user", "pass", None, coalesce_window=5, **kwargs
+        )
+        request_mock = mocker.patch.object(c, "_request")
+        request_mock.side_effect = responses
+        return c, request_mock
+
+    def test_coalesce_disabled(self, state_dir):
+        c = client.Client("https://thehost", "user", "pass", None)
+        assert c.read_cache is None
+
+    def test_identical_gets_are_coalesced(self, state_dir, mocker):
+        leader, leader_mock = self.get_client(
+            mocker, [client.Response(200, b'[{"name": "vm0"}]', {"X-A": "b"})]
+        )
+        follower, follower_mock = self.get_client(mocker, [])
+
+        assert leader.get("/rest/v1/VirDomain").json == [{"name": "vm0"}]
+        response = follower.get("/rest/v1/VirDomain")
+
+        assert response.status == 200
+        assert response.json == [{"name": "vm0"}]
+        assert response.headers == {"x-a": "b"}
+        assert leader_mock.call_count == 1
+        follower_mock.assert_not_called()
+        # Coalescing alone does not enable the persistent cache.
+        assert leader.read_cache.get("/rest/v1/VirDomain") is None
+
+    def test_entry_is_locked_while_fetching(self, state_dir, mocker):
+        c, request_mock = self.get_client(mocker, [])
+        lock_path = c.read_cache._entry_path("GET rest/v1/VirDomain")[:-5] + ".lock"
+
+        def request(*args, **kwargs):
+            with open(lock_path, "a+") as probe:
+                with pytest.raises(OSError):
+                    fcntl.flock(probe, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return client.Response(200, "[]", None)
+
+        request_mock.side_effect = request
+        c.get("/rest/v1/VirDomain")
+        request_mock.assert_called_once()
+
+    def test_different_query_is_not_coalesced(self, state_dir, mocker):
+        ok = client.Response(200, "[]", None)
+        c, request_mock = self.get_client(mocker, [ok, ok])
+        c.get("/rest/v1/VirDomain", query=dict(a="1"))
+        c.get("/rest/v1/VirDomain", query=dict(a="2"))
+        assert request_mock.call_count == 2
+
+    def test_error_and_task_tag_are_not_coalesced(self, state_dir, mocker):
+        c, request_mock = self.get_client(
+            mocker,
+            [
+                client.Response(404, "{}", None),
+                client.Response(404, "{}", None),
+                client.Response(200, "[]", None),
+                client.Response(200, "[]", None),
+            ],
+        )
+        c.get("/rest/v1/VirDomain/missing")
+        c.get("/rest/v1/VirDomain/missing")
+        c.get("/rest/v1/TaskTag/123")
+        c.get("/rest/v1/TaskTag/123")
+        assert request_mock.call_count == 4
+
+    def test_write_discards_shared_response(self, state_dir, mocker):
+        ok = client.Response(200, "[]", None)
+        c, request_mock = self.get_client(
+            mocker, [ok, client.Response(200, '{"taskTag": "1"}', None), ok]
+        )
+        c.get("/rest/v1/VirDomain")
+        c.post("/rest/v1/VirDomain", data={})
+        c.get("/rest/v1/VirDomain")
+        assert request_mock.call_count == 3
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# # Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+
+import pytest
+
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.record_store import (
+    RecordStore,
+    get_value,
+    _MISSING,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
+    MIN_PYTHON_VERSION,
+    is_superset,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < MIN_PYTHON_VERSION,
+    reason=f"requires python{MIN_PYTHON_VERSION[0]}.{MIN_PYTHON_VERSION[1]} or higher",
+)
+
+RECORDS = [
+    dict(uuid="d1", type="VIRTIO_DISK", slot=0, tags=["a"], info=dict(name="x")),
+    dict(uuid="d2", type="VIRTIO_DISK", slot=1, tags=["b"], info=dict(name="y")),
+    dict(uuid="d3", type="IDE_CDROM", slot=0, tags=["a"], info=None),
+    dict(uuid="d4", type="IDE_CDROM", slot=1),
+]
+
+
+class TestGetValue:
+    @pytest.mark.parametrize(
+        "record,key,expected",
+        [
+            (dict(a=1), "a", 1),
+            (dict(a=None), "a", None),
+            (dict(a=1), "b", _MISSING),
+            (dict(a=dict(b=dict(c=3))), "a.b.c", 3),
+            (dict(a=dict(b=1)), "a.c", _MISSING),
+            (dict(a=None), "a.b", _MISSING),
+            ({"a.b": 1, "a": dict(b=2)}, "a.b", 1),
+            ("not-a-dict", "a", _MISSING),
+        ],
+    )
+    def test_get_value(self, record, key, expected):
+        assert get_value(record, key) is expected or get_value(record, key) == expected
+
+
+class TestRecordStore:
+    @pytest.mark.parametrize(
+        "query",
+        [
+            None,
+            dict(),
+            dict(uuid="d2"),
+            dict(uuid="missing"),
+            dict(type="IDE_CDROM", slot=1),
+            dict(slot=0),
+            dict(tags=["a"]),
+            dict(info=None),
+        ],
+    )
+    def test_find_matches_is_superset(self, query):
+        store = RecordStore(RECORDS)
+        expected = [record for record in RECORDS if is_superset(record, query)]
+        assert store.find(query) == expected
+        # Second query is served from the index
+        assert store.find(query) == expected
+
+    def test_find_nested_key(self):
+        store = RecordStore(RECORDS)
+        assert store.find({"info.name": "y"}) == [RECORDS[1]]
+        assert store.find({"info.name": "z"}) == []
+
+    def test_index_built_once(self):
+        store = RecordStore(RECORDS)
+        store.find(dict(type="VIRTIO_DISK", slot=1))
+        store.find(dict(slot=0, type="IDE_CDROM"))
+        store.find(dict(uuid="d1"))
+        assert sorted(store._indexes) == [("slot", "type"), ("uuid",)]
+
+    def test_positions(self):
+        store = RecordStore(RECORDS)
+        assert store.positions(dict(slot=1)) == [1, 3]
+        assert store.positions(dict(tags=["a"])) == [0, 2]
+        assert store.positions() == [0, 1, 2, 3]
+
+    def test_find_one(self):
+        store = RecordStore(RECORDS)
+        assert store.find_one(dict(uuid="d3")) == RECORDS[2]
+        assert store.find_one(dict(uuid="d9")) is None
+
+    def test_non_dict_records(self):
+        store = RecordStore(["result"])
+        assert store.find() == ["result"]
+        assert store.find(dict(a="b")) == []
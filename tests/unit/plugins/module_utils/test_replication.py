@@ -11,6 +11,7 @@ import sys
 
 import pytest
 
+from ansible_collections.scale_computing.hypercore.plugins.module_utils import errors
 from ansible_collections.scale_computing.hypercore.plugins.module_utils.replication import (
     Replication,
 )
@@ -60,6 +61,7 @@ class TestGet:
             "vm_name": "test-vm",
         }
         remote_cluster_dict = {
+            "uuid": "7890f2ab-3r9a-89ff-5k91-3gdahgh47ghg",
             "remoteClusterInfo": {"clusterName": "remote-cluster-name"},
             "connectionStatus": "status",
             "replicationOK": "ok",
@@ -89,16 +91,10 @@ class TestGet:
             "machineType": "scale-7.2",
             "sourceVirDomainUUID": "",
         }
-        mocker.patch(
-            "ansible_collections.scale_computing.hypercore.plugins.module_utils.vm.Node.get_node"
-        ).return_value = None
-        mocker.patch(
-            "ansible_collections.scale_computing.hypercore.plugins.module_utils.vm.SnapshotSchedule.get_snapshot_schedule"
-        ).return_value = None
-        rest_client.get_record.return_value = remote_cluster_dict
         rest_client.list_records.side_effect = [
             [hypercore_data],
             [vm_dict],
+            [remote_cluster_dict],
         ]
         results = Replication.get(
             rest_client=rest_client,
@@ -108,6 +104,27 @@ class TestGet:
         assert results.state == "disabled"
         assert results.connection_uuid == "7890f2ab-3r9a-89ff-5k91-3gdahgh47ghg"
         assert results.vm_uuid == "7542f2gg-5f9a-51ff-8a91-8ceahgf47ghg"
+        assert results.vm_name == "XLAB_test_vm"
+        assert results.remote_cluster == "remote-cluster-name"
+        # Replications, VMs and cluster connections are each read only once.
+        assert rest_client.list_records.call_count == 3
+        rest_client.get_record.assert_not_called()
+
+    def test_get_source_vm_missing(self, rest_client):
+        rest_client.list_records.side_effect = [
+            [
+                {
+                    "sourceDomainUUID": "vm-uuid",
+                    "uuid": "replication-uuid",
+                    "enable": True,
+                    "connectionUUID": "connection-uuid",
+                }
+            ],
+            [],
+            [],
+        ]
+        with pytest.raises(errors.VMNotFound):
+            Replication.get(rest_client=rest_client, query=None)
 
 
 class TestCreateFromHypercore:
@@ -90,6 +90,24 @@ class TestRole:
             uuid="51e6d073-7566-4273-9196-58720117bd7f",
         )
 
+    def test_get_role_map(self, rest_client):
+        rest_client.list_records.return_value = [
+            dict(name="Admin", uuid="51e6d073-7566-4273-9196-58720117bd7f"),
+            dict(name="Read", uuid="7224a2bd-5a08-4b99-a0de-9977089c66a4"),
+        ]
+
+        role_map = Role.get_role_map(rest_client)
+
+        rest_client.list_records.assert_called_once_with("/rest/v1/Role")
+        assert role_map == {
+            "51e6d073-7566-4273-9196-58720117bd7f": Role(
+                name="Admin", uuid="51e6d073-7566-4273-9196-58720117bd7f"
+            ),
+            "7224a2bd-5a08-4b99-a0de-9977089c66a4": Role(
+                name="Read", uuid="7224a2bd-5a08-4b99-a0de-9977089c66a4"
+            ),
+        }
+
     def test_get_role_from_name(self, rest_client):
         role_name = "Admin"
         rest_client.get_record.return_value = dict(
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# # Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+
+import pytest
+
+from ansible_collections.scale_computing.hypercore.plugins.module_utils import (
+    errors,
+    task_tag,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.task_tag import (
+    TaskProgress,
+    TaskTag,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
+    MIN_PYTHON_VERSION,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < MIN_PYTHON_VERSION,
+    reason=f"requires python{MIN_PYTHON_VERSION[0]}.{MIN_PYTHON_VERSION[1]} or higher",
+)
+
+
+@pytest.fixture
+def clock(mocker):
+    # Fake clock, sleep advances it.
+    now = [1000.0]
+    mocker.patch.object(task_tag, "time", side_effect=lambda: now[0])
+    mocker.patch.object(
+        task_tag,
+        "sleep",
+        side_effect=lambda seconds: now.__setitem__(0, now[0] + seconds),
+    )
+    return now
+
+
+def status(state, progress=None, message=""):
+    return dict(state=state, progressPercent=progress, formattedMessage=message)
+
+
+class TestTaskProgress:
+    def test_add(self, clock):
+        lines = []
+        progress = TaskProgress(log=lines.append)
+
+        for elapsed, task_status in (
+            (1, status("QUEUED")),
+            (2, status("RUNNING", 0)),
+            (3, status("RUNNING", 0)),
+            (6, status("RUNNING", 30, "Copying disk 1")),
+        ):
+            clock[0] = 1000.0 + elapsed
+            progress.add("1234", task_status)
+
+        assert progress.rate == 7.5
+        assert progress.eta == 9.3
+        assert progress.to_ansible() == dict(
+            task_tag="1234",
+            duration=6.0,
+            rate=7.5,
+            eta=9.3,
+            timeline=[
+                dict(time=1.0, state="QUEUED", progress=None, message=None),
+                dict(time=2.0, state="RUNNING", progress=0, message=None),
+                dict(time=6.0, state="RUNNING", progress=30, message="Copying disk 1"),
+            ],
+        )
+        assert lines == [
+            "Task 1234: QUEUED",
+            "Task 1234: RUNNING 0%",
+            "Task 1234: RUNNING 30% (7.5 %/s, ETA 9.3 s) - Copying disk 1",
+        ]
+
+    def test_add_finished(self, clock):
+        progress = TaskProgress()
+
+        progress.add("1234", status("RUNNING"))
+        clock[0] += 2
+        progress.add("1234", status("COMPLETE"))
+
+        assert progress.rate is None
+        assert progress.eta == 0.0
+        assert [sample["state"] for sample in progress.timeline] == [
+            "RUNNING",
+            "COMPLETE",
+        ]
+
+
+class TestWaitTask:
+    def test_wait_task_progress(self, rest_client, clock):
+        rest_client.get_record.side_effect = [
+            status("RUNNING", 10),
+            status("RUNNING", 50),
+            status("RUNNING", 50),
+            status("COMPLETE", 100),
+        ]
+        progress = TaskProgress()
+
+        TaskTag.wait_task(rest_client, dict(taskTag="1234"), progress=progress)
+
+        assert [
+            (sample["time"], sample["progress"]) for sample in progress.timeline
+        ] == [(0.0, 10), (1.0, 50), (3.0, 100)]
+        assert progress.rate == 30.0
+        assert progress.eta == 0.0
+
+    def test_wait_task_progress_error(self, rest_client, clock):
+        rest_client.get_record.return_value = status("ERROR", 20, "Disk full")
+        progress = TaskProgress()
+
+        with pytest.raises(errors.ScaleComputingError):
+            TaskTag.wait_task(rest_client, dict(taskTag="1234"), progress=progress)
+
+        assert progress.timeline == [
+            dict(time=0.0, state="ERROR", progress=20, message="Disk full")
+        ]
+
+    def test_wait_task_no_task(self, rest_client):
+        progress = TaskProgress()
+
+        TaskTag.wait_task(rest_client, dict(taskTag=""), progress=progress)
+
+        assert progress.to_ansible()["task_tag"] is None
+        assert progress.timeline == []
+
+    def test_wait_task_no_wait(self, rest_client):
+        progress = TaskProgress()
+
+        TaskTag.wait_task(
+            rest_client,
+            dict(taskTag="1234", createdUUID="uuid"),
+            progress=progress,
+            wait=False,
+        )
+
+        assert progress.task == dict(taskTag="1234", createdUUID="uuid")
+        rest_client.get_record.assert_not_called()
+
+
+class TestWaitTasks:
+    def test_wait_tasks_states(self, rest_client, clock):
+        rest_client.get_record.side_effect = [
+            status("RUNNING"),
+            status("COMPLETE"),
+            None,
+        ]
+
+        states = TaskTag.wait_tasks(
+            rest_client, [dict(taskTag="1"), dict(taskTag="2"), dict(taskTag="")]
+        )
+
+        assert states == {"1": "COMPLETE", "2": "COMPLETE"}
+
+    def test_wait_tasks_no_raise(self, rest_client, clock):
+        rest_client.get_record.side_effect = [
+            status("ERROR"),
+            status("COMPLETE"),
+        ]
+
+        states = TaskTag.wait_tasks(
+            rest_client, [dict(taskTag="1"), dict(taskTag="2")], raise_errors=False
+        )
+
+        assert states == {"1": "ERROR", "2": "COMPLETE"}
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# # Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import csv
+import os
+import sys
+
+import pytest
+
+from ansible_collections.scale_computing.hypercore.plugins.module_utils import (
+    time_zone_catalog,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
+    MIN_PYTHON_VERSION,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < MIN_PYTHON_VERSION,
+    reason=f"requires python{MIN_PYTHON_VERSION[0]}.{MIN_PYTHON_VERSION[1]} or higher",
+)
+
+ZONESPEC = os.path.join(
+    os.path.dirname(time_zone_catalog.__file__), "date_time_zonespec.csv"
+)
+
+
+def normalize(offset):
+    # "+01:00:00" or "00:00:00" to "+01:00"
+    return (offset if offset[0] in "+-" else "+" + offset)[:6]
+
+
+class TestTimeZoneCatalog:
+    def test_catalog_matches_zonespec(self):
+        with open(ZONESPEC) as zonespec:
+            rows = list(csv.DictReader(zonespec))
+
+        assert time_zone_catalog.get_zones() == frozenset(row["ID"] for row in rows)
+        for row in rows:
+            assert time_zone_catalog._load()[row["ID"]] == (
+                normalize(row["GMT offset"]),
+                normalize(row["DST adjustment"]),
+            )
+
+    @pytest.mark.parametrize(
+        "zone,expected",
+        [
+            ("US/Eastern", True),
+            ("Europe/Ljubljana", True),
+            ("UTC", True),
+            ("Unsupported/Zone", False),
+            ("Europe", False),
+            (None, False),
+        ],
+    )
+    def test_is_supported(self, zone, expected):
+        assert time_zone_catalog.is_supported(zone) is expected
+
+    @pytest.mark.parametrize(
+        "zone,expected",
+        [
+            ("Europe/Ljubljana", dict(standard="+01:00", daylight_saving="+02:00")),
+            ("America/St_Johns", dict(standard="-03:30", daylight_saving="-02:30")),
+            ("Asia/Katmandu", dict(standard="+05:45", daylight_saving=None)),
+            ("UTC", dict(standard="+00:00", daylight_saving=None)),
+            ("Unsupported/Zone", None),
+            (None, None),
+        ],
+    )
+    def test_get_offset(self, zone, expected):
+        assert time_zone_catalog.get_offset(zone) == expected
@@ -55,11 +55,10 @@ class TestUser:
         assert User.from_hypercore([]) is None
 
     def test_user_to_ansible(self, mocker, rest_client):
-        mocker.patch(
-            "ansible_collections.scale_computing.hypercore.plugins.module_utils.user.Role.get_role_from_uuid"
-        ).side_effect = [
-            Role(name="Cluster Settings", uuid="38b346c6-a626-444b-b6ab-92ecd671afc0"),
-            Role(name="Cluster Shutdown", uuid="7224a2bd-5a08-4b99-a0de-9977089c66a4"),
+        rest_client.list_records.return_value = [
+            dict(name="Cluster Settings", uuid="38b346c6-a626-444b-b6ab-92ecd671afc0"),
+            dict(name="Cluster Shutdown", uuid="7224a2bd-5a08-4b99-a0de-9977089c66a4"),
+            dict(name="Admin", uuid="51e6d073-7566-4273-9196-58720117bd7f"),
         ]
 
         user = User(
@@ -89,6 +88,31 @@ class TestUser:
         )
 
         assert user.to_ansible(rest_client) == ansible_dict
+        # All roles are read with a single request.
+        rest_client.list_records.assert_called_once_with("/rest/v1/Role")
+
+    def test_user_to_ansible_with_role_map(self, rest_client):
+        role_map = {
+            "38b346c6-a626-444b-b6ab-92ecd671afc0": Role(
+                name="Cluster Settings", uuid="38b346c6-a626-444b-b6ab-92ecd671afc0"
+            ),
+        }
+        user = User(
+            full_name="fullname",
+            role_uuids=[
+                "38b346c6-a626-444b-b6ab-92ecd671afc0",
+                "deleted-role-uuid",
+            ],
+            session_limit=0,
+            username="username",
+            uuid="51e6d073-7566-4273-9196-58720117bd7f",
+        )
+
+        assert user.to_ansible(rest_client, role_map)["roles"] == [
+            dict(name="Cluster Settings", uuid="38b346c6-a626-444b-b6ab-92ecd671afc0")
+        ]
+        rest_client.list_records.assert_not_called()
+        rest_client.get_record.assert_not_called()
 
     def test_user_equal_true(self):
         user1 = User(
@@ -7,11 +7,15 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import os
 import sys
 
 import pytest
 
-from ansible_collections.scale_computing.hypercore.plugins.module_utils import utils
+from ansible_collections.scale_computing.hypercore.plugins.module_utils import (
+    errors,
+    utils,
+)
 from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
     MIN_PYTHON_VERSION,
 )
@@ -94,3 +98,75 @@ class TestFilterResults:
         assert utils.filter_results(
             [dict(a=1), dict(b=1), dict(a=1, b=2)], dict(a=1)
         ) == [dict(a=1), dict(a=1, b=2)]
+
+
+class TestDrain:
+    def test_drain(self):
+        records = [1, 2, 3]
+        drained = utils.drain(records)
+
+        assert next(drained) == 1
+        assert sorted(records) == [2, 3]
+        assert list(drained) == [2, 3]
+        assert records == []
+
+
+class TestGetStateDir:
+    def test_get_state_dir(self, tmp_path, monkeypatch):
+        base_dir = tmp_path / "state"
+        monkeypatch.setenv("SC_STATE_DIR", str(base_dir))
+
+        path = utils.get_state_dir("https://10.5.11.200:443", "limiter")
+
+        assert path == str(base_dir / "https_10.5.11.200_443" / "limiter")
+        assert (base_dir.stat().st_mode & 0o777) == 0o700
+
+    def test_default_dir_per_user(self, tmp_path, monkeypatch, mocker):
+        monkeypatch.delenv("SC_STATE_DIR", raising=False)
+        mocker.patch.object(utils.tempfile, "gettempdir", return_value=str(tmp_path))
+
+        path = utils.get_state_dir("host")
+
+        assert path == str(
+            tmp_path / "scale_computing_hypercore-{0}".format(os.getuid()) / "host"
+        )
+
+    def test_accessible_to_others(self, tmp_path, monkeypatch):
+        base_dir = tmp_path / "state"
+        base_dir.mkdir(mode=0o755)
+        base_dir.chmod(0o755)
+        monkeypatch.setenv("SC_STATE_DIR", str(base_dir))
+
+        with pytest.raises(errors.ScaleComputingError, match="not accessible"):
+            utils.get_state_dir("host")
+
+    def test_owned_by_other_user(self, tmp_path, monkeypatch, mocker):
+        monkeypatch.setenv("SC_STATE_DIR", str(tmp_path))
+        mocker.patch.object(utils.os, "getuid", return_value=os.getuid() + 1)
+
+        with pytest.raises(errors.ScaleComputingError, match="owned by the current"):
+            utils.get_state_dir("host")
+
+
+class TestPayloadMapperSlots:
+    @staticmethod
+    def get_subclasses(cls):
+        for subclass in cls.__subclasses__():
+            yield subclass
+            yield from TestPayloadMapperSlots.get_subclasses(subclass)
+
+    def test_subclasses_have_no_instance_dict(self):
+        # Import all module_utils, so that all subclasses are registered.
+        import importlib
+        import pkgutil
+        from ansible_collections.scale_computing.hypercore.plugins import module_utils
+
+        for module_info in pkgutil.iter_modules(module_utils.__path__):
+            importlib.import_module(
+                "{0}.{1}".format(module_utils.__name__, module_info.name)
+            )
+
+        subclasses = list(self.get_subclasses(utils.PayloadMapper))
+        assert len(subclasses) > 20
+        for subclass in subclasses:
+            assert "__dict__" not in dir(subclass), subclass
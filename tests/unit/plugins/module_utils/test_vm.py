@@ -239,9 +239,67 @@ class TestVM:
             replication_source_vm_uuid="64c9b3a1-3eab-4d16-994f-177bed274f84",
         )
 
+    @staticmethod
+    def _get_nic(vlan, mac, uuid):
+        nic = Nic()
+        nic.vlan = vlan
+        nic.mac = mac
+        nic.uuid = uuid
+        return nic
+
+    @staticmethod
+    def _get_vm_with_devices():
+        return VM(
+            name="VM-name",
+            memory=42,
+            vcpu=2,
+            disks=[
+                Disk(type="virtio_disk", slot=0, uuid="disk-0"),
+                Disk(type="virtio_disk", slot=1, uuid="disk-1"),
+                Disk(type="ide_cdrom", slot=1, uuid="cdrom-1"),
+            ],
+            nics=[
+                TestVM._get_nic(1, "12-34-56-78-AB", "nic-1"),
+                TestVM._get_nic(2, "12-34-56-78-CD", "nic-2"),
+            ],
+        )
+
     def test_find_disk(self):
-        # TODO (domen): Write tests for find_disk, if necessary
-        pass
+        vm = self._get_vm_with_devices()
+
+        assert vm.find_disk(0).uuid == "disk-0"
+        assert vm.find_disk(5) is None
+        with pytest.raises(errors.DeviceNotUnique):
+            vm.find_disk(1)
+
+    def test_device_lookups_reuse_index(self, mocker):
+        vm = self._get_vm_with_devices()
+        disk_to_ansible = mocker.spy(Disk, "to_ansible")
+        nic_to_ansible = mocker.spy(Nic, "to_ansible")
+
+        boot_order = vm.set_boot_devices_order(
+            [
+                dict(type="nic", nic_vlan=2),
+                dict(type="ide_cdrom", disk_slot=1),
+                dict(type="virtio_disk", disk_slot=0),
+                dict(type="virtio_disk", disk_slot=7),
+                dict(type="nic", nic_vlan=1),
+            ]
+        )
+
+        assert boot_order == ["nic-2", "cdrom-1", "disk-0", "nic-1"]
+        # Every device is converted once, not once per lookup
+        assert disk_to_ansible.call_count == 3
+        assert nic_to_ansible.call_count == 2
+
+    def test_device_index_reset_on_new_devices(self):
+        vm = self._get_vm_with_devices()
+        assert vm.find_nic(vlan=1)[0].uuid == "nic-1"
+
+        vm.nics = [TestVM._get_nic(1, "12-34-56-78-EF", "nic-new")]
+
+        assert vm.find_nic(vlan=1)[0].uuid == "nic-new"
+        assert vm.get_specific_nic(dict(vlan=1))["uuid"] == "nic-new"
 
     def test_equal_true(self):
         assert VM(
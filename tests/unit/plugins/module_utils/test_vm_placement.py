@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+# # Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+
+import pytest
+
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.vm_placement import (
+    PlacementPlan,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
+    MIN_PYTHON_VERSION,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < MIN_PYTHON_VERSION,
+    reason=f"requires python{MIN_PYTHON_VERSION[0]}.{MIN_PYTHON_VERSION[1]} or higher",
+)
+
+GIB = 1024**3
+
+
+def node(number, mem_size=100 * GIB, **fields):
+    return dict(
+        dict(
+            uuid="node-{0}".format(number),
+            lanIP="10.0.0.{0}".format(number),
+            memSize=mem_size,
+        ),
+        **fields,
+    )
+
+
+def vm(name, mem_gib, preferred="", backup="", node_uuid="", tags="", strict=False):
+    return dict(
+        uuid=name + "-uuid",
+        name=name,
+        mem=mem_gib * GIB,
+        numVCPU=2,
+        tags=tags,
+        nodeUUID=node_uuid,
+        affinityStrategy=dict(
+            strictAffinity=strict,
+            preferredNodeUUID=preferred,
+            backupNodeUUID=backup,
+        ),
+    )
+
+
+def all_uuids(vm_dicts):
+    return set(vm_dict["uuid"] for vm_dict in vm_dicts)
+
+
+def placement(plan):
+    return dict((vm.name, (vm.preferred, vm.backup)) for vm in plan.vms)
+
+
+class TestPlacementPlan:
+    def test_balanced_cluster_is_not_changed(self):
+        vms = [
+            vm("a", 10, "node-1", "node-2"),
+            vm("b", 10, "node-2", "node-1"),
+        ]
+        plan = PlacementPlan([node(1), node(2)], vms, all_uuids(vms))
+
+        assert plan.plan() == []
+
+    def test_hotspot_is_spread(self):
+        vms = [
+            vm("a", 30, "node-1", "node-2"),
+            vm("b", 20, "node-1", "node-2"),
+            vm("c", 10, "node-1", "node-2"),
+        ]
+        plan = PlacementPlan([node(1), node(2), node(3)], vms, all_uuids(vms))
+
+        changed = plan.plan()
+
+        assert sorted(vm.name for vm in changed) == ["a", "b"]
+        assert set(vm.preferred for vm in plan.vms) == set(
+            ["node-1", "node-2", "node-3"]
+        )
+        assert all(vm.backup != vm.preferred for vm in plan.vms)
+        summary = dict((item["node_uuid"], item) for item in plan.node_summary())
+        assert summary["node-1"]["before"] == dict(memory=60 * GIB, vcpu=6, vms=3)
+        assert summary["node-1"]["after"] == dict(memory=10 * GIB, vcpu=2, vms=1)
+        assert summary["node-1"]["memory_limit"] == 100 * GIB
+
+    def test_running_node_is_used_without_preferred_node(self):
+        vms = [vm("a", 10, node_uuid="node-1"), vm("b", 10, node_uuid="node-1")]
+        plan = PlacementPlan([node(1), node(2)], vms, all_uuids(vms))
+
+        plan.plan()
+
+        assert placement(plan) == dict(a=("node-2", "node-1"), b=("node-1", "node-2"))
+
+    def test_memory_limit(self):
+        vms = [vm("a", 60, "node-1"), vm("b", 30, "node-1"), vm("c", 60, "node-2")]
+        plan = PlacementPlan(
+            [node(1), node(2)], vms, all_uuids(vms), max_memory_percent=80
+        )
+
+        plan.plan()
+
+        # b does not fit on node-2 (60 + 30 > 80).
+        assert plan.vms[1].preferred == "node-1"
+
+    def test_unplaced_vm_does_not_overcommit(self):
+        vms = [vm("a", 70, "node-1"), vm("b", 70, "node-2"), vm("c", 20)]
+        plan = PlacementPlan(
+            [node(1), node(2)], vms, all_uuids(vms), max_memory_percent=80
+        )
+
+        changed = plan.plan()
+
+        assert plan.vms[2].preferred is None
+        assert plan.vms[2].backup is None
+        assert [vm.name for vm in plan.unplaced] == ["c"]
+        assert "c" not in [vm.name for vm in changed]
+        assert all(item["after"]["memory"] == 70 * GIB for item in plan.node_summary())
+
+    def test_pinned_and_strict_vms_keep_nodes(self):
+        vms = [
+            vm("a", 30, "node-1"),
+            vm("b", 30, "node-1", strict=True),
+            vm("c", 30, "node-1"),
+        ]
+        plan = PlacementPlan([node(1), node(2)], vms, all_uuids(vms) - set(["a-uuid"]))
+
+        changed = plan.plan()
+
+        assert [vm.name for vm in changed] == ["c"]
+        assert placement(plan) == dict(
+            a=("node-1", None), b=("node-1", None), c=("node-2", "node-1")
+        )
+
+    def test_anti_affinity(self):
+        vms = [
+            vm("db-1", 10, "node-1", tags="db"),
+            vm("db-2", 10, "node-1", tags="db"),
+            vm("web-1", 10, "node-2", tags="web"),
+            vm("web-2", 10, "node-2", tags="web"),
+        ]
+        plan = PlacementPlan(
+            [node(1), node(2)], vms, all_uuids(vms), anti_affinity_tags=["db"]
+        )
+
+        plan.plan()
+
+        assert plan.vms[0].preferred != plan.vms[1].preferred
+        assert plan.vms[0].backup != plan.vms[1].backup
+
+    def test_max_moves(self):
+        vms = [vm("vm-{0}".format(i), 10, "node-1", "node-2") for i in range(6)]
+        plan = PlacementPlan(
+            [node(1), node(2), node(3)], vms, all_uuids(vms), max_moves=1
+        )
+
+        plan.plan()
+
+        assert sum(1 for vm in plan.vms if vm.preferred != "node-1") == 1
+
+    def test_nodes_not_allowed_to_run_vms(self):
+        vms = [vm("a", 10, "node-1"), vm("b", 10)]
+        plan = PlacementPlan(
+            [node(1, allowRunningVMs=False), node(2)], vms, all_uuids(vms)
+        )
+
+        plan.plan()
+
+        assert placement(plan) == dict(a=("node-2", None), b=("node-2", None))
+        assert [item["node_uuid"] for item in plan.node_summary()] == ["node-2"]
+
+    def test_unknown_memory_size(self):
+        vms = [vm("a", 10, "node-1"), vm("b", 10, "node-1")]
+        plan = PlacementPlan(
+            [node(1, mem_size=None), node(2, mem_size=None)], vms, all_uuids(vms)
+        )
+
+        plan.plan()
+
+        assert set(vm.preferred for vm in plan.vms) == set(["node-1", "node-2"])
+        assert plan.node_summary()[0]["memory_limit"] is None
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# # Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+
+import pytest
+
+from ansible_collections.scale_computing.hypercore.plugins.module_utils import errors
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.vm_selector import (
+    VMIndex,
+    VMSelector,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
+    MIN_PYTHON_VERSION,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < MIN_PYTHON_VERSION,
+    reason=f"requires python{MIN_PYTHON_VERSION[0]}.{MIN_PYTHON_VERSION[1]} or higher",
+)
+
+VMS = [
+    dict(uuid="1", name="web-1", tags="prod,web", state="RUNNING", nodeUUID="n1"),
+    dict(uuid="2", name="web-2", tags="dev,web", state="SHUTOFF", nodeUUID="n2"),
+    dict(uuid="3", name="db-1", tags="prod,db", state="RUNNING", nodeUUID="n2"),
+    dict(uuid="4", name="test", tags="", state="PAUSED", nodeUUID="n1"),
+]
+
+NODES = [
+    dict(uuid="n1", lanIP="10.0.0.1", backplaneIP="10.1.0.1"),
+    dict(uuid="n2", lanIP="10.0.0.2", backplaneIP="10.1.0.2"),
+]
+
+
+def list_records(endpoint, query=None):
+    return dict(
+        [("/rest/v1/VirDomain", VMS), ("/rest/v1/Node", NODES)],
+    )[endpoint]
+
+
+class TestVMIndex:
+    def test_index(self):
+        index = VMIndex(VMS)
+
+        assert index.by_name["db-1"] == [2]
+        assert index.by_tag == dict(prod=[0, 2], web=[0, 1], dev=[1], db=[2])
+
+    def test_tagged(self):
+        index = VMIndex(VMS)
+
+        assert index.tagged(["web", "prod"], match_all=True) == [0]
+        assert index.tagged(["web", "db"], match_all=False) == [0, 1, 2]
+        assert index.tagged(["web", "missing"], match_all=True) == []
+        assert index.tagged([], match_all=False) == []
+
+    def test_get_by_names(self):
+        index = VMIndex(VMS)
+
+        assert index.get_by_names(["db-1", "missing"]) == [VMS[2]]
+        with pytest.raises(errors.VMNotFound, match="missing"):
+            index.get_by_names(["db-1", "missing"], must_exist=True)
+
+
+class TestVMSelector:
+    @pytest.mark.parametrize(
+        "selector,expected_uuids",
+        [
+            (dict(), ["1", "2", "3", "4"]),
+            (dict(tags=["prod"]), ["1", "3"]),
+            (dict(tags=["prod", "web"]), ["1"]),
+            (dict(tags=["prod", "web"], tags_match="any"), ["1", "2", "3"]),
+            (dict(name="web-*"), ["1", "2"]),
+            (dict(name="test"), ["4"]),
+            (dict(name_regex=r"-\d$"), ["1", "2", "3"]),
+            (dict(power_state=["started", "paused"]), ["1", "3", "4"]),
+            (dict(node="n2"), ["2", "3"]),
+            (dict(node="10.0.0.1"), ["1", "4"]),
+            (dict(node="10.1.0.2", tags=["prod"]), ["3"]),
+            (dict(tags=["web"], name="*-2", power_state=["stopped"]), ["2"]),
+        ],
+    )
+    def test_select(self, rest_client, selector, expected_uuids):
+        rest_client.list_records.side_effect = list_records
+
+        vm_dicts = VMSelector.from_ansible(selector).select(rest_client)
+
+        assert [vm_dict["uuid"] for vm_dict in vm_dicts] == expected_uuids
+
+    def test_select_lists_vms_once(self, rest_client):
+        rest_client.list_records.side_effect = list_records
+
+        VMSelector(tags=["web"]).select(rest_client)
+
+        rest_client.list_records.assert_called_once_with("/rest/v1/VirDomain")
+
+    def test_select_with_index(self, rest_client):
+        index = VMIndex(VMS)
+
+        assert VMSelector(tags=["db"]).select(rest_client, index) == [VMS[2]]
+        rest_client.list_records.assert_not_called()
+
+    def test_missing_node(self, rest_client):
+        rest_client.list_records.side_effect = list_records
+
+        with pytest.raises(errors.ScaleComputingError, match="not found"):
+            VMSelector(node="10.9.9.9").select(rest_client)
+
+    def test_invalid_regex(self):
+        with pytest.raises(errors.ScaleComputingError, match="Invalid name_regex"):
+            VMSelector(name_regex="web-(")
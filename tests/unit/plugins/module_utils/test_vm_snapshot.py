@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# # Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+
+import pytest
+
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.vm_snapshot import (
+    VMSnapshot,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
+    MIN_PYTHON_VERSION,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < MIN_PYTHON_VERSION,
+    reason=f"requires python{MIN_PYTHON_VERSION[0]}.{MIN_PYTHON_VERSION[1]} or higher",
+)
+
+
+def get_snapshot(uuid, vm_uuid, vm_name, serial, label):
+    return dict(
+        uuid=uuid,
+        domainUUID=vm_uuid,
+        domain=dict(name=vm_name, snapshotSerialNumber=serial),
+        timestamp=123,
+        label=label,
+        type="USER",
+        automatedTriggerTimestamp=0,
+        localRetainUntilTimestamp=0,
+        remoteRetainUntilTimestamp=0,
+        blockCountDiffFromSerialNumber=2,
+        replication=True,
+    )
+
+
+SNAPSHOTS = [
+    get_snapshot("snap-1", "vm-1-uuid", "vm-1", 1, "daily"),
+    get_snapshot("snap-2", "vm-1-uuid", "vm-1", 2, "weekly"),
+    get_snapshot("snap-3", "vm-2-uuid", "vm-2", 1, "daily"),
+]
+
+
+class TestFilterSnapshotsByParams:
+    @staticmethod
+    def list_records(endpoint, query=None):
+        if endpoint == "/rest/v1/VirDomain":
+            vms = [
+                dict(uuid="vm-1-uuid", name="vm-1"),
+                dict(uuid="vm-2-uuid", name="vm-2"),
+            ]
+            return [vm for vm in vms if vm["name"] == query["name"]]
+        assert endpoint == "/rest/v1/VirDomainSnapshot"
+        return list(SNAPSHOTS)
+
+    @pytest.mark.parametrize(
+        "params,expected_uuids",
+        [
+            (
+                dict(vm_name=None, serial=None, label=None),
+                ["snap-1", "snap-2", "snap-3"],
+            ),
+            (dict(vm_name="vm-1", serial=None, label=None), ["snap-1", "snap-2"]),
+            (dict(vm_name=None, serial=1, label=None), ["snap-1", "snap-3"]),
+            (dict(vm_name=None, serial=None, label="daily"), ["snap-1", "snap-3"]),
+            (dict(vm_name="vm-2", serial=1, label="daily"), ["snap-3"]),
+            (dict(vm_name="vm-2", serial=None, label="weekly"), []),
+        ],
+    )
+    def test_filter(self, rest_client, params, expected_uuids):
+        rest_client.list_records.side_effect = self.list_records
+
+        results = VMSnapshot.filter_snapshots_by_params(params, rest_client)
+
+        assert [snapshot["snapshot_uuid"] for snapshot in results] == expected_uuids
+
+    def test_filter_result_is_converted(self, rest_client):
+        rest_client.list_records.side_effect = self.list_records
+
+        results = VMSnapshot.filter_snapshots_by_params(
+            dict(vm_name=None, serial=2, label=None), rest_client
+        )
+
+        assert results == [
+            dict(
+                snapshot_uuid="snap-2",
+                vm=dict(name="vm-1", uuid="vm-1-uuid", snapshot_serial_number=2),
+                timestamp=123,
+                label="weekly",
+                type="USER",
+                automated_trigger_timestamp=0,
+                local_retain_until_timestamp=0,
+                remote_retain_until_timestamp=0,
+                block_count_diff_from_serial_number=2,
+                replication=True,
+            )
+        ]
+
+    def test_missing_vm_skips_snapshot_listing(self, rest_client):
+        rest_client.list_records.side_effect = self.list_records
+
+        results = VMSnapshot.filter_snapshots_by_params(
+            dict(vm_name="missing", serial=None, label=None), rest_client
+        )
+
+        assert results == []
+        rest_client.list_records.assert_called_once_with(
+            "/rest/v1/VirDomain", {"name": "missing"}
+        )
+
+    def test_iter_is_lazy(self, rest_client, mocker):
+        rest_client.list_records.side_effect = self.list_records
+        from_hypercore = mocker.spy(VMSnapshot, "from_hypercore")
+
+        snapshots = VMSnapshot.iter_snapshots_by_params(
+            dict(vm_name=None, serial=None, label=None), rest_client
+        )
+        next(snapshots)
+
+        assert from_hypercore.call_count == 1
+
+    def test_raw_records_are_released(self, rest_client):
+        raw_records = list(SNAPSHOTS)
+        rest_client.list_records.return_value = raw_records
+
+        snapshots = VMSnapshot.iter_snapshots_by_params(
+            dict(vm_name=None, serial=None, label=None), rest_client
+        )
+        next(snapshots)
+
+        # Converted record is not referenced by the listing anymore
+        assert len(raw_records) == 2
+        assert SNAPSHOTS[0] not in raw_records
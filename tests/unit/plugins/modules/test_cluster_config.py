@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+# # Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+
+import pytest
+
+from ansible_collections.scale_computing.hypercore.plugins.module_utils import errors
+from ansible_collections.scale_computing.hypercore.plugins.modules import (
+    cluster_config,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
+    MIN_PYTHON_VERSION,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < MIN_PYTHON_VERSION,
+    reason=f"requires python{MIN_PYTHON_VERSION[0]}.{MIN_PYTHON_VERSION[1]} or higher",
+)
+
+RECORDS = {
+    "/rest/v1/Cluster": [
+        dict(uuid="cluster-uuid", clusterName="cluster-a", icosVersion="9.2.11.210763")
+    ],
+    "/rest/v1/DNSConfig": [
+        dict(
+            uuid="dns-uuid",
+            searchDomains=["example.com"],
+            serverIPs=["1.1.1.1"],
+            latestTaskTag={},
+        )
+    ],
+    "/rest/v1/TimeSource": [
+        dict(uuid="ts-uuid", host="pool.ntp.org", latestTaskTag={})
+    ],
+    "/rest/v1/TimeZone": [
+        dict(uuid="tz-uuid", timeZone="Europe/Ljubljana", latestTaskTag={})
+    ],
+    "/rest/v1/AlertSMTPConfig": [
+        dict(
+            uuid="smtp-uuid",
+            smtpServer="smtp.example.com",
+            port=25,
+            useSSL=False,
+            useAuth=False,
+            authUser="",
+            authPassword="",
+            fromAddress="cluster@example.com",
+            latestTaskTag={},
+        )
+    ],
+    "/rest/v1/AlertEmailTarget": [
+        dict(
+            uuid="email-1",
+            alertTagUUID="0",
+            emailAddress="old@example.com",
+            resendDelay=86400,
+            silentPeriod=900,
+            latestTaskTag={},
+        ),
+        dict(
+            uuid="email-2",
+            alertTagUUID="0",
+            emailAddress="keep@example.com",
+            resendDelay=86400,
+            silentPeriod=900,
+            latestTaskTag={},
+        ),
+    ],
+    "/rest/v1/AlertSyslogTarget": [
+        dict(
+            uuid="syslog-1",
+            alertTagUUID="0",
+            host="10.0.0.10",
+            port=514,
+            protocol="SYSLOG_PROTOCOL_UDP",
+            resendDelay=86400,
+            silentPeriod=900,
+            latestTaskTag={},
+        ),
+    ],
+}
+
+CONFIG = dict(
+    name="cluster-a",
+    dns=dict(server_ips=["1.1.1.1"], search_domains=["example.com"]),
+    time_server="pool.ntp.org",
+    time_zone="Europe/Ljubljana",
+    smtp=dict(server="smtp.example.com", port=25, from_address="cluster@example.com"),
+    email_alerts=["old@example.com", "keep@example.com"],
+    syslog_servers=[dict(host="10.0.0.10", port=514, protocol="udp")],
+)
+
+
+@pytest.fixture
+def api(rest_client):
+    rest_client.list_records.side_effect = lambda endpoint: RECORDS.get(endpoint, [])
+    return rest_client
+
+
+def get_params(config, **params):
+    return dict(dict(config=config, max_concurrency=5), **params)
+
+
+class TestGetSections:
+    @pytest.mark.parametrize(
+        "config,expected",
+        [
+            (dict(), []),
+            (dict(name="", dns=None, smtp={}), []),
+            (dict(time_zone="UTC", name="a"), ["name", "time_zone"]),
+            (dict(email_alerts=[], syslog_servers=None), ["email_alerts"]),
+        ],
+    )
+    def test_get_sections(self, config, expected):
+        assert cluster_config.get_sections(config) == expected
+
+
+class TestRun:
+    def test_no_changes(self, create_module, api):
+        module = create_module(params=get_params(CONFIG))
+
+        changed, operations, diff = cluster_config.run(module, api)
+
+        assert changed is False
+        assert operations == []
+        assert diff["before"] == diff["after"]
+        assert sorted(diff["before"]) == sorted(CONFIG)
+        api.update_record.assert_not_called()
+        api.create_record.assert_not_called()
+
+    def test_check_mode(self, create_module, api, mocker):
+        run_tasks = mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.cluster_config.run_tasks"
+        )
+        module = create_module(
+            params=get_params(
+                dict(
+                    name="cluster-b",
+                    dns=dict(server_ips=["2.2.2.2", "2.2.2.2", ""]),
+                    email_alerts=["keep@example.com", "new@example.com"],
+                    syslog_servers=[],
+                )
+            ),
+            check_mode=True,
+        )
+
+        changed, operations, diff = cluster_config.run(module, api)
+
+        assert changed is True
+        assert operations == [
+            dict(section="name", description="set cluster name"),
+            dict(section="dns", description="update DNS configuration"),
+            dict(section="email_alerts", description="remove old@example.com"),
+            dict(section="email_alerts", description="add new@example.com"),
+            dict(section="syslog_servers", description="remove 10.0.0.10"),
+        ]
+        assert diff["before"]["dns"] == dict(
+            server_ips=["1.1.1.1"], search_domains=["example.com"]
+        )
+        assert diff["after"]["dns"] == dict(
+            server_ips=["2.2.2.2"], search_domains=["example.com"]
+        )
+        assert diff["after"]["syslog_servers"] == []
+        run_tasks.assert_not_called()
+
+    def test_run(self, create_module, api, mocker):
+        run_tasks = mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.cluster_config.run_tasks"
+        )
+        run_tasks.return_value = [
+            dict(task_tag="t1", state="COMPLETE", error=None, duration=1.0),
+            dict(task_tag="t2", state="COMPLETE", error=None, duration=2.0),
+        ]
+        module = create_module(
+            params=get_params(
+                dict(time_zone="UTC", time_server="ntp.example.com"),
+                max_concurrency=3,
+            )
+        )
+
+        changed, operations, diff = cluster_config.run(module, api)
+
+        assert changed is True
+        assert operations == [
+            dict(
+                section="time_server",
+                description="update time server",
+                task_tag="t1",
+                duration=1.0,
+            ),
+            dict(
+                section="time_zone",
+                description="update time zone",
+                task_tag="t2",
+                duration=2.0,
+            ),
+        ]
+        assert diff == dict(
+            before=dict(time_server="pool.ntp.org", time_zone="Europe/Ljubljana"),
+            after=dict(time_server="ntp.example.com", time_zone="UTC"),
+        )
+        assert run_tasks.call_args.kwargs["max_concurrency"] == 3
+
+        start = run_tasks.call_args.args[2]
+        for operation in run_tasks.call_args.args[1]:
+            start(operation)
+        api.update_record.assert_any_call(
+            "/rest/v1/TimeSource/ts-uuid", dict(host="ntp.example.com"), False
+        )
+        api.update_record.assert_any_call(
+            "/rest/v1/TimeZone/tz-uuid", dict(timeZone="UTC"), False
+        )
+
+    def test_run_create(self, create_module, rest_client, mocker):
+        rest_client.list_records.return_value = []
+        run_tasks = mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.cluster_config.run_tasks"
+        )
+        run_tasks.return_value = [
+            dict(task_tag="t1", state="COMPLETE", error=None, duration=1.0),
+        ]
+        module = create_module(
+            params=get_params(dict(smtp=dict(server="smtp.example.com", port=25)))
+        )
+
+        changed, operations, diff = cluster_config.run(module, rest_client)
+
+        assert changed is True
+        assert diff["before"] == dict(smtp=None)
+        start = run_tasks.call_args.args[2]
+        start(run_tasks.call_args.args[1][0])
+        rest_client.create_record.assert_called_once_with(
+            "/rest/v1/AlertSMTPConfig",
+            dict(
+                smtpServer="smtp.example.com",
+                port=25,
+                useSSL=False,
+                authUser="",
+                authPassword="",
+                fromAddress="",
+            ),
+            False,
+        )
+
+    def test_run_syslog_update(self, create_module, api, mocker):
+        run_tasks = mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.cluster_config.run_tasks"
+        )
+        run_tasks.return_value = [
+            dict(task_tag=None, state="COMPLETE", error=None, duration=1.0),
+        ]
+        update = mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.cluster_config.SyslogServer.update"
+        )
+        module = create_module(
+            params=get_params(
+                dict(syslog_servers=[dict(host="10.0.0.10", port=514, protocol="tcp")])
+            )
+        )
+
+        changed, operations, diff = cluster_config.run(module, api)
+
+        assert operations[0]["description"] == "update 10.0.0.10"
+        start = run_tasks.call_args.args[2]
+        assert start(run_tasks.call_args.args[1][0]) is None
+        update.assert_called_once_with(
+            api, dict(host="10.0.0.10", port=514, protocol="SYSLOG_PROTOCOL_TCP")
+        )
+
+    def test_run_failed(self, create_module, api, mocker):
+        mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.cluster_config.run_tasks"
+        ).return_value = [
+            dict(task_tag="t1", state="ERROR", error="bad", duration=1.0),
+        ]
+        module = create_module(params=get_params(dict(time_zone="UTC")))
+
+        with pytest.raises(
+            errors.ScaleComputingError,
+            match="Failed to apply 1 of 1 cluster configuration changes: "
+            "time_zone \\(update time zone\\): bad",
+        ):
+            cluster_config.run(module, api)
+
+
+class TestPlan:
+    @pytest.mark.parametrize(
+        "version,supported",
+        [("9.2.11.210763", True), ("9.1.21.1", True), ("9.2.10.1", False)],
+    )
+    def test_plan_name_version(self, rest_client, version, supported):
+        records = [dict(uuid="cluster-uuid", clusterName="a", icosVersion=version)]
+
+        if supported:
+            before, after, operations = cluster_config.plan_name(
+                rest_client, "b", records
+            )
+            assert (before, after, len(operations)) == ("a", "b", 1)
+        else:
+            with pytest.raises(
+                errors.ScaleComputingError,
+                match="version=9.2.10.1 does not match required version",
+            ):
+                cluster_config.plan_name(rest_client, "b", records)
+        rest_client.get_record.assert_not_called()
+
+    def test_plan_name_unchanged_any_version(self, rest_client):
+        records = [dict(uuid="cluster-uuid", clusterName="a", icosVersion="9.1.0.1")]
+
+        assert cluster_config.plan_name(rest_client, "a", records) == ("a", "a", [])
+
+    def test_plan_time_zone_unsupported(self, rest_client):
+        with pytest.raises(
+            errors.ScaleComputingError, match="Time zone Europe not supported"
+        ):
+            cluster_config.plan_time_zone(rest_client, "Europe", [])
+
+
+class TestMain:
+    def setup_method(self):
+        self.cluster_instance = dict(
+            host="https://0.0.0.0",
+            username="admin",
+            password="admin",
+        )
+
+    def test_fail(self, run_main):
+        success, result = run_main(
+            cluster_config,
+            dict(
+                cluster_instance=self.cluster_instance,
+                config=dict(syslog_servers=[dict(port=514)]),
+            ),
+        )
+
+        assert success is False
+        assert "host" in result["msg"]
+
+    def test_params(self, run_main):
+        params = dict(
+            cluster_instance=self.cluster_instance,
+            config=dict(
+                CONFIG,
+                registration=dict(
+                    company_name="Example",
+                    contact="John Doe",
+                    phone="123",
+                    email="john@example.com",
+                ),
+                oidc=dict(
+                    client_id="id",
+                    shared_secret="secret",
+                    config_url="https://example.com",
+                    scopes="openid",
+                ),
+            ),
+            max_concurrency=2,
+        )
+        success, result = run_main(cluster_config, params)
+
+        assert success is True
@@ -32,6 +32,7 @@ class TestEnsureAbsent:
                     username="admin",
                     password="admin",
                 ),
+                wait=True,
                 name="ISO-image-name",
                 state="absent",
             ),
@@ -95,6 +96,7 @@ class TestEnsurePresent:
                     username="admin",
                     password="admin",
                 ),
+                wait=True,
                 name="ISO-image-name",
                 state="present",
                 source="/path/to/source",
@@ -165,6 +167,7 @@ class TestEnsurePresent:
                     username="admin",
                     password="admin",
                 ),
+                wait=True,
                 name="ISO-image-name",
                 source="/path/to/source",
                 state="present",
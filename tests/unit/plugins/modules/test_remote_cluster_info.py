@@ -72,18 +72,15 @@ class TestRun:
             ),
         )
 
-        rest_client.list_records.return_value = [
-            dict(
-                remoteClusterInfo={"clusterName": "PUB4"},
-                connectionStatus="ESTABLISHED",
-                replicationOK=True,
-                remoteNodeIPs=["10.5.11.11"],
-                remoteNodeUUIDs=["895033ed-b863-4a42-8215-477a1a4ef812"],
-            )
-        ]
+        # PUB4 is filtered out by the nested key query
+        rest_client.list_records.return_value = []
 
         result = remote_cluster_info.run(module, rest_client)
         assert result == []
+        rest_client.list_records.assert_called_once_with(
+            "/rest/v1/RemoteClusterConnection",
+            {"remoteClusterInfo.clusterName": "PUB3"},
+        )
 
     def test_run_records_present_without_query(self, create_module, rest_client):
         module = create_module(
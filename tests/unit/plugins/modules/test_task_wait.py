@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# # Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+
+import pytest
+
+from ansible_collections.scale_computing.hypercore.plugins.module_utils import errors
+from ansible_collections.scale_computing.hypercore.plugins.modules import task_wait
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
+    MIN_PYTHON_VERSION,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < MIN_PYTHON_VERSION,
+    reason=f"requires python{MIN_PYTHON_VERSION[0]}.{MIN_PYTHON_VERSION[1]} or higher",
+)
+
+
+@pytest.fixture
+def no_sleep(mocker):
+    mocker.patch(
+        "ansible_collections.scale_computing.hypercore.plugins.module_utils.task_tag.sleep"
+    )
+
+
+class TestRun:
+    def test_run_task_tags(self, create_module, rest_client, no_sleep):
+        states = dict(t1=["RUNNING", "COMPLETE"], t2=["COMPLETE"])
+        rest_client.get_record.side_effect = lambda endpoint, query: dict(
+            state=states[endpoint.split("/")[-1]].pop(0)
+        )
+        module = create_module(
+            params=dict(
+                task_tag=None,
+                task_tags=[
+                    dict(taskTag="t1", createdUUID="uuid-1"),
+                    None,
+                    dict(taskTag="t2", createdUUID=""),
+                    dict(taskTag="", createdUUID="uuid-3"),
+                ],
+            )
+        )
+
+        changed, record, diff, records = task_wait.run(module, rest_client)
+
+        assert changed is False
+        assert records == [
+            dict(task_tag="t1", created_uuid="uuid-1", state="COMPLETE"),
+            dict(task_tag="t2", created_uuid="", state="COMPLETE"),
+        ]
+
+    def test_run_task_tags_failed(self, create_module, rest_client, no_sleep):
+        states = dict(t1="ERROR", t2="COMPLETE")
+        rest_client.get_record.side_effect = lambda endpoint, query: dict(
+            state=states[endpoint.split("/")[-1]]
+        )
+        module = create_module(
+            params=dict(
+                task_tag=None, task_tags=[dict(taskTag="t1"), dict(taskTag="t2")]
+            )
+        )
+
+        with pytest.raises(errors.BulkError, match="1 of 2 tasks: t1") as exc_info:
+            task_wait.run(module, rest_client)
+
+        assert exc_info.value.records == [
+            dict(task_tag="t1", created_uuid=None, state="ERROR"),
+            dict(task_tag="t2", created_uuid=None, state="COMPLETE"),
+        ]
+
+    def test_run_task_tag(self, create_module, rest_client, mocker):
+        wait_task = mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.task_wait.TaskTag.wait_task"
+        )
+        module = create_module(params=dict(task_tag=dict(taskTag="t1"), task_tags=None))
+
+        assert task_wait.run(module, rest_client) == (False, None, None, None)
+        wait_task.assert_called_once_with(
+            rest_client, dict(taskTag="t1"), progress=None
+        )
+
+
+class TestMain:
+    def setup_method(self):
+        self.cluster_instance = dict(
+            host="https://0.0.0.0",
+            username="admin",
+            password="admin",
+        )
+
+    def test_fail(self, run_main):
+        success, result = run_main(
+            task_wait, dict(cluster_instance=self.cluster_instance)
+        )
+
+        assert success is False
+        assert "one of the following is required: task_tag, task_tags" in (
+            result["msg"]
+        )
+
+    def test_params(self, run_main_with_reboot):
+        params = dict(
+            cluster_instance=self.cluster_instance,
+            task_tags=[dict(taskTag="t1", createdUUID=""), None],
+        )
+        success, result = run_main_with_reboot(task_wait, params)
+
+        assert success is True
@@ -104,6 +104,17 @@ class TestModifyTimeZone:
 
             time_zone.modify_time_zone(module, rest_client)
 
+    def test_modify_time_zone_unsupported_zone_before_api_calls(
+        self, create_module, rest_client
+    ):
+        module = create_module(params=dict(zone="Europe"))
+
+        with pytest.raises(errors.ScaleComputingError, match="Europe not supported"):
+            time_zone.modify_time_zone(module, rest_client)
+
+        rest_client.get_record.assert_not_called()
+        rest_client.update_record.assert_not_called()
+
 
 class TestMain:
     def setup_method(self):
@@ -127,3 +138,4 @@ class TestMain:
         success, result = run_main(time_zone, params)
 
         assert success is True
+        assert result["offset"] == dict(standard="-05:00", daylight_saving="-04:00")
@@ -56,6 +56,9 @@ class TestRun:
             ),
         ]
 
+        mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.user_info.Role.get_role_map"
+        ).return_value = {}
         mocker.patch(
             "ansible_collections.scale_computing.hypercore.plugins.modules.user_info.User.to_ansible"
         ).side_effect = [
@@ -140,6 +143,9 @@ class TestRun:
             ),
         ]
 
+        mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.user_info.Role.get_role_map"
+        ).return_value = {}
         mocker.patch(
             "ansible_collections.scale_computing.hypercore.plugins.modules.user_info.User.to_ansible"
         ).return_value = {
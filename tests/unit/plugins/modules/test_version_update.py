@@ -7,6 +7,10 @@ import sys
 import pytest
 
 from ansible_collections.scale_computing.hypercore.plugins.modules import version_update
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.hypercore_version import (
+    Update,
+    UpdateStatus,
+)
 from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
     MIN_PYTHON_VERSION,
 )
@@ -17,6 +21,93 @@ pytestmark = pytest.mark.skipif(
 )
 
 
+class TestRun:
+    @pytest.fixture
+    def update(self, mocker):
+        cluster = mocker.MagicMock(icos_version="9.1.14.208456")
+        mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.version_update.Cluster.get"
+        ).return_value = cluster
+        update = Update(
+            uuid="9.2.11.210763",
+            description="",
+            change_log="",
+            build_id=210763,
+            major_version=9,
+            minor_version=2,
+            revision=11,
+            timestamp=0,
+        )
+        mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.version_update.Update.get"
+        ).return_value = update
+        mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.version_update.Update.apply"
+        )
+        return update
+
+    def test_run_no_wait(self, create_module, rest_client, update, mocker):
+        wait_mock = mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.version_update.UpdateStatus.wait"
+        )
+        module = create_module(
+            params=dict(
+                cluster_instance=dict(
+                    host="https://0.0.0.0", username="admin", password="admin"
+                ),
+                icos_version="9.2.11.210763",
+                wait=False,
+                wait_timeout=10800,
+            )
+        )
+
+        changed, record, diff, wait_result = version_update.run(module, rest_client)
+
+        assert changed is True
+        assert record["uuid"] == "9.2.11.210763"
+        assert wait_result == dict(task_tag=version_update.Update.apply.return_value)
+        wait_mock.assert_not_called()
+
+    def test_run_wait(self, create_module, rest_client, update, mocker):
+        status = UpdateStatus(
+            prepare_status="",
+            update_status="COMPLETE",
+            from_build="208456",
+            to_build="210763",
+            to_version="9.2.11.210763",
+            percent="100",
+            update_status_details="",
+            usernotes="",
+        )
+        timeline = [
+            dict(time=0.0, update_status="IN PROGRESS", percent="0"),
+            dict(time=120.0, update_status=None, error="Connection refused"),
+            dict(time=300.0, update_status="COMPLETE", percent="100"),
+        ]
+        wait_mock = mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.version_update.UpdateStatus.wait"
+        )
+        wait_mock.return_value = (status, timeline)
+        module = create_module(
+            params=dict(
+                cluster_instance=dict(
+                    host="https://0.0.0.0", username="admin", password="admin"
+                ),
+                icos_version="9.2.11.210763",
+                wait=True,
+                wait_timeout=600,
+            )
+        )
+
+        changed, record, diff, wait_result = version_update.run(module, rest_client)
+
+        assert changed is True
+        wait_mock.assert_called_once_with(rest_client, "9.2.11.210763", 600)
+        assert wait_result["update_status"]["update_status"] == "COMPLETE"
+        assert wait_result["timeline"] == timeline
+        assert "duration" in wait_result
+
+
 class TestMain:
     def test_all_params(self, run_main, mocker):
         params = dict(
@@ -10,6 +10,9 @@ from ansible_collections.scale_computing.hypercore.plugins.modules import virtua
 from ansible_collections.scale_computing.hypercore.plugins.module_utils.virtual_disk import (
     VirtualDisk,
 )
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.task_tag import (
+    TaskProgress,
+)
 from ansible_collections.scale_computing.hypercore.plugins.module_utils.errors import (
     ScaleComputingError,
 )
@@ -392,6 +395,9 @@ class TestMain:
         ).return_value = None
         success, results = run_main(virtual_disk, params)
         assert success == expected_result[0]
+        if success:
+            assert results.pop("task_tag") is None
+            assert results.pop("task_progress")["timeline"] == []
         assert results == expected_result[1]
 
 
@@ -1166,6 +1172,7 @@ class TestEnsurePresent:
                 name="foobar.qcow2",
                 source="c:/somewhere/foobar.qcow2",
                 state="present",
+                wait=True,
             )
         )
         # Does virtual_disk exist on cluster or not.
@@ -1365,6 +1372,7 @@ class TestEnsureAbsent:
                 name="foobar.qcow2",
                 source="c:/somewhere/foobar.qcow2",
                 state="absent",
+                wait=True,
             )
         )
         # Does virtual_disk exist on cluster or not.
@@ -1395,6 +1403,37 @@ class TestEnsureAbsent:
         assert isinstance(result, tuple)
         assert result == expected_result
 
+    def test_ensure_absent_virtual_disk_no_wait(self, create_module, rest_client):
+        module = create_module(
+            params=dict(
+                cluster_instance=dict(
+                    host="https://my.host.name", username="user", password="pass"
+                ),
+                name="foobar.qcow2",
+                source=None,
+                state="absent",
+                wait=False,
+            )
+        )
+        virtual_disk_obj = VirtualDisk(
+            name="foobar.qcow2",
+            uuid="disk-uuid",
+            block_size=1048576,
+            size=1073741824,
+            replication_factor=2,
+        )
+        rest_client.delete_record.return_value = dict(createdUUID="", taskTag="12")
+        progress = TaskProgress()
+
+        result = virtual_disk.ensure_absent(
+            module, rest_client, virtual_disk_obj, progress
+        )
+
+        before = virtual_disk_obj.to_ansible()
+        assert result == (True, None, dict(before=before, after=None))
+        assert progress.task == dict(createdUUID="", taskTag="12")
+        rest_client.get_record.assert_not_called()
+
 
 # Test wait_task_and_get_updated() module function.
 class TestWaitTaskAndGetUpdated:
@@ -1597,6 +1636,7 @@ class TestWaitTaskAndGetUpdated:
                 name="foobar.qcow2",
                 source="c:/somewhere/foobar.qcow2",
                 state="present",
+                wait=True,
             )
         )
         updated_virtual_disk_obj = VirtualDisk.from_hypercore(updated_virtual_disk_dict)
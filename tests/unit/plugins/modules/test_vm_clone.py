@@ -35,7 +35,14 @@ class TestMain:
         )
         success, results = run_main_info(vm_clone, params)
         assert success is True
-        assert results == {"changed": False, "msg": []}
+        assert results == {
+            "changed": False,
+            "msg": [],
+            "task_tag": None,
+            "task_progress": dict(
+                task_tag=None, duration=0.0, rate=None, eta=None, timeline=[]
+            ),
+        }
 
 
 class TestRun:
@@ -100,6 +107,7 @@ class TestRun:
                     username="admin",
                     password="admin",
                 ),
+                wait=True,
                 vm_name="XLAB-test-vm-clone",
                 source_vm_name="XLAB-test-vm",
             )
@@ -122,6 +130,7 @@ class TestRun:
                     username="admin",
                     password="admin",
                 ),
+                wait=True,
                 vm_name="XLAB-test-vm-clone",
                 source_vm_name="XLAB-test-vm",
             )
@@ -141,6 +150,7 @@ class TestRun:
                     username="admin",
                     password="admin",
                 ),
+                wait=True,
                 vm_name="XLAB-test-vm-clone",
                 source_vm_name="XLAB-test-vm",
                 tags=None,
@@ -172,6 +182,7 @@ class TestRun:
                     username="admin",
                     password="admin",
                 ),
+                wait=True,
                 vm_name="XLAB-test-vm-clone",
                 source_vm_name="XLAB-test-vm",
                 tags="bla,bla1",
@@ -205,6 +216,7 @@ class TestRun:
                     username="admin",
                     password="admin",
                 ),
+                wait=True,
                 vm_name="XLAB-test-vm-clone",
                 source_vm_name="XLAB-test-vm",
                 tags="bla,bla1",
@@ -8,6 +8,9 @@ import pytest
 
 from ansible_collections.scale_computing.hypercore.plugins.modules import vm_export
 from ansible_collections.scale_computing.hypercore.plugins.module_utils import errors
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.task_tag import (
+    TaskProgress,
+)
 from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
     MIN_PYTHON_VERSION,
 )
@@ -52,7 +55,14 @@ class TestMain:
         success, results = run_main_info(vm_export, params)
 
         assert success is True
-        assert results == {"changed": False, "msg": []}
+        assert results == {
+            "changed": False,
+            "msg": [],
+            "task_tag": None,
+            "task_progress": dict(
+                task_tag=None, duration=0.0, rate=None, eta=None, timeline=[]
+            ),
+        }
 
 
 class TestRun:
@@ -119,6 +129,7 @@ class TestRun:
                     username="admin",
                     password="admin",
                 ),
+                wait=True,
                 vm_name="XLAB-test-vm",
                 smb={
                     "server": "test-server",
@@ -158,6 +169,7 @@ class TestRun:
                     username="admin",
                     password="admin",
                 ),
+                wait=True,
                 vm_name="XLAB-test-vm",
                 smb={
                     "server": "test-server",
@@ -175,3 +187,36 @@ class TestRun:
             match="Virtual machine - {'name': 'XLAB-test-vm'} - not found",
         ):
             vm_export.run(module, rest_client)
+
+    def test_run_no_wait(self, create_module, rest_client, mocker):
+        module = create_module(
+            params=dict(
+                cluster_instance=dict(
+                    host="https://0.0.0.0",
+                    username="admin",
+                    password="admin",
+                ),
+                wait=False,
+                vm_name="XLAB-test-vm",
+                smb={
+                    "server": "test-server",
+                    "path": "/somewhere/else",
+                    "file_name": None,
+                    "username": "user",
+                    "password": "pass",
+                },
+                http_uri=None,
+            )
+        )
+        vm = mocker.Mock()
+        vm.export_vm.return_value = dict(taskTag="1234", createdUUID="")
+        mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.vm_export.VM.get_or_fail"
+        ).return_value = [vm]
+        progress = TaskProgress()
+
+        results = vm_export.run(module, rest_client, progress)
+
+        assert results == (True, "Virtual machine - XLAB-test-vm - export started.")
+        assert progress.task == dict(taskTag="1234", createdUUID="")
+        rest_client.get_record.assert_not_called()
@@ -52,7 +52,14 @@ class TestMain:
         success, results = run_main_info(vm_import, params)
 
         assert success is True
-        assert results == {"changed": False, "msg": []}
+        assert results == {
+            "changed": False,
+            "msg": [],
+            "task_tag": None,
+            "task_progress": dict(
+                task_tag=None, duration=0.0, rate=None, eta=None, timeline=[]
+            ),
+        }
 
 
 class TestRun:
@@ -118,6 +125,7 @@ class TestRun:
                     username="admin",
                     password="admin",
                 ),
+                wait=True,
                 vm_name="XLAB-test-vm",
                 smb={
                     "server": "test-server",
@@ -153,6 +161,7 @@ class TestRun:
                     username="admin",
                     password="admin",
                 ),
+                wait=True,
                 vm_name="XLAB-test-vm",
                 smb={
                     "server": "test-server",
@@ -210,6 +219,7 @@ class TestRun:
                     username="admin",
                     password="admin",
                 ),
+                wait=True,
                 vm_name="XLAB-test-vm",
                 smb={
                     "server": "test-server",
@@ -27,6 +27,7 @@ class TestRun:
                     password="admin",
                 ),
                 vm_name="VM-unique-name",
+                vm_selector=None,
             ),
         )
 
@@ -110,6 +111,7 @@ class TestRun:
                     password="admin",
                 ),
                 vm_name="VM-unique-name",
+                vm_selector=None,
                 uuid="id",
             ),
         )
@@ -117,3 +119,32 @@ class TestRun:
         rest_client.list_records.return_value = []
         result = vm_info.run(module, rest_client)
         assert result == []
+
+    def test_run_vm_selector(self, create_module, rest_client, mocker):
+        module = create_module(
+            params=dict(
+                cluster_instance=dict(
+                    host="https://0.0.0.0",
+                    username="admin",
+                    password="admin",
+                ),
+                vm_name=None,
+                vm_selector=dict(tags=["prod"], tags_match="all"),
+            ),
+        )
+        rest_client.list_records.return_value = [
+            dict(uuid="id-1", name="vm-1", tags="prod"),
+            dict(uuid="id-2", name="vm-2", tags="dev"),
+        ]
+        from_hypercore = mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.vm_info.VM.from_hypercore"
+        )
+        from_hypercore.return_value.to_ansible.return_value = dict(vm_name="vm-1")
+
+        result = vm_info.run(module, rest_client)
+
+        assert result == [dict(vm_name="vm-1")]
+        from_hypercore.assert_called_once_with(
+            dict(uuid="id-1", name="vm-1", tags="prod"), rest_client
+        )
+        rest_client.list_records.assert_called_once_with("/rest/v1/VirDomain")
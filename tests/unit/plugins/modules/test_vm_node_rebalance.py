@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# # Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+
+import pytest
+
+from ansible_collections.scale_computing.hypercore.plugins.module_utils import errors
+from ansible_collections.scale_computing.hypercore.plugins.modules import (
+    vm_node_rebalance,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
+    MIN_PYTHON_VERSION,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < MIN_PYTHON_VERSION,
+    reason=f"requires python{MIN_PYTHON_VERSION[0]}.{MIN_PYTHON_VERSION[1]} or higher",
+)
+
+GIB = 1024**3
+
+NODES = [
+    dict(uuid="node-1", lanIP="10.0.0.1", backplaneIP="10.1.0.1", memSize=64 * GIB),
+    dict(uuid="node-2", lanIP="10.0.0.2", backplaneIP="10.1.0.2", memSize=64 * GIB),
+]
+
+
+def vm(name, preferred, backup, tags=""):
+    return dict(
+        uuid=name + "-uuid",
+        name=name,
+        mem=8 * GIB,
+        numVCPU=2,
+        tags=tags,
+        state="RUNNING",
+        nodeUUID=preferred,
+        affinityStrategy=dict(
+            strictAffinity=False,
+            preferredNodeUUID=preferred,
+            backupNodeUUID=backup,
+        ),
+    )
+
+
+VMS = [
+    vm("vm-1", "node-1", "node-2", tags="prod"),
+    vm("vm-2", "node-1", "node-2", tags="prod"),
+]
+
+
+@pytest.fixture
+def api(rest_client):
+    rest_client.list_records.side_effect = lambda endpoint: dict(
+        (("/rest/v1/Node", NODES), ("/rest/v1/VirDomain", VMS))
+    )[endpoint]
+    return rest_client
+
+
+def get_params(**params):
+    return dict(
+        dict(
+            vm_selector=None,
+            pinned_vms=[],
+            anti_affinity_tags=[],
+            max_memory_percent=90,
+            max_moves=None,
+            max_concurrency=5,
+        ),
+        **params,
+    )
+
+
+class TestRun:
+    def test_check_mode(self, create_module, api, mocker):
+        run_tasks = mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.vm_node_rebalance.run_tasks"
+        )
+        module = create_module(params=get_params(), check_mode=True)
+
+        changed, records, nodes, unplaced = vm_node_rebalance.run(module, api)
+
+        assert changed is True
+        assert records == [
+            dict(
+                vm_name="vm-1",
+                vm_uuid="vm-1-uuid",
+                before=dict(preferred_node_uuid="node-1", backup_node_uuid="node-2"),
+                after=dict(preferred_node_uuid="node-2", backup_node_uuid="node-1"),
+            )
+        ]
+        assert [node["after"]["vms"] for node in nodes] == [1, 1]
+        assert unplaced == []
+        run_tasks.assert_not_called()
+
+    def test_pinned(self, create_module, api):
+        module = create_module(params=get_params(pinned_vms=["vm-1", "vm-2"]))
+
+        assert vm_node_rebalance.run(module, api)[:2] == (False, [])
+
+    def test_pinned_missing(self, create_module, api):
+        module = create_module(params=get_params(pinned_vms=["missing"]))
+
+        with pytest.raises(errors.VMNotFound, match="missing"):
+            vm_node_rebalance.run(module, api)
+
+    def test_selector(self, create_module, api):
+        module = create_module(params=get_params(vm_selector=dict(tags=["db"])))
+
+        assert vm_node_rebalance.run(module, api)[:2] == (False, [])
+
+    def test_run(self, create_module, api, mocker):
+        run_tasks = mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.vm_node_rebalance.run_tasks"
+        )
+        run_tasks.return_value = [
+            dict(task_tag="t1", state="COMPLETE", error=None, duration=1.0),
+        ]
+        module = create_module(params=get_params(max_concurrency=2))
+
+        changed, records, nodes, _unplaced = vm_node_rebalance.run(module, api)
+
+        assert changed is True
+        assert records[0]["task_tag"] == "t1"
+        assert records[0]["duration"] == 1.0
+        assert run_tasks.call_args.kwargs["max_concurrency"] == 2
+        start = run_tasks.call_args.args[2]
+        start(run_tasks.call_args.args[1][0])
+        api.update_record.assert_called_once_with(
+            "/rest/v1/VirDomain/vm-1-uuid",
+            dict(
+                affinityStrategy=dict(
+                    strictAffinity=False,
+                    preferredNodeUUID="node-2",
+                    backupNodeUUID="node-1",
+                )
+            ),
+            False,
+        )
+
+    def test_run_failed(self, create_module, api, mocker):
+        mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.vm_node_rebalance.run_tasks"
+        ).return_value = [
+            dict(task_tag="t1", state="ERROR", error="bad", duration=1.0),
+        ]
+        module = create_module(params=get_params())
+
+        with pytest.raises(
+            errors.ScaleComputingError, match="Failed to update 1 of 1 VMs: vm-1: bad"
+        ):
+            vm_node_rebalance.run(module, api)
+
+
+class TestMain:
+    def setup_method(self):
+        self.cluster_instance = dict(
+            host="https://0.0.0.0",
+            username="admin",
+            password="admin",
+        )
+
+    def test_params(self, run_main_with_reboot):
+        params = dict(
+            cluster_instance=self.cluster_instance,
+            vm_selector=dict(tags=["prod"]),
+            pinned_vms=["vm-1"],
+            anti_affinity_tags=["db"],
+            max_memory_percent=80,
+            max_moves=3,
+            max_concurrency=2,
+        )
+        success, result = run_main_with_reboot(vm_node_rebalance, params)
+
+        assert success is True
@@ -59,6 +59,7 @@ class TestEnabledOrReenabled:
             "remote_cluster": "remote-cluster-name",
         }
         remote_cluster_dict = {
+            "uuid": "7890f2ab-3r9a-89ff-5k91-3gdahgh47ghg",
             "remoteClusterInfo": {"clusterName": "remote-cluster-name"},
             "connectionStatus": "status",
             "replicationOK": "ok",
@@ -93,6 +94,7 @@ class TestEnabledOrReenabled:
             [connection_dict],
             [replication_dict],
             [vm_dict],
+            [remote_cluster_dict],
         ]
         rest_client.create_record.return_value = {"taskTag": "1234"}
         mocker.patch(
@@ -143,6 +145,7 @@ class TestEnabledOrReenabled:
             "connectionUUID": "7890f2ab-3r9a-89ff-5k91-3gdahgh47ghg",
         }
         remote_cluster_dict = {
+            "uuid": "7890f2ab-3r9a-89ff-5k91-3gdahgh47ghg",
             "remoteClusterInfo": {"clusterName": "remote-cluster-name"},
             "connectionStatus": "status",
             "replicationOK": "ok",
@@ -176,8 +179,10 @@ class TestEnabledOrReenabled:
             [vm_dict],
             [replication_dict],
             [vm_dict],
+            [remote_cluster_dict],
             [replication_dict_after],
             [vm_dict],
+            [remote_cluster_dict],
         ]
         rest_client.update_record.return_value = {"taskTag": "1234"}
         mocker.patch(
@@ -222,6 +227,7 @@ class TestEnabledOrReenabled:
             "connectionUUID": "7890f2ab-3r9a-89ff-5k91-3gdahgh47ghg",
         }
         remote_cluster_dict = {
+            "uuid": "7890f2ab-3r9a-89ff-5k91-3gdahgh47ghg",
             "remoteClusterInfo": {"clusterName": "remote-cluster-name"},
             "connectionStatus": "status",
             "replicationOK": "ok",
@@ -245,6 +251,7 @@ class TestEnabledOrReenabled:
             [vm_dict],
             [replication_dict],
             [vm_dict],
+            [remote_cluster_dict],
         ]
         rest_client.update_record.return_value = {"taskTag": ""}
         mocker.patch(
@@ -403,6 +410,7 @@ class TestDisabled:
             "state": "enabled",
         }
         remote_cluster_dict = {
+            "uuid": "7890f2ab-3r9a-89ff-5k91-3gdahgh47ghg",
             "remoteClusterInfo": {"clusterName": "remote-cluster-name"},
             "connectionStatus": "status",
             "replicationOK": "ok",
@@ -426,8 +434,10 @@ class TestDisabled:
             [vm_dict],
             [replication_dict],
             [vm_dict],
+            [remote_cluster_dict],
             [replication_dict_after],
             [vm_dict],
+            [remote_cluster_dict],
         ]
         rest_client.update_record.return_value = {"taskTag": "1234"}
         mocker.patch(
@@ -90,11 +90,12 @@ class TestRun:
         )
         vm_replication = {
             "uuid": "replication-uuid",
-            "sourceDomainUUID": "vm-uuid",
+            "sourceDomainUUID": "7542f2gg-5f9a-51ff-8a91-8ceahgf47ghg",
             "enable": True,
             "connectionUUID": "remote-cluster-connection-uuid",
         }
         cluster_dict = {
+            "uuid": "remote-cluster-connection-uuid",
             "remoteClusterInfo": {"clusterName": "remote-cluster-name"},
             "connectionStatus": "status",
             "replicationOK": "ok",
@@ -107,6 +108,7 @@ class TestRun:
             [vm_dict],
             [vm_replication],
             [vm_dict],
+            [cluster_dict],
         ]
         mocker.patch(
             "ansible_collections.scale_computing.hypercore.plugins.module_utils.vm.Node.get_node"
@@ -142,15 +144,16 @@ class TestRun:
             "uuid": "replication-uuid",
             "sourceDomainUUID": "7542f2gg-5f9a-51ff-8a91-8ceahgf47ghg",
             "enable": True,
-            "connectionUUID": "remote-cluster-name",
+            "connectionUUID": "remote-cluster-connection-uuid",
         }
         vm_replication_2 = {
             "uuid": "replication-uuid-2",
             "sourceDomainUUID": "7542f2gg-5f9a-51ff-8a91-8ceahgf47ffs",
             "enable": False,
-            "connectionUUID": "remote-cluster-name",
+            "connectionUUID": "remote-cluster-connection-uuid",
         }
         cluster_dict = {
+            "uuid": "remote-cluster-connection-uuid",
             "remoteClusterInfo": {"clusterName": "remote-cluster-name"},
             "connectionStatus": "status",
             "replicationOK": "ok",
@@ -162,8 +165,8 @@ class TestRun:
         rest_client.get_record.return_value = cluster_dict
         rest_client.list_records.side_effect = [
             [vm_replication_1, vm_replication_2],
-            [vm_dict_1],
-            [vm_dict_2],
+            [vm_dict_1, vm_dict_2],
+            [cluster_dict],
         ]
         mocker.patch(
             "ansible_collections.scale_computing.hypercore.plugins.module_utils.vm.Node.get_node"
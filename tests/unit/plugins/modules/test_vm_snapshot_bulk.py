@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+# # Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+
+import pytest
+
+from ansible_collections.scale_computing.hypercore.plugins.module_utils import errors
+from ansible_collections.scale_computing.hypercore.plugins.modules import (
+    vm_snapshot_bulk,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
+    MIN_PYTHON_VERSION,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < MIN_PYTHON_VERSION,
+    reason=f"requires python{MIN_PYTHON_VERSION[0]}.{MIN_PYTHON_VERSION[1]} or higher",
+)
+
+VMS = [
+    dict(uuid="vm-1-uuid", name="vm-1", tags="prod,web", state="RUNNING"),
+    dict(uuid="vm-2-uuid", name="vm-2", tags="prod", state="SHUTOFF"),
+    dict(uuid="vm-3-uuid", name="vm-3", tags="", state="RUNNING"),
+]
+
+
+def get_params(**params):
+    return dict(
+        dict(vm_names=None, vm_selector=None, label="backup", max_concurrency=5),
+        **params,
+    )
+
+
+class TestSelectVMs:
+    @pytest.mark.parametrize(
+        "params,expected_names",
+        [
+            (dict(vm_names=["vm-3", "vm-1"]), ["vm-3", "vm-1"]),
+            (dict(vm_selector=dict(tags=["prod"])), ["vm-1", "vm-2"]),
+            (dict(vm_selector=dict(tags=["prod", "web"])), ["vm-1"]),
+            (dict(vm_selector=dict(tags=["db"])), []),
+            (
+                dict(vm_names=["vm-3", "vm-1"], vm_selector=dict(tags=["prod"])),
+                ["vm-3", "vm-1", "vm-2"],
+            ),
+            (dict(vm_selector=dict(power_state=["started"])), ["vm-1", "vm-3"]),
+        ],
+    )
+    def test_select_vms(self, create_module, rest_client, params, expected_names):
+        rest_client.list_records.return_value = VMS
+        module = create_module(params=get_params(**params))
+
+        vms = vm_snapshot_bulk.select_vms(module, rest_client)
+
+        assert [vm["name"] for vm in vms] == expected_names
+        rest_client.list_records.assert_called_once_with("/rest/v1/VirDomain")
+
+    def test_select_vms_missing(self, create_module, rest_client):
+        rest_client.list_records.return_value = VMS
+        module = create_module(params=get_params(vm_names=["vm-1", "missing"]))
+
+        with pytest.raises(errors.VMNotFound, match="missing"):
+            vm_snapshot_bulk.select_vms(module, rest_client)
+
+
+class TestRun:
+    def test_run_check_mode(self, create_module, rest_client, mocker):
+        rest_client.list_records.return_value = VMS
+        run_tasks = mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.vm_snapshot_bulk.run_tasks"
+        )
+        module = create_module(
+            params=get_params(vm_selector=dict(tags=["prod"])), check_mode=True
+        )
+
+        changed, records, duration = vm_snapshot_bulk.run(module, rest_client)
+
+        assert changed is True
+        assert records == [
+            dict(vm_name="vm-1", vm_uuid="vm-1-uuid"),
+            dict(vm_name="vm-2", vm_uuid="vm-2-uuid"),
+        ]
+        run_tasks.assert_not_called()
+        rest_client.create_record.assert_not_called()
+
+    def test_run_no_vms(self, create_module, rest_client):
+        rest_client.list_records.return_value = VMS
+        module = create_module(params=get_params(vm_selector=dict(tags=["db"])))
+
+        assert vm_snapshot_bulk.run(module, rest_client) == (False, [], 0.0)
+
+    def test_run(self, create_module, rest_client, mocker):
+        rest_client.list_records.return_value = VMS
+        run_tasks = mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.vm_snapshot_bulk.run_tasks"
+        )
+        run_tasks.return_value = [
+            dict(
+                task_tag="t1",
+                created_uuid="s1",
+                state="COMPLETE",
+                error=None,
+                duration=1.0,
+            ),
+            dict(
+                task_tag="t2",
+                created_uuid="s2",
+                state="COMPLETE",
+                error=None,
+                duration=2.0,
+            ),
+        ]
+        module = create_module(
+            params=get_params(vm_selector=dict(tags=["prod"]), max_concurrency=7)
+        )
+
+        changed, records, duration = vm_snapshot_bulk.run(module, rest_client)
+
+        assert changed is True
+        assert records == [
+            dict(
+                vm_name="vm-1",
+                vm_uuid="vm-1-uuid",
+                snapshot_uuid="s1",
+                task_tag="t1",
+                duration=1.0,
+            ),
+            dict(
+                vm_name="vm-2",
+                vm_uuid="vm-2-uuid",
+                snapshot_uuid="s2",
+                task_tag="t2",
+                duration=2.0,
+            ),
+        ]
+        assert duration >= 0
+        assert run_tasks.call_args.kwargs["max_concurrency"] == 7
+
+        start = run_tasks.call_args.args[2]
+        start(records[0])
+        rest_client.create_record.assert_called_once_with(
+            "/rest/v1/VirDomainSnapshot",
+            dict(domainUUID="vm-1-uuid", label="backup"),
+            False,
+        )
+
+    def test_run_failed(self, create_module, rest_client, mocker):
+        rest_client.list_records.return_value = VMS
+        mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.vm_snapshot_bulk.run_tasks"
+        ).return_value = [
+            dict(
+                task_tag=None,
+                created_uuid=None,
+                state="ERROR",
+                error="bad",
+                duration=0.1,
+            ),
+        ]
+        module = create_module(params=get_params(vm_names=["vm-3"]))
+
+        with pytest.raises(
+            errors.ScaleComputingError, match="Failed to create 1 of 1 snapshots: vm-3"
+        ):
+            vm_snapshot_bulk.run(module, rest_client)
+
+
+class TestMain:
+    def setup_method(self):
+        self.cluster_instance = dict(
+            host="https://0.0.0.0",
+            username="admin",
+            password="admin",
+        )
+
+    def test_fail(self, run_main):
+        success, result = run_main(
+            vm_snapshot_bulk, dict(cluster_instance=self.cluster_instance, label="x")
+        )
+
+        assert success is False
+        assert "one of the following is required: vm_names, vm_selector" in (
+            result["msg"]
+        )
+
+    def test_params(self, run_main):
+        params = dict(
+            cluster_instance=self.cluster_instance,
+            vm_names=["vm-1"],
+            vm_selector=dict(tags=["prod"], tags_match="any", name="web-*"),
+            label="backup",
+            max_concurrency=10,
+        )
+        success, result = run_main(vm_snapshot_bulk, params)
+
+        assert success is True
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+# # Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+
+import pytest
+
+from ansible_collections.scale_computing.hypercore.plugins.module_utils import errors
+from ansible_collections.scale_computing.hypercore.plugins.modules import (
+    vm_snapshot_prune,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
+    MIN_PYTHON_VERSION,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < MIN_PYTHON_VERSION,
+    reason=f"requires python{MIN_PYTHON_VERSION[0]}.{MIN_PYTHON_VERSION[1]} or higher",
+)
+
+DAY = 24 * 60 * 60
+NOW = 100 * DAY
+
+
+def get_snapshot(uuid, vm_uuid, age_days, label="nightly", snapshot_type="USER"):
+    return dict(
+        snapshot_uuid=uuid,
+        vm=dict(name=vm_uuid, uuid=vm_uuid, snapshot_serial_number=1),
+        timestamp=NOW - age_days * DAY,
+        label=label,
+        type=snapshot_type,
+    )
+
+
+SNAPSHOTS = [
+    get_snapshot("s1", "vm-1", 1),
+    get_snapshot("s2", "vm-1", 5),
+    get_snapshot("s3", "vm-1", 10),
+    get_snapshot("s4", "vm-1", 20),
+    get_snapshot("s5", "vm-2", 30),
+    get_snapshot("s6", "vm-2", 40, label="manual"),
+    get_snapshot("s7", "vm-2", 50, snapshot_type="AUTOMATED"),
+]
+
+
+def get_params(**params):
+    return dict(
+        dict(
+            vm_name=None,
+            keep_last=None,
+            max_age_days=None,
+            label_patterns=None,
+            snapshot_types=["USER"],
+            max_concurrency=5,
+        ),
+        **params,
+    )
+
+
+class TestGetPruneSet:
+    @pytest.mark.parametrize(
+        "params,expected_removed,expected_kept",
+        [
+            (dict(keep_last=2), ["s3", "s4"], 4),
+            (dict(keep_last=0), ["s1", "s2", "s3", "s4", "s5", "s6"], 0),
+            (dict(max_age_days=7), ["s3", "s4", "s5", "s6"], 2),
+            (dict(keep_last=1, max_age_days=7), ["s3", "s4", "s6"], 3),
+            (dict(keep_last=1, label_patterns=["night*"]), ["s2", "s3", "s4"], 2),
+            (
+                dict(keep_last=1, snapshot_types=["USER", "AUTOMATED"]),
+                ["s2", "s3", "s4", "s6", "s7"],
+                2,
+            ),
+        ],
+    )
+    def test_get_prune_set(
+        self, create_module, params, expected_removed, expected_kept
+    ):
+        module = create_module(params=get_params(**params))
+
+        to_remove, kept = vm_snapshot_prune.get_prune_set(module, SNAPSHOTS, NOW)
+
+        assert sorted(snapshot["snapshot_uuid"] for snapshot in to_remove) == (
+            expected_removed
+        )
+        assert kept == expected_kept
+
+
+class TestRun:
+    @pytest.fixture(autouse=True)
+    def snapshots(self, mocker):
+        mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.vm_snapshot_prune.time"
+        ).return_value = NOW
+        mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.module_utils.vm_snapshot.VMSnapshot.iter_snapshots_by_params"
+        ).return_value = iter([dict(snapshot) for snapshot in SNAPSHOTS])
+
+    def test_run_check_mode(self, create_module, rest_client, mocker):
+        run_tasks = mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.vm_snapshot_prune.run_tasks"
+        )
+        module = create_module(params=get_params(keep_last=3), check_mode=True)
+
+        changed, records, kept = vm_snapshot_prune.run(module, rest_client)
+
+        assert changed is True
+        assert [record["snapshot_uuid"] for record in records] == ["s4"]
+        assert kept == 5
+        run_tasks.assert_not_called()
+        rest_client.delete_record.assert_not_called()
+
+    def test_run_nothing_to_remove(self, create_module, rest_client, mocker):
+        run_tasks = mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.vm_snapshot_prune.run_tasks"
+        )
+        module = create_module(params=get_params(keep_last=10))
+
+        changed, records, kept = vm_snapshot_prune.run(module, rest_client)
+
+        assert (changed, records, kept) == (False, [], 6)
+        run_tasks.assert_not_called()
+
+    def test_run(self, create_module, rest_client, mocker):
+        run_tasks = mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.vm_snapshot_prune.run_tasks"
+        )
+        run_tasks.return_value = [
+            dict(task_tag="t1", state="COMPLETE", error=None, duration=1.5),
+            dict(task_tag="t2", state="COMPLETE", error=None, duration=2.0),
+        ]
+        module = create_module(params=get_params(keep_last=2, max_concurrency=2))
+
+        changed, records, kept = vm_snapshot_prune.run(module, rest_client)
+
+        assert changed is True
+        assert [
+            (record["snapshot_uuid"], record["task_tag"], record["duration"])
+            for record in records
+        ] == [("s3", "t1", 1.5), ("s4", "t2", 2.0)]
+        assert run_tasks.call_args.kwargs["max_concurrency"] == 2
+
+        # Start function deletes the snapshot
+        start = run_tasks.call_args.args[2]
+        start(dict(snapshot_uuid="s4"))
+        rest_client.delete_record.assert_called_once_with(
+            "/rest/v1/VirDomainSnapshot/s4", False
+        )
+
+    def test_run_failed(self, create_module, rest_client, mocker):
+        mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.modules.vm_snapshot_prune.run_tasks"
+        ).return_value = [
+            dict(task_tag="t1", state="COMPLETE", error=None, duration=1.5),
+            dict(task_tag="t2", state="ERROR", error="task failed", duration=2.0),
+        ]
+        module = create_module(params=get_params(keep_last=2))
+
+        with pytest.raises(
+            errors.ScaleComputingError, match="Failed to remove 1 of 2 snapshots"
+        ):
+            vm_snapshot_prune.run(module, rest_client)
+
+
+class TestMain:
+    def setup_method(self):
+        self.cluster_instance = dict(
+            host="https://0.0.0.0",
+            username="admin",
+            password="admin",
+        )
+
+    def test_fail(self, run_main):
+        success, result = run_main(
+            vm_snapshot_prune, dict(cluster_instance=self.cluster_instance)
+        )
+
+        assert success is False
+        assert "one of the following is required: keep_last, max_age_days" in (
+            result["msg"]
+        )
+
+    def test_params(self, run_main):
+        params = dict(
+            cluster_instance=self.cluster_instance,
+            vm_name="demo-vm",
+            keep_last=2,
+            max_age_days=7.5,
+            label_patterns=["nightly-*"],
+            snapshot_types=["USER", "AUTOMATED"],
+            max_concurrency=3,
+        )
+        success, result = run_main(vm_snapshot_prune, params)
+
+        assert success is True
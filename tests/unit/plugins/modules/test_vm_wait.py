@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# # Copyright: (c) 2023, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+
+import pytest
+
+from ansible_collections.scale_computing.hypercore.plugins.module_utils import errors
+from ansible_collections.scale_computing.hypercore.plugins.modules import vm_wait
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.utils import (
+    MIN_PYTHON_VERSION,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < MIN_PYTHON_VERSION,
+    reason=f"requires python{MIN_PYTHON_VERSION[0]}.{MIN_PYTHON_VERSION[1]} or higher",
+)
+
+
+def vms(*states):
+    return [
+        dict(
+            uuid="vm-{0}-uuid".format(number),
+            name="vm-{0}".format(number),
+            tags="prod" if number < 3 else "",
+            state=state,
+        )
+        for number, state in enumerate(states, 1)
+    ]
+
+
+def get_params(**params):
+    return dict(
+        dict(vm_names=None, vm_selector=None, power_state=["stopped"], timeout=300),
+        **params,
+    )
+
+
+@pytest.fixture
+def clock(mocker):
+    # Fake clock, sleep advances it.
+    now = [1000.0]
+    mocker.patch.object(vm_wait, "time", side_effect=lambda: now[0])
+    sleep_mock = mocker.patch.object(
+        vm_wait,
+        "sleep",
+        side_effect=lambda seconds: now.__setitem__(0, now[0] + seconds),
+    )
+    return sleep_mock
+
+
+class TestSelectVMs:
+    @pytest.mark.parametrize(
+        "params,expected_names",
+        [
+            (dict(), ["vm-1", "vm-2", "vm-3"]),
+            (dict(vm_names=["vm-3"]), ["vm-3"]),
+            (dict(vm_selector=dict(tags=["prod"])), ["vm-1", "vm-2"]),
+            (
+                dict(vm_names=["vm-1"], vm_selector=dict(tags=["prod"])),
+                ["vm-1", "vm-2"],
+            ),
+        ],
+    )
+    def test_select_vms(self, create_module, rest_client, params, expected_names):
+        rest_client.list_records.return_value = vms("RUNNING", "RUNNING", "SHUTOFF")
+        module = create_module(params=get_params(**params))
+
+        selected = vm_wait.select_vms(module, rest_client)
+
+        assert [vm["name"] for vm in selected] == expected_names
+
+    def test_select_vms_missing(self, create_module, rest_client):
+        rest_client.list_records.return_value = vms("RUNNING")
+        module = create_module(params=get_params(vm_names=["missing"]))
+
+        with pytest.raises(errors.VMNotFound, match="missing"):
+            vm_wait.select_vms(module, rest_client)
+
+
+class TestRun:
+    def test_run_already_done(self, create_module, rest_client, clock):
+        rest_client.list_records.return_value = vms("SHUTOFF", "CRASHED")
+        module = create_module(params=get_params(power_state=["stopped", "crashed"]))
+
+        changed, records, duration = vm_wait.run(module, rest_client)
+
+        assert changed is False
+        assert records == [
+            dict(
+                vm_name="vm-1",
+                vm_uuid="vm-1-uuid",
+                power_state="stopped",
+                time_to_state=0.0,
+            ),
+            dict(
+                vm_name="vm-2",
+                vm_uuid="vm-2-uuid",
+                power_state="crashed",
+                time_to_state=0.0,
+            ),
+        ]
+        assert duration == 0.0
+        rest_client.list_records.assert_called_once_with("/rest/v1/VirDomain")
+        clock.assert_not_called()
+
+    def test_run_wait(self, create_module, rest_client, clock):
+        rest_client.list_records.side_effect = [
+            vms("RUNNING", "RUNNING", "RUNNING"),
+            vms("SHUTDOWN", "RUNNING", "RUNNING"),
+            vms("SHUTDOWN", "RUNNING", "RUNNING"),
+            vms("SHUTOFF", "SHUTDOWN", "RUNNING")[:2],  # vm-3 was deleted
+            vms("SHUTOFF", "SHUTOFF"),
+        ]
+        module = create_module(params=get_params())
+
+        changed, records, duration = vm_wait.run(module, rest_client)
+
+        assert [
+            (record["vm_name"], record["power_state"], record["time_to_state"])
+            for record in records
+        ] == [
+            ("vm-1", "stopped", 3.5),
+            ("vm-2", "stopped", 4.5),
+            ("vm-3", None, 3.5),
+        ]
+        assert duration == 4.5
+        # Interval grows while nothing changes, and is reset on change.
+        assert [call.args[0] for call in clock.call_args_list] == [1.0, 1.0, 1.5, 1.0]
+
+    def test_run_timeout(self, create_module, rest_client, clock):
+        rest_client.list_records.return_value = vms("SHUTOFF", "RUNNING")
+        module = create_module(params=get_params(timeout=120))
+
+        with pytest.raises(
+            errors.ScaleComputingError,
+            match="1 of 2 VMs did not reach power state stopped in 120 seconds: "
+            "vm-2 \\(started\\)",
+        ):
+            vm_wait.run(module, rest_client)
+
+        intervals = [call.args[0] for call in clock.call_args_list]
+        assert max(intervals) == vm_wait.VM_STATE_MAX_INTERVAL
+        assert sum(intervals) == 120
+
+
+class TestMain:
+    def setup_method(self):
+        self.cluster_instance = dict(
+            host="https://0.0.0.0",
+            username="admin",
+            password="admin",
+        )
+
+    def test_fail(self, run_main):
+        success, result = run_main(
+            vm_wait, dict(cluster_instance=self.cluster_instance)
+        )
+
+        assert success is False
+        assert "missing required arguments: power_state" in result["msg"]
+
+    def test_params(self, run_main):
+        params = dict(
+            cluster_instance=self.cluster_instance,
+            vm_names=["vm-1"],
+            vm_selector=dict(tags=["prod"]),
+            power_state=["stopped", "crashed"],
+            timeout=60,
+        )
+        success, result = run_main(vm_wait, params)
+
+        assert success is True